@@ -0,0 +1,10 @@
+"""インプロセスキャッシュ"""
+from .lru_ttl_cache import LRUTTLCache
+from .single_flight import SingleFlight
+from .versioned_cache import VersionedCache
+
+__all__ = [
+    "LRUTTLCache",
+    "SingleFlight",
+    "VersionedCache",
+]
@@ -0,0 +1,156 @@
+"""LRU + TTL で破棄するインプロセスキャッシュ"""
+import dataclasses
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+def estimate_size(value: Any) -> int:
+    """
+    値のおおよそのメモリ使用量（バイト）を見積もる
+
+    エンティティ（dataclass）はフィールドの値まで、タプルは要素まで含めて合計する。
+    max_bytes による上限管理の目安であり、厳密な値ではない。
+
+    Args:
+        value: 見積もる値
+
+    Returns:
+        バイト数
+    """
+    size = sys.getsizeof(value)
+    if dataclasses.is_dataclass(value):
+        size += sum(sys.getsizeof(getattr(value, f.name)) for f in dataclasses.fields(value))
+    elif isinstance(value, tuple):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class LRUTTLCache(Generic[V]):
+    """
+    件数・メモリ量の上限と有効期限を持つスレッドセーフなキャッシュ
+
+    エントリは ttl_seconds 経過で期限切れになり、max_entries 件または
+    max_bytes バイト（0 は無制限）を超えた場合は最も長く使われていない
+    エントリから削除する（LRU）。
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: int = 0):
+        """
+        Args:
+            max_entries: 保持する最大エントリ数
+            ttl_seconds: エントリを保持する秒数
+            max_bytes: 保持する値の合計サイズの上限（0 の場合は無制限）
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # key -> (有効期限, 値, 見積もりサイズ)
+        self._entries: "OrderedDict[Hashable, Tuple[float, V, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        # invalidate() のたびに進める番号。読み込み中に無効化されたかの判定に使う
+        self.epoch = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        キャッシュされた値を取得する
+
+        Args:
+            key: キー
+
+        Returns:
+            値。キャッシュにない場合または期限切れの場合は None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, if_epoch: Optional[int] = None) -> None:
+        """
+        値を保存し、上限を超えた分を LRU で削除する
+
+        Args:
+            key: キー
+            value: 保存する値
+            if_epoch: 指定した場合、読み込み開始時に取得した epoch から
+                invalidate() が呼ばれていなければ保存する（古い値の保存を防ぐ）
+        """
+        size = estimate_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            return
+        with self._lock:
+            if if_epoch is not None and if_epoch != self.epoch:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        指定したキーのエントリを削除する
+
+        Args:
+            key: キー
+        """
+        with self._lock:
+            self.epoch += 1
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """全エントリを削除する"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        キャッシュの統計情報を返す
+
+        Returns:
+            Dict[str, int]: エントリ数、見積もりサイズとヒット／ミス数
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """エントリを削除してサイズを差し引く（ロック取得済みで呼び出す）"""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
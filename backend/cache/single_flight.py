@@ -0,0 +1,96 @@
+"""同じキーへの同時の読み込みを 1 回にまとめる（single-flight）"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class SingleFlight:
+    """
+    同じキーに対する同時の非同期呼び出しを 1 回の実行にまとめる
+
+    最初の呼び出し（リーダー）だけが関数を実行し、実行中に同じキーで
+    呼び出された場合はその結果（または例外）を共有する。結果は保持しない
+    ため、キャッシュと組み合わせて使う。同一イベントループ内での利用を前提とする。
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        key の実行中の呼び出しがあればその結果を待ち、なければ fn を実行する
+
+        Args:
+            key: 同一とみなす呼び出しのキー
+            fn: 実行するコルーチン関数
+
+        Returns:
+            fn の戻り値（まとめられた呼び出しでは共有された値）
+
+        Raises:
+            Exception: fn が失敗した場合（まとめられた呼び出しにも同じ例外を送出する）
+        """
+        self.calls += 1
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # リーダーがキャンセルされた場合は自分が実行し直す
+                if inflight.cancelled() and not asyncio.current_task().cancelling():
+                    self.coalesced -= 1
+                    continue
+                raise
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executions += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 待機中の呼び出しがない場合に "exception was never retrieved" を出さない
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def forget(self, key: Hashable) -> None:
+        """
+        key の実行中の呼び出しを以降の呼び出しと共有しないようにする
+
+        書き込みの後に呼び出すと、書き込み前に始まった読み込みの結果を
+        新しい呼び出しが受け取ることはなくなる。
+
+        Args:
+            key: キー
+        """
+        self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        統計情報を返す
+
+        Returns:
+            Dict[str, int]: 呼び出し数、実際の実行数、まとめられた呼び出し数と実行中の数
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
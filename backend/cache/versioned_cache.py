@@ -0,0 +1,79 @@
+"""世代番号で一括無効化できる一覧結果のキャッシュ"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from backend.cache.lru_ttl_cache import LRUTTLCache
+from backend.cache.single_flight import SingleFlight
+
+V = TypeVar("V")
+
+
+class VersionedCache:
+    """
+    コレクション単位の世代番号をキーに含めるキャッシュ
+
+    書き込みのたびに bump() で世代番号を進めるだけで、それ以前の世代の
+    エントリは参照されなくなる（O(1) の無効化）。古い世代のエントリは
+    LRU / TTL で自然に破棄される。同じキーへの同時のキャッシュミスは
+    1 回の読み込みにまとめ、後続の呼び出しはその結果を待つ。
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: int = 0):
+        """
+        Args:
+            max_entries: 保持する最大エントリ数（全世代の合計）
+            ttl_seconds: エントリを保持する秒数
+            max_bytes: 保持する値の合計サイズの上限（0 の場合は無制限）
+        """
+        self.generation = 0
+        self._cache: LRUTTLCache[Any] = LRUTTLCache(max_entries, ttl_seconds, max_bytes)
+        self._single_flight = SingleFlight()
+
+    def bump(self) -> None:
+        """世代番号を進め、これまでのエントリを全て無効にする"""
+        self.generation += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        現在の世代のキャッシュを返し、なければ loader で読み込んで保存する
+
+        読み込み中に bump() された場合、結果は読み込み開始時の世代に保存されるため
+        新しい世代の読み手に古い結果が返ることはない。
+
+        Args:
+            key: 世代以外のキー（limit / cursor など）
+            loader: キャッシュミス時に値を読み込むコルーチン関数
+
+        Returns:
+            キャッシュまたは loader から取得した値
+
+        Raises:
+            Exception: loader が失敗した場合（待機中の呼び出しにも同じ例外を送出する）
+        """
+        versioned_key = (self.generation, key)
+        value = self._cache.get(versioned_key)
+        if value is not None:
+            return value
+        return await self._single_flight.do(versioned_key, lambda: self._load(versioned_key, loader))
+
+    async def _load(self, versioned_key: Tuple[int, Hashable], loader: Callable[[], Awaitable[V]]) -> V:
+        """loader で読み込み、読み込み開始時の世代のキーで保存する"""
+        value = await loader()
+        self._cache.set(versioned_key, value)
+        return value
+
+    def clear(self) -> None:
+        """全エントリを削除する"""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        キャッシュの統計情報を返す
+
+        Returns:
+            Dict[str, int]: 世代番号、まとめられた読み込み数と LRUTTLCache の統計
+        """
+        return {
+            "generation": self.generation,
+            "coalesced": self._single_flight.coalesced,
+            **self._cache.stats(),
+        }
@@ -0,0 +1,46 @@
+"""AWS SDK (boto3 / botocore) の共通設定"""
+from typing import Any, Dict, Optional
+
+from botocore.config import Config
+
+from backend.config.settings import settings
+
+
+def aws_session_kwargs(region_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    boto3 セッションの作成に使用する引数を返す
+
+    Args:
+        region_name: リージョン（省略時は AWS_REGION）
+
+    Returns:
+        Dict[str, Any]: boto3.session.Session に渡すキーワード引数
+    """
+    session_kwargs: Dict[str, Any] = {
+        "region_name": region_name or settings.aws_region
+    }
+
+    if settings.aws_access_key_id and settings.aws_secret_access_key:
+        session_kwargs["aws_access_key_id"] = settings.aws_access_key_id
+        session_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
+
+    return session_kwargs
+
+
+def build_botocore_config() -> Config:
+    """
+    接続プール・タイムアウト・リトライを設定した botocore Config を作成する
+
+    Returns:
+        Config: boto3 クライアント／リソースに渡す設定
+    """
+    return Config(
+        max_pool_connections=settings.aws_max_pool_connections,
+        connect_timeout=settings.aws_connect_timeout,
+        read_timeout=settings.aws_read_timeout,
+        tcp_keepalive=settings.aws_tcp_keepalive,
+        retries={
+            "mode": settings.aws_retry_mode,
+            "max_attempts": settings.aws_max_attempts,
+        },
+    )
@@ -6,22 +6,65 @@ class Settings(BaseSettings):
     """アプリケーション設定"""
     
     # データベース設定
-    database_type: str = "dynamodb"  # "dynamodb" or "mysql"
+    database_type: str = "dynamodb"  # "dynamodb", "dynamodb_async", "mysql" or "mysql_async"
     
     # AWS 設定
     aws_region: str = "ap-northeast-1"
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     
+    # AWS SDK (botocore) 接続設定
+    aws_max_pool_connections: int = 50
+    aws_connect_timeout: float = 2.0  # 秒
+    aws_read_timeout: float = 5.0  # 秒
+    aws_tcp_keepalive: bool = True
+    aws_retry_mode: str = "standard"  # "legacy", "standard" or "adaptive"
+    aws_max_attempts: int = 3
+    
     # AWS Cognito 設定
     cognito_user_pool_id: str
     cognito_client_id: str
     cognito_region: Optional[str] = None
+    cognito_token_validation: str = "jwks"  # "jwks"（署名をローカル検証）or "remote"（GetUser API）
+    cognito_jwks_cache_ttl: int = 3600  # 秒
+    
+    # 検証済みトークンキャッシュ設定
+    auth_token_cache_max_entries: int = 10000
+    auth_token_cache_ttl: int = 300  # 秒。トークンの exp の方が早い場合はそちらを優先
+    auth_token_cache_negative_ttl: int = 10  # 秒。拒否されたトークンを保持する時間
+    auth_unavailable_retry_after: int = 5  # 秒。認証基盤の一時的な障害時に 503 の Retry-After で返す値
+    
+    # エンティティキャッシュ設定（get_by_id のリードスルーキャッシュ）
+    entity_cache_enabled: bool = True
+    entity_cache_max_entries: int = 10000  # Film / Actor それぞれの最大エントリ数
+    entity_cache_max_bytes: int = 64 * 1024 * 1024  # Film / Actor それぞれの見積もりサイズ上限（0 は無制限）
+    entity_cache_ttl: int = 60  # 秒。他のプロセスでの更新が反映されるまでの最大時間
+    
+    # 一覧キャッシュ設定（GET /api/films, /api/actors のシリアライズ済みレスポンス）
+    list_cache_enabled: bool = True
+    list_cache_max_entries: int = 1000  # Films / Actors それぞれの最大エントリ数（limit / cursor の組み合わせごと）
+    list_cache_max_bytes: int = 64 * 1024 * 1024  # Films / Actors それぞれの合計サイズ上限（0 は無制限）
+    list_cache_ttl: int = 30  # 秒。他のプロセスでの更新が反映されるまでの最大時間
+    
+    # 同じ ID への同時の詳細取得を 1 回の読み込みにまとめる（single-flight）
+    single_flight_enabled: bool = True
+    
+    # DynamoDB（dynamodb / dynamodb_async）の全文検索に使うインプロセスの検索インデックス
+    search_index_enabled: bool = True
+    search_index_refresh_interval: int = 600  # 秒。テーブルから作り直す間隔（0 は起動時だけ。サジェストも同じ間隔）
+    search_index_max_prefix_expansions: int = 50  # 検索語の最後の語を前方一致で展開する最大の語数
+    
+    # タイトル・氏名の入力補完（サジェスト）に使うインプロセスのインデックス（どのデータベースタイプでも共通）
+    suggest_enabled: bool = True
     
     # DynamoDB 設定
     dynamodb_films_table: str = "Films"
     dynamodb_actors_table: str = "Actors"
+    dynamodb_film_actors_table: str = "FilmActors"  # 映画とアクターの出演関係（隣接リスト）
     dynamodb_endpoint_url: Optional[str] = None  # ローカル開発用
+    dynamodb_active_shards: int = 8  # active_shard-index のシャード数（変更時は移行スクリプトを再実行）
+    # 同期リポジトリで各シャードへの Query を並列に実行するスレッド数（None の場合は THREADPOOL_MAX_WORKERS × DYNAMODB_ACTIVE_SHARDS）
+    dynamodb_shard_query_max_workers: Optional[int] = None
     
     # MySQL 設定
     mysql_host: Optional[str] = None
@@ -30,6 +73,12 @@ class Settings(BaseSettings):
     mysql_user: Optional[str] = None
     mysql_password: Optional[str] = None
     
+    # MySQL 接続プール設定
+    mysql_pool_size: int = 10
+    mysql_max_overflow: int = 20
+    mysql_pool_recycle: int = 1800  # 秒。MySQL の wait_timeout より短くする
+    mysql_pool_timeout: int = 30  # 秒。プールから接続を取得するまでの待機時間
+    
     # CORS 設定
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
     
@@ -37,6 +86,18 @@ class Settings(BaseSettings):
     app_name: str = "Film Actor Management API"
     debug: bool = False
     
+    # 一覧 API のページネーション設定
+    api_page_default_limit: int = 50  # limit 未指定時の 1 ページあたりの件数
+    api_page_max_limit: int = 200  # limit に指定できる最大値
+    api_stream_batch_size: int = 500  # ストリーミング出力時に DB から一度に取り出す行数
+    api_batch_max_items: int = 500  # 一括 API の 1 リクエストに含められる最大件数
+    api_search_max_length: int = 200  # 検索 API の検索語の最大文字数（サジェスト API の prefix も同じ）
+    api_suggest_default_limit: int = 10  # サジェスト API で limit 未指定時の件数
+    api_suggest_max_limit: int = 50  # サジェスト API の limit に指定できる最大値
+    
+    # ブロッキング I/O（DB・AWS API 呼び出し）を実行するスレッドプールの最大スレッド数
+    threadpool_max_workers: int = 40
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -52,6 +113,11 @@ class Settings(BaseSettings):
         if not all([self.mysql_host, self.mysql_database, self.mysql_user, self.mysql_password]):
             raise ValueError("MySQL configuration is incomplete")
         return f"mysql+pymysql://{self.mysql_user}:{self.mysql_password}@{self.mysql_host}:{self.mysql_port}/{self.mysql_database}"
+    
+    @property
+    def mysql_async_url(self) -> str:
+        """非同期 MySQL ドライバ（aiomysql）用の接続 URL を生成"""
+        return self.mysql_url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
 
 
 # グローバル設定インスタンス
@@ -1,66 +1,220 @@
 """Actor コントローラー"""
+import asyncio
 import logging
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, status
+from typing import Dict, Any, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 
-from backend.repositories.actor_repository import ActorRepository
-from backend.controllers.dependencies import get_actor_repository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.controllers.dependencies import (
+    actor_list_cache,
+    get_actor_repository,
+    get_actor_suggest_index,
+    get_cast_repository
+)
+from backend.controllers.etag import (
+    compute_etag,
+    conditional_json_response,
+    parse_if_match,
+    version_etag
+)
+from backend.controllers.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
+from backend.controllers.responses import actor_to_response, film_to_response
+from backend.entities.actor import Actor
 from backend.services.auth_middleware import get_current_user
-from backend.use_cases.create_actor_use_case import CreateActorUseCase
-from backend.use_cases.get_actors_use_case import GetActorsUseCase
-from backend.use_cases.get_actor_by_id_use_case import GetActorByIdUseCase
-from backend.use_cases.update_actor_use_case import UpdateActorUseCase
-from backend.use_cases.delete_actor_use_case import DeleteActorUseCase
-from backend.exceptions import ValidationError, NotFoundError, DatabaseError
-from backend.schemas.actor_schemas import ActorRequest, ActorResponse, ActorsListResponse
+from backend.use_cases.create_actor_use_case import AsyncCreateActorUseCase
+from backend.use_cases.get_actors_use_case import AsyncGetActorsUseCase
+from backend.use_cases.get_actor_by_id_use_case import AsyncGetActorByIdUseCase
+from backend.use_cases.update_actor_use_case import AsyncUpdateActorUseCase
+from backend.use_cases.delete_actor_use_case import AsyncDeleteActorUseCase
+from backend.use_cases.search_actors_use_case import AsyncSearchActorsUseCase
+from backend.use_cases.suggest_actors_use_case import SuggestActorsUseCase
+from backend.use_cases.get_actor_films_use_case import AsyncGetActorFilmsUseCase
+from backend.search import PrefixIndex
+from backend.config.settings import settings
+from backend.exceptions import ValidationError, NotFoundError, ConflictError, DatabaseError
+from backend.schemas.cast_schemas import ActorWithFilmsResponse
+from backend.schemas.actor_schemas import (
+    ActorBatchResult,
+    ActorRequest,
+    ActorResponse,
+    ActorsBatchGetRequest,
+    ActorsBatchGetResponse,
+    ActorsBatchRequest,
+    ActorsBatchResponse,
+    ActorsListResponse,
+    ActorSuggestion,
+    ActorSuggestionsResponse
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/actors", tags=["actors"])
 
 
-@router.get("", response_model=ActorsListResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=ActorsListResponse,
+    status_code=status.HTTP_200_OK,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+)
 async def get_actors(
-    repository: ActorRepository = Depends(get_actor_repository),
+    limit: int = Query(settings.api_page_default_limit, ge=1, le=settings.api_page_max_limit),
+    cursor: Optional[str] = Query(None),
+    stream: bool = Query(False),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
-    全アクターを取得するエンドポイント
+    アクターを 1 ページ分取得するエンドポイント（last_update の降順）
+
+    ?stream=true または Accept: application/x-ndjson の場合は、limit / cursor を
+    無視して全件を 1 行 1 件の JSON（NDJSON）として逐次返す。
+    通常の一覧は、次の書き込みまでシリアライズ済みの結果と ETag を一覧キャッシュから返す。
+    If-None-Match が ETag に一致する場合は 304 を返す（キャッシュヒット時は DB にアクセスしない）。
 
     Args:
+        limit: 1 ページあたりの最大件数
+        cursor: 前のページで返された next_cursor。先頭ページの場合は省略
+        stream: True の場合は全件を NDJSON でストリーミングする
+        accept: Accept ヘッダー（application/x-ndjson でストリーミング）
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
         repository: Actor リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        List[ActorResponse]: アクターのリスト
+        ActorsListResponse: アクターのリストと次のページのカーソル
+        （ストリーミング時は StreamingResponse）
 
     Raises:
-        HTTPException: データベース操作に失敗した場合
+        HTTPException: cursor が不正な場合またはデータベース操作に失敗した場合
     """
     try:
-        logger.info("全アクターの取得を開始")
-        use_case = GetActorsUseCase(repository)
-        actors = use_case.execute()
-        logger.info(f"アクターを {len(actors)} 件取得しました")
-        actors_responses = [
-            ActorResponse(
-                actor_id=str(actor.actor_id),
-                first_name=actor.first_name,
-                last_name=actor.last_name,
-                last_update=actor.last_update.isoformat(),
-                delete_flag=actor.delete_flag
-            )
-            for actor in actors
-        ]
-        return ActorsListResponse(actors=actors_responses)
+        use_case = AsyncGetActorsUseCase(repository)
+        if wants_ndjson(stream, accept):
+            logger.info("アクター一覧のストリーミング出力を開始")
+            return await ndjson_response(use_case.stream(), actor_to_response)
+
+        async def load_page() -> Tuple[str, bytes]:
+            logger.info(f"アクター一覧の取得を開始: limit={limit}")
+            page = await use_case.execute(limit, cursor)
+            actors = page.items
+            logger.info(f"アクターを {len(actors)} 件取得しました")
+            actors_responses = [actor_to_response(actor) for actor in actors]
+            response = ActorsListResponse(actors=actors_responses, next_cursor=page.next_cursor)
+            body = response.model_dump_json().encode("utf-8")
+            return compute_etag(body), body
+
+        # 一覧キャッシュには書き込みがあるまでシリアライズ済みの JSON と ETag を保持する
+        if settings.list_cache_enabled:
+            etag, body = await actor_list_cache.get_or_load((limit, cursor), load_page)
+        else:
+            etag, body = await load_page()
+        return conditional_json_response(body, etag, if_none_match)
+    except ValidationError as e:
+        logger.warning(f"アクター一覧取得の検証エラー: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"アクターの取得中にエラーが発生: {str(e)}", exc_info=True)
         raise DatabaseError(f"アクターの取得中にエラーが発生しました: {str(e)}") from e
 
 
+@router.get("/search", response_model=ActorsListResponse, status_code=status.HTTP_200_OK)
+async def search_actors(
+    q: str = Query(..., min_length=1, max_length=settings.api_search_max_length),
+    limit: int = Query(settings.api_page_default_limit, ge=1, le=settings.api_page_max_limit),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    姓名でアクターを全文検索するエンドポイント（関連度の高い順）
+
+    MySQL は FULLTEXT インデックス（ngram パーサー）、DynamoDB はプロセス内の検索インデックスで
+    検索する。結果は一覧と同じく一覧キャッシュに保持し、If-None-Match が ETag に一致する場合は 304 を返す。
+
+    Args:
+        q: 検索語
+        limit: 1 ページあたりの最大件数
+        cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は省略
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
+        repository: Actor リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        ActorsListResponse: アクターのリストと次のページのカーソル
+
+    Raises:
+        HTTPException: 検索語や cursor が不正な場合、全文検索を利用できない場合、
+            またはデータベース操作に失敗した場合
+    """
+    try:
+        use_case = AsyncSearchActorsUseCase(repository)
+
+        async def load_page() -> Tuple[str, bytes]:
+            logger.info(f"アクターの検索を開始: q={q!r}, limit={limit}")
+            page = await use_case.execute(q, limit, cursor)
+            logger.info(f"アクターを {len(page.items)} 件検索しました")
+            response = ActorsListResponse(
+                actors=[actor_to_response(actor) for actor in page.items],
+                next_cursor=page.next_cursor
+            )
+            body = response.model_dump_json().encode("utf-8")
+            return compute_etag(body), body
+
+        if settings.list_cache_enabled:
+            etag, body = await actor_list_cache.get_or_load(("search", q, limit, cursor), load_page)
+        else:
+            etag, body = await load_page()
+        return conditional_json_response(body, etag, if_none_match)
+    except ValidationError as e:
+        logger.warning(f"アクター検索の検証エラー: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"アクターの検索中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"アクターの検索中にエラーが発生しました: {str(e)}") from e
+
+
+@router.get("/suggest", response_model=ActorSuggestionsResponse, status_code=status.HTTP_200_OK)
+async def suggest_actors(
+    prefix: str = Query(..., min_length=1, max_length=settings.api_search_max_length),
+    limit: int = Query(settings.api_suggest_default_limit, ge=1, le=settings.api_suggest_max_limit),
+    index: Optional[PrefixIndex] = Depends(get_actor_suggest_index),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    入力途中の氏名（「名 姓」または「姓 名」）で始まるアクターを返すエンドポイント（氏名の辞書順）
+
+    プロセス内のサジェストのインデックスだけを参照し、データベースにはアクセスしない。
+
+    Args:
+        prefix: 入力途中の氏名
+        limit: 返す最大件数
+        index: 氏名のサジェストのインデックス
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        ActorSuggestionsResponse: actor_id と氏名のリスト
+
+    Raises:
+        HTTPException: prefix が空の場合、またはサジェストを利用できない場合
+    """
+    try:
+        suggestions = SuggestActorsUseCase(index).execute(prefix, limit)
+        return ActorSuggestionsResponse(
+            suggestions=[ActorSuggestion(actor_id=s.doc_id, name=s.value) for s in suggestions]
+        )
+    except ValidationError as e:
+        logger.warning(f"アクターサジェストの検証エラー: {str(e)}")
+        raise
+
+
 @router.post("", response_model=ActorResponse, status_code=status.HTTP_201_CREATED)
 async def create_actor(
     request: ActorRequest,
-    repository: ActorRepository = Depends(get_actor_repository),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -79,19 +233,13 @@ async def create_actor(
     """
     try:
         logger.info(f"アクターの作成を開始: {request.first_name} {request.last_name}")
-        use_case = CreateActorUseCase(repository)
-        actor = use_case.execute(
+        use_case = AsyncCreateActorUseCase(repository)
+        actor = await use_case.execute(
             first_name=request.first_name,
             last_name=request.last_name
         )
         logger.info(f"アクターを作成しました: ID={actor.actor_id}")
-        return ActorResponse(
-            actor_id=actor.actor_id,
-            first_name=actor.first_name,
-            last_name=actor.last_name,
-            last_update=actor.last_update.isoformat(),
-            delete_flag=actor.delete_flag
-        )
+        return actor_to_response(actor)
     except ValidationError as e:
         logger.warning(f"アクター作成の検証エラー: {str(e)}")
         raise
@@ -100,38 +248,137 @@ async def create_actor(
         raise DatabaseError(f"アクターの作成中にエラーが発生しました: {str(e)}") from e
 
 
-@router.get("/{actor_id}", response_model=ActorResponse, status_code=status.HTTP_200_OK)
+@router.post(":batch", response_model=ActorsBatchResponse, status_code=status.HTTP_200_OK)
+async def create_actors_batch(
+    request: ActorsBatchRequest,
+    repository: AsyncActorRepository = Depends(get_actor_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    複数のアクターをまとめて作成するエンドポイント
+
+    各要素を POST /api/actors と同じ規則で検証し、検証に通ったものだけを
+    1 回の一括書き込み（MySQL は複数行 INSERT、DynamoDB は BatchWriteItem）で作成する。
+    結果は要素ごとに status（201 / 400）で返す。
+
+    Args:
+        request: アクター一括作成リクエスト（最大 API_BATCH_MAX_ITEMS 件）
+        repository: Actor リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        ActorsBatchResponse: リクエストと同じ順序の要素ごとの結果
+
+    Raises:
+        HTTPException: 件数が不正な場合またはデータベース操作に失敗した場合
+    """
+    if not request.actors or len(request.actors) > settings.api_batch_max_items:
+        raise ValidationError(f"actors には 1 件以上 {settings.api_batch_max_items} 件以下を指定してください")
+    try:
+        logger.info(f"アクターの一括作成を開始: {len(request.actors)} 件")
+        use_case = AsyncCreateActorUseCase(repository)
+        results = await use_case.execute_many([actor.model_dump(exclude={"version"}) for actor in request.actors])
+        items = [
+            ActorBatchResult(index=index, status=status.HTTP_201_CREATED, actor=actor_to_response(result))
+            if isinstance(result, Actor)
+            else ActorBatchResult(index=index, status=status.HTTP_400_BAD_REQUEST, error=str(result))
+            for index, result in enumerate(results)
+        ]
+        created = sum(1 for item in items if item.actor is not None)
+        logger.info(f"アクターを一括作成しました: 作成 {created} 件, 検証エラー {len(items) - created} 件")
+        return ActorsBatchResponse(results=items, created=created, failed=len(items) - created)
+    except Exception as e:
+        logger.error(f"アクターの一括作成中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"アクターの一括作成中にエラーが発生しました: {str(e)}") from e
+
+
+@router.post(":batchGet", response_model=ActorsBatchGetResponse, status_code=status.HTTP_200_OK)
+async def get_actors_batch(
+    request: ActorsBatchGetRequest,
+    repository: AsyncActorRepository = Depends(get_actor_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    指定された複数の ID のアクターをまとめて取得するエンドポイント
+
+    MySQL は 1 回の IN 検索、DynamoDB は BatchGetItem で取得し、
+    詳細取得のキャッシュにある ID はデータベースにアクセスしない。
+
+    Args:
+        request: アクター一括取得リクエスト（最大 API_BATCH_MAX_ITEMS 件）
+        repository: Actor リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        ActorsBatchGetResponse: リクエストの順序に並べたアクターと見つからなかった ID
+
+    Raises:
+        HTTPException: 件数が不正な場合またはデータベース操作に失敗した場合
+    """
+    if not request.actor_ids or len(request.actor_ids) > settings.api_batch_max_items:
+        raise ValidationError(f"actor_ids には 1 件以上 {settings.api_batch_max_items} 件以下を指定してください")
+    try:
+        logger.info(f"アクターの一括取得を開始: {len(request.actor_ids)} 件")
+        use_case = AsyncGetActorByIdUseCase(repository)
+        actors = await use_case.execute_many(request.actor_ids)
+        found_ids = {actor.actor_id for actor in actors}
+        not_found = [actor_id for actor_id in dict.fromkeys(request.actor_ids) if actor_id not in found_ids]
+        logger.info(f"アクターを一括取得しました: {len(actors)} 件, 見つからない ID {len(not_found)} 件")
+        return ActorsBatchGetResponse(actors=[actor_to_response(actor) for actor in actors], not_found=not_found)
+    except Exception as e:
+        logger.error(f"アクターの一括取得中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"アクターの一括取得中にエラーが発生しました: {str(e)}") from e
+
+
+@router.get("/{actor_id}", response_model=ActorWithFilmsResponse, status_code=status.HTTP_200_OK)
 async def get_actor(
     actor_id: str,
-    repository: ActorRepository = Depends(get_actor_repository),
+    expand: Optional[Literal["films"]] = Query(None, description="films を指定すると出演作を展開する"),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
+    cast_repository: AsyncCastRepository = Depends(get_cast_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
     指定された ID のアクターを取得するエンドポイント
 
+    expand=films の場合はアクターと出演作を並行して取得し、出演作を films に展開する
+    （出演作は 1 回のクエリでまとめて読み出す。get_film の expand=actors と同じ）。
+
     Args:
         actor_id: アクター ID
+        expand: 展開する関連（films のみ）
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
         repository: Actor リポジトリ
+        cast_repository: Cast リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        ActorResponse: アクター情報
+        ActorWithFilmsResponse: アクター情報（ETag 付き。If-None-Match が一致する場合は 304）。
+            expand を指定しない場合 films は null。展開時の ETag はレスポンス本文から計算する
 
     Raises:
         HTTPException: アクターが見つからない場合またはデータベース操作に失敗した場合
     """
     try:
-        logger.info(f"アクターの取得を開始: ID={actor_id}")
-        use_case = GetActorByIdUseCase(repository)
-        actor = use_case.execute(actor_id)
+        logger.info(f"アクターの取得を開始: ID={actor_id}, expand={expand}")
+        use_case = AsyncGetActorByIdUseCase(repository)
+        if expand == "films":
+            actor, films = await asyncio.gather(
+                use_case.execute(actor_id),
+                AsyncGetActorFilmsUseCase(cast_repository).execute(actor_id)
+            )
+            logger.info(f"アクターを取得しました: ID={actor_id}, 出演作={len(films)}件")
+            response = ActorWithFilmsResponse(
+                **actor_to_response(actor).model_dump(),
+                films=[film_to_response(film) for film in films]
+            )
+            body = response.model_dump_json().encode("utf-8")
+            return conditional_json_response(body, compute_etag(body), if_none_match)
+        actor = await use_case.execute(actor_id)
         logger.info(f"アクターを取得しました: ID={actor_id}")
-        return ActorResponse(
-            actor_id=str(actor.actor_id),
-            first_name=actor.first_name,
-            last_name=actor.last_name,
-            last_update=actor.last_update.isoformat(),
-            delete_flag=actor.delete_flag
-        )
+        body = actor_to_response(actor).model_dump_json().encode("utf-8")
+        return conditional_json_response(body, version_etag(actor.version), if_none_match)
     except NotFoundError as e:
         logger.warning(f"アクターが見つかりません: ID={actor_id}")
         raise
@@ -144,46 +391,56 @@ async def get_actor(
 async def update_actor(
     actor_id: str,
     request: ActorRequest,
-    repository: ActorRepository = Depends(get_actor_repository),
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
-    アクターを更新するエンドポイント
+    アクターを更新するエンドポイント（楽観的ロック）
+
+    If-Match ヘッダー（GET で返された ETag）またはリクエストの version を条件に更新し、
+    他の更新で変更されていた場合は 409 を返す。どちらも省略した場合は現在のバージョンを条件にする。
 
     Args:
         actor_id: アクター ID
         request: アクター更新リクエスト
+        response: 更新後の ETag を設定するレスポンス
+        if_match: If-Match ヘッダー（更新の条件にするバージョンの ETag）
         repository: Actor リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        ActorResponse: 更新されたアクター
+        ActorResponse: 更新されたアクター（更新後のバージョンの ETag 付き）
 
     Raises:
-        HTTPException: 検証エラー、アクターが見つからない場合、またはデータベース操作に失敗した場合
+        HTTPException: 検証エラー、アクターが見つからない場合、バージョンが競合した場合、
+            またはデータベース操作に失敗した場合
     """
     try:
         logger.info(f"アクターの更新を開始: ID={actor_id}")
-        use_case = UpdateActorUseCase(repository)
-        actor = use_case.execute(
+        expected_version = parse_if_match(if_match)
+        if expected_version is None:
+            expected_version = request.version
+        use_case = AsyncUpdateActorUseCase(repository)
+        actor = await use_case.execute(
             actor_id=actor_id,
             first_name=request.first_name,
-            last_name=request.last_name
-        )
-        logger.info(f"アクターを更新しました: ID={actor_id}")
-        return ActorResponse(
-            actor_id=actor.actor_id,
-            first_name=actor.first_name,
-            last_name=actor.last_name,
-            last_update=actor.last_update.isoformat(),
-            delete_flag=actor.delete_flag
+            last_name=request.last_name,
+            expected_version=expected_version
         )
+        logger.info(f"アクターを更新しました: ID={actor_id}, version={actor.version}")
+        response.headers["ETag"] = version_etag(actor.version)
+        return actor_to_response(actor)
     except ValidationError as e:
         logger.warning(f"アクター更新の検証エラー: ID={actor_id}, {str(e)}")
         raise
     except NotFoundError as e:
         logger.warning(f"アクターが見つかりません: ID={actor_id}")
         raise
+    except ConflictError as e:
+        logger.warning(f"アクター更新の競合: ID={actor_id}, {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"アクターの更新中にエラーが発生: ID={actor_id}, {str(e)}", exc_info=True)
         raise DatabaseError(f"アクターの更新中にエラーが発生しました: {str(e)}") from e
@@ -192,7 +449,7 @@ async def update_actor(
 @router.delete("/{actor_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_actor(
     actor_id: str,
-    repository: ActorRepository = Depends(get_actor_repository),
+    repository: AsyncActorRepository = Depends(get_actor_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -208,8 +465,8 @@ async def delete_actor(
     """
     try:
         logger.info(f"アクターの削除を開始: ID={actor_id}")
-        use_case = DeleteActorUseCase(repository)
-        use_case.execute(actor_id)
+        use_case = AsyncDeleteActorUseCase(repository)
+        await use_case.execute(actor_id)
         logger.info(f"アクターを削除しました: ID={actor_id}")
     except NotFoundError as e:
         logger.warning(f"アクターが見つかりません: ID={actor_id}")
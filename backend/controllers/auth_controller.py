@@ -1,10 +1,12 @@
 """認証コントローラー"""
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi.concurrency import run_in_threadpool
 
 from backend.services.auth_service import AuthService
 from backend.services.auth_middleware import get_auth_service
-from backend.exceptions import AuthenticationError
+from backend.config.settings import settings
+from backend.exceptions import AuthenticationError, AuthServiceUnavailableError
 from backend.schemas.auth_schemas import (
     LoginRequest,
     LoginResponse,
@@ -45,7 +47,7 @@ async def login(
     """
     logger.info(f"ログイン試行: username={request.username}")
     try:
-        tokens = auth_service.authenticate(request.username, request.password)
+        tokens = await run_in_threadpool(auth_service.authenticate, request.username, request.password)
         logger.info(f"ログイン成功: username={request.username}")
         return LoginResponse(**tokens)
     except AuthenticationError as e:
@@ -81,7 +83,7 @@ async def get_user_info(
         UserInfoResponse: ユーザー情報
 
     Raises:
-        HTTPException: トークンが無効な場合
+        HTTPException: トークンが無効な場合、または Cognito に一時的に問い合わせできない場合（503）
     """
     logger.info("ユーザー情報取得リクエスト")
     try:
@@ -94,7 +96,8 @@ async def get_user_info(
             )
 
         token = authorization.replace("Bearer ", "")
-        user_info = auth_service.validate_token(token)
+        # email などのプロフィール属性が必要なため GetUser を使用する
+        user_info = await run_in_threadpool(auth_service.get_user_info, token)
 
         username = user_info.get("username", "")
         logger.info(f"ユーザー情報取得成功: username={username}")
@@ -112,6 +115,13 @@ async def get_user_info(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e)
         ) from e
+    except AuthServiceUnavailableError as e:
+        logger.warning(f"Cognito に問い合わせできません: error={str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="認証サービスに一時的に接続できません。しばらくしてから再試行してください",
+            headers={"Retry-After": str(settings.auth_unavailable_retry_after)}
+        ) from e
     except Exception as e:
         logger.error(
             f"ユーザー情報取得エラー: error={str(e)}",
@@ -144,7 +154,7 @@ async def forgot_password(
     """
     logger.info(f"パスワードリセット要求: username={request.username}")
     try:
-        result = auth_service.forgot_password(request.username)
+        result = await run_in_threadpool(auth_service.forgot_password, request.username)
         logger.info(f"パスワードリセットコード送信成功: username={request.username}")
         return ForgotPasswordResponse(**result)
     except AuthenticationError as e:
@@ -187,7 +197,8 @@ async def confirm_forgot_password(
     """
     logger.info(f"パスワードリセット確認: username={request.username}")
     try:
-        result = auth_service.confirm_forgot_password(
+        result = await run_in_threadpool(
+            auth_service.confirm_forgot_password,
             request.username,
             request.confirmation_code,
             request.new_password
@@ -234,7 +245,8 @@ async def confirm_sign_up(
     """
     logger.info(f"ユーザー確認: username={request.username}")
     try:
-        result = auth_service.confirm_sign_up(
+        result = await run_in_threadpool(
+            auth_service.confirm_sign_up,
             request.username,
             request.confirmation_code
         )
@@ -280,7 +292,7 @@ async def resend_confirmation_code(
     """
     logger.info(f"確認コード再送信要求: username={request.username}")
     try:
-        result = auth_service.resend_confirmation_code(request.username)
+        result = await run_in_threadpool(auth_service.resend_confirmation_code, request.username)
         logger.info(f"確認コード再送信成功: username={request.username}")
         return ResendConfirmationCodeResponse(**result)
     except AuthenticationError as e:
@@ -1,44 +1,275 @@
 """依存性注入の設定"""
-from backend.repositories.film_repository import FilmRepository
-from backend.repositories.actor_repository import ActorRepository
+from typing import Optional, Tuple
+from fastapi import FastAPI, Request
+
+from backend.cache import LRUTTLCache, SingleFlight, VersionedCache
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
 from backend.repositories.dynamodb_film_repository import DynamoDBFilmRepository
 from backend.repositories.dynamodb_actor_repository import DynamoDBActorRepository
+from backend.repositories.dynamodb_async_film_repository import DynamoDBAsyncFilmRepository
+from backend.repositories.dynamodb_async_actor_repository import DynamoDBAsyncActorRepository
+from backend.repositories.dynamodb_cast_repository import DynamoDBCastRepository
+from backend.repositories.dynamodb_async_cast_repository import DynamoDBAsyncCastRepository
 from backend.repositories.mysql_film_repository import MySQLFilmRepository
 from backend.repositories.mysql_actor_repository import MySQLActorRepository
+from backend.repositories.mysql_async_film_repository import MySQLAsyncFilmRepository
+from backend.repositories.mysql_async_actor_repository import MySQLAsyncActorRepository
+from backend.repositories.mysql_cast_repository import MySQLCastRepository
+from backend.repositories.mysql_async_cast_repository import MySQLAsyncCastRepository
+from backend.repositories.threadpool_film_repository import ThreadPoolFilmRepository
+from backend.repositories.threadpool_actor_repository import ThreadPoolActorRepository
+from backend.repositories.threadpool_cast_repository import ThreadPoolCastRepository
+from backend.repositories.cached_film_repository import CachedFilmRepository
+from backend.repositories.cached_actor_repository import CachedActorRepository
+from backend.repositories.search_indexed_film_repository import FILM_SEARCH_FIELDS, SearchIndexedFilmRepository
+from backend.repositories.search_indexed_actor_repository import ACTOR_SEARCH_FIELDS, SearchIndexedActorRepository
+from backend.search import InvertedIndex, PrefixIndex
 from backend.config.settings import settings
 
 
-def get_film_repository() -> FilmRepository:
+# プロセス内で共有するエンティティキャッシュ（どのデータベースタイプでも共通）
+film_cache: LRUTTLCache[Film] = LRUTTLCache(
+    max_entries=settings.entity_cache_max_entries,
+    ttl_seconds=settings.entity_cache_ttl,
+    max_bytes=settings.entity_cache_max_bytes,
+)
+actor_cache: LRUTTLCache[Actor] = LRUTTLCache(
+    max_entries=settings.entity_cache_max_entries,
+    ttl_seconds=settings.entity_cache_ttl,
+    max_bytes=settings.entity_cache_max_bytes,
+)
+
+# プロセス内で共有する一覧キャッシュ（書き込みのたびに世代番号を進めて無効化する）
+film_list_cache = VersionedCache(
+    max_entries=settings.list_cache_max_entries,
+    ttl_seconds=settings.list_cache_ttl,
+    max_bytes=settings.list_cache_max_bytes,
+)
+actor_list_cache = VersionedCache(
+    max_entries=settings.list_cache_max_entries,
+    ttl_seconds=settings.list_cache_ttl,
+    max_bytes=settings.list_cache_max_bytes,
+)
+
+# 同じ ID への同時の get_by_id を 1 回の読み込みにまとめる
+film_single_flight = SingleFlight()
+actor_single_flight = SingleFlight()
+
+# DynamoDB の全文検索に使うプロセス内の検索インデックス（起動時に rebuild_search_indexes で作成する）
+film_search_index = InvertedIndex(
+    FILM_SEARCH_FIELDS,
+    max_prefix_expansions=settings.search_index_max_prefix_expansions,
+)
+actor_search_index = InvertedIndex(
+    ACTOR_SEARCH_FIELDS,
+    max_prefix_expansions=settings.search_index_max_prefix_expansions,
+)
+
+
+# タイトル・氏名の入力補完に使うプロセス内のサジェストのインデックス（どのデータベースタイプでも共通）
+film_suggest_index = PrefixIndex()
+actor_suggest_index = PrefixIndex()
+
+
+def search_index_enabled() -> bool:
+    """検索インデックスを使う場合 True（DynamoDB で SEARCH_INDEX_ENABLED の場合）"""
+    return settings.search_index_enabled and settings.database_type in ("dynamodb", "dynamodb_async")
+
+
+def suggest_enabled() -> bool:
+    """サジェストのインデックスを使う場合 True（SUGGEST_ENABLED の場合）"""
+    return settings.suggest_enabled
+
+
+def in_process_indexes_enabled() -> bool:
+    """検索インデックス・サジェストのインデックスのどちらかを使う場合 True"""
+    return search_index_enabled() or suggest_enabled()
+
+
+def _search_indexed_film_repository(repository: AsyncFilmRepository) -> SearchIndexedFilmRepository:
+    """repository を有効なインプロセスのインデックスを保守するデコレーターで包む"""
+    return SearchIndexedFilmRepository(
+        repository,
+        index=film_search_index if search_index_enabled() else None,
+        prefix_index=film_suggest_index if suggest_enabled() else None
+    )
+
+
+def _search_indexed_actor_repository(repository: AsyncActorRepository) -> SearchIndexedActorRepository:
+    """repository を有効なインプロセスのインデックスを保守するデコレーターで包む"""
+    return SearchIndexedActorRepository(
+        repository,
+        index=actor_search_index if search_index_enabled() else None,
+        prefix_index=actor_suggest_index if suggest_enabled() else None
+    )
+
+
+def _film_repository(app: FastAPI) -> AsyncFilmRepository:
+    """
+    DATABASE_TYPE の Film リポジトリを作成する（デコレーターで包む前のもの）
+
+    Raises:
+        ValueError: サポートされていないデータベースタイプの場合
+    """
+    if settings.database_type == "dynamodb":
+        return ThreadPoolFilmRepository(DynamoDBFilmRepository(app.state.dynamodb))
+    if settings.database_type == "mysql":
+        return ThreadPoolFilmRepository(MySQLFilmRepository(app.state.mysql_engine))
+    if settings.database_type == "mysql_async":
+        return MySQLAsyncFilmRepository(app.state.mysql_async_engine)
+    if settings.database_type == "dynamodb_async":
+        return DynamoDBAsyncFilmRepository(app.state.dynamodb_async)
+    raise ValueError(f"Unsupported database type: {settings.database_type}")
+
+
+def _actor_repository(app: FastAPI) -> AsyncActorRepository:
+    """
+    DATABASE_TYPE の Actor リポジトリを作成する（デコレーターで包む前のもの）
+
+    Raises:
+        ValueError: サポートされていないデータベースタイプの場合
+    """
+    if settings.database_type == "dynamodb":
+        return ThreadPoolActorRepository(DynamoDBActorRepository(app.state.dynamodb))
+    if settings.database_type == "mysql":
+        return ThreadPoolActorRepository(MySQLActorRepository(app.state.mysql_engine))
+    if settings.database_type == "mysql_async":
+        return MySQLAsyncActorRepository(app.state.mysql_async_engine)
+    if settings.database_type == "dynamodb_async":
+        return DynamoDBAsyncActorRepository(app.state.dynamodb_async)
+    raise ValueError(f"Unsupported database type: {settings.database_type}")
+
+
+async def rebuild_search_indexes(app: FastAPI) -> Tuple[int, int]:
+    """
+    Films / Actors テーブルをページ単位で読み出して、有効な検索インデックス・サジェストのインデックスを作り直す
+
+    検索結果が変わるため、一覧キャッシュ（検索結果を含む）の世代番号も進める。
+
+    Args:
+        app: データベース接続を app.state に持つアプリケーション
+
+    Returns:
+        索引付けした (Film の件数, Actor の件数)
+
+    Raises:
+        Exception: データベース操作に失敗した場合
+    """
+    films = await _search_indexed_film_repository(_film_repository(app)).rebuild()
+    actors = await _search_indexed_actor_repository(_actor_repository(app)).rebuild()
+    film_list_cache.bump()
+    actor_list_cache.bump()
+    return films, actors
+
+
+def get_film_suggest_index() -> Optional[PrefixIndex]:
+    """映画タイトルのサジェストのインデックスを返す（SUGGEST_ENABLED が無効の場合は None）"""
+    return film_suggest_index if suggest_enabled() else None
+
+
+def get_actor_suggest_index() -> Optional[PrefixIndex]:
+    """アクター氏名のサジェストのインデックスを返す（SUGGEST_ENABLED が無効の場合は None）"""
+    return actor_suggest_index if suggest_enabled() else None
+
+
+async def get_film_repository(request: Request) -> AsyncFilmRepository:
     """
     環境変数に基づいて適切な Film リポジトリを返す
 
+    同期リポジトリ（dynamodb / mysql）はスレッドプールで実行するアダプターで
+    ラップし、mysql_async / dynamodb_async の場合はネイティブな非同期リポジトリを返す。
+    ENTITY_CACHE_ENABLED / LIST_CACHE_ENABLED / SINGLE_FLIGHT_ENABLED の場合は、
+    キャッシュの読み込み・同時読み込みのまとめ込みと書き込み時の無効化を行う
+    デコレーターで包む。DynamoDB で SEARCH_INDEX_ENABLED の場合・SUGGEST_ENABLED の場合は、
+    書き込みを検索インデックス・サジェストのインデックスに反映する（検索インデックスでは全文検索も
+    行う）デコレーターでさらに包む。
+
+    Args:
+        request: 現在のリクエスト（アプリケーション共有リソースの取得に使用）
+
     Returns:
-        FilmRepository: DynamoDB または MySQL の Film リポジトリ
+        AsyncFilmRepository: DynamoDB または MySQL の Film リポジトリ
 
     Raises:
         ValueError: サポートされていないデータベースタイプの場合
     """
-    if settings.database_type == "dynamodb":
-        return DynamoDBFilmRepository()
-    elif settings.database_type == "mysql":
-        return MySQLFilmRepository()
-    else:
-        raise ValueError(f"Unsupported database type: {settings.database_type}")
+    repository = _film_repository(request.app)
+    if settings.entity_cache_enabled or settings.list_cache_enabled or settings.single_flight_enabled:
+        repository = CachedFilmRepository(
+            repository,
+            cache=film_cache if settings.entity_cache_enabled else None,
+            list_cache=film_list_cache if settings.list_cache_enabled else None,
+            single_flight=film_single_flight if settings.single_flight_enabled else None
+        )
+    if in_process_indexes_enabled():
+        # 検索結果の読み込み（get_many）にもキャッシュが使われるよう一番外側で包む
+        repository = _search_indexed_film_repository(repository)
+    return repository
 
 
-def get_actor_repository() -> ActorRepository:
+async def get_actor_repository(request: Request) -> AsyncActorRepository:
     """
     環境変数に基づいて適切な Actor リポジトリを返す
 
+    同期リポジトリ（dynamodb / mysql）はスレッドプールで実行するアダプターで
+    ラップし、mysql_async / dynamodb_async の場合はネイティブな非同期リポジトリを返す。
+    ENTITY_CACHE_ENABLED / LIST_CACHE_ENABLED / SINGLE_FLIGHT_ENABLED の場合は、
+    キャッシュの読み込み・同時読み込みのまとめ込みと書き込み時の無効化を行う
+    デコレーターで包む。DynamoDB で SEARCH_INDEX_ENABLED の場合・SUGGEST_ENABLED の場合は、
+    書き込みを検索インデックス・サジェストのインデックスに反映する（検索インデックスでは全文検索も
+    行う）デコレーターでさらに包む。
+
+    Args:
+        request: 現在のリクエスト（アプリケーション共有リソースの取得に使用）
+
+    Returns:
+        AsyncActorRepository: DynamoDB または MySQL の Actor リポジトリ
+
+    Raises:
+        ValueError: サポートされていないデータベースタイプの場合
+    """
+    repository = _actor_repository(request.app)
+    if settings.entity_cache_enabled or settings.list_cache_enabled or settings.single_flight_enabled:
+        repository = CachedActorRepository(
+            repository,
+            cache=actor_cache if settings.entity_cache_enabled else None,
+            list_cache=actor_list_cache if settings.list_cache_enabled else None,
+            single_flight=actor_single_flight if settings.single_flight_enabled else None
+        )
+    if in_process_indexes_enabled():
+        # 検索結果の読み込み（get_many）にもキャッシュが使われるよう一番外側で包む
+        repository = _search_indexed_actor_repository(repository)
+    return repository
+
+
+async def get_cast_repository(request: Request) -> AsyncCastRepository:
+    """
+    環境変数に基づいて適切な Cast（映画とアクターの出演関係）リポジトリを返す
+
+    同期リポジトリ（dynamodb / mysql）はスレッドプールで実行するアダプターで
+    ラップし、mysql_async / dynamodb_async の場合はネイティブな非同期リポジトリを返す。
+    出演関係は Film / Actor の書き込みとは別に変わるため、エンティティキャッシュ・一覧キャッシュは使わない。
+
+    Args:
+        request: 現在のリクエスト（アプリケーション共有リソースの取得に使用）
+
     Returns:
-        ActorRepository: DynamoDB または MySQL の Actor リポジトリ
+        AsyncCastRepository: DynamoDB または MySQL の Cast リポジトリ
 
     Raises:
         ValueError: サポートされていないデータベースタイプの場合
     """
+    app = request.app
     if settings.database_type == "dynamodb":
-        return DynamoDBActorRepository()
-    elif settings.database_type == "mysql":
-        return MySQLActorRepository()
-    else:
-        raise ValueError(f"Unsupported database type: {settings.database_type}")
+        return ThreadPoolCastRepository(DynamoDBCastRepository(app.state.dynamodb))
+    if settings.database_type == "mysql":
+        return ThreadPoolCastRepository(MySQLCastRepository(app.state.mysql_engine))
+    if settings.database_type == "mysql_async":
+        return MySQLAsyncCastRepository(app.state.mysql_async_engine)
+    if settings.database_type == "dynamodb_async":
+        return DynamoDBAsyncCastRepository(app.state.dynamodb_async)
+    raise ValueError(f"Unsupported database type: {settings.database_type}")
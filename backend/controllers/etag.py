@@ -0,0 +1,108 @@
+"""ETag による条件付きリクエスト（If-None-Match / 304 Not Modified、If-Match による楽観的ロック）"""
+import hashlib
+import re
+from typing import Optional
+from fastapi import Response, status
+
+from backend.exceptions import ValidationError
+
+# version_etag が返す ETag の形式
+_VERSION_ETAG = re.compile(r'^"v(\d+)"$')
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    シリアライズ済みのレスポンスボディから強い ETag を計算する
+
+    ボディのバイト列が同じであれば、どのプロセスで計算しても同じ値になる。
+
+    Args:
+        body: JSON にシリアライズしたレスポンスボディ
+
+    Returns:
+        ダブルクォートで囲んだ ETag
+    """
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def version_etag(version: int) -> str:
+    """
+    エンティティのバージョンから強い ETag を作る
+
+    エンティティの表現は作成・更新・削除のたびに version が増えるときにだけ変わるため、
+    ボディをハッシュしなくても version で同一性を判定できる。If-Match で送り返された
+    値は parse_if_match でバージョンに戻す。
+
+    Args:
+        version: エンティティのバージョン
+
+    Returns:
+        ダブルクォートで囲んだ ETag（'"v3"' など）
+    """
+    return f'"v{version}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    If-Match ヘッダーから更新の条件にするバージョンを取り出す
+
+    Args:
+        if_match: If-Match ヘッダーの値（version_etag の形式）
+
+    Returns:
+        バージョン。ヘッダーがない場合と "*" の場合は None
+
+    Raises:
+        ValidationError: version_etag の形式ではない場合（弱い ETag を含む）
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    match = _VERSION_ETAG.match(if_match.strip())
+    if match is None:
+        raise ValidationError("If-Match must be an ETag returned by this API (e.g. \"v3\")")
+    return int(match.group(1))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match ヘッダーが ETag に一致するかを判定する
+
+    RFC 9110 に従い、If-None-Match は弱い比較（W/ の有無を無視）で判定する。
+
+    Args:
+        if_none_match: If-None-Match ヘッダーの値
+        etag: 現在のリソースの ETag
+
+    Returns:
+        一致する場合（または "*" の場合）True
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_json_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """
+    ETag 付きの JSON レスポンスを返す。If-None-Match が一致する場合は 304 を返す
+
+    認証付きのレスポンスのため共有キャッシュには保存させず、
+    クライアントには毎回 ETag で再検証させる（private, no-cache）。
+
+    Args:
+        body: JSON にシリアライズしたレスポンスボディ
+        etag: compute_etag または version_etag で作った ETag
+        if_none_match: If-None-Match ヘッダーの値
+
+    Returns:
+        Response: 200（ボディあり）または 304（ボディなし）
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,73 +1,240 @@
 """Film コントローラー"""
+import asyncio
 import logging
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, status
+from typing import Dict, Any, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 
-from backend.repositories.film_repository import FilmRepository
-from backend.controllers.dependencies import get_film_repository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.controllers.dependencies import (
+    film_list_cache,
+    get_actor_repository,
+    get_cast_repository,
+    get_film_repository,
+    get_film_suggest_index
+)
+from backend.controllers.etag import (
+    compute_etag,
+    conditional_json_response,
+    parse_if_match,
+    version_etag
+)
+from backend.controllers.ndjson import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
+from backend.controllers.responses import actor_to_response, film_to_response
+from backend.entities.film import Film
+from backend.entities.rating import Rating
+from backend.repositories.film_query import FilmQuery, FilmSort, SortOrder
 from backend.services.auth_middleware import get_current_user
-from backend.use_cases.create_film_use_case import CreateFilmUseCase
-from backend.use_cases.get_films_use_case import GetFilmsUseCase
-from backend.use_cases.get_film_by_id_use_case import GetFilmByIdUseCase
-from backend.use_cases.update_film_use_case import UpdateFilmUseCase
-from backend.use_cases.delete_film_use_case import DeleteFilmUseCase
-from backend.exceptions import ValidationError, NotFoundError, DatabaseError
+from backend.use_cases.create_film_use_case import AsyncCreateFilmUseCase
+from backend.use_cases.get_films_use_case import AsyncGetFilmsUseCase
+from backend.use_cases.get_film_by_id_use_case import AsyncGetFilmByIdUseCase
+from backend.use_cases.update_film_use_case import AsyncUpdateFilmUseCase
+from backend.use_cases.delete_film_use_case import AsyncDeleteFilmUseCase
+from backend.use_cases.search_films_use_case import AsyncSearchFilmsUseCase
+from backend.use_cases.suggest_films_use_case import SuggestFilmsUseCase
+from backend.use_cases.get_film_actors_use_case import AsyncGetFilmActorsUseCase
+from backend.use_cases.add_film_actor_use_case import AsyncAddFilmActorUseCase
+from backend.use_cases.remove_film_actor_use_case import AsyncRemoveFilmActorUseCase
+from backend.search import PrefixIndex
+from backend.config.settings import settings
+from backend.exceptions import ValidationError, NotFoundError, ConflictError, DatabaseError
+from backend.schemas.cast_schemas import FilmWithActorsResponse
 from backend.schemas.film_schemas import (
+    FilmBatchResult,
     FilmRequest,
     FilmResponse,
-    FilmsListResponse
+    FilmsBatchGetRequest,
+    FilmsBatchGetResponse,
+    FilmsBatchRequest,
+    FilmsBatchResponse,
+    FilmsListResponse,
+    FilmSuggestion,
+    FilmSuggestionsResponse
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/films", tags=["films"])
 
 
-@router.get("", response_model=FilmsListResponse, status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=FilmsListResponse,
+    status_code=status.HTTP_200_OK,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+)
 async def get_films(
-    repository: FilmRepository = Depends(get_film_repository),
+    limit: int = Query(settings.api_page_default_limit, ge=1, le=settings.api_page_max_limit),
+    cursor: Optional[str] = Query(None),
+    rating: Optional[Rating] = Query(None),
+    year_from: Optional[int] = Query(None, ge=1800, le=2100),
+    year_to: Optional[int] = Query(None, ge=1800, le=2100),
+    sort: FilmSort = Query(FilmSort.LAST_UPDATE),
+    order: Optional[SortOrder] = Query(None),
+    stream: bool = Query(False),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
-    全映画を取得するエンドポイント
+    映画を絞り込み・並び替えて 1 ページ分取得するエンドポイント（既定は last_update の降順）
+
+    絞り込みと並び替えはデータベース側（MySQL は複合インデックス、DynamoDB は GSI）で行う。
+    cursor は同じ絞り込み・並び替え条件の前のページで返されたものに限る。
+
+    ?stream=true または Accept: application/x-ndjson の場合は、limit / cursor を
+    無視して全件を 1 行 1 件の JSON（NDJSON）として逐次返す。
+    通常の一覧は、次の書き込みまでシリアライズ済みの結果と ETag を一覧キャッシュから返す。
+    If-None-Match が ETag に一致する場合は 304 を返す（キャッシュヒット時は DB にアクセスしない）。
 
     Args:
+        limit: 1 ページあたりの最大件数
+        cursor: 前のページで返された next_cursor。先頭ページの場合は省略
+        rating: このレーティングの映画だけを返す
+        year_from: 公開年の下限（含む）。指定した場合、公開年のない映画は含まれない
+        year_to: 公開年の上限（含む）。指定した場合、公開年のない映画は含まれない
+        sort: 並び替えの基準（last_update / title / release_year）
+        order: 並び順の方向（asc / desc。省略時は title は昇順、それ以外は降順）
+        stream: True の場合は条件に合う全件を NDJSON でストリーミングする
+        accept: Accept ヘッダー（application/x-ndjson でストリーミング）
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
         repository: Film リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        FilmsListResponse: 映画のリスト
+        FilmsListResponse: 映画のリストと次のページのカーソル
+        （ストリーミング時は StreamingResponse）
 
     Raises:
-        HTTPException: データベース操作に失敗した場合
+        HTTPException: cursor や絞り込み条件が不正な場合またはデータベース操作に失敗した場合
     """
     try:
-        logger.info("全映画の取得を開始")
-        use_case = GetFilmsUseCase(repository)
-        films = use_case.execute()
-        logger.info(f"映画を {len(films)} 件取得しました")
-        film_responses = [
-            FilmResponse(
-                film_id=str(film.film_id),
-                title=film.title,
-                rating=film.rating,
-                description=film.description,
-                image_path=film.image_path,
-                release_year=film.release_year,
-                last_update=film.last_update.isoformat(),
-                delete_flag=film.delete_flag
-            )
-            for film in films
-        ]
-        return FilmsListResponse(films=film_responses)
+        query = FilmQuery(rating=rating, year_from=year_from, year_to=year_to, sort=sort, order=order)
+        use_case = AsyncGetFilmsUseCase(repository)
+        if wants_ndjson(stream, accept):
+            logger.info(f"映画一覧のストリーミング出力を開始: {query}")
+            return await ndjson_response(use_case.stream(query), film_to_response)
+
+        async def load_page() -> Tuple[str, bytes]:
+            logger.info(f"映画一覧の取得を開始: limit={limit}, {query}")
+            page = await use_case.execute(limit, cursor, query)
+            films = page.items
+            logger.info(f"映画を {len(films)} 件取得しました")
+            film_responses = [film_to_response(film) for film in films]
+            response = FilmsListResponse(films=film_responses, next_cursor=page.next_cursor)
+            body = response.model_dump_json().encode("utf-8")
+            return compute_etag(body), body
+
+        # 一覧キャッシュには書き込みがあるまでシリアライズ済みの JSON と ETag を保持する
+        if settings.list_cache_enabled:
+            etag, body = await film_list_cache.get_or_load((limit, cursor, query), load_page)
+        else:
+            etag, body = await load_page()
+        return conditional_json_response(body, etag, if_none_match)
+    except ValidationError as e:
+        logger.warning(f"映画一覧取得の検証エラー: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"映画の取得中にエラーが発生: {str(e)}", exc_info=True)
         raise DatabaseError(f"映画の取得中にエラーが発生しました: {str(e)}") from e
 
 
+@router.get("/search", response_model=FilmsListResponse, status_code=status.HTTP_200_OK)
+async def search_films(
+    q: str = Query(..., min_length=1, max_length=settings.api_search_max_length),
+    limit: int = Query(settings.api_page_default_limit, ge=1, le=settings.api_page_max_limit),
+    cursor: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    タイトルと説明文で映画を全文検索するエンドポイント（関連度の高い順）
+
+    MySQL は FULLTEXT インデックス（ngram パーサー）、DynamoDB はプロセス内の検索インデックスで
+    検索する。結果は一覧と同じく一覧キャッシュに保持し、If-None-Match が ETag に一致する場合は 304 を返す。
+
+    Args:
+        q: 検索語
+        limit: 1 ページあたりの最大件数
+        cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は省略
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
+        repository: Film リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        FilmsListResponse: 映画のリストと次のページのカーソル
+
+    Raises:
+        HTTPException: 検索語や cursor が不正な場合、全文検索を利用できない場合、
+            またはデータベース操作に失敗した場合
+    """
+    try:
+        use_case = AsyncSearchFilmsUseCase(repository)
+
+        async def load_page() -> Tuple[str, bytes]:
+            logger.info(f"映画の検索を開始: q={q!r}, limit={limit}")
+            page = await use_case.execute(q, limit, cursor)
+            logger.info(f"映画を {len(page.items)} 件検索しました")
+            response = FilmsListResponse(
+                films=[film_to_response(film) for film in page.items],
+                next_cursor=page.next_cursor
+            )
+            body = response.model_dump_json().encode("utf-8")
+            return compute_etag(body), body
+
+        if settings.list_cache_enabled:
+            etag, body = await film_list_cache.get_or_load(("search", q, limit, cursor), load_page)
+        else:
+            etag, body = await load_page()
+        return conditional_json_response(body, etag, if_none_match)
+    except ValidationError as e:
+        logger.warning(f"映画検索の検証エラー: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(f"映画の検索中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"映画の検索中にエラーが発生しました: {str(e)}") from e
+
+
+@router.get("/suggest", response_model=FilmSuggestionsResponse, status_code=status.HTTP_200_OK)
+async def suggest_films(
+    prefix: str = Query(..., min_length=1, max_length=settings.api_search_max_length),
+    limit: int = Query(settings.api_suggest_default_limit, ge=1, le=settings.api_suggest_max_limit),
+    index: Optional[PrefixIndex] = Depends(get_film_suggest_index),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    入力途中のタイトルで始まる映画を返すエンドポイント（タイトルの辞書順）
+
+    プロセス内のサジェストのインデックスだけを参照し、データベースにはアクセスしない。
+
+    Args:
+        prefix: 入力途中のタイトル
+        limit: 返す最大件数
+        index: タイトルのサジェストのインデックス
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        FilmSuggestionsResponse: film_id とタイトルのリスト
+
+    Raises:
+        HTTPException: prefix が空の場合、またはサジェストを利用できない場合
+    """
+    try:
+        suggestions = SuggestFilmsUseCase(index).execute(prefix, limit)
+        return FilmSuggestionsResponse(
+            suggestions=[FilmSuggestion(film_id=s.doc_id, title=s.value) for s in suggestions]
+        )
+    except ValidationError as e:
+        logger.warning(f"映画サジェストの検証エラー: {str(e)}")
+        raise
+
+
 @router.post("", response_model=FilmResponse, status_code=status.HTTP_201_CREATED)
 async def create_film(
     request: FilmRequest,
-    repository: FilmRepository = Depends(get_film_repository),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -86,8 +253,8 @@ async def create_film(
     """
     try:
         logger.info(f"映画の作成を開始: {request.title}")
-        use_case = CreateFilmUseCase(repository)
-        film = use_case.execute(
+        use_case = AsyncCreateFilmUseCase(repository)
+        film = await use_case.execute(
             title=request.title,
             rating=request.rating,
             description=request.description,
@@ -95,16 +262,7 @@ async def create_film(
             release_year=request.release_year
         )
         logger.info(f"映画を作成しました: ID={film.film_id}")
-        return FilmResponse(
-            film_id=film.film_id,
-            title=film.title,
-            rating=film.rating,
-            description=film.description,
-            image_path=film.image_path,
-            release_year=film.release_year,
-            last_update=film.last_update.isoformat(),
-            delete_flag=film.delete_flag
-        )
+        return film_to_response(film)
     except ValidationError as e:
         logger.warning(f"映画作成の検証エラー: {str(e)}")
         raise
@@ -113,41 +271,139 @@ async def create_film(
         raise DatabaseError(f"映画の作成中にエラーが発生しました: {str(e)}") from e
 
 
-@router.get("/{film_id}", response_model=FilmResponse, status_code=status.HTTP_200_OK)
+@router.post(":batch", response_model=FilmsBatchResponse, status_code=status.HTTP_200_OK)
+async def create_films_batch(
+    request: FilmsBatchRequest,
+    repository: AsyncFilmRepository = Depends(get_film_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    複数の映画をまとめて作成するエンドポイント
+
+    各要素を POST /api/films と同じ規則で検証し、検証に通ったものだけを
+    1 回の一括書き込み（MySQL は複数行 INSERT、DynamoDB は BatchWriteItem）で作成する。
+    結果は要素ごとに status（201 / 400）で返す。
+
+    Args:
+        request: 映画一括作成リクエスト（最大 API_BATCH_MAX_ITEMS 件）
+        repository: Film リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        FilmsBatchResponse: リクエストと同じ順序の要素ごとの結果
+
+    Raises:
+        HTTPException: 件数が不正な場合またはデータベース操作に失敗した場合
+    """
+    if not request.films or len(request.films) > settings.api_batch_max_items:
+        raise ValidationError(f"films には 1 件以上 {settings.api_batch_max_items} 件以下を指定してください")
+    try:
+        logger.info(f"映画の一括作成を開始: {len(request.films)} 件")
+        use_case = AsyncCreateFilmUseCase(repository)
+        results = await use_case.execute_many([film.model_dump(exclude={"version"}) for film in request.films])
+        items = [
+            FilmBatchResult(index=index, status=status.HTTP_201_CREATED, film=film_to_response(result))
+            if isinstance(result, Film)
+            else FilmBatchResult(index=index, status=status.HTTP_400_BAD_REQUEST, error=str(result))
+            for index, result in enumerate(results)
+        ]
+        created = sum(1 for item in items if item.film is not None)
+        logger.info(f"映画を一括作成しました: 作成 {created} 件, 検証エラー {len(items) - created} 件")
+        return FilmsBatchResponse(results=items, created=created, failed=len(items) - created)
+    except Exception as e:
+        logger.error(f"映画の一括作成中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"映画の一括作成中にエラーが発生しました: {str(e)}") from e
+
+
+@router.post(":batchGet", response_model=FilmsBatchGetResponse, status_code=status.HTTP_200_OK)
+async def get_films_batch(
+    request: FilmsBatchGetRequest,
+    repository: AsyncFilmRepository = Depends(get_film_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    指定された複数の ID の映画をまとめて取得するエンドポイント
+
+    MySQL は 1 回の IN 検索、DynamoDB は BatchGetItem で取得し、
+    詳細取得のキャッシュにある ID はデータベースにアクセスしない。
+
+    Args:
+        request: 映画一括取得リクエスト（最大 API_BATCH_MAX_ITEMS 件）
+        repository: Film リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Returns:
+        FilmsBatchGetResponse: リクエストの順序に並べた映画と見つからなかった ID
+
+    Raises:
+        HTTPException: 件数が不正な場合またはデータベース操作に失敗した場合
+    """
+    if not request.film_ids or len(request.film_ids) > settings.api_batch_max_items:
+        raise ValidationError(f"film_ids には 1 件以上 {settings.api_batch_max_items} 件以下を指定してください")
+    try:
+        logger.info(f"映画の一括取得を開始: {len(request.film_ids)} 件")
+        use_case = AsyncGetFilmByIdUseCase(repository)
+        films = await use_case.execute_many(request.film_ids)
+        found_ids = {film.film_id for film in films}
+        not_found = [film_id for film_id in dict.fromkeys(request.film_ids) if film_id not in found_ids]
+        logger.info(f"映画を一括取得しました: {len(films)} 件, 見つからない ID {len(not_found)} 件")
+        return FilmsBatchGetResponse(films=[film_to_response(film) for film in films], not_found=not_found)
+    except Exception as e:
+        logger.error(f"映画の一括取得中にエラーが発生: {str(e)}", exc_info=True)
+        raise DatabaseError(f"映画の一括取得中にエラーが発生しました: {str(e)}") from e
+
+
+@router.get("/{film_id}", response_model=FilmWithActorsResponse, status_code=status.HTTP_200_OK)
 async def get_film(
     film_id: str,
-    repository: FilmRepository = Depends(get_film_repository),
+    expand: Optional[Literal["actors"]] = Query(None, description="actors を指定すると出演者を展開する"),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
+    cast_repository: AsyncCastRepository = Depends(get_cast_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
     指定された ID の映画を取得するエンドポイント
 
+    expand=actors の場合は映画と出演者を並行して取得し、出演者を actors に展開する。
+    出演者はリポジトリ側で 1 回のクエリ（MySQL は JOIN、DynamoDB は Query と BatchGetItem）で
+    まとめて読み出すため、出演者の数だけ Actor を取得し直すことはない。
+
     Args:
         film_id: 映画 ID
+        expand: 展開する関連（actors のみ）
+        if_none_match: If-None-Match ヘッダー（ETag が一致すれば 304 を返す）
         repository: Film リポジトリ
+        cast_repository: Cast リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        FilmResponse: 映画情報
+        FilmWithActorsResponse: 映画情報（ETag 付き。If-None-Match が一致する場合は 304）。
+            expand を指定しない場合 actors は null。
+            出演者の変更は映画のバージョンを変えないため、展開時の ETag はレスポンス本文から計算する
 
     Raises:
         HTTPException: 映画が見つからない場合またはデータベース操作に失敗した場合
     """
     try:
-        logger.info(f"映画の取得を開始: ID={film_id}")
-        use_case = GetFilmByIdUseCase(repository)
-        film = use_case.execute(film_id)
+        logger.info(f"映画の取得を開始: ID={film_id}, expand={expand}")
+        use_case = AsyncGetFilmByIdUseCase(repository)
+        if expand == "actors":
+            film, actors = await asyncio.gather(
+                use_case.execute(film_id),
+                AsyncGetFilmActorsUseCase(cast_repository).execute(film_id)
+            )
+            logger.info(f"映画を取得しました: ID={film_id}, 出演者={len(actors)}件")
+            response = FilmWithActorsResponse(
+                **film_to_response(film).model_dump(),
+                actors=[actor_to_response(actor) for actor in actors]
+            )
+            body = response.model_dump_json().encode("utf-8")
+            return conditional_json_response(body, compute_etag(body), if_none_match)
+        film = await use_case.execute(film_id)
         logger.info(f"映画を取得しました: ID={film_id}")
-        return FilmResponse(
-            film_id=str(film.film_id),
-            title=film.title,
-            rating=film.rating,
-            description=film.description,
-            image_path=film.image_path,
-            release_year=film.release_year,
-            last_update=film.last_update.isoformat(),
-            delete_flag=film.delete_flag
-        )
+        body = film_to_response(film).model_dump_json().encode("utf-8")
+        return conditional_json_response(body, version_etag(film.version), if_none_match)
     except NotFoundError as e:
         logger.warning(f"映画が見つかりません: ID={film_id}")
         raise
@@ -160,52 +416,59 @@ async def get_film(
 async def update_film(
     film_id: str,
     request: FilmRequest,
-    repository: FilmRepository = Depends(get_film_repository),
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
-    映画を更新するエンドポイント
+    映画を更新するエンドポイント（楽観的ロック）
+
+    If-Match ヘッダー（GET で返された ETag）またはリクエストの version を条件に更新し、
+    他の更新で変更されていた場合は 409 を返す。どちらも省略した場合は現在のバージョンを条件にする。
 
     Args:
         film_id: 映画 ID
         request: 映画更新リクエスト
+        response: 更新後の ETag を設定するレスポンス
+        if_match: If-Match ヘッダー（更新の条件にするバージョンの ETag）
         repository: Film リポジトリ
         current_user: 現在のユーザー情報（認証済み）
 
     Returns:
-        FilmResponse: 更新された映画
+        FilmResponse: 更新された映画（更新後のバージョンの ETag 付き）
 
     Raises:
-        HTTPException: 検証エラー、映画が見つからない場合、またはデータベース操作に失敗した場合
+        HTTPException: 検証エラー、映画が見つからない場合、バージョンが競合した場合、
+            またはデータベース操作に失敗した場合
     """
     try:
         logger.info(f"映画の更新を開始: ID={film_id}")
-        use_case = UpdateFilmUseCase(repository)
-        film = use_case.execute(
+        expected_version = parse_if_match(if_match)
+        if expected_version is None:
+            expected_version = request.version
+        use_case = AsyncUpdateFilmUseCase(repository)
+        film = await use_case.execute(
             film_id=film_id,
             title=request.title,
             rating=request.rating,
             description=request.description,
             image_path=request.image_path,
-            release_year=request.release_year
-        )
-        logger.info(f"映画を更新しました: ID={film_id}")
-        return FilmResponse(
-            film_id=film.film_id,
-            title=film.title,
-            rating=film.rating,
-            description=film.description,
-            image_path=film.image_path,
-            release_year=film.release_year,
-            last_update=film.last_update.isoformat(),
-            delete_flag=film.delete_flag
+            release_year=request.release_year,
+            expected_version=expected_version
         )
+        logger.info(f"映画を更新しました: ID={film_id}, version={film.version}")
+        response.headers["ETag"] = version_etag(film.version)
+        return film_to_response(film)
     except ValidationError as e:
         logger.warning(f"映画更新の検証エラー: ID={film_id}, {str(e)}")
         raise
     except NotFoundError as e:
         logger.warning(f"映画が見つかりません: ID={film_id}")
         raise
+    except ConflictError as e:
+        logger.warning(f"映画更新の競合: ID={film_id}, {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"映画の更新中にエラーが発生: ID={film_id}, {str(e)}", exc_info=True)
         raise DatabaseError(f"映画の更新中にエラーが発生しました: {str(e)}") from e
@@ -214,7 +477,7 @@ async def update_film(
 @router.delete("/{film_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_film(
     film_id: str,
-    repository: FilmRepository = Depends(get_film_repository),
+    repository: AsyncFilmRepository = Depends(get_film_repository),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -230,8 +493,8 @@ async def delete_film(
     """
     try:
         logger.info(f"映画の削除を開始: ID={film_id}")
-        use_case = DeleteFilmUseCase(repository)
-        use_case.execute(film_id)
+        use_case = AsyncDeleteFilmUseCase(repository)
+        await use_case.execute(film_id)
         logger.info(f"映画を削除しました: ID={film_id}")
     except NotFoundError as e:
         logger.warning(f"映画が見つかりません: ID={film_id}")
@@ -239,3 +502,75 @@ async def delete_film(
     except Exception as e:
         logger.error(f"映画の削除中にエラーが発生: ID={film_id}, {str(e)}", exc_info=True)
         raise DatabaseError(f"映画の削除中にエラーが発生しました: {str(e)}") from e
+
+
+@router.put("/{film_id}/actors/{actor_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def add_film_actor(
+    film_id: str,
+    actor_id: str,
+    film_repository: AsyncFilmRepository = Depends(get_film_repository),
+    actor_repository: AsyncActorRepository = Depends(get_actor_repository),
+    cast_repository: AsyncCastRepository = Depends(get_cast_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    アクターを映画の出演者として登録するエンドポイント（登録済みの場合も 204 を返す）
+
+    Args:
+        film_id: 映画 ID
+        actor_id: アクター ID
+        film_repository: Film リポジトリ
+        actor_repository: Actor リポジトリ
+        cast_repository: Cast リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Raises:
+        HTTPException: 映画・アクターが見つからない場合またはデータベース操作に失敗した場合
+    """
+    try:
+        logger.info(f"出演者の登録を開始: 映画ID={film_id}, アクターID={actor_id}")
+        use_case = AsyncAddFilmActorUseCase(film_repository, actor_repository, cast_repository)
+        await use_case.execute(film_id, actor_id)
+        logger.info(f"出演者を登録しました: 映画ID={film_id}, アクターID={actor_id}")
+    except NotFoundError as e:
+        logger.warning(f"出演者を登録できません: {str(e)}")
+        raise
+    except Exception as e:
+        logger.error(
+            f"出演者の登録中にエラーが発生: 映画ID={film_id}, アクターID={actor_id}, {str(e)}", exc_info=True
+        )
+        raise DatabaseError(f"出演者の登録中にエラーが発生しました: {str(e)}") from e
+
+
+@router.delete("/{film_id}/actors/{actor_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_film_actor(
+    film_id: str,
+    actor_id: str,
+    cast_repository: AsyncCastRepository = Depends(get_cast_repository),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    アクターを映画の出演者から外すエンドポイント
+
+    Args:
+        film_id: 映画 ID
+        actor_id: アクター ID
+        cast_repository: Cast リポジトリ
+        current_user: 現在のユーザー情報（認証済み）
+
+    Raises:
+        HTTPException: 出演者として登録されていない場合またはデータベース操作に失敗した場合
+    """
+    try:
+        logger.info(f"出演者の削除を開始: 映画ID={film_id}, アクターID={actor_id}")
+        use_case = AsyncRemoveFilmActorUseCase(cast_repository)
+        await use_case.execute(film_id, actor_id)
+        logger.info(f"出演者を削除しました: 映画ID={film_id}, アクターID={actor_id}")
+    except NotFoundError as e:
+        logger.warning(f"出演者として登録されていません: 映画ID={film_id}, アクターID={actor_id}")
+        raise
+    except Exception as e:
+        logger.error(
+            f"出演者の削除中にエラーが発生: 映画ID={film_id}, アクターID={actor_id}, {str(e)}", exc_info=True
+        )
+        raise DatabaseError(f"出演者の削除中にエラーが発生しました: {str(e)}") from e
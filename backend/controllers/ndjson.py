@@ -0,0 +1,72 @@
+"""NDJSON（改行区切り JSON）ストリーミングレスポンス"""
+import logging
+from typing import AsyncIterator, Callable, Optional, TypeVar
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from backend.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+def wants_ndjson(stream: bool, accept: Optional[str]) -> bool:
+    """
+    一覧 API をストリーミングモードで返すかどうかを判定する
+
+    Args:
+        stream: クエリパラメータ stream の値
+        accept: Accept ヘッダーの値
+
+    Returns:
+        ?stream=true または Accept: application/x-ndjson の場合 True
+    """
+    return stream or (accept is not None and NDJSON_MEDIA_TYPE in accept)
+
+
+async def ndjson_response(
+    items: AsyncIterator[T],
+    to_response: Callable[[T], BaseModel]
+) -> StreamingResponse:
+    """
+    非同期イテレーターの要素を 1 行 1 件の JSON として逐次送信するレスポンスを作成する
+
+    全件をリストに溜めずに API_STREAM_BATCH_SIZE 行ごとに送信するため、
+    メモリ使用量は件数によらず一定になる。最初の 1 件はレスポンス開始前に
+    取得するので、接続エラーなどは通常どおりエラーレスポンスとして返る。
+
+    Args:
+        items: リポジトリの iter_all() が返す非同期イテレーター
+        to_response: エンティティをレスポンスモデルに変換する関数
+
+    Returns:
+        StreamingResponse: application/x-ndjson のストリーミングレスポンス
+
+    Raises:
+        Exception: 最初の 1 件の取得に失敗した場合
+    """
+    iterator = items.__aiter__()
+    try:
+        first: Optional[T] = await iterator.__anext__()
+    except StopAsyncIteration:
+        return StreamingResponse(iter(()), media_type=NDJSON_MEDIA_TYPE)
+
+    async def body() -> AsyncIterator[str]:
+        lines = [to_response(first).model_dump_json() + "\n"]
+        try:
+            async for item in iterator:
+                lines.append(to_response(item).model_dump_json() + "\n")
+                if len(lines) >= settings.api_stream_batch_size:
+                    yield "".join(lines)
+                    lines = []
+        except Exception as e:
+            # ヘッダー送信後はステータスコードを変更できないため、ログを残して接続を切断する
+            logger.error(f"ストリーミング出力中にエラーが発生: {str(e)}", exc_info=True)
+            raise
+        if lines:
+            yield "".join(lines)
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,32 @@
+"""エンティティを API のレスポンスモデルに変換する（Film / Actor コントローラーで共有）"""
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.schemas.actor_schemas import ActorResponse
+from backend.schemas.film_schemas import FilmResponse
+
+
+def film_to_response(film: Film) -> FilmResponse:
+    """Film エンティティをレスポンスモデルに変換"""
+    return FilmResponse(
+        film_id=str(film.film_id),
+        title=film.title,
+        rating=film.rating,
+        description=film.description,
+        image_path=film.image_path,
+        release_year=film.release_year,
+        last_update=film.last_update.isoformat(),
+        delete_flag=film.delete_flag,
+        version=film.version
+    )
+
+
+def actor_to_response(actor: Actor) -> ActorResponse:
+    """Actor エンティティをレスポンスモデルに変換"""
+    return ActorResponse(
+        actor_id=str(actor.actor_id),
+        first_name=actor.first_name,
+        last_name=actor.last_name,
+        last_update=actor.last_update.isoformat(),
+        delete_flag=actor.delete_flag,
+        version=actor.version
+    )
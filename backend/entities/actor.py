@@ -10,3 +10,4 @@ class Actor:
     last_name: str
     last_update: datetime
     delete_flag: bool = False
+    version: int = 1  # 更新のたびに 1 ずつ増える楽観的ロック用のバージョン
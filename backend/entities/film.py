@@ -16,3 +16,4 @@ class Film:
     image_path: Optional[str] = None
     release_year: Optional[int] = None
     delete_flag: bool = False
+    version: int = 1  # 更新のたびに 1 ずつ増える楽観的ロック用のバージョン
@@ -2,10 +2,13 @@
 import logging
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
+from backend.config.settings import settings
 from backend.exceptions import (
     AuthenticationError,
+    AuthServiceUnavailableError,
     ValidationError,
     NotFoundError,
+    ConflictError,
     DatabaseError,
     ErrorResponse
 )
@@ -33,6 +36,26 @@ async def authentication_error_handler(
     )
 
 
+async def auth_service_unavailable_error_handler(
+    request: Request,
+    exc: AuthServiceUnavailableError
+) -> JSONResponse:
+    """認証基盤の一時的な障害のエラーハンドラー"""
+    logger.warning(f"Auth service unavailable: {str(exc)}")
+    
+    error_response = ErrorResponse(
+        error_code="AUTH_SERVICE_UNAVAILABLE",
+        message="認証サービスに一時的に接続できません。しばらくしてから再試行してください",
+        details=None
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=error_response.model_dump(),
+        headers={"Retry-After": str(settings.auth_unavailable_retry_after)}
+    )
+
+
 async def validation_error_handler(
     request: Request,
     exc: ValidationError
@@ -71,6 +94,25 @@ async def not_found_error_handler(
     )
 
 
+async def conflict_error_handler(
+    request: Request,
+    exc: ConflictError
+) -> JSONResponse:
+    """楽観的ロックの競合エラーハンドラー"""
+    logger.info(f"Conflict: {str(exc)}")
+    
+    error_response = ErrorResponse(
+        error_code="CONFLICT",
+        message=str(exc) or "リソースが他の更新で変更されています",
+        details=None
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=error_response.model_dump()
+    )
+
+
 async def database_error_handler(
     request: Request,
     exc: DatabaseError
@@ -117,7 +159,9 @@ def register_exception_handlers(app):
         app: FastAPI アプリケーションインスタンス
     """
     app.add_exception_handler(AuthenticationError, authentication_error_handler)
+    app.add_exception_handler(AuthServiceUnavailableError, auth_service_unavailable_error_handler)
     app.add_exception_handler(ValidationError, validation_error_handler)
     app.add_exception_handler(NotFoundError, not_found_error_handler)
+    app.add_exception_handler(ConflictError, conflict_error_handler)
     app.add_exception_handler(DatabaseError, database_error_handler)
     app.add_exception_handler(Exception, general_exception_handler)
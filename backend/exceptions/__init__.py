@@ -8,6 +8,11 @@ class AuthenticationError(Exception):
     pass
 
 
+class AuthServiceUnavailableError(Exception):
+    """認証基盤（JWKS エンドポイントや Cognito API）への問い合わせが一時的に失敗したエラー"""
+    pass
+
+
 class ValidationError(Exception):
     """検証エラー"""
     pass
@@ -18,6 +23,11 @@ class NotFoundError(Exception):
     pass
 
 
+class ConflictError(Exception):
+    """楽観的ロックの競合エラー（リソースが他の更新で変更されている）"""
+    pass
+
+
 class DatabaseError(Exception):
     """データベースエラー"""
     pass
@@ -1,10 +1,24 @@
 """FastAPI メインアプリケーション"""
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config.settings import settings
 from backend.controllers import auth_controller, film_controller, actor_controller
+from backend.repositories.database import create_mysql_engine, create_mysql_async_engine
+from backend.repositories.dynamodb_connection import DynamoDBConnection
+from backend.repositories.dynamodb_async_connection import AsyncDynamoDBConnection
+from backend.services.auth_middleware import token_cache
+from backend.controllers.dependencies import (
+    actor_cache, actor_list_cache, actor_search_index, actor_single_flight, actor_suggest_index, film_cache,
+    film_list_cache, film_search_index, film_single_flight, film_suggest_index, in_process_indexes_enabled,
+    rebuild_search_indexes, search_index_enabled, suggest_enabled
+)
+from backend.services.cognito_auth_service import CognitoAuthService
 from backend.error_handlers import (
     register_exception_handlers
 )
@@ -19,6 +33,90 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _refresh_search_indexes(app: FastAPI) -> None:
+    """
+    SEARCH_INDEX_REFRESH_INTERVAL 秒ごとに検索インデックス・サジェストのインデックスを作り直す
+
+    他のプロセスでの書き込みを取り込むため。失敗した場合はログに記録し、次の周期で再試行する。
+    """
+    while True:
+        await asyncio.sleep(settings.search_index_refresh_interval)
+        try:
+            films, actors = await rebuild_search_indexes(app)
+            logger.info(f"Search indexes refreshed: films={films}, actors={actors}")
+        except Exception:
+            logger.exception("Failed to refresh search indexes")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    アプリケーションのライフサイクルを管理する
+
+    起動時にリクエスト間で共有するリソース（DB 接続プール、認証サービスなど）を作成して
+    app.state に格納し、終了時に解放する。
+
+    Args:
+        app: FastAPI アプリケーションインスタンス
+    """
+    # 同期リポジトリ（dynamodb / mysql）と認証サービスの呼び出しは run_in_threadpool で
+    # 実行するため、その同時実行数（= DB・AWS API への同時リクエスト数）の上限をここで設定する
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_max_workers
+
+    if settings.database_type == "mysql":
+        app.state.mysql_engine = create_mysql_engine()
+        logger.info(
+            f"MySQL connection pool created: pool_size={settings.mysql_pool_size}, "
+            f"max_overflow={settings.mysql_max_overflow}"
+        )
+    elif settings.database_type == "mysql_async":
+        app.state.mysql_async_engine = create_mysql_async_engine()
+        logger.info(
+            f"MySQL async connection pool created: pool_size={settings.mysql_pool_size}, "
+            f"max_overflow={settings.mysql_max_overflow}"
+        )
+    elif settings.database_type == "dynamodb":
+        app.state.dynamodb = DynamoDBConnection()
+        logger.info(
+            f"DynamoDB connection created: max_pool_connections={settings.aws_max_pool_connections}"
+        )
+    elif settings.database_type == "dynamodb_async":
+        app.state.dynamodb_async = AsyncDynamoDBConnection()
+        await app.state.dynamodb_async.open()
+        logger.info(
+            f"DynamoDB async connection opened: max_pool_connections={settings.aws_max_pool_connections}"
+        )
+
+    app.state.auth_service = CognitoAuthService()
+
+    # DynamoDB には全文検索の機能がないため、検索インデックス（とサジェストのインデックス）を
+    # テーブルから作成してから受け付けを始める
+    refresh_task = None
+    if in_process_indexes_enabled():
+        films, actors = await rebuild_search_indexes(app)
+        logger.info(f"Search indexes built: films={films}, actors={actors}")
+        if settings.search_index_refresh_interval > 0:
+            refresh_task = asyncio.create_task(_refresh_search_indexes(app))
+
+    try:
+        yield
+    finally:
+        if refresh_task is not None:
+            refresh_task.cancel()
+        if settings.database_type == "mysql":
+            app.state.mysql_engine.dispose()
+            logger.info("MySQL connection pool disposed")
+        elif settings.database_type == "mysql_async":
+            await app.state.mysql_async_engine.dispose()
+            logger.info("MySQL async connection pool disposed")
+        elif settings.database_type == "dynamodb":
+            app.state.dynamodb.close()
+            logger.info("DynamoDB connection closed")
+        elif settings.database_type == "dynamodb_async":
+            await app.state.dynamodb_async.close()
+            logger.info("DynamoDB async connection closed")
+
+
 def create_app() -> FastAPI:
     """
     FastAPI アプリケーションを作成して設定する
@@ -34,7 +132,8 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         debug=settings.debug,
         description="Film と Actor の管理システム API",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=lifespan
     )
 
     # CORS ミドルウェアを設定
@@ -44,6 +143,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
 
     # ルーターを登録
@@ -86,7 +186,26 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "database_type": settings.database_type
+        "database_type": settings.database_type,
+        "caches": {
+            "auth_token": token_cache.stats(),
+            "film_entity": film_cache.stats(),
+            "actor_entity": actor_cache.stats(),
+            "film_list": film_list_cache.stats(),
+            "actor_list": actor_list_cache.stats()
+        },
+        "single_flight": {
+            "film_get_by_id": film_single_flight.stats(),
+            "actor_get_by_id": actor_single_flight.stats()
+        },
+        "search_index": {
+            "film": film_search_index.stats(),
+            "actor": actor_search_index.stats()
+        } if search_index_enabled() else None,
+        "suggest_index": {
+            "film": film_suggest_index.stats(),
+            "actor": actor_suggest_index.stats()
+        } if suggest_enabled() else None
     }
 
 
@@ -1,12 +1,34 @@
 """リポジトリパッケージ"""
 from .actor_repository import ActorRepository
 from .film_repository import FilmRepository
+from .cast_repository import CastRepository
+from .async_actor_repository import AsyncActorRepository
+from .async_film_repository import AsyncFilmRepository
+from .async_cast_repository import AsyncCastRepository
 from .mysql_actor_repository import MySQLActorRepository
 from .mysql_film_repository import MySQLFilmRepository
+from .mysql_cast_repository import MySQLCastRepository
+from .mysql_async_actor_repository import MySQLAsyncActorRepository
+from .mysql_async_film_repository import MySQLAsyncFilmRepository
+from .mysql_async_cast_repository import MySQLAsyncCastRepository
+from .dynamodb_async_actor_repository import DynamoDBAsyncActorRepository
+from .dynamodb_async_film_repository import DynamoDBAsyncFilmRepository
+from .dynamodb_async_cast_repository import DynamoDBAsyncCastRepository
 
 __all__ = [
     "FilmRepository",
     "ActorRepository",
+    "CastRepository",
     "MySQLFilmRepository",
     "MySQLActorRepository",
+    "MySQLCastRepository",
+    "AsyncFilmRepository",
+    "AsyncActorRepository",
+    "AsyncCastRepository",
+    "MySQLAsyncFilmRepository",
+    "MySQLAsyncActorRepository",
+    "MySQLAsyncCastRepository",
+    "DynamoDBAsyncFilmRepository",
+    "DynamoDBAsyncActorRepository",
+    "DynamoDBAsyncCastRepository",
 ]
@@ -1,8 +1,9 @@
 """Actor リポジトリの抽象基底クラス"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Iterator
 
 from backend.entities.actor import Actor
+from backend.repositories.pagination import Page
 
 
 class ActorRepository(ABC):
@@ -24,6 +25,22 @@ class ActorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """
+        複数の Actor をまとめて作成する
+
+        Args:
+            actors: 作成する Actor エンティティのリスト
+
+        Returns:
+            作成された Actor エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> List[Actor]:
         """
@@ -37,6 +54,58 @@ class ActorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Actor]:
+        """
+        削除されていない全ての Actor を 1 件ずつ返す (delete_flag=False)
+
+        全件をメモリに載せずに順次取り出すため、件数によらずメモリ使用量は一定になる。
+
+        Yields:
+            Actor エンティティ
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていない Actor を 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に text を含む削除されていない Actor を関連度の高い順に 1 ページ分取得する
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合、またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, actor_id: str) -> Optional[Actor]:
         """
@@ -53,19 +122,57 @@ class ActorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    @abstractmethod
+    def get_version(self, actor_id: str) -> Optional[int]:
+        """
+        指定された actor_id の Actor の現在のバージョンをキャッシュを通さずに取得する
+
+        If-Match なしの更新で条件にするバージョンを読むために使う。キャッシュ層は
+        内側のリポジトリに委譲し、データベースの最新の値を返す。
+
+        Args:
+            actor_id: 対象の Actor の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor をまとめて取得する
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
     @abstractmethod
     def update(self, actor: Actor) -> Actor:
         """
-        既存の Actor を更新する
+        既存の Actor を actor.version を条件に更新する（楽観的ロック）
+
+        現在のバージョンが actor.version と一致する場合だけ更新し、version を 1 増やす。
 
         Args:
-            actor: 更新する Actor エンティティ
+            actor: 更新する Actor エンティティ（version は読み込んだ時点のバージョン）
 
         Returns:
-            更新された Actor エンティティ
+            更新された Actor エンティティ（version は更新後のバージョン）
 
         Raises:
             NotFoundError: Actor が見つからない場合
+            ConflictError: actor.version が現在のバージョンと一致しない場合
             DatabaseError: データベース操作に失敗した場合
         """
         pass
@@ -79,7 +186,7 @@ class ActorRepository(ABC):
             actor_id: 削除する Actor の ID
 
         Returns:
-            削除が成功した場合 True、Actor が見つからない場合 False
+            削除した場合 True、Actor が見つからないか既に削除済みの場合 False
 
         Raises:
             DatabaseError: データベース操作に失敗した場合
@@ -0,0 +1,77 @@
+"""Cast（映画とアクターの出演関係）リポジトリの非同期版抽象基底クラス"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+
+
+class AsyncCastRepository(ABC):
+    """映画とアクターの多対多の出演関係の非同期データアクセスを定義する抽象基底クラス"""
+
+    @abstractmethod
+    async def add(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（既に登録されている場合は何もしない）
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    async def remove(self, film_id: str, actor_id: str) -> bool:
+        """
+        アクターを映画の出演者から外す
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Returns:
+            外した場合 True、出演者として登録されていなかった場合 False
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    async def get_actors(self, film_id: str) -> List[Actor]:
+        """
+        映画の出演者のうち削除されていない Actor をまとめて取得する
+
+        出演関係の読み出しと Actor の取得は 1 回ずつ（出演者の数によらない）。
+
+        Args:
+            film_id: 映画の ID
+
+        Returns:
+            actor_id の順に並べた Actor エンティティのリスト
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    async def get_films(self, actor_id: str) -> List[Film]:
+        """
+        アクターの出演作のうち削除されていない Film をまとめて取得する
+
+        出演関係の読み出しと Film の取得は 1 回ずつ（出演作の数によらない）。
+
+        Args:
+            actor_id: アクターの ID
+
+        Returns:
+            film_id の順に並べた Film エンティティのリスト
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
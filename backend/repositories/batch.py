@@ -0,0 +1,126 @@
+"""複数 ID をまとめて取得する一括処理の共通部分"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# BatchGetItem の 1 リクエストあたりの最大キー数
+DYNAMODB_BATCH_GET_MAX_KEYS = 100
+
+# UnprocessedKeys を再送する最大回数と、指数バックオフの初期・最大待ち時間（秒）
+DYNAMODB_BATCH_MAX_RETRIES = 8
+DYNAMODB_BATCH_BASE_DELAY = 0.05
+DYNAMODB_BATCH_MAX_DELAY = 1.0
+
+
+def unique_ids(ids: Iterable[str]) -> List[str]:
+    """
+    重複を取り除いた ID のリストを返す（最初に現れた順序を保つ）
+
+    Args:
+        ids: ID のイテラブル
+
+    Returns:
+        重複のない ID のリスト
+    """
+    return list(dict.fromkeys(ids))
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    シーケンスを size 件ずつに分割する
+
+    Args:
+        items: 分割するシーケンス
+        size: 1 チャンクあたりの最大件数
+
+    Yields:
+        最大 size 件のシーケンス
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def order_by_ids(entities: Iterable[T], ids: Sequence[str], key: Callable[[T], str]) -> List[T]:
+    """
+    エンティティを ids の順序に並べ替える（見つからない ID は読み飛ばす）
+
+    Args:
+        entities: 取得したエンティティ（順序は任意）
+        ids: 重複のない ID のリスト
+        key: エンティティから ID を取り出す関数
+
+    Returns:
+        ids の順序に並べたエンティティのリスト
+    """
+    by_id = {key(entity): entity for entity in entities}
+    return [by_id[entity_id] for entity_id in ids if entity_id in by_id]
+
+
+def _backoff_delay(attempt: int) -> float:
+    """attempt 回目の再送までの待ち時間（秒）"""
+    return min(DYNAMODB_BATCH_BASE_DELAY * (2 ** attempt), DYNAMODB_BATCH_MAX_DELAY)
+
+
+def batch_get_items(resource: Any, table_name: str, key_name: str, ids: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    BatchGetItem で複数のアイテムを取得する
+
+    100 キーずつリクエストし、UnprocessedKeys は指数バックオフで再送する。
+
+    Args:
+        resource: boto3 の DynamoDB リソース
+        table_name: テーブル名
+        key_name: パーティションキー名（"film_id" など）
+        ids: 重複のない ID のリスト
+
+    Returns:
+        取得したアイテムのリスト（順序は不定）
+
+    Raises:
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+        Exception: 再送しても UnprocessedKeys が残った場合
+    """
+    items: List[Dict[str, Any]] = []
+    for chunk in chunked(ids, DYNAMODB_BATCH_GET_MAX_KEYS):
+        request_items = {table_name: {'Keys': [{key_name: entity_id} for entity_id in chunk]}}
+        for attempt in range(DYNAMODB_BATCH_MAX_RETRIES + 1):
+            response = resource.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                break
+            if attempt < DYNAMODB_BATCH_MAX_RETRIES:
+                time.sleep(_backoff_delay(attempt))
+        else:
+            raise Exception(f"BatchGetItem left unprocessed keys on {table_name}")
+    return items
+
+
+async def async_batch_get_items(
+    resource: Any,
+    table_name: str,
+    key_name: str,
+    ids: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    BatchGetItem で複数のアイテムを取得する（aioboto3 版、引数・例外は batch_get_items と同じ）
+
+    Returns:
+        取得したアイテムのリスト（順序は不定）
+    """
+    items: List[Dict[str, Any]] = []
+    for chunk in chunked(ids, DYNAMODB_BATCH_GET_MAX_KEYS):
+        request_items = {table_name: {'Keys': [{key_name: entity_id} for entity_id in chunk]}}
+        for attempt in range(DYNAMODB_BATCH_MAX_RETRIES + 1):
+            response = await resource.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                break
+            if attempt < DYNAMODB_BATCH_MAX_RETRIES:
+                await asyncio.sleep(_backoff_delay(attempt))
+        else:
+            raise Exception(f"BatchGetItem left unprocessed keys on {table_name}")
+    return items
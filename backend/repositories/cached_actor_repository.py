@@ -0,0 +1,183 @@
+"""Actor のキャッシュを管理する非同期リポジトリのデコレーター"""
+import dataclasses
+from typing import AsyncIterator, Dict, List, Optional
+
+from backend.cache import LRUTTLCache, SingleFlight, VersionedCache
+from backend.entities.actor import Actor
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.batch import unique_ids
+from backend.repositories.pagination import Page
+
+
+class CachedActorRepository(AsyncActorRepository):
+    """
+    任意の AsyncActorRepository を包み、キャッシュの読み込みと無効化を行うデコレーター
+
+    - cache: get_by_id をリードスルーでキャッシュし、create / update / delete の
+      後に（失敗した場合も）該当する actor_id のエントリを破棄する。
+      キャッシュ内のエンティティが呼び出し元で書き換えられないよう、コピーを返す。
+    - list_cache: 一覧 API のキャッシュ。create / update / delete のたびに世代番号を進める。
+    - single_flight: 同じ actor_id への同時の get_by_id を 1 回の読み込みにまとめる。
+      書き込み後は実行中の読み込みを共有しないようにする。
+
+    いずれも None の場合はその機能を使わない。一覧系の操作はそのまま委譲する。
+    """
+
+    def __init__(
+        self,
+        repository: AsyncActorRepository,
+        cache: Optional[LRUTTLCache[Actor]] = None,
+        list_cache: Optional[VersionedCache] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        """
+        Args:
+            repository: ラップする Actor リポジトリ（MySQL / DynamoDB のいずれでもよい）
+            cache: actor_id をキーとするエンティティキャッシュ
+            list_cache: 一覧 API の結果を保持する世代付きキャッシュ
+            single_flight: get_by_id の同時呼び出しをまとめる SingleFlight
+        """
+        self.repository = repository
+        self.cache = cache
+        self.list_cache = list_cache
+        self.single_flight = single_flight
+
+    def _invalidate(self, actor_id: str) -> None:
+        """書き込み後に actor_id のエントリと一覧キャッシュを無効化する"""
+        if self.cache is not None:
+            self.cache.invalidate(actor_id)
+        if self.list_cache is not None:
+            self.list_cache.bump()
+        if self.single_flight is not None:
+            self.single_flight.forget(actor_id)
+
+    async def create(self, actor: Actor) -> Actor:
+        """新しい Actor を作成し、キャッシュを無効化する"""
+        created = await self.repository.create(actor)
+        self._invalidate(created.actor_id)
+        return created
+
+    async def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """複数の Actor をまとめて作成し、一覧キャッシュを無効化する"""
+        try:
+            return await self.repository.create_many(actors)
+        finally:
+            # 途中まで書き込まれた場合に備えて失敗時も無効化する
+            if self.list_cache is not None:
+                self.list_cache.bump()
+
+    async def get_all(self) -> List[Actor]:
+        """削除されていない全ての Actor を取得する"""
+        return await self.repository.get_all()
+
+    async def iter_all(self) -> AsyncIterator[Actor]:
+        """削除されていない全ての Actor を 1 件ずつ返す"""
+        async for actor in self.repository.iter_all():
+            yield actor
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """削除されていない Actor を 1 ページ分取得する"""
+        return await self.repository.get_page(limit, cursor)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """姓名に text を含む Actor を関連度の高い順に 1 ページ分取得する"""
+        return await self.repository.search(text, limit, cursor)
+
+    async def get_by_id(self, actor_id: str) -> Optional[Actor]:
+        """
+        指定された actor_id の Actor をキャッシュ優先で取得する
+
+        キャッシュにない場合、同じ actor_id への同時の呼び出しは 1 回の読み込みにまとめる。
+
+        Args:
+            actor_id: 取得する Actor の ID
+
+        Returns:
+            Actor エンティティ、見つからない場合は None
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.cache is not None:
+            cached = self.cache.get(actor_id)
+            if cached is not None:
+                return dataclasses.replace(cached)
+
+        if self.single_flight is None:
+            actor = await self._fetch(actor_id)
+        else:
+            actor = await self.single_flight.do(actor_id, lambda: self._fetch(actor_id))
+        # まとめられた呼び出し同士で同じインスタンスを共有しないようコピーを返す
+        return dataclasses.replace(actor) if actor is not None else None
+
+    async def _fetch(self, actor_id: str) -> Optional[Actor]:
+        """リポジトリから読み込み、読み込み中に書き込みがなければキャッシュに保存する"""
+        epoch = self.cache.epoch if self.cache is not None else None
+        actor = await self.repository.get_by_id(actor_id)
+        if actor is not None and self.cache is not None:
+            self.cache.set(actor_id, dataclasses.replace(actor), if_epoch=epoch)
+        return actor
+
+    async def get_version(self, actor_id: str) -> Optional[int]:
+        """
+        指定された actor_id の Actor の現在のバージョンをキャッシュを通さずに取得する
+
+        キャッシュ内のエンティティは TTL の間に他のプロセスの更新で古くなっている場合があり、
+        If-Match なしの更新の条件にすると競合でないのに 409 になるため、内側のリポジトリに委譲する。
+
+        Args:
+            actor_id: 対象の Actor の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+        """
+        return await self.repository.get_version(actor_id)
+
+    async def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor をキャッシュ優先でまとめて取得する
+
+        キャッシュにない ID だけをリポジトリの get_many で 1 回で取得し、キャッシュに保存する。
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.cache is None:
+            return await self.repository.get_many(actor_ids)
+
+        ids = unique_ids(actor_ids)
+        found: Dict[str, Actor] = {}
+        misses: List[str] = []
+        for actor_id in ids:
+            cached = self.cache.get(actor_id)
+            if cached is not None:
+                found[actor_id] = dataclasses.replace(cached)
+            else:
+                misses.append(actor_id)
+
+        if misses:
+            epoch = self.cache.epoch
+            for actor in await self.repository.get_many(misses):
+                self.cache.set(actor.actor_id, dataclasses.replace(actor), if_epoch=epoch)
+                found[actor.actor_id] = actor
+        return [found[actor_id] for actor_id in ids if actor_id in found]
+
+    async def update(self, actor: Actor) -> Actor:
+        """既存の Actor を更新し、キャッシュを無効化する"""
+        try:
+            return await self.repository.update(actor)
+        finally:
+            self._invalidate(actor.actor_id)
+
+    async def delete(self, actor_id: str) -> bool:
+        """指定された actor_id の Actor を論理削除し、キャッシュを無効化する"""
+        try:
+            return await self.repository.delete(actor_id)
+        finally:
+            self._invalidate(actor_id)
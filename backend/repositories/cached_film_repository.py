@@ -0,0 +1,189 @@
+"""Film のキャッシュを管理する非同期リポジトリのデコレーター"""
+import dataclasses
+from typing import AsyncIterator, Dict, List, Optional
+
+from backend.cache import LRUTTLCache, SingleFlight, VersionedCache
+from backend.entities.film import Film
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.batch import unique_ids
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.pagination import Page
+
+
+class CachedFilmRepository(AsyncFilmRepository):
+    """
+    任意の AsyncFilmRepository を包み、キャッシュの読み込みと無効化を行うデコレーター
+
+    - cache: get_by_id をリードスルーでキャッシュし、create / update / delete の
+      後に（失敗した場合も）該当する film_id のエントリを破棄する。
+      キャッシュ内のエンティティが呼び出し元で書き換えられないよう、コピーを返す。
+    - list_cache: 一覧 API のキャッシュ。create / update / delete のたびに世代番号を進める。
+    - single_flight: 同じ film_id への同時の get_by_id を 1 回の読み込みにまとめる。
+      書き込み後は実行中の読み込みを共有しないようにする。
+
+    いずれも None の場合はその機能を使わない。一覧系の操作はそのまま委譲する。
+    """
+
+    def __init__(
+        self,
+        repository: AsyncFilmRepository,
+        cache: Optional[LRUTTLCache[Film]] = None,
+        list_cache: Optional[VersionedCache] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        """
+        Args:
+            repository: ラップする Film リポジトリ（MySQL / DynamoDB のいずれでもよい）
+            cache: film_id をキーとするエンティティキャッシュ
+            list_cache: 一覧 API の結果を保持する世代付きキャッシュ
+            single_flight: get_by_id の同時呼び出しをまとめる SingleFlight
+        """
+        self.repository = repository
+        self.cache = cache
+        self.list_cache = list_cache
+        self.single_flight = single_flight
+
+    def _invalidate(self, film_id: str) -> None:
+        """書き込み後に film_id のエントリと一覧キャッシュを無効化する"""
+        if self.cache is not None:
+            self.cache.invalidate(film_id)
+        if self.list_cache is not None:
+            self.list_cache.bump()
+        if self.single_flight is not None:
+            self.single_flight.forget(film_id)
+
+    async def create(self, film: Film) -> Film:
+        """新しい Film を作成し、キャッシュを無効化する"""
+        created = await self.repository.create(film)
+        self._invalidate(created.film_id)
+        return created
+
+    async def create_many(self, films: List[Film]) -> List[Film]:
+        """複数の Film をまとめて作成し、一覧キャッシュを無効化する"""
+        try:
+            return await self.repository.create_many(films)
+        finally:
+            # 途中まで書き込まれた場合に備えて失敗時も無効化する
+            if self.list_cache is not None:
+                self.list_cache.bump()
+
+    async def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """削除されていない Film を query の条件と並び順で全て取得する"""
+        return await self.repository.get_all(query)
+
+    async def iter_all(self) -> AsyncIterator[Film]:
+        """削除されていない全ての Film を 1 件ずつ返す"""
+        async for film in self.repository.iter_all():
+            yield film
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """削除されていない Film を query の条件と並び順で 1 ページ分取得する"""
+        return await self.repository.get_page(limit, cursor, query)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """タイトルと説明文に text を含む Film を関連度の高い順に 1 ページ分取得する"""
+        return await self.repository.search(text, limit, cursor)
+
+    async def get_by_id(self, film_id: str) -> Optional[Film]:
+        """
+        指定された film_id の Film をキャッシュ優先で取得する
+
+        キャッシュにない場合、同じ film_id への同時の呼び出しは 1 回の読み込みにまとめる。
+
+        Args:
+            film_id: 取得する Film の ID
+
+        Returns:
+            Film エンティティ、見つからない場合は None
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.cache is not None:
+            cached = self.cache.get(film_id)
+            if cached is not None:
+                return dataclasses.replace(cached)
+
+        if self.single_flight is None:
+            film = await self._fetch(film_id)
+        else:
+            film = await self.single_flight.do(film_id, lambda: self._fetch(film_id))
+        # まとめられた呼び出し同士で同じインスタンスを共有しないようコピーを返す
+        return dataclasses.replace(film) if film is not None else None
+
+    async def _fetch(self, film_id: str) -> Optional[Film]:
+        """リポジトリから読み込み、読み込み中に書き込みがなければキャッシュに保存する"""
+        epoch = self.cache.epoch if self.cache is not None else None
+        film = await self.repository.get_by_id(film_id)
+        if film is not None and self.cache is not None:
+            self.cache.set(film_id, dataclasses.replace(film), if_epoch=epoch)
+        return film
+
+    async def get_version(self, film_id: str) -> Optional[int]:
+        """
+        指定された film_id の Film の現在のバージョンをキャッシュを通さずに取得する
+
+        キャッシュ内のエンティティは TTL の間に他のプロセスの更新で古くなっている場合があり、
+        If-Match なしの更新の条件にすると競合でないのに 409 になるため、内側のリポジトリに委譲する。
+
+        Args:
+            film_id: 対象の Film の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+        """
+        return await self.repository.get_version(film_id)
+
+    async def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film をキャッシュ優先でまとめて取得する
+
+        キャッシュにない ID だけをリポジトリの get_many で 1 回で取得し、キャッシュに保存する。
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.cache is None:
+            return await self.repository.get_many(film_ids)
+
+        ids = unique_ids(film_ids)
+        found: Dict[str, Film] = {}
+        misses: List[str] = []
+        for film_id in ids:
+            cached = self.cache.get(film_id)
+            if cached is not None:
+                found[film_id] = dataclasses.replace(cached)
+            else:
+                misses.append(film_id)
+
+        if misses:
+            epoch = self.cache.epoch
+            for film in await self.repository.get_many(misses):
+                self.cache.set(film.film_id, dataclasses.replace(film), if_epoch=epoch)
+                found[film.film_id] = film
+        return [found[film_id] for film_id in ids if film_id in found]
+
+    async def update(self, film: Film) -> Film:
+        """既存の Film を更新し、キャッシュを無効化する"""
+        try:
+            return await self.repository.update(film)
+        finally:
+            self._invalidate(film.film_id)
+
+    async def delete(self, film_id: str) -> bool:
+        """指定された film_id の Film を論理削除し、キャッシュを無効化する"""
+        try:
+            return await self.repository.delete(film_id)
+        finally:
+            self._invalidate(film_id)
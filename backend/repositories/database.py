@@ -0,0 +1,52 @@
+"""MySQL データベースエンジンの管理"""
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from backend.config.settings import settings
+
+
+def create_mysql_engine() -> Engine:
+    """
+    アプリケーション全体で共有する SQLAlchemy エンジンを作成する
+
+    エンジンは接続プールを保持するため、リクエストごとではなく
+    アプリケーションの起動時に一度だけ作成し、終了時に dispose() する。
+
+    Returns:
+        Engine: 接続プール設定済みの SQLAlchemy エンジン
+
+    Raises:
+        ValueError: MySQL の設定が不完全な場合
+    """
+    return create_engine(
+        settings.mysql_url,
+        pool_pre_ping=True,
+        pool_size=settings.mysql_pool_size,
+        max_overflow=settings.mysql_max_overflow,
+        pool_recycle=settings.mysql_pool_recycle,
+        pool_timeout=settings.mysql_pool_timeout,
+    )
+
+
+def create_mysql_async_engine() -> AsyncEngine:
+    """
+    アプリケーション全体で共有する SQLAlchemy AsyncEngine を作成する
+
+    DATABASE_TYPE=mysql_async の場合に使用する。接続プールの設定は
+    create_mysql_engine() と共通。
+
+    Returns:
+        AsyncEngine: 接続プール設定済みの SQLAlchemy AsyncEngine
+
+    Raises:
+        ValueError: MySQL の設定が不完全な場合
+    """
+    return create_async_engine(
+        settings.mysql_async_url,
+        pool_pre_ping=True,
+        pool_size=settings.mysql_pool_size,
+        max_overflow=settings.mysql_max_overflow,
+        pool_recycle=settings.mysql_pool_recycle,
+        pool_timeout=settings.mysql_pool_timeout,
+    )
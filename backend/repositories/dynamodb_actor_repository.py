@@ -1,43 +1,51 @@
 """DynamoDB を使用した Actor リポジトリの実装"""
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional
-import boto3
+from typing import List, Optional, Iterator
 from botocore.exceptions import ClientError
 
 from backend.entities.actor import Actor
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.batch import batch_get_items, order_by_ids, unique_ids
+from backend.repositories.dynamodb_connection import DynamoDBConnection
+from backend.repositories.dynamodb_shards import (
+    active_shard,
+    iter_active_items,
+    query_active_items,
+    query_active_page
+)
+from backend.repositories.optimistic_lock import (
+    dynamodb_current_version,
+    dynamodb_item_version,
+    dynamodb_version_get_kwargs,
+    dynamodb_versioned_put_kwargs,
+    version_mismatch_error
+)
+from backend.repositories.pagination import Page
 from backend.config.settings import settings
+from backend.exceptions import ValidationError
 
 
-class DynamoDBActorRepository(ActorRepository):
-    """DynamoDB を使用した Actor リポジトリの実装"""
-
-    def __init__(self):
-        """DynamoDB クライアントを初期化"""
-        dynamodb_config = {
-            'region_name': settings.aws_region
-        }
-        
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
-            dynamodb_config['aws_access_key_id'] = settings.aws_access_key_id
-            dynamodb_config['aws_secret_access_key'] = settings.aws_secret_access_key
-        
-        if settings.dynamodb_endpoint_url:
-            dynamodb_config['endpoint_url'] = settings.dynamodb_endpoint_url
-        
-        self.dynamodb = boto3.resource('dynamodb', **dynamodb_config)
-        self.table = self.dynamodb.Table(settings.dynamodb_actors_table)
+class ActorItemMapper:
+    """DynamoDB アイテムと Actor エンティティを相互に変換する（同期・非同期リポジトリで共有）"""
 
     def _entity_to_item(self, actor: Actor) -> dict:
         """Actor エンティティを DynamoDB アイテムに変換"""
-        return {
+        item = {
             'actor_id': actor.actor_id,
             'first_name': actor.first_name,
             'last_name': actor.last_name,
             'last_update': actor.last_update.isoformat(),
-            'delete_flag': actor.delete_flag
+            'delete_flag': actor.delete_flag,
+            'version': actor.version
         }
 
+        # 削除されていない間だけ active_shard を持たせ、active_shard-index を疎にする
+        if not actor.delete_flag:
+            item['active_shard'] = active_shard(actor.actor_id)
+
+        return item
+
     def _item_to_entity(self, item: dict) -> Actor:
         """DynamoDB アイテムを Actor エンティティに変換"""
         return Actor(
@@ -45,9 +53,24 @@ class DynamoDBActorRepository(ActorRepository):
             first_name=item['first_name'],
             last_name=item['last_name'],
             last_update=datetime.fromisoformat(item['last_update']),
-            delete_flag=item.get('delete_flag', False)
+            delete_flag=item.get('delete_flag', False),
+            version=int(item.get('version', 1))
         )
 
+
+class DynamoDBActorRepository(ActorItemMapper, ActorRepository):
+    """DynamoDB を使用した Actor リポジトリの実装"""
+
+    def __init__(self, connection: DynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する DynamoDB 接続
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_actors_table)
+
     def create(self, actor: Actor) -> Actor:
         """
         新しい Actor を作成する
@@ -68,10 +91,35 @@ class DynamoDBActorRepository(ActorRepository):
         except ClientError as e:
             raise Exception(f"Failed to create actor: {e.response['Error']['Message']}") from e
 
+    def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """
+        複数の Actor を BatchWriteItem でまとめて作成する
+
+        batch_writer が 25 件ずつ BatchWriteItem を送信し、UnprocessedItems は再送する。
+
+        Args:
+            actors: 作成する Actor エンティティのリスト
+
+        Returns:
+            作成された Actor エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            with self.table.batch_writer() as batch:
+                for actor in actors:
+                    batch.put_item(Item=self._entity_to_item(actor))
+            return list(actors)
+        except ClientError as e:
+            raise Exception(f"Failed to create actors: {e.response['Error']['Message']}") from e
+
     def get_all(self) -> List[Actor]:
         """
         削除されていない全ての Actor を取得する (delete_flag=False)
 
+        active_shard-index の全シャードを並列に Query し、結果をまとめる。
+
         Returns:
             Actor エンティティのリスト
 
@@ -79,32 +127,64 @@ class DynamoDBActorRepository(ActorRepository):
             Exception: データベース操作に失敗した場合
         """
         try:
-            # delete_flag-index GSI を使用してクエリ
-            response = self.table.query(
-                IndexName='delete_flag-index',
-                KeyConditionExpression='delete_flag = :flag',
-                ExpressionAttributeValues={
-                    ':flag': False
-                }
-            )
-            
-            actors = [self._item_to_entity(item) for item in response.get('Items', [])]
-            
-            # ページネーションがある場合は続きを取得
-            while 'LastEvaluatedKey' in response:
-                response = self.table.query(
-                    IndexName='delete_flag-index',
-                    KeyConditionExpression='delete_flag = :flag',
-                    ExpressionAttributeValues={
-                        ':flag': False
-                    },
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
-                actors.extend([self._item_to_entity(item) for item in response.get('Items', [])])
-            
-            return actors
+            items = query_active_items(self.table)
         except ClientError as e:
             raise Exception(f"Failed to get all actors: {e.response['Error']['Message']}") from e
+        return [self._item_to_entity(item) for item in items]
+
+    def iter_all(self) -> Iterator[Actor]:
+        """
+        削除されていない全ての Actor を 1 件ずつ返す (delete_flag=False)
+
+        active_shard-index をシャードごとに Query し、ページ（最大 1MB）ごとに取得して順に返す。
+
+        Yields:
+            Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            for item in iter_active_items(self.table):
+                yield self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to iterate actors: {e.response['Error']['Message']}") from e
+
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていない Actor を last_update の降順で 1 ページ分取得する (delete_flag=False)
+
+        active_shard-index の各シャードから並列に先頭 limit + 1 件を取得してマージする。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            items, next_cursor = query_active_page(self.table, 'actor_id', limit, cursor)
+        except ClientError as e:
+            raise Exception(f"Failed to get actor page: {e.response['Error']['Message']}") from e
+        return Page(items=[self._item_to_entity(item) for item in items], next_cursor=next_cursor)
+
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        全文検索（DynamoDB には全文検索の機能がないため、SEARCH_INDEX_ENABLED の場合は
+        SearchIndexedActorRepository がインプロセスの検索インデックスで行う）
+
+        Actors テーブルの Scan と contains() による検索は件数に比例して読み込みキャパシティを
+        消費するため行わない。
+
+        Raises:
+            ValidationError: 常に送出する
+        """
+        raise ValidationError("DynamoDB の全文検索は SEARCH_INDEX_ENABLED が無効のため利用できません")
 
     def get_by_id(self, actor_id: str) -> Optional[Actor]:
         """
@@ -130,54 +210,112 @@ class DynamoDBActorRepository(ActorRepository):
         except ClientError as e:
             raise Exception(f"Failed to get actor by id: {e.response['Error']['Message']}") from e
 
+    def get_version(self, actor_id: str) -> Optional[int]:
+        """
+        指定された actor_id の Actor の現在のバージョンを強い整合性の読み込みで取得する
+
+        Args:
+            actor_id: 対象の Actor の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = self.table.get_item(**dynamodb_version_get_kwargs('actor_id', actor_id))
+            return dynamodb_item_version(response.get('Item'))
+        except ClientError as e:
+            raise Exception(f"Failed to get actor version: {e.response['Error']['Message']}") from e
+
+    def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor を BatchGetItem でまとめて取得する
+
+        100 キーずつリクエストし、UnprocessedKeys は指数バックオフで再送する。
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(actor_ids)
+        try:
+            items = batch_get_items(self.resource, self.table.name, 'actor_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get actors by ids: {e.response['Error']['Message']}") from e
+        return order_by_ids((self._item_to_entity(item) for item in items), ids, lambda actor: actor.actor_id)
+
     def update(self, actor: Actor) -> Actor:
         """
-        既存の Actor を更新する
+        既存の Actor を actor.version を条件とする PutItem 1 回で更新する
+
+        アイテムが存在し version が一致する場合だけ書き込み、version を 1 増やす。
+        ロックを取らないため、同時の更新が互いを待つことはない。
 
         Args:
-            actor: 更新する Actor エンティティ
+            actor: 更新する Actor エンティティ（version は読み込んだ時点のバージョン）
 
         Returns:
-            更新された Actor エンティティ
+            更新された Actor エンティティ（version は更新後のバージョン）
 
         Raises:
+            NotFoundError: Actor が見つからない場合
+            ConflictError: version が現在のバージョンと一致しない場合
             Exception: データベース操作に失敗した場合
         """
+        updated = replace(actor, version=actor.version + 1)
         try:
-            item = self._entity_to_item(actor)
-            self.table.put_item(Item=item)
-            return actor
+            self.table.put_item(
+                Item=self._entity_to_item(updated),
+                **dynamodb_versioned_put_kwargs('actor_id', actor.version)
+            )
+            return updated
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise version_mismatch_error(
+                    "Actor", actor.actor_id, actor.version, dynamodb_current_version(e)
+                ) from e
             raise Exception(f"Failed to update actor: {e.response['Error']['Message']}") from e
 
     def delete(self, actor_id: str) -> bool:
         """
         指定された actor_id の Actor を論理削除する (delete_flag=True)
 
+        存在確認の GetItem を行わず、条件付きの UpdateItem 1 回で判定する。
+
         Args:
             actor_id: 削除する Actor の ID
 
         Returns:
-            削除が成功した場合 True、Actor が見つからない場合 False
+            削除した場合 True、Actor が見つからないか既に削除済みの場合 False
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         try:
-            # まず Actor が存在するか確認
-            actor = self.get_by_id(actor_id)
-            if actor is None:
-                return False
-            
-            # delete_flag を True に更新
+            # 存在して削除されていない場合だけ delete_flag を True にし、active_shard-index から外す（version も 1 増やす）
             self.table.update_item(
                 Key={'actor_id': actor_id},
-                UpdateExpression='SET delete_flag = :flag, last_update = :update',
+                UpdateExpression=(
+                    'SET delete_flag = :flag, last_update = :update, '
+                    'version = if_not_exists(version, :one) + :one REMOVE active_shard'
+                ),
+                ConditionExpression='attribute_exists(actor_id) AND delete_flag = :active',
                 ExpressionAttributeValues={
                     ':flag': True,
+                    ':active': False,
+                    ':one': 1,
                     ':update': datetime.now().isoformat()
                 }
             )
             return True
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
             raise Exception(f"Failed to delete actor: {e.response['Error']['Message']}") from e
@@ -0,0 +1,279 @@
+"""aioboto3 を使用した非同期 DynamoDB Actor リポジトリの実装"""
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional, AsyncIterator
+from botocore.exceptions import ClientError
+
+from backend.entities.actor import Actor
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.batch import async_batch_get_items, order_by_ids, unique_ids
+from backend.repositories.dynamodb_async_connection import AsyncDynamoDBConnection
+from backend.repositories.dynamodb_actor_repository import ActorItemMapper
+from backend.repositories.dynamodb_shards import (
+    async_iter_active_items,
+    async_query_active_items,
+    async_query_active_page
+)
+from backend.repositories.optimistic_lock import (
+    dynamodb_current_version,
+    dynamodb_item_version,
+    dynamodb_version_get_kwargs,
+    dynamodb_versioned_put_kwargs,
+    version_mismatch_error
+)
+from backend.repositories.pagination import Page
+from backend.config.settings import settings
+from backend.exceptions import ValidationError
+
+
+class DynamoDBAsyncActorRepository(ActorItemMapper, AsyncActorRepository):
+    """aioboto3 を使用した非同期 DynamoDB Actor リポジトリの実装"""
+
+    def __init__(self, connection: AsyncDynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する非同期 DynamoDB 接続（open() 済み）
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_actors_table)
+
+    async def create(self, actor: Actor) -> Actor:
+        """
+        新しい Actor を作成する
+
+        Args:
+            actor: 作成する Actor エンティティ
+
+        Returns:
+            作成された Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            item = self._entity_to_item(actor)
+            await self.table.put_item(Item=item)
+            return actor
+        except ClientError as e:
+            raise Exception(f"Failed to create actor: {e.response['Error']['Message']}") from e
+
+    async def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """
+        複数の Actor を BatchWriteItem でまとめて作成する
+
+        batch_writer が 25 件ずつ BatchWriteItem を送信し、UnprocessedItems は再送する。
+
+        Args:
+            actors: 作成する Actor エンティティのリスト
+
+        Returns:
+            作成された Actor エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            async with self.table.batch_writer() as batch:
+                for actor in actors:
+                    await batch.put_item(Item=self._entity_to_item(actor))
+            return list(actors)
+        except ClientError as e:
+            raise Exception(f"Failed to create actors: {e.response['Error']['Message']}") from e
+
+    async def get_all(self) -> List[Actor]:
+        """
+        削除されていない全ての Actor を取得する (delete_flag=False)
+
+        active_shard-index の全シャードを並列に Query し、結果をまとめる。
+
+        Returns:
+            Actor エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            items = await async_query_active_items(self.table)
+        except ClientError as e:
+            raise Exception(f"Failed to get all actors: {e.response['Error']['Message']}") from e
+        return [self._item_to_entity(item) for item in items]
+
+    async def iter_all(self) -> AsyncIterator[Actor]:
+        """
+        削除されていない全ての Actor を 1 件ずつ返す (delete_flag=False)
+
+        active_shard-index をシャードごとに Query し、ページ（最大 1MB）ごとに取得して順に返す。
+
+        Yields:
+            Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            async for item in async_iter_active_items(self.table):
+                yield self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to iterate actors: {e.response['Error']['Message']}") from e
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていない Actor を last_update の降順で 1 ページ分取得する (delete_flag=False)
+
+        active_shard-index の各シャードから並列に先頭 limit + 1 件を取得してマージする。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            items, next_cursor = await async_query_active_page(self.table, 'actor_id', limit, cursor)
+        except ClientError as e:
+            raise Exception(f"Failed to get actor page: {e.response['Error']['Message']}") from e
+        return Page(items=[self._item_to_entity(item) for item in items], next_cursor=next_cursor)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        全文検索（DynamoDB には全文検索の機能がないため、SEARCH_INDEX_ENABLED の場合は
+        SearchIndexedActorRepository がインプロセスの検索インデックスで行う）
+
+        Actors テーブルの Scan と contains() による検索は件数に比例して読み込みキャパシティを
+        消費するため行わない。
+
+        Raises:
+            ValidationError: 常に送出する
+        """
+        raise ValidationError("DynamoDB の全文検索は SEARCH_INDEX_ENABLED が無効のため利用できません")
+
+    async def get_by_id(self, actor_id: str) -> Optional[Actor]:
+        """
+        指定された actor_id の Actor を取得する
+
+        Args:
+            actor_id: 取得する Actor の ID
+
+        Returns:
+            Actor エンティティ、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = await self.table.get_item(Key={'actor_id': actor_id})
+            item = response.get('Item')
+            
+            if item is None:
+                return None
+            
+            return self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to get actor by id: {e.response['Error']['Message']}") from e
+
+    async def get_version(self, actor_id: str) -> Optional[int]:
+        """
+        指定された actor_id の Actor の現在のバージョンを強い整合性の読み込みで取得する
+
+        Args:
+            actor_id: 対象の Actor の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = await self.table.get_item(**dynamodb_version_get_kwargs('actor_id', actor_id))
+            return dynamodb_item_version(response.get('Item'))
+        except ClientError as e:
+            raise Exception(f"Failed to get actor version: {e.response['Error']['Message']}") from e
+
+    async def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor を BatchGetItem でまとめて取得する
+
+        100 キーずつリクエストし、UnprocessedKeys は指数バックオフで再送する。
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(actor_ids)
+        try:
+            items = await async_batch_get_items(self.resource, self.table.name, 'actor_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get actors by ids: {e.response['Error']['Message']}") from e
+        return order_by_ids((self._item_to_entity(item) for item in items), ids, lambda actor: actor.actor_id)
+
+    async def update(self, actor: Actor) -> Actor:
+        """
+        既存の Actor を actor.version を条件とする PutItem 1 回で更新する
+        （動作・引数・戻り値・例外は DynamoDBActorRepository.update と同じ）
+
+        Returns:
+            更新された Actor エンティティ（version は更新後のバージョン）
+        """
+        updated = replace(actor, version=actor.version + 1)
+        try:
+            await self.table.put_item(
+                Item=self._entity_to_item(updated),
+                **dynamodb_versioned_put_kwargs('actor_id', actor.version)
+            )
+            return updated
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise version_mismatch_error(
+                    "Actor", actor.actor_id, actor.version, dynamodb_current_version(e)
+                ) from e
+            raise Exception(f"Failed to update actor: {e.response['Error']['Message']}") from e
+
+    async def delete(self, actor_id: str) -> bool:
+        """
+        指定された actor_id の Actor を論理削除する (delete_flag=True)
+
+        存在確認の GetItem を行わず、条件付きの UpdateItem 1 回で判定する。
+
+        Args:
+            actor_id: 削除する Actor の ID
+
+        Returns:
+            削除した場合 True、Actor が見つからないか既に削除済みの場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            # 存在して削除されていない場合だけ delete_flag を True にし、active_shard-index から外す（version も 1 増やす）
+            await self.table.update_item(
+                Key={'actor_id': actor_id},
+                UpdateExpression=(
+                    'SET delete_flag = :flag, last_update = :update, '
+                    'version = if_not_exists(version, :one) + :one REMOVE active_shard'
+                ),
+                ConditionExpression='attribute_exists(actor_id) AND delete_flag = :active',
+                ExpressionAttributeValues={
+                    ':flag': True,
+                    ':active': False,
+                    ':one': 1,
+                    ':update': datetime.now().isoformat()
+                }
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise Exception(f"Failed to delete actor: {e.response['Error']['Message']}") from e
@@ -0,0 +1,90 @@
+"""aioboto3 を使用した非同期 DynamoDB Cast（映画とアクターの出演関係）リポジトリの実装"""
+from typing import List
+from botocore.exceptions import ClientError
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.batch import async_batch_get_items, unique_ids
+from backend.repositories.dynamodb_async_connection import AsyncDynamoDBConnection
+from backend.repositories.dynamodb_cast_repository import CastItemMapper
+from backend.config.settings import settings
+
+
+class DynamoDBAsyncCastRepository(CastItemMapper, AsyncCastRepository):
+    """aioboto3 と FilmActors テーブル（隣接リスト）を使用した非同期 Cast リポジトリの実装"""
+
+    def __init__(self, connection: AsyncDynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する非同期 DynamoDB 接続（open() 済み）
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_film_actors_table)
+
+    async def _query_ids(self, key_name: str, key_value: str, id_name: str) -> List[str]:
+        """
+        出演関係を Query して相手側の ID を返す（DynamoDBCastRepository._query_ids の非同期版）
+
+        Raises:
+            ClientError: DynamoDB の API 呼び出しに失敗した場合
+        """
+        query_kwargs = self._edge_query_kwargs(key_name, key_value, id_name)
+        ids: List[str] = []
+        while True:
+            response = await self.table.query(**query_kwargs)
+            ids.extend(item[id_name] for item in response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return ids
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    async def add(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（動作・引数・例外は DynamoDBCastRepository.add と同じ）
+        """
+        try:
+            await self.table.put_item(Item=self._edge_item(film_id, actor_id))
+        except ClientError as e:
+            raise Exception(f"Failed to add cast member: {e.response['Error']['Message']}") from e
+
+    async def remove(self, film_id: str, actor_id: str) -> bool:
+        """
+        アクターを映画の出演者から外す（引数・戻り値・例外は DynamoDBCastRepository.remove と同じ）
+
+        Returns:
+            外した場合 True、出演者として登録されていなかった場合 False
+        """
+        try:
+            response = await self.table.delete_item(
+                Key={'film_id': film_id, 'actor_id': actor_id},
+                ReturnValues='ALL_OLD'
+            )
+            return bool(response.get('Attributes'))
+        except ClientError as e:
+            raise Exception(f"Failed to remove cast member: {e.response['Error']['Message']}") from e
+
+    async def get_actors(self, film_id: str) -> List[Actor]:
+        """
+        映画の出演者のうち削除されていない Actor を Query と BatchGetItem で取得する
+        （動作・引数・戻り値・例外は DynamoDBCastRepository.get_actors と同じ）
+        """
+        try:
+            ids = unique_ids(await self._query_ids('film_id', film_id, 'actor_id'))
+            items = await async_batch_get_items(self.resource, settings.dynamodb_actors_table, 'actor_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get film actors: {e.response['Error']['Message']}") from e
+        return self._active_actors(items, ids)
+
+    async def get_films(self, actor_id: str) -> List[Film]:
+        """
+        アクターの出演作のうち削除されていない Film を Query と BatchGetItem で取得する
+        （動作・引数・戻り値・例外は DynamoDBCastRepository.get_films と同じ）
+        """
+        try:
+            ids = unique_ids(await self._query_ids('actor_id', actor_id, 'film_id'))
+            items = await async_batch_get_items(self.resource, settings.dynamodb_films_table, 'film_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get actor films: {e.response['Error']['Message']}") from e
+        return self._active_films(items, ids)
@@ -0,0 +1,58 @@
+"""非同期 DynamoDB 接続の管理"""
+from contextlib import AsyncExitStack
+from typing import Any, Dict
+
+import aioboto3
+
+from backend.config.aws import aws_session_kwargs, build_botocore_config
+from backend.config.settings import settings
+
+
+class AsyncDynamoDBConnection:
+    """
+    アプリケーション全体で共有する非同期 DynamoDB 接続
+
+    aioboto3 のセッションとリソース（内部の aiohttp 接続プール）を起動時に
+    一度だけ開き、終了時に閉じる。リポジトリは open() 済みの Table を使用する。
+    """
+
+    def __init__(self):
+        """aioboto3 セッションを作成"""
+        self.session = aioboto3.Session(**aws_session_kwargs())
+        self.resource = None
+        self._tables: Dict[str, Any] = {}
+        self._exit_stack = AsyncExitStack()
+
+    async def open(self) -> None:
+        """DynamoDB リソースを開き、使用するテーブルを読み込む"""
+        resource_kwargs: Dict[str, Any] = {"config": build_botocore_config()}
+        if settings.dynamodb_endpoint_url:
+            resource_kwargs["endpoint_url"] = settings.dynamodb_endpoint_url
+
+        self.resource = await self._exit_stack.enter_async_context(
+            self.session.resource("dynamodb", **resource_kwargs)
+        )
+        for table_name in (
+            settings.dynamodb_films_table,
+            settings.dynamodb_actors_table,
+            settings.dynamodb_film_actors_table
+        ):
+            self._tables[table_name] = await self.resource.Table(table_name)
+
+    def table(self, table_name: str):
+        """
+        open() で読み込んだ Table オブジェクトを取得する
+
+        Args:
+            table_name: テーブル名
+
+        Returns:
+            aioboto3 の DynamoDB Table リソース
+        """
+        return self._tables[table_name]
+
+    async def close(self) -> None:
+        """DynamoDB リソースと接続プールを閉じる"""
+        await self._exit_stack.aclose()
+        self._tables.clear()
+        self.resource = None
@@ -0,0 +1,322 @@
+"""aioboto3 を使用した非同期 DynamoDB Film リポジトリの実装"""
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, AsyncIterator
+from botocore.exceptions import ClientError
+
+from backend.entities.film import Film
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.batch import async_batch_get_items, order_by_ids, unique_ids
+from backend.repositories.dynamodb_async_connection import AsyncDynamoDBConnection
+from backend.repositories.dynamodb_film_repository import FilmItemMapper
+from backend.repositories.dynamodb_film_indexes import (
+    film_index_position,
+    film_index_query,
+    film_item_cursor
+)
+from backend.repositories.dynamodb_shards import (
+    IndexQuery,
+    async_iter_active_items,
+    async_query_index_items,
+    async_query_index_page,
+    sort_items
+)
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.optimistic_lock import (
+    dynamodb_current_version,
+    dynamodb_item_version,
+    dynamodb_version_get_kwargs,
+    dynamodb_versioned_put_kwargs,
+    version_mismatch_error
+)
+from backend.repositories.pagination import Page
+from backend.config.settings import settings
+from backend.exceptions import ValidationError
+
+
+class DynamoDBAsyncFilmRepository(FilmItemMapper, AsyncFilmRepository):
+    """aioboto3 を使用した非同期 DynamoDB Film リポジトリの実装"""
+
+    def __init__(self, connection: AsyncDynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する非同期 DynamoDB 接続（open() 済み）
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_films_table)
+
+    async def create(self, film: Film) -> Film:
+        """
+        新しい Film を作成する
+
+        Args:
+            film: 作成する Film エンティティ
+
+        Returns:
+            作成された Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            item = self._entity_to_item(film)
+            await self.table.put_item(Item=item)
+            return film
+        except ClientError as e:
+            raise Exception(f"Failed to create film: {e.response['Error']['Message']}") from e
+
+    async def create_many(self, films: List[Film]) -> List[Film]:
+        """
+        複数の Film を BatchWriteItem でまとめて作成する
+
+        batch_writer が 25 件ずつ BatchWriteItem を送信し、UnprocessedItems は再送する。
+
+        Args:
+            films: 作成する Film エンティティのリスト
+
+        Returns:
+            作成された Film エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            async with self.table.batch_writer() as batch:
+                for film in films:
+                    await batch.put_item(Item=self._entity_to_item(film))
+            return list(films)
+        except ClientError as e:
+            raise Exception(f"Failed to create films: {e.response['Error']['Message']}") from e
+
+    async def _load_index_items(self, index_query: IndexQuery, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        キーだけを射影する GSI から読んだアイテムの本体を BatchGetItem で読む
+        （DynamoDBFilmRepository._load_index_items の非同期版）
+
+        Raises:
+            ClientError: DynamoDB の API 呼び出しに失敗した場合
+        """
+        if not index_query.keys_only:
+            return items
+        ids = [item['film_id'] for item in items]
+        loaded = await async_batch_get_items(self.resource, self.table.name, 'film_id', ids)
+        return self._ordered_active_items(loaded, ids)
+
+    async def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """
+        削除されていない Film を query の条件と並び順で全て取得する (delete_flag=False)
+
+        条件に対応する GSI（FILM_QUERY_INDEXES）の全パーティションを並列に Query して並び替え、
+        キーだけを射影する GSI の場合はアイテム本体を BatchGetItem で読む。公開年の範囲は
+        公開年で並べる GSI のソートキーの範囲（KeyConditionExpression）として DynamoDB 側で評価する。
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        index_query = film_index_query(query or FilmQuery())
+        try:
+            items = sort_items(await async_query_index_items(self.table, index_query), index_query, 'film_id')
+            items = await self._load_index_items(index_query, items)
+        except ClientError as e:
+            raise Exception(f"Failed to get all films: {e.response['Error']['Message']}") from e
+        return [self._item_to_entity(item) for item in items]
+
+    async def iter_all(self) -> AsyncIterator[Film]:
+        """
+        削除されていない全ての Film を 1 件ずつ返す (delete_flag=False)
+
+        active_shard-index をシャードごとに Query し、ページ（最大 1MB）ごとに取得して順に返す。
+
+        Yields:
+            Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            async for item in async_iter_active_items(self.table):
+                yield self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to iterate films: {e.response['Error']['Message']}") from e
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない Film を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        条件に対応する GSI（FILM_QUERY_INDEXES）の各パーティションから並列に先頭 limit + 1 件を
+        取得してマージし、キーだけを射影する GSI の場合はページのアイテム本体を BatchGetItem で読む。
+        カーソルの形式は MySQL の実装と同じ。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        query = query or FilmQuery()
+        position = film_index_position(query, cursor)
+        index_query = film_index_query(query)
+        try:
+            index_items, has_more = await async_query_index_page(self.table, index_query, 'film_id', limit, position)
+            items = await self._load_index_items(index_query, index_items)
+        except ClientError as e:
+            raise Exception(f"Failed to get film page: {e.response['Error']['Message']}") from e
+        # カーソルは GSI から読んだ並び順の末尾から作る（DynamoDBFilmRepository.get_page と同じ）
+        next_cursor = film_item_cursor(query, index_items[-1]) if has_more else None
+        return Page(items=[self._item_to_entity(item) for item in items], next_cursor=next_cursor)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        全文検索（DynamoDB には全文検索の機能がないため、SEARCH_INDEX_ENABLED の場合は
+        SearchIndexedFilmRepository がインプロセスの検索インデックスで行う）
+
+        Films テーブルの Scan と contains() による検索は件数に比例して読み込みキャパシティを
+        消費するため行わない。
+
+        Raises:
+            ValidationError: 常に送出する
+        """
+        raise ValidationError("DynamoDB の全文検索は SEARCH_INDEX_ENABLED が無効のため利用できません")
+
+    async def get_by_id(self, film_id: str) -> Optional[Film]:
+        """
+        指定された film_id の Film を取得する
+
+        Args:
+            film_id: 取得する Film の ID
+
+        Returns:
+            Film エンティティ、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = await self.table.get_item(Key={'film_id': film_id})
+            item = response.get('Item')
+            
+            if item is None:
+                return None
+            
+            return self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to get film by id: {e.response['Error']['Message']}") from e
+
+    async def get_version(self, film_id: str) -> Optional[int]:
+        """
+        指定された film_id の Film の現在のバージョンを強い整合性の読み込みで取得する
+
+        Args:
+            film_id: 対象の Film の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = await self.table.get_item(**dynamodb_version_get_kwargs('film_id', film_id))
+            return dynamodb_item_version(response.get('Item'))
+        except ClientError as e:
+            raise Exception(f"Failed to get film version: {e.response['Error']['Message']}") from e
+
+    async def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film を BatchGetItem でまとめて取得する
+
+        100 キーずつリクエストし、UnprocessedKeys は指数バックオフで再送する。
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(film_ids)
+        try:
+            items = await async_batch_get_items(self.resource, self.table.name, 'film_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get films by ids: {e.response['Error']['Message']}") from e
+        return order_by_ids((self._item_to_entity(item) for item in items), ids, lambda film: film.film_id)
+
+    async def update(self, film: Film) -> Film:
+        """
+        既存の Film を film.version を条件とする PutItem 1 回で更新する
+        （動作・引数・戻り値・例外は DynamoDBFilmRepository.update と同じ）
+
+        Returns:
+            更新された Film エンティティ（version は更新後のバージョン）
+        """
+        updated = replace(film, version=film.version + 1)
+        try:
+            await self.table.put_item(
+                Item=self._entity_to_item(updated),
+                **dynamodb_versioned_put_kwargs('film_id', film.version)
+            )
+            return updated
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise version_mismatch_error(
+                    "Film", film.film_id, film.version, dynamodb_current_version(e)
+                ) from e
+            raise Exception(f"Failed to update film: {e.response['Error']['Message']}") from e
+
+    async def delete(self, film_id: str) -> bool:
+        """
+        指定された film_id の Film を論理削除する (delete_flag=True)
+
+        存在確認の GetItem を行わず、条件付きの UpdateItem 1 回で判定する。
+
+        Args:
+            film_id: 削除する Film の ID
+
+        Returns:
+            削除した場合 True、Film が見つからないか既に削除済みの場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            # 存在して削除されていない場合だけ delete_flag を True にし、active_shard-index とレーティングの GSI から外す（version も 1 増やす）
+            await self.table.update_item(
+                Key={'film_id': film_id},
+                UpdateExpression=(
+                    'SET delete_flag = :flag, last_update = :update, '
+                    'version = if_not_exists(version, :one) + :one REMOVE active_shard, active_rating'
+                ),
+                ConditionExpression='attribute_exists(film_id) AND delete_flag = :active',
+                ExpressionAttributeValues={
+                    ':flag': True,
+                    ':active': False,
+                    ':one': 1,
+                    ':update': datetime.now().isoformat()
+                }
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise Exception(f"Failed to delete film: {e.response['Error']['Message']}") from e
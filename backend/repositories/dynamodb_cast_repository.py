@@ -0,0 +1,182 @@
+"""DynamoDB を使用した Cast（映画とアクターの出演関係）リポジトリの実装"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+from botocore.exceptions import ClientError
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.batch import batch_get_items, order_by_ids, unique_ids
+from backend.repositories.cast_repository import CastRepository
+from backend.repositories.dynamodb_actor_repository import ActorItemMapper
+from backend.repositories.dynamodb_connection import DynamoDBConnection
+from backend.repositories.dynamodb_film_repository import FilmItemMapper
+from backend.config.settings import settings
+
+# FilmActors テーブルの逆向きの GSI（アクターの出演作の取得用）
+FILM_ACTORS_BY_ACTOR_INDEX = "actor_id-film_id-index"
+
+
+class CastItemMapper:
+    """
+    出演関係のアイテム・Query の引数を組み立て、取得したアイテムをエンティティに変換する
+    （同期・非同期リポジトリで共有）
+
+    FilmActors テーブルは出演関係 1 件を 1 アイテム（隣接リストの辺）として、film_id を
+    パーティションキー・actor_id をソートキーに持つ。逆向きは KEYS_ONLY の GSI
+    （actor_id-film_id-index）で引く。
+    """
+
+    _actor_mapper = ActorItemMapper()
+    _film_mapper = FilmItemMapper()
+
+    def _edge_item(self, film_id: str, actor_id: str) -> dict:
+        """出演関係のアイテム"""
+        return {'film_id': film_id, 'actor_id': actor_id, 'last_update': datetime.now().isoformat()}
+
+    def _edge_query_kwargs(self, key_name: str, key_value: str, id_name: str) -> Dict[str, Any]:
+        """
+        key_name が key_value の出演関係の id_name だけを読み出す Query の引数
+
+        Args:
+            key_name: 絞り込むキー（film_id ならテーブル、actor_id なら GSI を Query する）
+            key_value: 絞り込む ID
+            id_name: 読み出す相手側の ID の属性名
+        """
+        kwargs: Dict[str, Any] = {
+            'KeyConditionExpression': '#pk = :pk',
+            'ProjectionExpression': '#id',
+            'ExpressionAttributeNames': {'#pk': key_name, '#id': id_name},
+            'ExpressionAttributeValues': {':pk': key_value},
+        }
+        if key_name == 'actor_id':
+            kwargs['IndexName'] = FILM_ACTORS_BY_ACTOR_INDEX
+        return kwargs
+
+    def _active_actors(self, items: Iterable[dict], ids: List[str]) -> List[Actor]:
+        """BatchGetItem で取得した Actors のアイテムを ids の順に並べ、削除されていないものだけを返す"""
+        actors = order_by_ids(
+            (self._actor_mapper._item_to_entity(item) for item in items), ids, lambda actor: actor.actor_id
+        )
+        return [actor for actor in actors if not actor.delete_flag]
+
+    def _active_films(self, items: Iterable[dict], ids: List[str]) -> List[Film]:
+        """BatchGetItem で取得した Films のアイテムを ids の順に並べ、削除されていないものだけを返す"""
+        films = order_by_ids(
+            (self._film_mapper._item_to_entity(item) for item in items), ids, lambda film: film.film_id
+        )
+        return [film for film in films if not film.delete_flag]
+
+
+class DynamoDBCastRepository(CastItemMapper, CastRepository):
+    """DynamoDB の FilmActors テーブル（隣接リスト）を使用した Cast リポジトリの実装"""
+
+    def __init__(self, connection: DynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する DynamoDB 接続
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_film_actors_table)
+
+    def _query_ids(self, key_name: str, key_value: str, id_name: str) -> List[str]:
+        """
+        出演関係を Query して相手側の ID を返す（1MB を超える場合だけ続きのページを読む）
+
+        Raises:
+            ClientError: DynamoDB の API 呼び出しに失敗した場合
+        """
+        query_kwargs = self._edge_query_kwargs(key_name, key_value, id_name)
+        ids: List[str] = []
+        while True:
+            response = self.table.query(**query_kwargs)
+            ids.extend(item[id_name] for item in response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return ids
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def add(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（既に登録されている場合は上書きする）
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            self.table.put_item(Item=self._edge_item(film_id, actor_id))
+        except ClientError as e:
+            raise Exception(f"Failed to add cast member: {e.response['Error']['Message']}") from e
+
+    def remove(self, film_id: str, actor_id: str) -> bool:
+        """
+        アクターを映画の出演者から外す
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Returns:
+            外した場合 True、出演者として登録されていなかった場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = self.table.delete_item(
+                Key={'film_id': film_id, 'actor_id': actor_id},
+                ReturnValues='ALL_OLD'
+            )
+            return bool(response.get('Attributes'))
+        except ClientError as e:
+            raise Exception(f"Failed to remove cast member: {e.response['Error']['Message']}") from e
+
+    def get_actors(self, film_id: str) -> List[Actor]:
+        """
+        映画の出演者のうち削除されていない Actor を取得する
+
+        FilmActors テーブルを film_id で Query して actor_id を求め、Actors テーブルから
+        BatchGetItem（100 キーずつ）でまとめて取得する。
+
+        Args:
+            film_id: 映画の ID
+
+        Returns:
+            actor_id の順に並べた Actor エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            ids = unique_ids(self._query_ids('film_id', film_id, 'actor_id'))
+            items = batch_get_items(self.resource, settings.dynamodb_actors_table, 'actor_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get film actors: {e.response['Error']['Message']}") from e
+        return self._active_actors(items, ids)
+
+    def get_films(self, actor_id: str) -> List[Film]:
+        """
+        アクターの出演作のうち削除されていない Film を取得する
+
+        actor_id-film_id-index を actor_id で Query して film_id を求め、Films テーブルから
+        BatchGetItem（100 キーずつ）でまとめて取得する。
+
+        Args:
+            actor_id: アクターの ID
+
+        Returns:
+            film_id の順に並べた Film エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            ids = unique_ids(self._query_ids('actor_id', actor_id, 'film_id'))
+            items = batch_get_items(self.resource, settings.dynamodb_films_table, 'film_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get actor films: {e.response['Error']['Message']}") from e
+        return self._active_films(items, ids)
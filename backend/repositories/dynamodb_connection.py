@@ -0,0 +1,61 @@
+"""DynamoDB 接続の管理"""
+import threading
+from typing import Any, Dict
+
+import boto3
+
+from backend.config.aws import aws_session_kwargs, build_botocore_config
+from backend.config.settings import settings
+
+
+class DynamoDBConnection:
+    """
+    アプリケーション全体で共有する DynamoDB 接続
+
+    boto3 のセッションとリソースの作成はコストが高く、作成ごとに HTTPS の
+    接続プールも新しく開かれるため、起動時に一度だけ作成して使い回す。
+
+    リポジトリは Table の query / get_item / put_item などのアクションのみを
+    使用し、これらはスレッドセーフな低レベルクライアント（resource.meta.client）
+    に委譲される。Table オブジェクトの作成はロックで保護する。
+    """
+
+    def __init__(self):
+        """boto3 セッション・リソースを作成"""
+        self.session = boto3.session.Session(**aws_session_kwargs())
+
+        resource_kwargs: Dict[str, Any] = {"config": build_botocore_config()}
+        if settings.dynamodb_endpoint_url:
+            resource_kwargs["endpoint_url"] = settings.dynamodb_endpoint_url
+
+        self.resource = self.session.resource("dynamodb", **resource_kwargs)
+        self._tables: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """リソースと接続プールを共有する低レベル DynamoDB クライアント"""
+        return self.resource.meta.client
+
+    def table(self, table_name: str):
+        """
+        指定された名前の Table オブジェクトを取得する
+
+        Args:
+            table_name: テーブル名
+
+        Returns:
+            DynamoDB Table リソース
+        """
+        table = self._tables.get(table_name)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(table_name)
+                if table is None:
+                    table = self.resource.Table(table_name)
+                    self._tables[table_name] = table
+        return table
+
+    def close(self) -> None:
+        """接続プールを閉じる"""
+        self.client.close()
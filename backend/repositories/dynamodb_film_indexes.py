@@ -0,0 +1,192 @@
+"""映画一覧の絞り込み・並び替えに使う Films テーブルの GSI"""
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.entities.film import Film
+from backend.repositories.dynamodb_shards import ACTIVE_SHARD_INDEX, IndexQuery, active_shard, active_shards
+from backend.repositories.film_query import FilmQuery, FilmSort
+from backend.repositories.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+# 削除されていないアイテムだけが持つ「rating#シャード番号」の属性（レーティングで絞り込む GSI のパーティションキー）。
+# レーティングは 5 種類しかないため、active_shard と同じシャード番号で書き込みと読み出しを分散する
+ACTIVE_RATING_ATTRIBUTE = 'active_rating'
+
+# 公開年で並べる GSI のソートキー。公開年のないアイテムは NO_RELEASE_YEAR（最も小さい値）になる
+RELEASE_YEAR_KEY_ATTRIBUTE = 'release_year_key'
+NO_RELEASE_YEAR = 0
+
+# 並び替えの基準ごとの GSI のソートキー
+SORT_ATTRIBUTES = {
+    FilmSort.LAST_UPDATE: 'last_update',
+    FilmSort.TITLE: 'title',
+    FilmSort.RELEASE_YEAR: RELEASE_YEAR_KEY_ATTRIBUTE,
+}
+
+# (パーティションキー, ソートキー) ごとの GSI 名。パーティションキーは、絞り込まない場合は
+# active_shard、レーティングで絞り込む場合は active_rating で、どちらも全シャードを並列に読む
+FILM_QUERY_INDEXES = {
+    ('active_shard', 'last_update'): ACTIVE_SHARD_INDEX,
+    ('active_shard', 'title'): 'active_shard-title-index',
+    ('active_shard', RELEASE_YEAR_KEY_ATTRIBUTE): 'active_shard-release_year-index',
+    (ACTIVE_RATING_ATTRIBUTE, 'last_update'): 'active_rating-last_update-index',
+    (ACTIVE_RATING_ATTRIBUTE, 'title'): 'active_rating-title-index',
+    (ACTIVE_RATING_ATTRIBUTE, RELEASE_YEAR_KEY_ATTRIBUTE): 'active_rating-release_year-index',
+}
+
+# 公開年で並べる GSI にキー以外に射影する属性（公開年の範囲を読んでから last_update・title で並べるため）。
+# active_shard-index 以外の GSI はアイテム本体を射影せず、ページのアイテムを BatchGetItem で読む
+RELEASE_YEAR_INDEX_ATTRIBUTES = ['last_update', 'title']
+
+# FILM_QUERY_INDEXES のキー属性の型
+FILM_QUERY_ATTRIBUTE_TYPES = {
+    'active_shard': 'N',
+    ACTIVE_RATING_ATTRIBUTE: 'S',
+    'last_update': 'S',
+    'title': 'S',
+    RELEASE_YEAR_KEY_ATTRIBUTE: 'N',
+}
+
+
+def film_query_attributes(film: Film) -> Dict[str, Any]:
+    """
+    Film を FILM_QUERY_INDEXES に載せるための属性を返す
+
+    active_rating は削除されていない間だけ持たせ、レーティングの GSI を疎にする。
+    値は active_rating_key（film_id から決まる active_shard と同じシャード番号）。
+
+    Args:
+        film: Film エンティティ
+
+    Returns:
+        アイテムに追加する属性
+    """
+    attributes: Dict[str, Any] = {
+        RELEASE_YEAR_KEY_ATTRIBUTE: film.release_year if film.release_year is not None else NO_RELEASE_YEAR
+    }
+    if not film.delete_flag:
+        attributes[ACTIVE_RATING_ATTRIBUTE] = active_rating_key(film.rating.value, active_shard(film.film_id))
+    return attributes
+
+
+def active_rating_key(rating: str, shard: int) -> str:
+    """レーティングで絞り込む GSI のパーティションキーの値（"PG#3" など）"""
+    return f"{rating}#{shard}"
+
+
+def film_index_query(query: FilmQuery) -> IndexQuery:
+    """
+    FilmQuery を読み出す GSI とパーティション・範囲の指定に変換する
+
+    公開年の範囲を指定した場合は、並び替えの基準によらず公開年で並べる GSI のソートキーの範囲
+    （KeyConditionExpression）で読み、範囲外のアイテムは読まない。last_update・title で並べる
+    場合は、範囲の全アイテムを読んでから並べ替える。
+
+    Args:
+        query: 絞り込み・並び替え条件
+
+    Returns:
+        IndexQuery
+    """
+    if query.rating is not None:
+        partition_attribute = ACTIVE_RATING_ATTRIBUTE
+        partitions = tuple(active_rating_key(query.rating.value, shard) for shard in active_shards())
+    else:
+        partition_attribute, partitions = 'active_shard', active_shards()
+    order_attribute = SORT_ATTRIBUTES[query.sort]
+    sort_attribute = RELEASE_YEAR_KEY_ATTRIBUTE if query.has_year_range else order_attribute
+    index_name = FILM_QUERY_INDEXES[(partition_attribute, sort_attribute)]
+    index_query = IndexQuery(
+        index_name=index_name,
+        partition_attribute=partition_attribute,
+        partitions=partitions,
+        sort_attribute=sort_attribute,
+        descending=query.descending,
+        order_attribute=order_attribute if order_attribute != sort_attribute else None,
+        keys_only=index_name != ACTIVE_SHARD_INDEX
+    )
+    if not query.has_year_range:
+        return index_query
+
+    # 公開年の範囲を指定した場合、公開年のない映画（NO_RELEASE_YEAR）は含めない
+    lower = query.year_from if query.year_from is not None else NO_RELEASE_YEAR + 1
+    return replace(index_query, lower=lower, upper=query.year_to)
+
+
+def film_index_position(query: FilmQuery, cursor: Optional[str]) -> Optional[Tuple[Any, str]]:
+    """
+    カーソルを GSI のソートキーと比較できる (ソートキーの値, film_id) に戻す
+
+    カーソルは MySQL のキーセットページネーションと同じ形式。
+
+    Raises:
+        ValidationError: cursor の形式が不正な場合
+    """
+    if cursor is None:
+        return None
+    value, film_id = decode_keyset_cursor(cursor, query.sort_key())
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif value is None:
+        value = NO_RELEASE_YEAR
+    return value, film_id
+
+
+def film_item_cursor(query: FilmQuery, item: Dict[str, Any]) -> str:
+    """
+    ページ末尾のアイテムから次ページのカーソルを作成する（MySQL と同じ形式）
+
+    アイテムは GSI から読んだキー（と並び替え用の属性）だけの場合があるため、
+    公開年は GSI のソートキー（release_year_key）から読む。
+    """
+    sort_key = query.sort_key()
+    if query.sort == FilmSort.RELEASE_YEAR:
+        release_year = int(item[RELEASE_YEAR_KEY_ATTRIBUTE])
+        value = None if release_year == NO_RELEASE_YEAR else release_year
+    else:
+        value = item.get(sort_key.attribute)
+    return encode_keyset_cursor(value, item['film_id'], sort_key.attribute)
+
+
+def film_query_index_definitions(provisioned_throughput: Optional[Dict[str, int]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    active_shard-index 以外の FILM_QUERY_INDEXES の GSI 定義を返す
+
+    書き込みのたびに GSI ごとに射影した属性の分だけ書き込みキャパシティを消費するため、
+    アイテム本体は射影しない（KEYS_ONLY。公開年で並べる GSI は並べ替え用に
+    RELEASE_YEAR_INDEX_ATTRIBUTES も射影する INCLUDE）。
+
+    Args:
+        provisioned_throughput: GSI のスループット（オンデマンドのテーブルの場合は None）
+
+    Returns:
+        GSI 名と GlobalSecondaryIndexes の要素の辞書
+    """
+    definitions = {}
+    for (partition_attribute, sort_attribute), index_name in FILM_QUERY_INDEXES.items():
+        if index_name == ACTIVE_SHARD_INDEX:
+            continue
+        definition: Dict[str, Any] = {
+            'IndexName': index_name,
+            'KeySchema': [
+                {'AttributeName': partition_attribute, 'KeyType': 'HASH'},
+                {'AttributeName': sort_attribute, 'KeyType': 'RANGE'}
+            ],
+            'Projection': (
+                {'ProjectionType': 'INCLUDE', 'NonKeyAttributes': list(RELEASE_YEAR_INDEX_ATTRIBUTES)}
+                if sort_attribute == RELEASE_YEAR_KEY_ATTRIBUTE
+                else {'ProjectionType': 'KEYS_ONLY'}
+            )
+        }
+        if provisioned_throughput is not None:
+            definition['ProvisionedThroughput'] = dict(provisioned_throughput)
+        definitions[index_name] = definition
+    return definitions
+
+
+def film_query_attribute_definitions() -> List[Dict[str, str]]:
+    """FILM_QUERY_INDEXES のキー属性の AttributeDefinitions を返す"""
+    return [
+        {'AttributeName': name, 'AttributeType': attribute_type}
+        for name, attribute_type in FILM_QUERY_ATTRIBUTE_TYPES.items()
+    ]
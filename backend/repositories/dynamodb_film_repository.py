@@ -1,33 +1,43 @@
 """DynamoDB を使用した Film リポジトリの実装"""
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional
-import boto3
+from typing import Any, Dict, Iterable, List, Optional, Iterator
 from botocore.exceptions import ClientError
 
 from backend.entities.film import Film
 from backend.entities.rating import Rating
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.batch import batch_get_items, order_by_ids, unique_ids
+from backend.repositories.dynamodb_connection import DynamoDBConnection
+from backend.repositories.dynamodb_film_indexes import (
+    film_index_position,
+    film_index_query,
+    film_item_cursor,
+    film_query_attributes
+)
+from backend.repositories.dynamodb_shards import (
+    IndexQuery,
+    active_shard,
+    iter_active_items,
+    query_index_items,
+    query_index_page,
+    sort_items
+)
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.optimistic_lock import (
+    dynamodb_current_version,
+    dynamodb_item_version,
+    dynamodb_version_get_kwargs,
+    dynamodb_versioned_put_kwargs,
+    version_mismatch_error
+)
+from backend.repositories.pagination import Page
 from backend.config.settings import settings
+from backend.exceptions import ValidationError
 
 
-class DynamoDBFilmRepository(FilmRepository):
-    """DynamoDB を使用した Film リポジトリの実装"""
-
-    def __init__(self):
-        """DynamoDB クライアントを初期化"""
-        dynamodb_config = {
-            'region_name': settings.aws_region
-        }
-        
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
-            dynamodb_config['aws_access_key_id'] = settings.aws_access_key_id
-            dynamodb_config['aws_secret_access_key'] = settings.aws_secret_access_key
-        
-        if settings.dynamodb_endpoint_url:
-            dynamodb_config['endpoint_url'] = settings.dynamodb_endpoint_url
-        
-        self.dynamodb = boto3.resource('dynamodb', **dynamodb_config)
-        self.table = self.dynamodb.Table(settings.dynamodb_films_table)
+class FilmItemMapper:
+    """DynamoDB アイテムと Film エンティティを相互に変換する（同期・非同期リポジトリで共有）"""
 
     def _entity_to_item(self, film: Film) -> dict:
         """Film エンティティを DynamoDB アイテムに変換"""
@@ -36,7 +46,8 @@ class DynamoDBFilmRepository(FilmRepository):
             'title': film.title,
             'rating': film.rating.value,
             'last_update': film.last_update.isoformat(),
-            'delete_flag': film.delete_flag
+            'delete_flag': film.delete_flag,
+            'version': film.version
         }
         
         if film.description is not None:
@@ -46,6 +57,12 @@ class DynamoDBFilmRepository(FilmRepository):
         if film.release_year is not None:
             item['release_year'] = film.release_year
         
+        # 削除されていない間だけ active_shard を持たせ、active_shard-index を疎にする
+        if not film.delete_flag:
+            item['active_shard'] = active_shard(film.film_id)
+        # 一覧の絞り込み・並び替えに使う GSI のキー
+        item.update(film_query_attributes(film))
+
         return item
 
     def _item_to_entity(self, item: dict) -> Film:
@@ -59,9 +76,35 @@ class DynamoDBFilmRepository(FilmRepository):
             description=item.get('description'),
             image_path=item.get('image_path'),
             release_year=int(release_year) if release_year is not None else None,
-            delete_flag=item.get('delete_flag', False)
+            delete_flag=item.get('delete_flag', False),
+            version=int(item.get('version', 1))
         )
 
+    def _ordered_active_items(self, items: Iterable[Dict[str, Any]], ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        BatchGetItem で取得したアイテムを GSI から読んだ ids の順に並べる
+
+        GSI は結果整合性のため、読み出しの間に削除されたアイテムは取り除く。
+        """
+        return [
+            item for item in order_by_ids(items, ids, lambda item: item['film_id'])
+            if not item.get('delete_flag', False)
+        ]
+
+
+class DynamoDBFilmRepository(FilmItemMapper, FilmRepository):
+    """DynamoDB を使用した Film リポジトリの実装"""
+
+    def __init__(self, connection: DynamoDBConnection):
+        """
+        Table リソースを初期化
+
+        Args:
+            connection: アプリケーション全体で共有する DynamoDB 接続
+        """
+        self.resource = connection.resource
+        self.table = connection.table(settings.dynamodb_films_table)
+
     def create(self, film: Film) -> Film:
         """
         新しい Film を作成する
@@ -82,9 +125,51 @@ class DynamoDBFilmRepository(FilmRepository):
         except ClientError as e:
             raise Exception(f"Failed to create film: {e.response['Error']['Message']}") from e
 
-    def get_all(self) -> List[Film]:
+    def create_many(self, films: List[Film]) -> List[Film]:
         """
-        削除されていない全ての Film を取得する (delete_flag=False)
+        複数の Film を BatchWriteItem でまとめて作成する
+
+        batch_writer が 25 件ずつ BatchWriteItem を送信し、UnprocessedItems は再送する。
+
+        Args:
+            films: 作成する Film エンティティのリスト
+
+        Returns:
+            作成された Film エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            with self.table.batch_writer() as batch:
+                for film in films:
+                    batch.put_item(Item=self._entity_to_item(film))
+            return list(films)
+        except ClientError as e:
+            raise Exception(f"Failed to create films: {e.response['Error']['Message']}") from e
+
+    def _load_index_items(self, index_query: IndexQuery, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        キーだけを射影する GSI から読んだアイテムの本体を BatchGetItem（100 キーずつ）で読む
+
+        Raises:
+            ClientError: DynamoDB の API 呼び出しに失敗した場合
+        """
+        if not index_query.keys_only:
+            return items
+        ids = [item['film_id'] for item in items]
+        return self._ordered_active_items(batch_get_items(self.resource, self.table.name, 'film_id', ids), ids)
+
+    def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """
+        削除されていない Film を query の条件と並び順で全て取得する (delete_flag=False)
+
+        条件に対応する GSI（FILM_QUERY_INDEXES）の全パーティションを並列に Query して並び替え、
+        キーだけを射影する GSI の場合はアイテム本体を BatchGetItem で読む。公開年の範囲は
+        公開年で並べる GSI のソートキーの範囲（KeyConditionExpression）として DynamoDB 側で評価する。
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
 
         Returns:
             Film エンティティのリスト
@@ -92,33 +177,81 @@ class DynamoDBFilmRepository(FilmRepository):
         Raises:
             Exception: データベース操作に失敗した場合
         """
+        index_query = film_index_query(query or FilmQuery())
         try:
-            # delete_flag-index GSI を使用してクエリ
-            response = self.table.query(
-                IndexName='delete_flag-index',
-                KeyConditionExpression='delete_flag = :flag',
-                ExpressionAttributeValues={
-                    ':flag': False
-                }
-            )
-            
-            films = [self._item_to_entity(item) for item in response.get('Items', [])]
-            
-            # ページネーションがある場合は続きを取得
-            while 'LastEvaluatedKey' in response:
-                response = self.table.query(
-                    IndexName='delete_flag-index',
-                    KeyConditionExpression='delete_flag = :flag',
-                    ExpressionAttributeValues={
-                        ':flag': False
-                    },
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
-                films.extend([self._item_to_entity(item) for item in response.get('Items', [])])
-            
-            return films
+            items = sort_items(query_index_items(self.table, index_query), index_query, 'film_id')
+            items = self._load_index_items(index_query, items)
         except ClientError as e:
             raise Exception(f"Failed to get all films: {e.response['Error']['Message']}") from e
+        return [self._item_to_entity(item) for item in items]
+
+    def iter_all(self) -> Iterator[Film]:
+        """
+        削除されていない全ての Film を 1 件ずつ返す (delete_flag=False)
+
+        active_shard-index をシャードごとに Query し、ページ（最大 1MB）ごとに取得して順に返す。
+
+        Yields:
+            Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            for item in iter_active_items(self.table):
+                yield self._item_to_entity(item)
+        except ClientError as e:
+            raise Exception(f"Failed to iterate films: {e.response['Error']['Message']}") from e
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない Film を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        条件に対応する GSI（FILM_QUERY_INDEXES）の各パーティションから並列に先頭 limit + 1 件を
+        取得してマージし、キーだけを射影する GSI の場合はページのアイテム本体を BatchGetItem で読む。
+        カーソルの形式は MySQL の実装と同じ。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        query = query or FilmQuery()
+        position = film_index_position(query, cursor)
+        index_query = film_index_query(query)
+        try:
+            index_items, has_more = query_index_page(self.table, index_query, 'film_id', limit, position)
+            items = self._load_index_items(index_query, index_items)
+        except ClientError as e:
+            raise Exception(f"Failed to get film page: {e.response['Error']['Message']}") from e
+        # カーソルは GSI から読んだ並び順の末尾から作る（本体の読み出し後に削除されたアイテムがあっても進む）
+        next_cursor = film_item_cursor(query, index_items[-1]) if has_more else None
+        return Page(items=[self._item_to_entity(item) for item in items], next_cursor=next_cursor)
+
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        全文検索（DynamoDB には全文検索の機能がないため、SEARCH_INDEX_ENABLED の場合は
+        SearchIndexedFilmRepository がインプロセスの検索インデックスで行う）
+
+        Films テーブルの Scan と contains() による検索は件数に比例して読み込みキャパシティを
+        消費するため行わない。
+
+        Raises:
+            ValidationError: 常に送出する
+        """
+        raise ValidationError("DynamoDB の全文検索は SEARCH_INDEX_ENABLED が無効のため利用できません")
 
     def get_by_id(self, film_id: str) -> Optional[Film]:
         """
@@ -144,54 +277,112 @@ class DynamoDBFilmRepository(FilmRepository):
         except ClientError as e:
             raise Exception(f"Failed to get film by id: {e.response['Error']['Message']}") from e
 
+    def get_version(self, film_id: str) -> Optional[int]:
+        """
+        指定された film_id の Film の現在のバージョンを強い整合性の読み込みで取得する
+
+        Args:
+            film_id: 対象の Film の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        try:
+            response = self.table.get_item(**dynamodb_version_get_kwargs('film_id', film_id))
+            return dynamodb_item_version(response.get('Item'))
+        except ClientError as e:
+            raise Exception(f"Failed to get film version: {e.response['Error']['Message']}") from e
+
+    def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film を BatchGetItem でまとめて取得する
+
+        100 キーずつリクエストし、UnprocessedKeys は指数バックオフで再送する。
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(film_ids)
+        try:
+            items = batch_get_items(self.resource, self.table.name, 'film_id', ids)
+        except ClientError as e:
+            raise Exception(f"Failed to get films by ids: {e.response['Error']['Message']}") from e
+        return order_by_ids((self._item_to_entity(item) for item in items), ids, lambda film: film.film_id)
+
     def update(self, film: Film) -> Film:
         """
-        既存の Film を更新する
+        既存の Film を film.version を条件とする PutItem 1 回で更新する
+
+        アイテムが存在し version が一致する場合だけ書き込み、version を 1 増やす。
+        ロックを取らないため、同時の更新が互いを待つことはない。
 
         Args:
-            film: 更新する Film エンティティ
+            film: 更新する Film エンティティ（version は読み込んだ時点のバージョン）
 
         Returns:
-            更新された Film エンティティ
+            更新された Film エンティティ（version は更新後のバージョン）
 
         Raises:
+            NotFoundError: Film が見つからない場合
+            ConflictError: version が現在のバージョンと一致しない場合
             Exception: データベース操作に失敗した場合
         """
+        updated = replace(film, version=film.version + 1)
         try:
-            item = self._entity_to_item(film)
-            self.table.put_item(Item=item)
-            return film
+            self.table.put_item(
+                Item=self._entity_to_item(updated),
+                **dynamodb_versioned_put_kwargs('film_id', film.version)
+            )
+            return updated
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise version_mismatch_error(
+                    "Film", film.film_id, film.version, dynamodb_current_version(e)
+                ) from e
             raise Exception(f"Failed to update film: {e.response['Error']['Message']}") from e
 
     def delete(self, film_id: str) -> bool:
         """
         指定された film_id の Film を論理削除する (delete_flag=True)
 
+        存在確認の GetItem を行わず、条件付きの UpdateItem 1 回で判定する。
+
         Args:
             film_id: 削除する Film の ID
 
         Returns:
-            削除が成功した場合 True、Film が見つからない場合 False
+            削除した場合 True、Film が見つからないか既に削除済みの場合 False
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         try:
-            # まず Film が存在するか確認
-            film = self.get_by_id(film_id)
-            if film is None:
-                return False
-            
-            # delete_flag を True に更新
+            # 存在して削除されていない場合だけ delete_flag を True にし、active_shard-index とレーティングの GSI から外す（version も 1 増やす）
             self.table.update_item(
                 Key={'film_id': film_id},
-                UpdateExpression='SET delete_flag = :flag, last_update = :update',
+                UpdateExpression=(
+                    'SET delete_flag = :flag, last_update = :update, '
+                    'version = if_not_exists(version, :one) + :one REMOVE active_shard, active_rating'
+                ),
+                ConditionExpression='attribute_exists(film_id) AND delete_flag = :active',
                 ExpressionAttributeValues={
                     ':flag': True,
+                    ':active': False,
+                    ':one': 1,
                     ':update': datetime.now().isoformat()
                 }
             )
             return True
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
             raise Exception(f"Failed to delete film: {e.response['Error']['Message']}") from e
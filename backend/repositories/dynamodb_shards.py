@@ -0,0 +1,519 @@
+"""DynamoDB の削除されていないアイテムを書き込み分散した疎な GSI で読み出す"""
+import asyncio
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from backend.config.settings import settings
+from backend.repositories.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+# 削除されていないアイテムだけが持つ active_shard 属性をパーティションキー、
+# last_update をソートキーとする疎な GSI
+ACTIVE_SHARD_INDEX = 'active_shard-index'
+
+
+def _shard_query_max_workers() -> int:
+    """
+    シャードへの並列 Query に使うスレッド数を返す
+
+    同期リポジトリは最大 THREADPOOL_MAX_WORKERS 件のリクエストから同時に呼ばれ、それぞれが
+    全シャードを並列に読むため、既定では両者の積にする（シャード数だけでは同時の一覧
+    リクエストがこのプールで直列になる）。
+    """
+    if settings.dynamodb_shard_query_max_workers is not None:
+        return max(settings.dynamodb_shard_query_max_workers, 1)
+    return max(settings.threadpool_max_workers * settings.dynamodb_active_shards, 1)
+
+
+# 同期リポジトリで各シャードへの Query を並列に実行するスレッドプール
+# （スレッドは必要になった時点で作られる）
+_executor = ThreadPoolExecutor(
+    max_workers=_shard_query_max_workers(),
+    thread_name_prefix="dynamodb-shard"
+)
+
+
+def active_shard(entity_id: str) -> int:
+    """
+    ID から active_shard の値（0 〜 DYNAMODB_ACTIVE_SHARDS - 1）を決める
+
+    プロセスや再起動によらず同じ ID は同じシャードになるよう CRC32 を使う。
+
+    Args:
+        entity_id: film_id または actor_id
+
+    Returns:
+        シャード番号
+    """
+    return zlib.crc32(entity_id.encode("utf-8")) % settings.dynamodb_active_shards
+
+
+def active_shards() -> Tuple[int, ...]:
+    """全てのシャード番号を返す"""
+    return tuple(range(settings.dynamodb_active_shards))
+
+
+@dataclass(frozen=True)
+class IndexQuery:
+    """
+    GSI の 1 つ以上のパーティションをソートキーの順に読む Query の指定
+
+    各パーティションを Query し、(ソートキー, ID) の順にマージする。order_attribute を指定した
+    場合は、ソートキーの範囲に含まれるアイテムを全て読んでから (order_attribute, ID) の順に並べる。
+
+    Attributes:
+        index_name: GSI 名
+        partition_attribute: GSI のパーティションキー名
+        partitions: 読むパーティションキーの値（シャード番号の一覧など）
+        sort_attribute: GSI のソートキー名
+        descending: ソートキーの降順に読む場合 True
+        lower: ソートキーの下限（含む）。None の場合は制限しない
+        upper: ソートキーの上限（含む）。None の場合は制限しない
+        order_attribute: 並び順の属性（GSI のソートキーと異なる場合。GSI に射影されている必要がある）
+        keys_only: GSI がキー（と並び替え用の属性）だけを射影する場合 True。
+            アイテム本体は読み出した ID で BatchGetItem する
+    """
+    index_name: str
+    partition_attribute: str
+    partitions: Tuple[Any, ...]
+    sort_attribute: str
+    descending: bool = True
+    lower: Optional[Any] = None
+    upper: Optional[Any] = None
+    order_attribute: Optional[str] = None
+    keys_only: bool = False
+
+    @property
+    def order_key_attribute(self) -> str:
+        """並び順の属性（order_attribute、指定しない場合はソートキー）"""
+        return self.order_attribute or self.sort_attribute
+
+
+def active_index_query() -> IndexQuery:
+    """削除されていないアイテムを active_shard-index から last_update の降順で読む指定"""
+    return IndexQuery(ACTIVE_SHARD_INDEX, 'active_shard', active_shards(), 'last_update')
+
+
+def _query_kwargs(
+    query: IndexQuery,
+    partition: Any,
+    position_value: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    1 つのパーティションを読む Query の引数を組み立てる
+
+    position_value を指定した場合は、ソートキーの範囲をその値まで（同じ値を含む）に狭める。
+
+    Returns:
+        Query の引数。ソートキーの範囲が空の場合は None
+    """
+    lower, upper = query.lower, query.upper
+    if position_value is not None:
+        if query.descending:
+            upper = position_value if upper is None else min(upper, position_value)
+        else:
+            lower = position_value if lower is None else max(lower, position_value)
+    if lower is not None and upper is not None and lower > upper:
+        return None
+
+    key_condition = '#pk = :pk'
+    values: Dict[str, Any] = {':pk': partition}
+    if lower is not None and upper is not None:
+        key_condition += ' AND #sk BETWEEN :lower AND :upper'
+        values.update({':lower': lower, ':upper': upper})
+    elif lower is not None:
+        key_condition += ' AND #sk >= :lower'
+        values[':lower'] = lower
+    elif upper is not None:
+        key_condition += ' AND #sk <= :upper'
+        values[':upper'] = upper
+
+    return {
+        'IndexName': query.index_name,
+        'KeyConditionExpression': key_condition,
+        'ExpressionAttributeNames': {'#pk': query.partition_attribute, '#sk': query.sort_attribute},
+        'ExpressionAttributeValues': values,
+        'ScanIndexForward': not query.descending
+    }
+
+
+def _sort_key(item: Dict[str, Any], query: IndexQuery, key_name: str) -> Tuple[Any, str]:
+    """アイテムの並び順（並び順の属性, ID）。ISO 8601 文字列は辞書順で時刻順になる"""
+    return item[query.order_key_attribute], item[key_name]
+
+
+def _is_after(
+    item: Dict[str, Any],
+    query: IndexQuery,
+    key_name: str,
+    position: Optional[Tuple[Any, str]]
+) -> bool:
+    """アイテムが並び順で position より後ろにあるか（ソートキーが同じ場合は ID で判定する）"""
+    if position is None:
+        return True
+    item_key = _sort_key(item, query, key_name)
+    return item_key < position if query.descending else item_key > position
+
+
+def _merge_page(
+    partition_items: Sequence[List[Dict[str, Any]]],
+    query: IndexQuery,
+    key_name: str,
+    limit: int
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    パーティションごとの先頭 limit + 1 件を並び順にマージして 1 ページ分を取り出す
+
+    Returns:
+        ページのアイテムと、次のページがあるかどうか
+    """
+    merged = sort_items(
+        [item for items in partition_items for item in items], query, key_name
+    )
+    return merged[:limit], len(merged) > limit
+
+
+def sort_items(items: List[Dict[str, Any]], query: IndexQuery, key_name: str) -> List[Dict[str, Any]]:
+    """
+    アイテムを query の並び順（ソートキー, ID）に並べ替える
+
+    Args:
+        items: アイテムのリスト
+        query: 読み出しに使った指定
+        key_name: テーブルのパーティションキー名
+
+    Returns:
+        並べ替えたアイテムのリスト
+    """
+    return sorted(
+        items,
+        key=lambda item: _sort_key(item, query, key_name),
+        reverse=query.descending
+    )
+
+
+def _slice_page(
+    items: List[Dict[str, Any]],
+    query: IndexQuery,
+    key_name: str,
+    limit: int,
+    position: Optional[Tuple[Any, str]]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    ソートキーの範囲の全アイテムを並び順に並べ、position より後ろの 1 ページ分を取り出す
+    （order_attribute を指定した場合）
+
+    Returns:
+        ページのアイテムと、次のページがあるかどうか
+    """
+    after = [item for item in sort_items(items, query, key_name) if _is_after(item, query, key_name, position)]
+    return after[:limit], len(after) > limit
+
+
+def _needs_more(
+    items: List[Dict[str, Any]],
+    query: IndexQuery,
+    limit: int,
+    response: Dict[str, Any]
+) -> bool:
+    """
+    パーティションの Query を続ける必要があるか
+
+    GSI ではソートキーが同じアイテムの順序は保証されないため、limit + 1 件目と同じ
+    ソートキーのアイテムを読み切るまで続ける（LastEvaluatedKey は GSI のキーを含む）。
+    """
+    last_evaluated_key = response.get('LastEvaluatedKey')
+    if last_evaluated_key is None:
+        return False
+    if len(items) <= limit:
+        return True
+    return last_evaluated_key[query.sort_attribute] == items[limit][query.sort_attribute]
+
+
+def _query_partition_all(table: Any, query: IndexQuery, partition: Any) -> List[Dict[str, Any]]:
+    """1 つのパーティションの条件に合う全アイテムを取得する"""
+    query_kwargs = _query_kwargs(query, partition)
+    items: List[Dict[str, Any]] = []
+    while query_kwargs is not None:
+        response = table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items
+
+
+def _query_partition_page(
+    table: Any,
+    query: IndexQuery,
+    partition: Any,
+    key_name: str,
+    limit: int,
+    position: Optional[Tuple[Any, str]]
+) -> List[Dict[str, Any]]:
+    """1 つのパーティションから position より後ろのアイテムを並び順に先頭から最大 limit + 1 件取得する"""
+    query_kwargs = _query_kwargs(query, partition, position[0] if position else None)
+    if query_kwargs is None:
+        return []
+    query_kwargs['Limit'] = limit + 1
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.query(**query_kwargs)
+        # ソートキーが同じアイテムは ID で前ページとの境界を判定する
+        items.extend(
+            item for item in response.get('Items', [])
+            if _is_after(item, query, key_name, position)
+        )
+        if not _needs_more(items, query, limit, response):
+            return sort_items(items, query, key_name)[:limit + 1]
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def query_index_items(table: Any, query: IndexQuery) -> List[Dict[str, Any]]:
+    """
+    条件に合う全アイテムを全パーティションへの並列 Query で取得する
+
+    Args:
+        table: boto3 の DynamoDB Table リソース
+        query: 読み出す GSI とパーティション・範囲の指定
+
+    Returns:
+        アイテムのリスト（順序は不定。並べ替えには sort_items を使う）
+
+    Raises:
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+    """
+    futures = [
+        _executor.submit(_query_partition_all, table, query, partition)
+        for partition in query.partitions
+    ]
+    return [item for future in futures for item in future.result()]
+
+
+def query_index_page(
+    table: Any,
+    query: IndexQuery,
+    key_name: str,
+    limit: int,
+    position: Optional[Tuple[Any, str]]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    条件に合うアイテムを (ソートキー, ID) の順で 1 ページ分取得する
+
+    各パーティションから並列に position より後ろの先頭 limit + 1 件を取得してマージする。
+    order_attribute を指定した場合は、ソートキーの範囲の全アイテムを読んでから並べて切り出す
+    （読み込み量は範囲に含まれるアイテム数に比例する）。
+
+    Args:
+        table: boto3 の DynamoDB Table リソース
+        query: 読み出す GSI とパーティション・範囲の指定
+        key_name: テーブルのパーティションキー名（"film_id" など）
+        limit: 1 ページあたりの最大件数
+        position: 前ページ末尾の (ソートキー, ID)。先頭ページの場合は None
+
+    Returns:
+        ページのアイテムと、次のページがあるかどうか
+
+    Raises:
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+    """
+    if query.order_attribute is not None:
+        # GSI の順序と並び順が異なるため、ソートキーの範囲を読み切ってから並べる
+        return _slice_page(query_index_items(table, query), query, key_name, limit, position)
+    futures = [
+        _executor.submit(_query_partition_page, table, query, partition, key_name, limit, position)
+        for partition in query.partitions
+    ]
+    return _merge_page([future.result() for future in futures], query, key_name, limit)
+
+
+def _decode_position(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+    """カーソルをアイテムの並び順と比較できる (last_update, ID) の文字列に戻す"""
+    if cursor is None:
+        return None
+    last_update, entity_id = decode_keyset_cursor(cursor)
+    return last_update.isoformat(), entity_id
+
+
+def _next_cursor(items: List[Dict[str, Any]], has_more: bool, key_name: str) -> Optional[str]:
+    """last_update の降順のページ末尾から次ページのカーソルを作成する"""
+    if not has_more:
+        return None
+    last = items[-1]
+    return encode_keyset_cursor(last['last_update'], last[key_name])
+
+
+def query_active_items(table: Any) -> List[Dict[str, Any]]:
+    """
+    削除されていない全アイテムを全シャードへの並列 Query で取得する
+
+    Args:
+        table: boto3 の DynamoDB Table リソース
+
+    Returns:
+        アイテムのリスト（順序は不定）
+
+    Raises:
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+    """
+    return query_index_items(table, active_index_query())
+
+
+def iter_active_items(table: Any) -> Iterator[Dict[str, Any]]:
+    """
+    削除されていない全アイテムをシャードごと・Query のページ（最大 1MB）ごとに順に返す
+
+    一度に保持するのは 1 ページ分だけなので、件数によらずメモリ使用量は一定になる。
+
+    Args:
+        table: boto3 の DynamoDB Table リソース
+
+    Yields:
+        アイテム
+
+    Raises:
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+    """
+    query = active_index_query()
+    for shard in query.partitions:
+        query_kwargs = _query_kwargs(query, shard)
+        while True:
+            response = table.query(**query_kwargs)
+            yield from response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def query_active_page(
+    table: Any,
+    key_name: str,
+    limit: int,
+    cursor: Optional[str]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    削除されていないアイテムを (last_update, ID) の降順で 1 ページ分取得する
+
+    各シャードから並列に先頭 limit + 1 件を取得してマージする。カーソルは
+    MySQL のキーセットページネーションと同じ (last_update, ID) の形式。
+
+    Args:
+        table: boto3 の DynamoDB Table リソース
+        key_name: テーブルのパーティションキー名（"film_id" など）
+        limit: 1 ページあたりの最大件数
+        cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+    Returns:
+        ページのアイテムと次ページのカーソル（最終ページの場合は None）
+
+    Raises:
+        ValidationError: cursor の形式が不正な場合
+        ClientError: DynamoDB の API 呼び出しに失敗した場合
+    """
+    position = _decode_position(cursor)
+    items, has_more = query_index_page(table, active_index_query(), key_name, limit, position)
+    return items, _next_cursor(items, has_more, key_name)
+
+
+async def _async_query_partition_all(table: Any, query: IndexQuery, partition: Any) -> List[Dict[str, Any]]:
+    """1 つのパーティションの条件に合う全アイテムを取得する（aioboto3 版）"""
+    query_kwargs = _query_kwargs(query, partition)
+    items: List[Dict[str, Any]] = []
+    while query_kwargs is not None:
+        response = await table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items
+
+
+async def _async_query_partition_page(
+    table: Any,
+    query: IndexQuery,
+    partition: Any,
+    key_name: str,
+    limit: int,
+    position: Optional[Tuple[Any, str]]
+) -> List[Dict[str, Any]]:
+    """1 つのパーティションから position より後ろのアイテムを並び順に最大 limit + 1 件取得する（aioboto3 版）"""
+    query_kwargs = _query_kwargs(query, partition, position[0] if position else None)
+    if query_kwargs is None:
+        return []
+    query_kwargs['Limit'] = limit + 1
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = await table.query(**query_kwargs)
+        # ソートキーが同じアイテムは ID で前ページとの境界を判定する
+        items.extend(
+            item for item in response.get('Items', [])
+            if _is_after(item, query, key_name, position)
+        )
+        if not _needs_more(items, query, limit, response):
+            return sort_items(items, query, key_name)[:limit + 1]
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+async def async_query_index_items(table: Any, query: IndexQuery) -> List[Dict[str, Any]]:
+    """条件に合う全アイテムを全パーティションへの並列 Query で取得する（aioboto3 版）"""
+    results = await asyncio.gather(*(
+        _async_query_partition_all(table, query, partition)
+        for partition in query.partitions
+    ))
+    return [item for items in results for item in items]
+
+
+async def async_query_index_page(
+    table: Any,
+    query: IndexQuery,
+    key_name: str,
+    limit: int,
+    position: Optional[Tuple[Any, str]]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    条件に合うアイテムを (ソートキー, ID) の順で 1 ページ分取得する
+    （aioboto3 版、引数・戻り値・例外は query_index_page と同じ）
+    """
+    if query.order_attribute is not None:
+        items = await async_query_index_items(table, query)
+        return _slice_page(items, query, key_name, limit, position)
+    results = await asyncio.gather(*(
+        _async_query_partition_page(table, query, partition, key_name, limit, position)
+        for partition in query.partitions
+    ))
+    return _merge_page(results, query, key_name, limit)
+
+
+async def async_query_active_items(table: Any) -> List[Dict[str, Any]]:
+    """削除されていない全アイテムを全シャードへの並列 Query で取得する（aioboto3 版）"""
+    return await async_query_index_items(table, active_index_query())
+
+
+async def async_iter_active_items(table: Any) -> AsyncIterator[Dict[str, Any]]:
+    """削除されていない全アイテムをシャードごと・Query のページごとに順に返す（aioboto3 版）"""
+    query = active_index_query()
+    for shard in query.partitions:
+        query_kwargs = _query_kwargs(query, shard)
+        while True:
+            response = await table.query(**query_kwargs)
+            for item in response.get('Items', []):
+                yield item
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+async def async_query_active_page(
+    table: Any,
+    key_name: str,
+    limit: int,
+    cursor: Optional[str]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    削除されていないアイテムを (last_update, ID) の降順で 1 ページ分取得する
+    （aioboto3 版、引数・戻り値・例外は query_active_page と同じ）
+    """
+    position = _decode_position(cursor)
+    items, has_more = await async_query_index_page(table, active_index_query(), key_name, limit, position)
+    return items, _next_cursor(items, has_more, key_name)
@@ -0,0 +1,88 @@
+"""映画一覧の絞り込み・並び替え条件"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+from backend.entities.rating import Rating
+from backend.repositories.pagination import LAST_UPDATE_DESC, SortKey
+
+
+class FilmSort(str, Enum):
+    """映画一覧の並び替えの基準"""
+    LAST_UPDATE = "last_update"
+    TITLE = "title"
+    RELEASE_YEAR = "release_year"
+
+
+class SortOrder(str, Enum):
+    """並び順の方向"""
+    ASC = "asc"
+    DESC = "desc"
+
+
+# order を省略した場合の方向（更新日時・公開年は新しい順、タイトルは昇順）
+DEFAULT_SORT_ORDERS = {
+    FilmSort.LAST_UPDATE: SortOrder.DESC,
+    FilmSort.TITLE: SortOrder.ASC,
+    FilmSort.RELEASE_YEAR: SortOrder.DESC,
+}
+
+
+def _parse_title(value: Any) -> str:
+    """カーソルのタイトルを検証する"""
+    if not isinstance(value, str):
+        raise TypeError("title must be a string")
+    return value
+
+
+def _parse_release_year(value: Any) -> int:
+    """カーソルの公開年を検証する"""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError("release_year must be an integer")
+    return value
+
+
+@dataclass(frozen=True)
+class FilmQuery:
+    """
+    映画一覧の絞り込み・並び替え条件（一覧キャッシュのキーに使えるよう不変）
+
+    Attributes:
+        rating: このレーティングの映画だけを返す（None の場合は絞り込まない）
+        year_from: 公開年の下限（含む）。指定した場合、公開年のない映画は含まれない
+        year_to: 公開年の上限（含む）。指定した場合、公開年のない映画は含まれない
+        sort: 並び替えの基準。同じ値の映画は film_id で並べる
+        order: 並び順の方向（None の場合は DEFAULT_SORT_ORDERS）
+    """
+    rating: Optional[Rating] = None
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    sort: FilmSort = FilmSort.LAST_UPDATE
+    order: Optional[SortOrder] = None
+
+    @property
+    def descending(self) -> bool:
+        """降順の場合 True"""
+        return (self.order or DEFAULT_SORT_ORDERS[self.sort]) == SortOrder.DESC
+
+    @property
+    def has_year_range(self) -> bool:
+        """公開年で絞り込む場合 True"""
+        return self.year_from is not None or self.year_to is not None
+
+    def sort_key(self) -> SortKey:
+        """
+        キーセットページネーションの並び順を返す
+
+        公開年のない映画は公開年が最も小さいものとして並ぶ（昇順では先頭、降順では末尾）。
+
+        Returns:
+            SortKey
+        """
+        if self.sort == FilmSort.TITLE:
+            return SortKey("title", self.descending, parse=_parse_title)
+        if self.sort == FilmSort.RELEASE_YEAR:
+            return SortKey("release_year", self.descending, nullable=True, parse=_parse_release_year)
+        if self.descending:
+            return LAST_UPDATE_DESC
+        return SortKey("last_update", descending=False)
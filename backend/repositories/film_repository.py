@@ -1,8 +1,10 @@
 """Film リポジトリの抽象基底クラス"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Iterator
 
 from backend.entities.film import Film
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.pagination import Page
 
 
 class FilmRepository(ABC):
@@ -25,9 +27,28 @@ class FilmRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Film]:
+    def create_many(self, films: List[Film]) -> List[Film]:
         """
-        削除されていない全ての Film を取得する (delete_flag=False)
+        複数の Film をまとめて作成する
+
+        Args:
+            films: 作成する Film エンティティのリスト
+
+        Returns:
+            作成された Film エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """
+        削除されていない Film を query の条件と並び順で全て取得する (delete_flag=False)
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
 
         Returns:
             Film エンティティのリスト
@@ -37,6 +58,66 @@ class FilmRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Film]:
+        """
+        削除されていない全ての Film を 1 件ずつ返す (delete_flag=False)
+
+        全件をメモリに載せずに順次取り出すため、件数によらずメモリ使用量は一定になる。
+
+        Yields:
+            Film エンティティ
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない Film を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        カーソルは同じ query の前のページで返されたものに限る。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    @abstractmethod
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に text を含む削除されていない Film を関連度の高い順に 1 ページ分取得する
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合、またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, film_id: str) -> Optional[Film]:
         """
@@ -53,19 +134,57 @@ class FilmRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    @abstractmethod
+    def get_version(self, film_id: str) -> Optional[int]:
+        """
+        指定された film_id の Film の現在のバージョンをキャッシュを通さずに取得する
+
+        If-Match なしの更新で条件にするバージョンを読むために使う。キャッシュ層は
+        内側のリポジトリに委譲し、データベースの最新の値を返す。
+
+        Args:
+            film_id: 対象の Film の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
+    def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film をまとめて取得する
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        pass
+
     @abstractmethod
     def update(self, film: Film) -> Film:
         """
-        既存の Film を更新する
+        既存の Film を film.version を条件に更新する（楽観的ロック）
+
+        現在のバージョンが film.version と一致する場合だけ更新し、version を 1 増やす。
 
         Args:
-            film: 更新する Film エンティティ
+            film: 更新する Film エンティティ（version は読み込んだ時点のバージョン）
 
         Returns:
-            更新された Film エンティティ
+            更新された Film エンティティ（version は更新後のバージョン）
 
         Raises:
             NotFoundError: Film が見つからない場合
+            ConflictError: film.version が現在のバージョンと一致しない場合
             DatabaseError: データベース操作に失敗した場合
         """
         pass
@@ -79,7 +198,7 @@ class FilmRepository(ABC):
             film_id: 削除する Film の ID
 
         Returns:
-            削除が成功した場合 True、Film が見つからない場合 False
+            削除した場合 True、Film が見つからないか既に削除済みの場合 False
 
         Raises:
             DatabaseError: データベース操作に失敗した場合
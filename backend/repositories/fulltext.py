@@ -0,0 +1,73 @@
+"""MySQL の FULLTEXT インデックスを使った全文検索"""
+from typing import Any, Callable, Optional, Sequence, TypeVar
+from sqlalchemy import Float, select, type_coerce
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql import Select
+
+from backend.repositories.pagination import SEARCH_RELEVANCE, Page, encode_keyset_cursor, keyset_condition
+
+T = TypeVar("T")
+
+
+def fulltext_select(
+    model: Any,
+    id_column: Any,
+    columns: Sequence[Any],
+    text: str,
+    limit: int,
+    cursor: Optional[str],
+    *filters: Any
+) -> Select:
+    """
+    columns の FULLTEXT インデックスで text に一致する行を関連度順に 1 ページ分（limit + 1 件）取得する
+    SELECT 文を組み立てる
+
+    自然言語モードで検索し、結果の行は (モデル, 関連度スコア)。同じスコアの行は id_column の降順に並ぶ。
+
+    Args:
+        model: 検索する SQLAlchemy モデル
+        id_column: 同じスコアの行を並べる主キーのカラム
+        columns: FULLTEXT インデックスのカラム（インデックスの定義と同じ順序）
+        text: 検索語
+        limit: 1 ページあたりの最大件数
+        cursor: 前のページで返された next_cursor。先頭ページの場合は None
+        filters: 追加の WHERE 条件
+
+    Returns:
+        SELECT 文
+
+    Raises:
+        ValidationError: cursor の形式が不正な場合
+    """
+    matched = match(*columns, against=text).in_natural_language_mode()
+    score = type_coerce(matched, Float)
+    statement = select(model, score.label(SEARCH_RELEVANCE.attribute)).where(matched, *filters)
+    if cursor is not None:
+        statement = statement.where(keyset_condition(score, id_column, cursor, SEARCH_RELEVANCE))
+    return statement.order_by(score.desc(), id_column.desc()).limit(limit + 1)
+
+
+def fulltext_page(
+    rows: Sequence[Any],
+    limit: int,
+    id_attribute: str,
+    to_entity: Callable[[Any], T]
+) -> Page[T]:
+    """
+    fulltext_select の結果（(モデル, スコア) の行）から Page を組み立てる
+
+    Args:
+        rows: fulltext_select の結果（最大 limit + 1 件）
+        limit: 1 ページあたりの最大件数
+        id_attribute: モデルの主キーの属性名
+        to_entity: モデルをエンティティに変換する関数
+
+    Returns:
+        エンティティのページ
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_model, last_score = rows[-1]
+        next_cursor = encode_keyset_cursor(last_score, getattr(last_model, id_attribute), SEARCH_RELEVANCE.attribute)
+    return Page(items=[to_entity(model) for model, _ in rows], next_cursor=next_cursor)
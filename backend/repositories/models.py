@@ -1,6 +1,6 @@
 """SQLAlchemy ORM モデル定義"""
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -9,6 +9,21 @@ Base = declarative_base()
 class FilmModel(Base):
     """Film テーブルの ORM モデル"""
     __tablename__ = 'films'
+    __table_args__ = (
+        # 一覧取得のキーセットページネーション用 (delete_flag, last_update, film_id)
+        Index('idx_films_delete_flag_last_update', 'delete_flag', 'last_update', 'film_id'),
+        # 一覧の絞り込み（rating）・並び替え（title / release_year）用。公開年の範囲は並び替えの列で絞り込む
+        Index('idx_films_delete_flag_rating_last_update', 'delete_flag', 'rating', 'last_update', 'film_id'),
+        Index('idx_films_delete_flag_title', 'delete_flag', 'title', 'film_id'),
+        Index('idx_films_delete_flag_rating_title', 'delete_flag', 'rating', 'title', 'film_id'),
+        Index('idx_films_delete_flag_release_year', 'delete_flag', 'release_year', 'film_id'),
+        Index('idx_films_delete_flag_rating_release_year', 'delete_flag', 'rating', 'release_year', 'film_id'),
+        # 全文検索用（ngram パーサーで日本語のタイトルも 2 文字単位で索引付けする）
+        Index(
+            'ft_films_title_description', 'title', 'description',
+            mysql_prefix='FULLTEXT', mysql_with_parser='ngram'
+        ),
+    )
 
     film_id = Column(String(36), primary_key=True)
     title = Column(String(255), nullable=False)
@@ -25,12 +40,23 @@ class FilmModel(Base):
         default=datetime.now,
         onupdate=datetime.now
     )
-    delete_flag = Column(Boolean, nullable=False, default=False, index=True)
+    delete_flag = Column(Boolean, nullable=False, default=False)
+    # 楽観的ロック用のバージョン（更新・削除のたびに 1 ずつ増える）
+    version = Column(Integer, nullable=False, default=1, server_default='1')
 
 
 class ActorModel(Base):
     """Actor テーブルの ORM モデル"""
     __tablename__ = 'actors'
+    __table_args__ = (
+        # 一覧取得のキーセットページネーション用 (delete_flag, last_update, actor_id)
+        Index('idx_actors_delete_flag_last_update', 'delete_flag', 'last_update', 'actor_id'),
+        # 全文検索用（ngram パーサーで日本語の姓名も 2 文字単位で索引付けする）
+        Index(
+            'ft_actors_first_name_last_name', 'first_name', 'last_name',
+            mysql_prefix='FULLTEXT', mysql_with_parser='ngram'
+        ),
+    )
 
     actor_id = Column(String(36), primary_key=True)
     first_name = Column(String(100), nullable=False)
@@ -41,4 +67,19 @@ class ActorModel(Base):
         default=datetime.now,
         onupdate=datetime.now
     )
-    delete_flag = Column(Boolean, nullable=False, default=False, index=True)
+    delete_flag = Column(Boolean, nullable=False, default=False)
+    # 楽観的ロック用のバージョン（更新・削除のたびに 1 ずつ増える）
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
+
+class FilmActorModel(Base):
+    """映画とアクターの出演関係（film_actors 中間テーブル）の ORM モデル"""
+    __tablename__ = 'film_actors'
+    __table_args__ = (
+        # アクターの出演作の取得用（主キー (film_id, actor_id) の逆向き）
+        Index('idx_film_actors_actor_id_film_id', 'actor_id', 'film_id'),
+    )
+
+    film_id = Column(String(36), ForeignKey('films.film_id'), primary_key=True)
+    actor_id = Column(String(36), ForeignKey('actors.actor_id'), primary_key=True)
+    last_update = Column(DateTime, nullable=False, default=datetime.now)
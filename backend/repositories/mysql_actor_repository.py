@@ -1,30 +1,23 @@
 """MySQL を使用した Actor リポジトリの実装"""
-from typing import List, Optional
-from sqlalchemy import create_engine
+from dataclasses import replace
+from typing import Any, List, Optional, Iterator, Sequence
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.entities.actor import Actor
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.batch import order_by_ids, unique_ids
+from backend.repositories.fulltext import fulltext_page, fulltext_select
+from backend.repositories.optimistic_lock import version_mismatch_error
 from backend.repositories.models import ActorModel
+from backend.repositories.pagination import Page, keyset_page, keyset_select
 from backend.config.settings import settings
 
 
-class MySQLActorRepository(ActorRepository):
-    """MySQL を使用した Actor リポジトリの実装"""
-
-    def __init__(self):
-        """SQLAlchemy エンジンとセッションを初期化"""
-        self.engine = create_engine(settings.mysql_url, pool_pre_ping=True)
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine
-        )
-
-    def _get_session(self) -> Session:
-        """新しいデータベースセッションを取得"""
-        return self.SessionLocal()
+class ActorModelMapper:
+    """ActorModel と Actor エンティティを相互に変換する（同期・非同期リポジトリで共有）"""
 
     def _model_to_entity(self, model: ActorModel) -> Actor:
         """ActorModel を Actor エンティティに変換"""
@@ -33,7 +26,8 @@ class MySQLActorRepository(ActorRepository):
             first_name=model.first_name,
             last_name=model.last_name,
             last_update=model.last_update,
-            delete_flag=model.delete_flag
+            delete_flag=model.delete_flag,
+            version=model.version
         )
 
     def _entity_to_model(self, actor: Actor) -> ActorModel:
@@ -43,9 +37,66 @@ class MySQLActorRepository(ActorRepository):
             first_name=actor.first_name,
             last_name=actor.last_name,
             last_update=actor.last_update,
-            delete_flag=actor.delete_flag
+            delete_flag=actor.delete_flag,
+            version=actor.version
+        )
+
+    def _entity_to_row(self, actor: Actor) -> dict:
+        """Actor エンティティを複数行 INSERT 用の列の辞書に変換"""
+        return {
+            'actor_id': actor.actor_id,
+            'first_name': actor.first_name,
+            'last_name': actor.last_name,
+            'last_update': actor.last_update,
+            'delete_flag': actor.delete_flag,
+            'version': actor.version
+        }
+
+
+    def _search_select(self, text: str, limit: int, cursor: Optional[str]):
+        """
+        (first_name, last_name) の FULLTEXT インデックスで text に一致する削除されていない Actor を
+        関連度順に 1 ページ分（limit + 1 件）取得する SELECT 文を組み立てる
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+        """
+        return fulltext_select(
+            ActorModel,
+            ActorModel.actor_id,
+            (ActorModel.first_name, ActorModel.last_name),
+            text,
+            limit,
+            cursor,
+            ActorModel.delete_flag == False
+        )
+
+    def _search_page(self, rows: Sequence[Any], limit: int) -> Page[Actor]:
+        """_search_select の結果（(ActorModel, スコア) の行）から Page を組み立てる"""
+        return fulltext_page(rows, limit, 'actor_id', self._model_to_entity)
+
+
+class MySQLActorRepository(ActorModelMapper, ActorRepository):
+    """MySQL を使用した Actor リポジトリの実装"""
+
+    def __init__(self, engine: Engine):
+        """
+        セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy エンジン
+        """
+        self.engine = engine
+        self.SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.engine
         )
 
+    def _get_session(self) -> Session:
+        """新しいデータベースセッションを取得"""
+        return self.SessionLocal()
+
     def create(self, actor: Actor) -> Actor:
         """
         新しい Actor を作成する
@@ -72,6 +123,32 @@ class MySQLActorRepository(ActorRepository):
         finally:
             session.close()
 
+    def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """
+        複数の Actor を 1 回の複数行 INSERT で作成する
+
+        Args:
+            actors: 作成する Actor エンティティのリスト
+
+        Returns:
+            作成された Actor エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        if not actors:
+            return []
+        session = self._get_session()
+        try:
+            session.execute(insert(ActorModel).values([self._entity_to_row(actor) for actor in actors]))
+            session.commit()
+            return list(actors)
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise Exception(f"Failed to create actors: {str(e)}") from e
+        finally:
+            session.close()
+
     def get_all(self) -> List[Actor]:
         """
         削除されていない全ての Actor を取得する (delete_flag=False)
@@ -93,6 +170,83 @@ class MySQLActorRepository(ActorRepository):
         finally:
             session.close()
 
+    def iter_all(self) -> Iterator[Actor]:
+        """
+        削除されていない全ての Actor を 1 件ずつ返す (delete_flag=False)
+
+        yield_per によりサーバーサイドカーソルから API_STREAM_BATCH_SIZE 行ずつ取り出す。
+
+        Yields:
+            Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            statement = select(ActorModel).where(
+                ActorModel.delete_flag == False
+            ).execution_options(yield_per=settings.api_stream_batch_size)
+            for actor_model in session.execute(statement).scalars():
+                yield self._model_to_entity(actor_model)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to iterate actors: {str(e)}") from e
+        finally:
+            session.close()
+
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていない Actor を last_update の降順で 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            statement = keyset_select(ActorModel, ActorModel.actor_id, limit, cursor)
+            actor_models = session.execute(statement).scalars().all()
+            return keyset_page(actor_models, limit, "actor_id", self._model_to_entity)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get actor page: {str(e)}") from e
+        finally:
+            session.close()
+
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に text を含む削除されていない Actor を関連度の高い順に 1 ページ分取得する
+
+        (first_name, last_name) の FULLTEXT インデックス（ngram パーサー）を自然言語モードで検索する。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        statement = self._search_select(text, limit, cursor)
+        session = self._get_session()
+        try:
+            rows = session.execute(statement).all()
+            return self._search_page(rows, limit)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to search actors: {str(e)}") from e
+        finally:
+            session.close()
+
     def get_by_id(self, actor_id: str) -> Optional[Actor]:
         """
         指定された actor_id の Actor を取得する
@@ -121,37 +275,93 @@ class MySQLActorRepository(ActorRepository):
         finally:
             session.close()
 
-    def update(self, actor: Actor) -> Actor:
+    def get_version(self, actor_id: str) -> Optional[int]:
         """
-        既存の Actor を更新する
+        指定された actor_id の Actor の現在のバージョンを取得する
 
         Args:
-            actor: 更新する Actor エンティティ
+            actor_id: 対象の Actor の ID
 
         Returns:
-            更新された Actor エンティティ
+            現在のバージョン、見つからない場合は None
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         session = self._get_session()
         try:
-            actor_model = session.query(ActorModel).filter(
-                ActorModel.actor_id == actor.actor_id
-            ).first()
+            return session.query(ActorModel.version).filter(
+                ActorModel.actor_id == actor_id
+            ).scalar()
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get actor version: {str(e)}") from e
+        finally:
+            session.close()
 
-            if actor_model is None:
-                raise Exception(f"Actor with id {actor.actor_id} not found")
+    def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor を 1 回の IN 検索で取得する
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(actor_ids)
+        if not ids:
+            return []
+        session = self._get_session()
+        try:
+            statement = select(ActorModel).where(ActorModel.actor_id.in_(ids))
+            actors = [self._model_to_entity(model) for model in session.execute(statement).scalars()]
+            return order_by_ids(actors, ids, lambda actor: actor.actor_id)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get actors by ids: {str(e)}") from e
+        finally:
+            session.close()
 
-            # 更新
-            actor_model.first_name = actor.first_name
-            actor_model.last_name = actor.last_name
-            actor_model.last_update = actor.last_update
-            actor_model.delete_flag = actor.delete_flag
+    def update(self, actor: Actor) -> Actor:
+        """
+        既存の Actor を actor.version を条件とする 1 回の UPDATE 文で更新する
 
+        UPDATE ... WHERE actor_id = ? AND version = ? で更新し、version を 1 増やす。
+        行ロックは UPDATE 文の間しか保持しないため、同時の更新が互いを待つことはない。
+        一致する行がなかった場合だけ現在の version を読み込み、存在しないのか
+        競合なのかを判定する。
+
+        Args:
+            actor: 更新する Actor エンティティ（version は読み込んだ時点のバージョン）
+
+        Returns:
+            更新された Actor エンティティ（version は更新後のバージョン）
+
+        Raises:
+            NotFoundError: Actor が見つからない場合
+            ConflictError: version が現在のバージョンと一致しない場合
+            Exception: データベース操作に失敗した場合
+        """
+        values = self._entity_to_row(actor)
+        del values['actor_id']
+        values['version'] = actor.version + 1
+        session = self._get_session()
+        try:
+            result = session.execute(
+                update(ActorModel)
+                .where(ActorModel.actor_id == actor.actor_id, ActorModel.version == actor.version)
+                .values(**values)
+            )
+            if result.rowcount == 0:
+                current_version = session.execute(
+                    select(ActorModel.version).where(ActorModel.actor_id == actor.actor_id)
+                ).scalar_one_or_none()
+                session.rollback()
+                raise version_mismatch_error("Actor", actor.actor_id, actor.version, current_version)
             session.commit()
-            session.refresh(actor_model)
-            return self._model_to_entity(actor_model)
+            return replace(actor, version=actor.version + 1)
         except SQLAlchemyError as e:
             session.rollback()
             raise Exception(f"Failed to update actor: {str(e)}") from e
@@ -162,28 +372,27 @@ class MySQLActorRepository(ActorRepository):
         """
         指定された actor_id の Actor を論理削除する (delete_flag=True)
 
+        存在確認の SELECT を行わず、1 回の UPDATE ... WHERE actor_id = ? AND delete_flag = 0 の
+        影響行数で判定する。
+
         Args:
             actor_id: 削除する Actor の ID
 
         Returns:
-            削除が成功した場合 True、Actor が見つからない場合 False
+            削除した場合 True、Actor が見つからないか既に削除済みの場合 False
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         session = self._get_session()
         try:
-            actor_model = session.query(ActorModel).filter(
-                ActorModel.actor_id == actor_id
-            ).first()
-
-            if actor_model is None:
-                return False
-
-            # delete_flag を True に更新
-            actor_model.delete_flag = True
+            result = session.execute(
+                update(ActorModel)
+                .where(ActorModel.actor_id == actor_id, ActorModel.delete_flag == False)
+                .values(delete_flag=True, version=ActorModel.version + 1)
+            )
             session.commit()
-            return True
+            return result.rowcount > 0
         except SQLAlchemyError as e:
             session.rollback()
             raise Exception(f"Failed to delete actor: {str(e)}") from e
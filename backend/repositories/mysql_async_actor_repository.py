@@ -0,0 +1,304 @@
+"""SQLAlchemy AsyncEngine を使用した Actor リポジトリの実装"""
+from dataclasses import replace
+from typing import List, Optional, AsyncIterator
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.entities.actor import Actor
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.batch import order_by_ids, unique_ids
+from backend.repositories.optimistic_lock import version_mismatch_error
+from backend.repositories.models import ActorModel
+from backend.repositories.pagination import Page, keyset_page, keyset_select
+from backend.repositories.mysql_actor_repository import ActorModelMapper
+from backend.config.settings import settings
+
+
+class MySQLAsyncActorRepository(ActorModelMapper, AsyncActorRepository):
+    """非同期 MySQL ドライバ（aiomysql）を使用した Actor リポジトリの実装"""
+
+    def __init__(self, engine: AsyncEngine):
+        """
+        非同期セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy AsyncEngine
+        """
+        self.engine = engine
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    def _get_session(self) -> AsyncSession:
+        """新しい非同期データベースセッションを取得"""
+        return self.SessionLocal()
+
+    async def create(self, actor: Actor) -> Actor:
+        """
+        新しい Actor を作成する
+
+        Args:
+            actor: 作成する Actor エンティティ
+
+        Returns:
+            作成された Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                actor_model = self._entity_to_model(actor)
+                session.add(actor_model)
+                await session.commit()
+                await session.refresh(actor_model)
+                return self._model_to_entity(actor_model)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to create actor: {str(e)}") from e
+
+    async def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """
+        複数の Actor を 1 回の複数行 INSERT で作成する
+
+        Args:
+            actors: 作成する Actor エンティティのリスト
+
+        Returns:
+            作成された Actor エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        if not actors:
+            return []
+        async with self._get_session() as session:
+            try:
+                await session.execute(insert(ActorModel).values([self._entity_to_row(actor) for actor in actors]))
+                await session.commit()
+                return list(actors)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to create actors: {str(e)}") from e
+
+    async def get_all(self) -> List[Actor]:
+        """
+        削除されていない全ての Actor を取得する (delete_flag=False)
+
+        Returns:
+            Actor エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(
+                    select(ActorModel).where(ActorModel.delete_flag == False)
+                )
+                return [self._model_to_entity(model) for model in result.scalars()]
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get all actors: {str(e)}") from e
+
+    async def iter_all(self) -> AsyncIterator[Actor]:
+        """
+        削除されていない全ての Actor を 1 件ずつ返す (delete_flag=False)
+
+        yield_per によりサーバーサイドカーソルから API_STREAM_BATCH_SIZE 行ずつ取り出す。
+
+        Yields:
+            Actor エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        statement = select(ActorModel).where(
+            ActorModel.delete_flag == False
+        ).execution_options(yield_per=settings.api_stream_batch_size)
+        async with self._get_session() as session:
+            try:
+                result = await session.stream_scalars(statement)
+                async for actor_model in result:
+                    yield self._model_to_entity(actor_model)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to iterate actors: {str(e)}") from e
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていない Actor を last_update の降順で 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        statement = keyset_select(ActorModel, ActorModel.actor_id, limit, cursor)
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(statement)
+                return keyset_page(result.scalars().all(), limit, "actor_id", self._model_to_entity)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get actor page: {str(e)}") from e
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に text を含む削除されていない Actor を関連度の高い順に 1 ページ分取得する
+
+        (first_name, last_name) の FULLTEXT インデックス（ngram パーサー）を自然言語モードで検索する。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        statement = self._search_select(text, limit, cursor)
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(statement)
+                return self._search_page(result.all(), limit)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to search actors: {str(e)}") from e
+
+    async def get_by_id(self, actor_id: str) -> Optional[Actor]:
+        """
+        指定された actor_id の Actor を取得する
+
+        Args:
+            actor_id: 取得する Actor の ID
+
+        Returns:
+            Actor エンティティ、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                actor_model = await session.get(ActorModel, actor_id)
+
+                if actor_model is None:
+                    return None
+
+                return self._model_to_entity(actor_model)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get actor by id: {str(e)}") from e
+
+    async def get_version(self, actor_id: str) -> Optional[int]:
+        """
+        指定された actor_id の Actor の現在のバージョンを取得する
+
+        Args:
+            actor_id: 対象の Actor の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                return await session.scalar(
+                    select(ActorModel.version).where(ActorModel.actor_id == actor_id)
+                )
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get actor version: {str(e)}") from e
+
+    async def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id の Actor を 1 回の IN 検索で取得する
+
+        Args:
+            actor_ids: 取得する Actor の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(actor_ids)
+        if not ids:
+            return []
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(select(ActorModel).where(ActorModel.actor_id.in_(ids)))
+                actors = [self._model_to_entity(model) for model in result.scalars()]
+                return order_by_ids(actors, ids, lambda actor: actor.actor_id)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get actors by ids: {str(e)}") from e
+
+    async def update(self, actor: Actor) -> Actor:
+        """
+        既存の Actor を actor.version を条件とする 1 回の UPDATE 文で更新する
+        （動作・引数・戻り値・例外は MySQLActorRepository.update と同じ）
+
+        Returns:
+            更新された Actor エンティティ（version は更新後のバージョン）
+        """
+        values = self._entity_to_row(actor)
+        del values['actor_id']
+        values['version'] = actor.version + 1
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(
+                    update(ActorModel)
+                    .where(ActorModel.actor_id == actor.actor_id, ActorModel.version == actor.version)
+                    .values(**values)
+                )
+                if result.rowcount == 0:
+                    current_version = (await session.execute(
+                        select(ActorModel.version).where(ActorModel.actor_id == actor.actor_id)
+                    )).scalar_one_or_none()
+                    await session.rollback()
+                    raise version_mismatch_error("Actor", actor.actor_id, actor.version, current_version)
+                await session.commit()
+                return replace(actor, version=actor.version + 1)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to update actor: {str(e)}") from e
+
+    async def delete(self, actor_id: str) -> bool:
+        """
+        指定された actor_id の Actor を論理削除する (delete_flag=True)
+
+        存在確認の SELECT を行わず、1 回の UPDATE ... WHERE actor_id = ? AND delete_flag = 0 の
+        影響行数で判定する。
+
+        Args:
+            actor_id: 削除する Actor の ID
+
+        Returns:
+            削除した場合 True、Actor が見つからないか既に削除済みの場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(
+                    update(ActorModel)
+                    .where(ActorModel.actor_id == actor_id, ActorModel.delete_flag == False)
+                    .values(delete_flag=True, version=ActorModel.version + 1)
+                )
+                await session.commit()
+                return result.rowcount > 0
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to delete actor: {str(e)}") from e
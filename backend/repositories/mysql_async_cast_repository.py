@@ -0,0 +1,85 @@
+"""SQLAlchemy AsyncEngine を使用した Cast（映画とアクターの出演関係）リポジトリの実装"""
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.mysql_cast_repository import CastStatements
+
+
+class MySQLAsyncCastRepository(CastStatements, AsyncCastRepository):
+    """非同期 MySQL ドライバ（aiomysql）と film_actors 中間テーブルを使用した Cast リポジトリの実装"""
+
+    def __init__(self, engine: AsyncEngine):
+        """
+        非同期セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy AsyncEngine
+        """
+        self.engine = engine
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    def _get_session(self) -> AsyncSession:
+        """新しい非同期データベースセッションを取得"""
+        return self.SessionLocal()
+
+    async def add(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（動作・引数・例外は MySQLCastRepository.add と同じ）
+        """
+        async with self._get_session() as session:
+            try:
+                await session.execute(self._insert(film_id, actor_id))
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to add cast member: {str(e)}") from e
+
+    async def remove(self, film_id: str, actor_id: str) -> bool:
+        """
+        アクターを映画の出演者から外す（引数・戻り値・例外は MySQLCastRepository.remove と同じ）
+
+        Returns:
+            外した場合 True、出演者として登録されていなかった場合 False
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(self._delete(film_id, actor_id))
+                await session.commit()
+                return result.rowcount > 0
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to remove cast member: {str(e)}") from e
+
+    async def get_actors(self, film_id: str) -> List[Actor]:
+        """
+        映画の出演者のうち削除されていない Actor を film_actors と actors の 1 回の JOIN で取得する
+        （引数・戻り値・例外は MySQLCastRepository.get_actors と同じ）
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(self._actors_select(film_id))
+                return [self._actor_to_entity(model) for model in result.scalars()]
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get film actors: {str(e)}") from e
+
+    async def get_films(self, actor_id: str) -> List[Film]:
+        """
+        アクターの出演作のうち削除されていない Film を film_actors と films の 1 回の JOIN で取得する
+        （引数・戻り値・例外は MySQLCastRepository.get_films と同じ）
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(self._films_select(actor_id))
+                return [self._film_to_entity(model) for model in result.scalars()]
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get actor films: {str(e)}") from e
@@ -0,0 +1,316 @@
+"""SQLAlchemy AsyncEngine を使用した Film リポジトリの実装"""
+from dataclasses import replace
+from typing import List, Optional, AsyncIterator
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.entities.film import Film
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.batch import order_by_ids, unique_ids
+from backend.repositories.optimistic_lock import version_mismatch_error
+from backend.repositories.models import FilmModel
+from backend.repositories.pagination import Page, keyset_page, keyset_select
+from backend.repositories.mysql_film_repository import FilmModelMapper
+from backend.config.settings import settings
+
+
+class MySQLAsyncFilmRepository(FilmModelMapper, AsyncFilmRepository):
+    """非同期 MySQL ドライバ（aiomysql）を使用した Film リポジトリの実装"""
+
+    def __init__(self, engine: AsyncEngine):
+        """
+        非同期セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy AsyncEngine
+        """
+        self.engine = engine
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    def _get_session(self) -> AsyncSession:
+        """新しい非同期データベースセッションを取得"""
+        return self.SessionLocal()
+
+    async def create(self, film: Film) -> Film:
+        """
+        新しい Film を作成する
+
+        Args:
+            film: 作成する Film エンティティ
+
+        Returns:
+            作成された Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                film_model = self._entity_to_model(film)
+                session.add(film_model)
+                await session.commit()
+                await session.refresh(film_model)
+                return self._model_to_entity(film_model)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to create film: {str(e)}") from e
+
+    async def create_many(self, films: List[Film]) -> List[Film]:
+        """
+        複数の Film を 1 回の複数行 INSERT で作成する
+
+        Args:
+            films: 作成する Film エンティティのリスト
+
+        Returns:
+            作成された Film エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        if not films:
+            return []
+        async with self._get_session() as session:
+            try:
+                await session.execute(insert(FilmModel).values([self._entity_to_row(film) for film in films]))
+                await session.commit()
+                return list(films)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to create films: {str(e)}") from e
+
+    async def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """
+        削除されていない Film を query の条件と並び順で全て取得する (delete_flag=False)
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(self._query_select(query or FilmQuery()))
+                return [self._model_to_entity(model) for model in result.scalars()]
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get all films: {str(e)}") from e
+
+    async def iter_all(self) -> AsyncIterator[Film]:
+        """
+        削除されていない全ての Film を 1 件ずつ返す (delete_flag=False)
+
+        yield_per によりサーバーサイドカーソルから API_STREAM_BATCH_SIZE 行ずつ取り出す。
+
+        Yields:
+            Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        statement = select(FilmModel).where(
+            FilmModel.delete_flag == False
+        ).execution_options(yield_per=settings.api_stream_batch_size)
+        async with self._get_session() as session:
+            try:
+                result = await session.stream_scalars(statement)
+                async for film_model in result:
+                    yield self._model_to_entity(film_model)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to iterate films: {str(e)}") from e
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない Film を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        query = query or FilmQuery()
+        sort = query.sort_key()
+        statement = keyset_select(
+            FilmModel, FilmModel.film_id, limit, cursor, sort, self._query_filters(query)
+        )
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(statement)
+                return keyset_page(result.scalars().all(), limit, "film_id", self._model_to_entity, sort)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get film page: {str(e)}") from e
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に text を含む削除されていない Film を関連度の高い順に 1 ページ分取得する
+
+        (title, description) の FULLTEXT インデックス（ngram パーサー）を自然言語モードで検索する。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        statement = self._search_select(text, limit, cursor)
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(statement)
+                return self._search_page(result.all(), limit)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to search films: {str(e)}") from e
+
+    async def get_by_id(self, film_id: str) -> Optional[Film]:
+        """
+        指定された film_id の Film を取得する
+
+        Args:
+            film_id: 取得する Film の ID
+
+        Returns:
+            Film エンティティ、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                film_model = await session.get(FilmModel, film_id)
+
+                if film_model is None:
+                    return None
+
+                return self._model_to_entity(film_model)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get film by id: {str(e)}") from e
+
+    async def get_version(self, film_id: str) -> Optional[int]:
+        """
+        指定された film_id の Film の現在のバージョンを取得する
+
+        Args:
+            film_id: 対象の Film の ID
+
+        Returns:
+            現在のバージョン、見つからない場合は None
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                return await session.scalar(
+                    select(FilmModel.version).where(FilmModel.film_id == film_id)
+                )
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get film version: {str(e)}") from e
+
+    async def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film を 1 回の IN 検索で取得する
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(film_ids)
+        if not ids:
+            return []
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(select(FilmModel).where(FilmModel.film_id.in_(ids)))
+                films = [self._model_to_entity(model) for model in result.scalars()]
+                return order_by_ids(films, ids, lambda film: film.film_id)
+            except SQLAlchemyError as e:
+                raise Exception(f"Failed to get films by ids: {str(e)}") from e
+
+    async def update(self, film: Film) -> Film:
+        """
+        既存の Film を film.version を条件とする 1 回の UPDATE 文で更新する
+        （動作・引数・戻り値・例外は MySQLFilmRepository.update と同じ）
+
+        Returns:
+            更新された Film エンティティ（version は更新後のバージョン）
+        """
+        values = self._entity_to_row(film)
+        del values['film_id']
+        values['version'] = film.version + 1
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(
+                    update(FilmModel)
+                    .where(FilmModel.film_id == film.film_id, FilmModel.version == film.version)
+                    .values(**values)
+                )
+                if result.rowcount == 0:
+                    current_version = (await session.execute(
+                        select(FilmModel.version).where(FilmModel.film_id == film.film_id)
+                    )).scalar_one_or_none()
+                    await session.rollback()
+                    raise version_mismatch_error("Film", film.film_id, film.version, current_version)
+                await session.commit()
+                return replace(film, version=film.version + 1)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to update film: {str(e)}") from e
+
+    async def delete(self, film_id: str) -> bool:
+        """
+        指定された film_id の Film を論理削除する (delete_flag=True)
+
+        存在確認の SELECT を行わず、1 回の UPDATE ... WHERE film_id = ? AND delete_flag = 0 の
+        影響行数で判定する。
+
+        Args:
+            film_id: 削除する Film の ID
+
+        Returns:
+            削除した場合 True、Film が見つからないか既に削除済みの場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        async with self._get_session() as session:
+            try:
+                result = await session.execute(
+                    update(FilmModel)
+                    .where(FilmModel.film_id == film_id, FilmModel.delete_flag == False)
+                    .values(delete_flag=True, version=FilmModel.version + 1)
+                )
+                await session.commit()
+                return result.rowcount > 0
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Failed to delete film: {str(e)}") from e
@@ -0,0 +1,183 @@
+"""MySQL を使用した Cast（映画とアクターの出演関係）リポジトリの実装"""
+from datetime import datetime
+from typing import List
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.sql import Select
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.cast_repository import CastRepository
+from backend.repositories.models import ActorModel, FilmActorModel, FilmModel
+from backend.repositories.mysql_actor_repository import ActorModelMapper
+from backend.repositories.mysql_film_repository import FilmModelMapper
+
+
+class CastStatements:
+    """出演関係の SQL 文を組み立て、結果をエンティティに変換する（同期・非同期リポジトリで共有）"""
+
+    _actor_mapper = ActorModelMapper()
+    _film_mapper = FilmModelMapper()
+
+    def _insert(self, film_id: str, actor_id: str):
+        """出演関係の行を追加する INSERT 文"""
+        return insert(FilmActorModel).values(film_id=film_id, actor_id=actor_id, last_update=datetime.now())
+
+    def _delete(self, film_id: str, actor_id: str):
+        """出演関係の行を削除する DELETE 文"""
+        return delete(FilmActorModel).where(
+            FilmActorModel.film_id == film_id,
+            FilmActorModel.actor_id == actor_id
+        )
+
+    def _actors_select(self, film_id: str) -> Select:
+        """
+        映画の削除されていない出演者を 1 回の JOIN で取得する SELECT 文
+
+        film_actors の主キー (film_id, actor_id) で出演関係を絞り込み、actors を主キーで結合する。
+        """
+        return (
+            select(ActorModel)
+            .join(FilmActorModel, FilmActorModel.actor_id == ActorModel.actor_id)
+            .where(FilmActorModel.film_id == film_id, ActorModel.delete_flag == False)
+            .order_by(ActorModel.actor_id)
+        )
+
+    def _films_select(self, actor_id: str) -> Select:
+        """
+        アクターの削除されていない出演作を 1 回の JOIN で取得する SELECT 文
+
+        film_actors の (actor_id, film_id) インデックスで出演関係を絞り込み、films を主キーで結合する。
+        """
+        return (
+            select(FilmModel)
+            .join(FilmActorModel, FilmActorModel.film_id == FilmModel.film_id)
+            .where(FilmActorModel.actor_id == actor_id, FilmModel.delete_flag == False)
+            .order_by(FilmModel.film_id)
+        )
+
+    def _actor_to_entity(self, model: ActorModel) -> Actor:
+        """ActorModel を Actor エンティティに変換"""
+        return self._actor_mapper._model_to_entity(model)
+
+    def _film_to_entity(self, model: FilmModel) -> Film:
+        """FilmModel を Film エンティティに変換"""
+        return self._film_mapper._model_to_entity(model)
+
+
+class MySQLCastRepository(CastStatements, CastRepository):
+    """MySQL の film_actors 中間テーブルを使用した Cast リポジトリの実装"""
+
+    def __init__(self, engine: Engine):
+        """
+        セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy エンジン
+        """
+        self.engine = engine
+        self.SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.engine
+        )
+
+    def _get_session(self) -> Session:
+        """新しいデータベースセッションを取得"""
+        return self.SessionLocal()
+
+    def add(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（既に登録されている場合は何もしない）
+
+        存在確認の SELECT を行わず INSERT し、主キーの重複は登録済みとみなす。
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            session.execute(self._insert(film_id, actor_id))
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise Exception(f"Failed to add cast member: {str(e)}") from e
+        finally:
+            session.close()
+
+    def remove(self, film_id: str, actor_id: str) -> bool:
+        """
+        アクターを映画の出演者から外す
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Returns:
+            外した場合 True、出演者として登録されていなかった場合 False
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            result = session.execute(self._delete(film_id, actor_id))
+            session.commit()
+            return result.rowcount > 0
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise Exception(f"Failed to remove cast member: {str(e)}") from e
+        finally:
+            session.close()
+
+    def get_actors(self, film_id: str) -> List[Actor]:
+        """
+        映画の出演者のうち削除されていない Actor を film_actors と actors の 1 回の JOIN で取得する
+
+        Args:
+            film_id: 映画の ID
+
+        Returns:
+            actor_id の順に並べた Actor エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            models = session.execute(self._actors_select(film_id)).scalars()
+            return [self._actor_to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get film actors: {str(e)}") from e
+        finally:
+            session.close()
+
+    def get_films(self, actor_id: str) -> List[Film]:
+        """
+        アクターの出演作のうち削除されていない Film を film_actors と films の 1 回の JOIN で取得する
+
+        Args:
+            actor_id: アクターの ID
+
+        Returns:
+            film_id の順に並べた Film エンティティのリスト
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            models = session.execute(self._films_select(actor_id)).scalars()
+            return [self._film_to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get actor films: {str(e)}") from e
+        finally:
+            session.close()
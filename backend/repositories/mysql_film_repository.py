@@ -1,31 +1,30 @@
 """MySQL を使用した Film リポジトリの実装"""
-from typing import List, Optional
-from sqlalchemy import create_engine
+from dataclasses import replace
+from typing import Any, List, Optional, Iterator, Sequence
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.entities.film import Film
 from backend.entities.rating import Rating
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.batch import order_by_ids, unique_ids
+from backend.repositories.fulltext import fulltext_page, fulltext_select
+from backend.repositories.optimistic_lock import version_mismatch_error
 from backend.repositories.models import FilmModel
+from backend.repositories.pagination import (
+    Page,
+    keyset_order,
+    keyset_page,
+    keyset_select
+)
 from backend.config.settings import settings
 
 
-class MySQLFilmRepository(FilmRepository):
-    """MySQL を使用した Film リポジトリの実装"""
-
-    def __init__(self):
-        """SQLAlchemy エンジンとセッションを初期化"""
-        self.engine = create_engine(settings.mysql_url, pool_pre_ping=True)
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine
-        )
-
-    def _get_session(self) -> Session:
-        """新しいデータベースセッションを取得"""
-        return self.SessionLocal()
+class FilmModelMapper:
+    """FilmModel と Film エンティティを相互に変換する（同期・非同期リポジトリで共有）"""
 
     def _model_to_entity(self, model: FilmModel) -> Film:
         """FilmModel を Film エンティティに変換"""
@@ -37,7 +36,8 @@ class MySQLFilmRepository(FilmRepository):
             description=model.description,
             image_path=model.image_path,
             release_year=model.release_year,
-            delete_flag=model.delete_flag
+            delete_flag=model.delete_flag,
+            version=model.version
         )
 
     def _entity_to_model(self, film: Film) -> FilmModel:
@@ -50,9 +50,86 @@ class MySQLFilmRepository(FilmRepository):
             description=film.description,
             image_path=film.image_path,
             release_year=film.release_year,
-            delete_flag=film.delete_flag
+            delete_flag=film.delete_flag,
+            version=film.version
         )
 
+    def _entity_to_row(self, film: Film) -> dict:
+        """Film エンティティを複数行 INSERT 用の列の辞書に変換"""
+        return {
+            'film_id': film.film_id,
+            'title': film.title,
+            'rating': film.rating.value,
+            'last_update': film.last_update,
+            'description': film.description,
+            'image_path': film.image_path,
+            'release_year': film.release_year,
+            'delete_flag': film.delete_flag,
+            'version': film.version
+        }
+
+    def _query_filters(self, query: FilmQuery) -> List[Any]:
+        """FilmQuery の絞り込み条件を WHERE 句の条件に変換"""
+        filters: List[Any] = []
+        if query.rating is not None:
+            filters.append(FilmModel.rating == query.rating.value)
+        if query.year_from is not None:
+            filters.append(FilmModel.release_year >= query.year_from)
+        if query.year_to is not None:
+            filters.append(FilmModel.release_year <= query.year_to)
+        return filters
+
+    def _query_select(self, query: FilmQuery):
+        """削除されていない Film を query の条件と並び順で全て取得する SELECT 文を組み立てる"""
+        return select(FilmModel).where(
+            FilmModel.delete_flag == False,
+            *self._query_filters(query)
+        ).order_by(*keyset_order(FilmModel, FilmModel.film_id, query.sort_key()))
+
+    def _search_select(self, text: str, limit: int, cursor: Optional[str]):
+        """
+        (title, description) の FULLTEXT インデックスで text に一致する削除されていない Film を
+        関連度順に 1 ページ分（limit + 1 件）取得する SELECT 文を組み立てる
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+        """
+        return fulltext_select(
+            FilmModel,
+            FilmModel.film_id,
+            (FilmModel.title, FilmModel.description),
+            text,
+            limit,
+            cursor,
+            FilmModel.delete_flag == False
+        )
+
+    def _search_page(self, rows: Sequence[Any], limit: int) -> Page[Film]:
+        """_search_select の結果（(FilmModel, スコア) の行）から Page を組み立てる"""
+        return fulltext_page(rows, limit, 'film_id', self._model_to_entity)
+
+
+class MySQLFilmRepository(FilmModelMapper, FilmRepository):
+    """MySQL を使用した Film リポジトリの実装"""
+
+    def __init__(self, engine: Engine):
+        """
+        セッションファクトリを初期化
+
+        Args:
+            engine: アプリケーション全体で共有する SQLAlchemy エンジン
+        """
+        self.engine = engine
+        self.SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.engine
+        )
+
+    def _get_session(self) -> Session:
+        """新しいデータベースセッションを取得"""
+        return self.SessionLocal()
+
     def create(self, film: Film) -> Film:
         """
         新しい Film を作成する
@@ -79,9 +156,40 @@ class MySQLFilmRepository(FilmRepository):
         finally:
             session.close()
 
-    def get_all(self) -> List[Film]:
+    def create_many(self, films: List[Film]) -> List[Film]:
         """
-        削除されていない全ての Film を取得する (delete_flag=False)
+        複数の Film を 1 回の複数行 INSERT で作成する
+
+        Args:
+            films: 作成する Film エンティティのリスト
+
+        Returns:
+            作成された Film エンティティのリスト（引数と同じ順序）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        if not films:
+            return []
+        session = self._get_session()
+        try:
+            session.execute(insert(FilmModel).values([self._entity_to_row(film) for film in films]))
+            session.commit()
+            return list(films)
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise Exception(f"Failed to create films: {str(e)}") from e
+        finally:
+            session.close()
+
+    def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """
+        削除されていない Film を query の条件と並び順で全て取得する (delete_flag=False)
+
+        絞り込みと並び替えは (delete_flag, [rating,] ソート列, film_id) の複合インデックスで行う。
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
 
         Returns:
             Film エンティティのリスト
@@ -91,15 +199,103 @@ class MySQLFilmRepository(FilmRepository):
         """
         session = self._get_session()
         try:
-            film_models = session.query(FilmModel).filter(
-                FilmModel.delete_flag == False
-            ).all()
+            statement = self._query_select(query or FilmQuery())
+            film_models = session.execute(statement).scalars().all()
             return [self._model_to_entity(model) for model in film_models]
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get all films: {str(e)}") from e
         finally:
             session.close()
 
+    def iter_all(self) -> Iterator[Film]:
+        """
+        削除されていない全ての Film を 1 件ずつ返す (delete_flag=False)
+
+        yield_per によりサーバーサイドカーソルから API_STREAM_BATCH_SIZE 行ずつ取り出す。
+
+        Yields:
+            Film エンティティ
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        session = self._get_session()
+        try:
+            statement = select(FilmModel).where(
+                FilmModel.delete_flag == False
+            ).execution_options(yield_per=settings.api_stream_batch_size)
+            for film_model in session.execute(statement).scalars():
+                yield self._model_to_entity(film_model)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to iterate films: {str(e)}") from e
+        finally:
+            session.close()
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない Film を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        絞り込みと並び替えは (delete_flag, [rating,] ソート列, film_id) の複合インデックスで行う。
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        query = query or FilmQuery()
+        sort = query.sort_key()
+        session = self._get_session()
+        try:
+            statement = keyset_select(
+                FilmModel, FilmModel.film_id, limit, cursor, sort, self._query_filters(query)
+            )
+            film_models = session.execute(statement).scalars().all()
+            return keyset_page(film_models, limit, "film_id", self._model_to_entity, sort)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get film page: {str(e)}") from e
+        finally:
+            session.close()
+
+    def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に text を含む削除されていない Film を関連度の高い順に 1 ページ分取得する
+
+        (title, description) の FULLTEXT インデックス（ngram パーサー）を自然言語モードで検索する。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            Exception: データベース操作に失敗した場合
+        """
+        statement = self._search_select(text, limit, cursor)
+        session = self._get_session()
+        try:
+            rows = session.execute(statement).all()
+            return self._search_page(rows, limit)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to search films: {str(e)}") from e
+        finally:
+            session.close()
+
     def get_by_id(self, film_id: str) -> Optional[Film]:
         """
         指定された film_id の Film を取得する
@@ -128,40 +324,93 @@ class MySQLFilmRepository(FilmRepository):
         finally:
             session.close()
 
-    def update(self, film: Film) -> Film:
+    def get_version(self, film_id: str) -> Optional[int]:
         """
-        既存の Film を更新する
+        指定された film_id の Film の現在のバージョンを取得する
 
         Args:
-            film: 更新する Film エンティティ
+            film_id: 対象の Film の ID
 
         Returns:
-            更新された Film エンティティ
+            現在のバージョン、見つからない場合は None
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         session = self._get_session()
         try:
-            film_model = session.query(FilmModel).filter(
-                FilmModel.film_id == film.film_id
-            ).first()
+            return session.query(FilmModel.version).filter(
+                FilmModel.film_id == film_id
+            ).scalar()
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get film version: {str(e)}") from e
+        finally:
+            session.close()
 
-            if film_model is None:
-                raise Exception(f"Film with id {film.film_id} not found")
+    def get_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の Film を 1 回の IN 検索で取得する
+
+        Args:
+            film_ids: 取得する Film の ID のリスト（重複は 1 件にまとめる）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        ids = unique_ids(film_ids)
+        if not ids:
+            return []
+        session = self._get_session()
+        try:
+            statement = select(FilmModel).where(FilmModel.film_id.in_(ids))
+            films = [self._model_to_entity(model) for model in session.execute(statement).scalars()]
+            return order_by_ids(films, ids, lambda film: film.film_id)
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get films by ids: {str(e)}") from e
+        finally:
+            session.close()
+
+    def update(self, film: Film) -> Film:
+        """
+        既存の Film を film.version を条件とする 1 回の UPDATE 文で更新する
 
-            # 更新
-            film_model.title = film.title
-            film_model.rating = film.rating.value
-            film_model.last_update = film.last_update
-            film_model.description = film.description
-            film_model.image_path = film.image_path
-            film_model.release_year = film.release_year
-            film_model.delete_flag = film.delete_flag
+        UPDATE ... WHERE film_id = ? AND version = ? で更新し、version を 1 増やす。
+        行ロックは UPDATE 文の間しか保持しないため、同時の更新が互いを待つことはない。
+        一致する行がなかった場合だけ現在の version を読み込み、存在しないのか
+        競合なのかを判定する。
 
+        Args:
+            film: 更新する Film エンティティ（version は読み込んだ時点のバージョン）
+
+        Returns:
+            更新された Film エンティティ（version は更新後のバージョン）
+
+        Raises:
+            NotFoundError: Film が見つからない場合
+            ConflictError: version が現在のバージョンと一致しない場合
+            Exception: データベース操作に失敗した場合
+        """
+        values = self._entity_to_row(film)
+        del values['film_id']
+        values['version'] = film.version + 1
+        session = self._get_session()
+        try:
+            result = session.execute(
+                update(FilmModel)
+                .where(FilmModel.film_id == film.film_id, FilmModel.version == film.version)
+                .values(**values)
+            )
+            if result.rowcount == 0:
+                current_version = session.execute(
+                    select(FilmModel.version).where(FilmModel.film_id == film.film_id)
+                ).scalar_one_or_none()
+                session.rollback()
+                raise version_mismatch_error("Film", film.film_id, film.version, current_version)
             session.commit()
-            session.refresh(film_model)
-            return self._model_to_entity(film_model)
+            return replace(film, version=film.version + 1)
         except SQLAlchemyError as e:
             session.rollback()
             raise Exception(f"Failed to update film: {str(e)}") from e
@@ -172,28 +421,27 @@ class MySQLFilmRepository(FilmRepository):
         """
         指定された film_id の Film を論理削除する (delete_flag=True)
 
+        存在確認の SELECT を行わず、1 回の UPDATE ... WHERE film_id = ? AND delete_flag = 0 の
+        影響行数で判定する。
+
         Args:
             film_id: 削除する Film の ID
 
         Returns:
-            削除が成功した場合 True、Film が見つからない場合 False
+            削除した場合 True、Film が見つからないか既に削除済みの場合 False
 
         Raises:
             Exception: データベース操作に失敗した場合
         """
         session = self._get_session()
         try:
-            film_model = session.query(FilmModel).filter(
-                FilmModel.film_id == film_id
-            ).first()
-
-            if film_model is None:
-                return False
-
-            # delete_flag を True に更新
-            film_model.delete_flag = True
+            result = session.execute(
+                update(FilmModel)
+                .where(FilmModel.film_id == film_id, FilmModel.delete_flag == False)
+                .values(delete_flag=True, version=FilmModel.version + 1)
+            )
             session.commit()
-            return True
+            return result.rowcount > 0
         except SQLAlchemyError as e:
             session.rollback()
             raise Exception(f"Failed to delete film: {str(e)}") from e
@@ -0,0 +1,111 @@
+"""version 属性による楽観的ロック（条件付き更新）の共通部分"""
+from typing import Any, Dict, Optional
+
+from botocore.exceptions import ClientError
+
+from backend.exceptions import ConflictError, NotFoundError
+
+
+def version_mismatch_error(
+    entity_name: str,
+    entity_id: str,
+    expected_version: int,
+    current_version: Optional[int]
+) -> Exception:
+    """
+    条件付き更新が行を更新しなかった場合に送出する例外を返す
+
+    Args:
+        entity_name: エンティティ名（"Film" など）
+        entity_id: 更新しようとした ID
+        expected_version: 更新の条件にしたバージョン
+        current_version: 現在のバージョン（存在しない場合は None）
+
+    Returns:
+        存在しない場合は NotFoundError、バージョンが異なる場合は ConflictError
+    """
+    if current_version is None:
+        return NotFoundError(f"{entity_name} with id {entity_id} not found")
+    return ConflictError(
+        f"{entity_name} with id {entity_id} has been modified by another request "
+        f"(expected version {expected_version}, current version {current_version})"
+    )
+
+
+def dynamodb_versioned_put_kwargs(key_name: str, expected_version: int) -> Dict[str, Any]:
+    """
+    存在することと version の一致を条件とする put_item の引数を組み立てる
+
+    version 属性のない既存のアイテムはバージョン 1 として扱う。条件を満たさなかった
+    場合は現在のアイテムを返させ、存在しないのか競合なのかを追加の読み込みなしに判定する。
+
+    Args:
+        key_name: テーブルのパーティションキー名（"film_id" など）
+        expected_version: 更新の条件にするバージョン
+
+    Returns:
+        put_item に Item と一緒に渡すキーワード引数
+    """
+    version_condition = 'version = :expected'
+    if expected_version == 1:
+        version_condition = f'({version_condition} OR attribute_not_exists(version))'
+    return {
+        'ConditionExpression': f'attribute_exists({key_name}) AND {version_condition}',
+        'ExpressionAttributeValues': {':expected': expected_version},
+        'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+    }
+
+
+def dynamodb_version_get_kwargs(key_name: str, entity_id: str) -> Dict[str, Any]:
+    """
+    現在のバージョンだけを強い整合性で読む get_item の引数を組み立てる
+
+    結果整合性の読み込みでは直前の更新より古いバージョンが返る場合があり、
+    If-Match なしの更新の条件にすると競合でないのに 409 になるため ConsistentRead にする。
+
+    Args:
+        key_name: テーブルのパーティションキー名（"film_id" など）
+        entity_id: 読み込むアイテムの ID
+
+    Returns:
+        get_item のキーワード引数
+    """
+    return {
+        'Key': {key_name: entity_id},
+        'ProjectionExpression': '#version',
+        'ExpressionAttributeNames': {'#version': 'version'},
+        'ConsistentRead': True
+    }
+
+
+def dynamodb_item_version(item: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    get_item で読んだアイテムのバージョンを返す（version 属性のないアイテムは 1）
+
+    Args:
+        item: get_item のレスポンスの Item
+
+    Returns:
+        現在のバージョン（アイテムが存在しない場合は None）
+    """
+    if item is None:
+        return None
+    return int(item.get('version', 1))
+
+
+def dynamodb_current_version(error: ClientError) -> Optional[int]:
+    """
+    ReturnValuesOnConditionCheckFailure で返された現在のアイテムからバージョンを取り出す
+
+    エラーレスポンスのアイテムは型注釈付きの低レベル形式（{"N": "2"} など）で返される。
+
+    Args:
+        error: ConditionalCheckFailedException の ClientError
+
+    Returns:
+        現在のバージョン（アイテムが存在しない場合は None）
+    """
+    item = error.response.get('Item')
+    if not item:
+        return None
+    return int(item.get('version', {}).get('N', 1))
@@ -0,0 +1,274 @@
+"""一覧取得のカーソル（キーセット）ページネーション"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+from sqlalchemy import and_, or_, select
+from sqlalchemy.sql import Select
+
+from backend.exceptions import ValidationError
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    一覧取得の 1 ページ分の結果
+
+    Attributes:
+        items: このページに含まれるエンティティのリスト
+        next_cursor: 次のページを取得するためのカーソル。最終ページの場合は None
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _json_default(value: Any) -> Any:
+    """DynamoDB の数値型（Decimal）や datetime を JSON に変換する"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    ページ位置をクライアントに返す不透明なカーソル文字列に変換する
+
+    Args:
+        position: 次ページの開始位置（MySQL はソートキー、DynamoDB は LastEvaluatedKey）
+
+    Returns:
+        URL セーフな Base64 文字列
+    """
+    raw = json.dumps(position, default=_json_default, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    カーソル文字列をページ位置に戻す
+
+    Args:
+        cursor: encode_cursor で生成したカーソル
+
+    Returns:
+        ページ位置の辞書
+
+    Raises:
+        ValidationError: カーソルの形式が不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        raise ValidationError("cursor の形式が不正です") from e
+    if not isinstance(position, dict):
+        raise ValidationError("cursor の形式が不正です")
+    return position
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """カーソルの ISO 8601 文字列を datetime に戻す"""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    キーセットページネーションの並び順（ソート列と方向）
+
+    同じ値の行は ID を第 2 キーとして同じ方向に並べる。
+
+    Attributes:
+        attribute: ソート列の属性名（カーソルのキーにも使う）
+        descending: 降順の場合 True
+        nullable: ソート列が NULL を取りうる場合 True（NULL は最も小さい値として並ぶ）
+        parse: カーソルの JSON の値をソート列の値に戻す関数（形式が不正な場合は TypeError / ValueError）
+    """
+    attribute: str = "last_update"
+    descending: bool = True
+    nullable: bool = False
+    parse: Callable[[Any], Any] = _parse_datetime
+
+
+# 一覧取得の既定の並び順（last_update の降順）
+LAST_UPDATE_DESC = SortKey()
+
+
+def _parse_score(value: Any) -> float:
+    """カーソルの関連度スコアを検証する"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError("score must be a number")
+    return float(value)
+
+
+# 全文検索の並び順（関連度スコアの降順。同じスコアは ID の降順）
+SEARCH_RELEVANCE = SortKey("score", descending=True, parse=_parse_score)
+
+
+def encode_keyset_cursor(sort_value: Any, entity_id: str, attribute: str = "last_update") -> str:
+    """
+    ページ末尾の (ソート列の値, ID) から次ページのカーソルを作成する
+
+    Args:
+        sort_value: ページ末尾の要素のソート列の値（datetime は ISO 8601 文字列になる）
+        entity_id: ページ末尾の要素の ID
+        attribute: ソート列の属性名
+
+    Returns:
+        カーソル文字列
+    """
+    return encode_cursor({attribute: sort_value, "id": entity_id})
+
+
+def decode_keyset_cursor(cursor: str, sort: SortKey = LAST_UPDATE_DESC) -> Tuple[Any, str]:
+    """
+    encode_keyset_cursor で作成したカーソルを (ソート列の値, ID) に戻す
+
+    別の並び順で作成したカーソルはソート列のキーを持たないため不正として扱う。
+
+    Args:
+        cursor: 前のページで返された next_cursor
+        sort: 現在の並び順
+
+    Returns:
+        前ページ末尾の (ソート列の値, ID)
+
+    Raises:
+        ValidationError: カーソルの形式が不正な場合
+    """
+    position = decode_cursor(cursor)
+    try:
+        value = position[sort.attribute]
+        if value is not None:
+            value = sort.parse(value)
+        elif not sort.nullable:
+            raise ValueError("null sort value")
+        return value, str(position["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValidationError("cursor の形式が不正です") from e
+
+
+def _after_position(column: Any, id_column: Any, value: Any, last_id: str, sort: SortKey) -> Any:
+    """並び順で (value, last_id) より後ろの行を表す条件（NULL は最も小さい値として扱う）"""
+    if sort.descending:
+        if value is None:
+            return and_(column.is_(None), id_column < last_id)
+        condition = or_(column < value, and_(column == value, id_column < last_id))
+        return or_(condition, column.is_(None)) if sort.nullable else condition
+    if value is None:
+        return or_(and_(column.is_(None), id_column > last_id), column.is_not(None))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+def keyset_condition(column: Any, id_column: Any, cursor: str, sort: SortKey = LAST_UPDATE_DESC) -> Any:
+    """
+    カーソルが指す前ページ末尾より並び順で後ろの行を表す WHERE 条件を返す
+
+    Args:
+        column: ソート列（全文検索のスコアなどの式も指定できる）
+        id_column: 主キー列
+        cursor: 前のページで返された next_cursor
+        sort: 並び順
+
+    Returns:
+        WHERE 条件
+
+    Raises:
+        ValidationError: カーソルの形式が不正な場合
+    """
+    value, last_id = decode_keyset_cursor(cursor, sort)
+    return _after_position(column, id_column, value, last_id, sort)
+
+
+def keyset_order(model: Any, id_column: Any, sort: SortKey = LAST_UPDATE_DESC) -> Tuple[Any, Any]:
+    """
+    並び順の ORDER BY 句（ソート列, ID）を返す
+
+    MySQL は NULL を昇順では先頭、降順では末尾に並べるため、_after_position と一致する。
+
+    Args:
+        model: ORM モデル
+        id_column: 主キー列
+        sort: 並び順
+
+    Returns:
+        order_by に渡す 2 つの列
+    """
+    column = getattr(model, sort.attribute)
+    if sort.descending:
+        return column.desc(), id_column.desc()
+    return column.asc(), id_column.asc()
+
+
+def keyset_select(
+    model: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str],
+    sort: SortKey = LAST_UPDATE_DESC,
+    filters: Sequence[Any] = ()
+) -> Select:
+    """
+    削除されていない行を sort の順で 1 ページ分取得する SELECT 文を組み立てる
+
+    OFFSET を使わず、前ページ末尾の (ソート列, ID) より後ろの行を
+    (delete_flag, [絞り込み列,] ソート列, ID) インデックスの範囲検索で取得する。
+    次ページの有無を判定するため limit + 1 件を取得する。
+
+    Args:
+        model: FilmModel または ActorModel
+        id_column: 主キー列（FilmModel.film_id など）
+        limit: 1 ページあたりの最大件数
+        cursor: 前のページで返された next_cursor
+        sort: 並び順（省略時は last_update の降順）
+        filters: 追加の WHERE 条件
+
+    Returns:
+        SELECT 文
+
+    Raises:
+        ValidationError: カーソルの形式が不正な場合
+    """
+    statement = select(model).where(model.delete_flag == False, *filters)
+    if cursor is not None:
+        statement = statement.where(
+            keyset_condition(getattr(model, sort.attribute), id_column, cursor, sort)
+        )
+    return statement.order_by(*keyset_order(model, id_column, sort)).limit(limit + 1)
+
+
+def keyset_page(
+    models: Sequence[Any],
+    limit: int,
+    id_attribute: str,
+    to_entity: Callable[[Any], T],
+    sort: SortKey = LAST_UPDATE_DESC
+) -> Page[T]:
+    """
+    keyset_select の結果（最大 limit + 1 件）から Page を組み立てる
+
+    Args:
+        models: 取得した ORM モデルのシーケンス
+        limit: 1 ページあたりの最大件数
+        id_attribute: 主キーの属性名（"film_id" など）
+        to_entity: ORM モデルをエンティティに変換する関数
+        sort: keyset_select に指定した並び順
+
+    Returns:
+        エンティティのページ
+    """
+    next_cursor = None
+    if len(models) > limit:
+        models = models[:limit]
+        last = models[-1]
+        next_cursor = encode_keyset_cursor(
+            getattr(last, sort.attribute), getattr(last, id_attribute), sort.attribute
+        )
+    return Page(items=[to_entity(model) for model in models], next_cursor=next_cursor)
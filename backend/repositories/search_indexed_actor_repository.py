@@ -0,0 +1,191 @@
+"""Actor のインプロセスの検索インデックス・サジェストを書き込みに合わせて更新する非同期リポジトリのデコレーター"""
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+
+from backend.entities.actor import Actor
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.pagination import SEARCH_RELEVANCE, Page, decode_keyset_cursor, encode_keyset_cursor
+from backend.search import InvertedIndex, PrefixIndex
+
+# 検索インデックスに載せるフィールドと重み
+ACTOR_SEARCH_FIELDS = {
+    'first_name': 1.0,
+    'last_name': 1.0,
+}
+
+
+def actor_search_fields(actor: Actor) -> Dict[str, Optional[str]]:
+    """Actor を検索インデックスのフィールドに変換する"""
+    return {'first_name': actor.first_name, 'last_name': actor.last_name}
+
+
+def actor_suggest_entry(actor: Actor) -> Tuple[List[str], str]:
+    """
+    Actor をサジェストの (前方一致で検索する文字列, 表示用の文字列) に変換する
+
+    名・姓のどちらから入力しても一致するよう「名 姓」と「姓 名」の両方で索引付けする。
+    """
+    name = f"{actor.first_name} {actor.last_name}"
+    return [name, f"{actor.last_name} {actor.first_name}"], name
+
+
+class SearchIndexedActorRepository(AsyncActorRepository):
+    """
+    任意の AsyncActorRepository を包み、インプロセスの検索インデックスとサジェストを保守するデコレーター
+
+    - index: 全文検索の転置インデックス。search をインデックスで処理し、関連度の高い actor_id の
+      ページの Actor を get_many でまとめて取得する。
+    - prefix_index: 氏名の前方一致のサジェスト（読み出しは SuggestActorsUseCase が直接行う）。
+
+    create / create_many / update / delete が成功するたびに両方を更新する。None のものは使わず、
+    index が None の場合は search もそのまま委譲する。それ以外の操作はそのまま委譲する。
+
+    インデックスはプロセスごとに独立しているため、他のプロセスでの書き込みは rebuild
+    （SEARCH_INDEX_REFRESH_INTERVAL ごとの再構築）まで反映されない。
+    """
+
+    def __init__(
+        self,
+        repository: AsyncActorRepository,
+        index: Optional[InvertedIndex] = None,
+        prefix_index: Optional[PrefixIndex] = None
+    ):
+        """
+        Args:
+            repository: ラップする Actor リポジトリ
+            index: actor_id をドキュメント ID とする検索インデックス（ACTOR_SEARCH_FIELDS で作成したもの）
+            prefix_index: actor_id をドキュメント ID とするサジェストのインデックス
+        """
+        self.repository = repository
+        self.index = index
+        self.prefix_index = prefix_index
+
+    def _add(self, actor: Actor) -> None:
+        """Actor をインデックスに追加する（同じ actor_id があれば置き換える）"""
+        if self.index is not None:
+            self.index.add(actor.actor_id, actor_search_fields(actor))
+        if self.prefix_index is not None:
+            self.prefix_index.add(actor.actor_id, *actor_suggest_entry(actor))
+
+    def _remove(self, actor_id: str) -> None:
+        """Actor をインデックスから取り除く"""
+        if self.index is not None:
+            self.index.remove(actor_id)
+        if self.prefix_index is not None:
+            self.prefix_index.remove(actor_id)
+
+    async def rebuild(self) -> int:
+        """
+        削除されていない全ての Actor を iter_all でページ単位に 1 度だけ読み出し、両方のインデックスを作り直す
+
+        再構築中もインデックスは検索でき、その間の書き込みは作り直したインデックスにも反映される。
+
+        Returns:
+            索引付けした Actor の件数
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        rebuilt = self.index.begin_rebuild() if self.index is not None else None
+        prefix_builder = self.prefix_index.begin_rebuild() if self.prefix_index is not None else None
+        count = 0
+        try:
+            async for actor in self.repository.iter_all():
+                if rebuilt is not None:
+                    rebuilt.add(actor.actor_id, actor_search_fields(actor))
+                if prefix_builder is not None:
+                    prefix_builder.add(actor.actor_id, *actor_suggest_entry(actor))
+                count += 1
+        except BaseException:
+            if rebuilt is not None:
+                self.index.abort_rebuild()
+            if prefix_builder is not None:
+                self.prefix_index.abort_rebuild()
+            raise
+        if rebuilt is not None:
+            self.index.finish_rebuild(rebuilt)
+        if prefix_builder is not None:
+            # 並べ替えと連結に時間がかかるため、イベントループを止めないようスレッドプールで実行する
+            await run_in_threadpool(self.prefix_index.finish_rebuild, prefix_builder)
+        return count
+
+    async def create(self, actor: Actor) -> Actor:
+        """新しい Actor を作成し、インデックスに追加する"""
+        created = await self.repository.create(actor)
+        self._add(created)
+        return created
+
+    async def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """複数の Actor をまとめて作成し、インデックスに追加する"""
+        created = await self.repository.create_many(actors)
+        for actor in created:
+            self._add(actor)
+        return created
+
+    async def get_all(self) -> List[Actor]:
+        """削除されていない全ての Actor を取得する"""
+        return await self.repository.get_all()
+
+    async def iter_all(self) -> AsyncIterator[Actor]:
+        """削除されていない全ての Actor を 1 件ずつ返す"""
+        async for actor in self.repository.iter_all():
+            yield actor
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """削除されていない Actor を 1 ページ分取得する"""
+        return await self.repository.get_page(limit, cursor)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に text を含む削除されていない Actor を関連度（BM25）の高い順に 1 ページ分取得する
+
+        最後の語は前方一致で検索する。カーソルは MySQL の全文検索と同じ (スコア, actor_id) の形式。
+        他のプロセスで削除された Actor はページから除くため、ページの件数が limit より少なくなることがある。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.index is None:
+            return await self.repository.search(text, limit, cursor)
+        after = decode_keyset_cursor(cursor, SEARCH_RELEVANCE) if cursor is not None else None
+        # 一致件数の多い語ではスコア計算に時間がかかるため、イベントループを止めないようスレッドプールで実行する
+        hits, has_more = await run_in_threadpool(self.index.search, text, limit, after)
+        actors = await self.repository.get_many([hit.doc_id for hit in hits])
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_keyset_cursor(hits[-1].score, hits[-1].doc_id, SEARCH_RELEVANCE.attribute)
+        return Page(items=[actor for actor in actors if not actor.delete_flag], next_cursor=next_cursor)
+
+    async def get_by_id(self, actor_id: str) -> Optional[Actor]:
+        """指定された actor_id の Actor を取得する"""
+        return await self.repository.get_by_id(actor_id)
+
+    async def get_version(self, actor_id: str) -> Optional[int]:
+        """指定された actor_id の Actor の現在のバージョンを取得する"""
+        return await self.repository.get_version(actor_id)
+
+    async def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """指定された複数の actor_id の Actor をまとめて取得する"""
+        return await self.repository.get_many(actor_ids)
+
+    async def update(self, actor: Actor) -> Actor:
+        """既存の Actor を更新し、インデックスの内容を置き換える"""
+        updated = await self.repository.update(actor)
+        self._add(updated)
+        return updated
+
+    async def delete(self, actor_id: str) -> bool:
+        """指定された actor_id の Actor を論理削除し、インデックスから取り除く"""
+        deleted = await self.repository.delete(actor_id)
+        # 見つからない・削除済みの場合（False）もインデックスに残っていれば取り除く
+        self._remove(actor_id)
+        return deleted
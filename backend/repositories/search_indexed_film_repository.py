@@ -0,0 +1,192 @@
+"""Film のインプロセスの検索インデックス・サジェストを書き込みに合わせて更新する非同期リポジトリのデコレーター"""
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+
+from backend.entities.film import Film
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.pagination import SEARCH_RELEVANCE, Page, decode_keyset_cursor, encode_keyset_cursor
+from backend.search import InvertedIndex, PrefixIndex
+
+# 検索インデックスに載せるフィールドと重み（タイトルの一致を説明文の一致より高く評価する）
+FILM_SEARCH_FIELDS = {
+    'title': 2.0,
+    'description': 1.0,
+}
+
+
+def film_search_fields(film: Film) -> Dict[str, Optional[str]]:
+    """Film を検索インデックスのフィールドに変換する"""
+    return {'title': film.title, 'description': film.description}
+
+
+def film_suggest_entry(film: Film) -> Tuple[List[str], str]:
+    """Film をサジェストの (前方一致で検索する文字列, 表示用の文字列) に変換する"""
+    return [film.title], film.title
+
+
+class SearchIndexedFilmRepository(AsyncFilmRepository):
+    """
+    任意の AsyncFilmRepository を包み、インプロセスの検索インデックスとサジェストを保守するデコレーター
+
+    - index: 全文検索の転置インデックス。search をインデックスで処理し、関連度の高い film_id の
+      ページの Film を get_many でまとめて取得する。
+    - prefix_index: タイトルの前方一致のサジェスト（読み出しは SuggestFilmsUseCase が直接行う）。
+
+    create / create_many / update / delete が成功するたびに両方を更新する。None のものは使わず、
+    index が None の場合は search もそのまま委譲する。それ以外の操作はそのまま委譲する。
+
+    インデックスはプロセスごとに独立しているため、他のプロセスでの書き込みは rebuild
+    （SEARCH_INDEX_REFRESH_INTERVAL ごとの再構築）まで反映されない。
+    """
+
+    def __init__(
+        self,
+        repository: AsyncFilmRepository,
+        index: Optional[InvertedIndex] = None,
+        prefix_index: Optional[PrefixIndex] = None
+    ):
+        """
+        Args:
+            repository: ラップする Film リポジトリ
+            index: film_id をドキュメント ID とする検索インデックス（FILM_SEARCH_FIELDS で作成したもの）
+            prefix_index: film_id をドキュメント ID とするサジェストのインデックス
+        """
+        self.repository = repository
+        self.index = index
+        self.prefix_index = prefix_index
+
+    def _add(self, film: Film) -> None:
+        """Film をインデックスに追加する（同じ film_id があれば置き換える）"""
+        if self.index is not None:
+            self.index.add(film.film_id, film_search_fields(film))
+        if self.prefix_index is not None:
+            self.prefix_index.add(film.film_id, *film_suggest_entry(film))
+
+    def _remove(self, film_id: str) -> None:
+        """Film をインデックスから取り除く"""
+        if self.index is not None:
+            self.index.remove(film_id)
+        if self.prefix_index is not None:
+            self.prefix_index.remove(film_id)
+
+    async def rebuild(self) -> int:
+        """
+        削除されていない全ての Film を iter_all でページ単位に 1 度だけ読み出し、両方のインデックスを作り直す
+
+        再構築中もインデックスは検索でき、その間の書き込みは作り直したインデックスにも反映される。
+
+        Returns:
+            索引付けした Film の件数
+
+        Raises:
+            Exception: データベース操作に失敗した場合
+        """
+        rebuilt = self.index.begin_rebuild() if self.index is not None else None
+        prefix_builder = self.prefix_index.begin_rebuild() if self.prefix_index is not None else None
+        count = 0
+        try:
+            async for film in self.repository.iter_all():
+                if rebuilt is not None:
+                    rebuilt.add(film.film_id, film_search_fields(film))
+                if prefix_builder is not None:
+                    prefix_builder.add(film.film_id, *film_suggest_entry(film))
+                count += 1
+        except BaseException:
+            if rebuilt is not None:
+                self.index.abort_rebuild()
+            if prefix_builder is not None:
+                self.prefix_index.abort_rebuild()
+            raise
+        if rebuilt is not None:
+            self.index.finish_rebuild(rebuilt)
+        if prefix_builder is not None:
+            # 並べ替えと連結に時間がかかるため、イベントループを止めないようスレッドプールで実行する
+            await run_in_threadpool(self.prefix_index.finish_rebuild, prefix_builder)
+        return count
+
+    async def create(self, film: Film) -> Film:
+        """新しい Film を作成し、インデックスに追加する"""
+        created = await self.repository.create(film)
+        self._add(created)
+        return created
+
+    async def create_many(self, films: List[Film]) -> List[Film]:
+        """複数の Film をまとめて作成し、インデックスに追加する"""
+        created = await self.repository.create_many(films)
+        for film in created:
+            self._add(film)
+        return created
+
+    async def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """削除されていない Film を query の条件と並び順で全て取得する"""
+        return await self.repository.get_all(query)
+
+    async def iter_all(self) -> AsyncIterator[Film]:
+        """削除されていない全ての Film を 1 件ずつ返す"""
+        async for film in self.repository.iter_all():
+            yield film
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """削除されていない Film を query の条件と並び順で 1 ページ分取得する"""
+        return await self.repository.get_page(limit, cursor, query)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に text を含む削除されていない Film を関連度（BM25）の高い順に 1 ページ分取得する
+
+        最後の語は前方一致で検索する。カーソルは MySQL の全文検索と同じ (スコア, film_id) の形式。
+        他のプロセスで削除された Film はページから除くため、ページの件数が limit より少なくなることがある。
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if self.index is None:
+            return await self.repository.search(text, limit, cursor)
+        after = decode_keyset_cursor(cursor, SEARCH_RELEVANCE) if cursor is not None else None
+        # 一致件数の多い語ではスコア計算に時間がかかるため、イベントループを止めないようスレッドプールで実行する
+        hits, has_more = await run_in_threadpool(self.index.search, text, limit, after)
+        films = await self.repository.get_many([hit.doc_id for hit in hits])
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_keyset_cursor(hits[-1].score, hits[-1].doc_id, SEARCH_RELEVANCE.attribute)
+        return Page(items=[film for film in films if not film.delete_flag], next_cursor=next_cursor)
+
+    async def get_by_id(self, film_id: str) -> Optional[Film]:
+        """指定された film_id の Film を取得する"""
+        return await self.repository.get_by_id(film_id)
+
+    async def get_version(self, film_id: str) -> Optional[int]:
+        """指定された film_id の Film の現在のバージョンを取得する"""
+        return await self.repository.get_version(film_id)
+
+    async def get_many(self, film_ids: List[str]) -> List[Film]:
+        """指定された複数の film_id の Film をまとめて取得する"""
+        return await self.repository.get_many(film_ids)
+
+    async def update(self, film: Film) -> Film:
+        """既存の Film を更新し、インデックスの内容を置き換える"""
+        updated = await self.repository.update(film)
+        self._add(updated)
+        return updated
+
+    async def delete(self, film_id: str) -> bool:
+        """指定された film_id の Film を論理削除し、インデックスから取り除く"""
+        deleted = await self.repository.delete(film_id)
+        # 見つからない・削除済みの場合（False）もインデックスに残っていれば取り除く
+        self._remove(film_id)
+        return deleted
@@ -0,0 +1,44 @@
+"""同期イテレーターをスレッドプール経由で非同期に取り出すユーティリティ"""
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, TypeVar
+from fastapi.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+def _take(iterator: Iterator[T], size: int) -> List[T]:
+    """イテレーターから最大 size 件を取り出す（スレッドプール上で実行）"""
+    return list(islice(iterator, size))
+
+
+def _close(iterator: Iterator[T]) -> None:
+    """ジェネレーターを閉じてセッション等のリソースを解放する"""
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+async def iterate_in_threadpool(iterator: Iterator[T], batch_size: int) -> AsyncIterator[T]:
+    """
+    ブロッキングする同期イテレーターを非同期イテレーターとして取り出す
+
+    1 件ごとにスレッドを切り替えるとオーバーヘッドが大きいため、
+    batch_size 件ずつまとめてスレッドプール上で取り出す。
+    途中で打ち切られた場合もジェネレーターを閉じてリソースを解放する。
+
+    Args:
+        iterator: 同期リポジトリの iter_all() などが返すイテレーター
+        batch_size: 1 回のスレッドプール呼び出しで取り出す件数
+
+    Yields:
+        iterator の要素
+    """
+    try:
+        while True:
+            batch = await run_in_threadpool(_take, iterator, batch_size)
+            if not batch:
+                return
+            for item in batch:
+                yield item
+    finally:
+        await run_in_threadpool(_close, iterator)
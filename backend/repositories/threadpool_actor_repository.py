@@ -0,0 +1,71 @@
+"""同期 Actor リポジトリをスレッドプールで実行する非同期アダプター"""
+from typing import List, Optional, AsyncIterator
+from fastapi.concurrency import run_in_threadpool
+
+from backend.entities.actor import Actor
+from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.pagination import Page
+from backend.repositories.streaming import iterate_in_threadpool
+from backend.config.settings import settings
+
+
+class ThreadPoolActorRepository(AsyncActorRepository):
+    """
+    同期的な ActorRepository を AsyncActorRepository として利用するためのアダプター
+
+    ブロッキングする DB・AWS API 呼び出しでイベントループを止めないよう、
+    各操作をスレッドプール（THREADPOOL_MAX_WORKERS で上限を設定）で実行する。
+    """
+
+    def __init__(self, repository: ActorRepository):
+        """
+        Args:
+            repository: ラップする同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def create(self, actor: Actor) -> Actor:
+        """新しい Actor を作成する"""
+        return await run_in_threadpool(self.repository.create, actor)
+
+    async def create_many(self, actors: List[Actor]) -> List[Actor]:
+        """複数の Actor をまとめて作成する"""
+        return await run_in_threadpool(self.repository.create_many, actors)
+
+    async def get_all(self) -> List[Actor]:
+        """削除されていない全ての Actor を取得する"""
+        return await run_in_threadpool(self.repository.get_all)
+
+    async def iter_all(self) -> AsyncIterator[Actor]:
+        """削除されていない全ての Actor を API_STREAM_BATCH_SIZE 件ずつスレッドプールで取り出して返す"""
+        async for actor in iterate_in_threadpool(self.repository.iter_all(), settings.api_stream_batch_size):
+            yield actor
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """削除されていない Actor を 1 ページ分取得する"""
+        return await run_in_threadpool(self.repository.get_page, limit, cursor)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """姓名に text を含む Actor を関連度の高い順に 1 ページ分取得する"""
+        return await run_in_threadpool(self.repository.search, text, limit, cursor)
+
+    async def get_by_id(self, actor_id: str) -> Optional[Actor]:
+        """指定された actor_id の Actor を取得する"""
+        return await run_in_threadpool(self.repository.get_by_id, actor_id)
+
+    async def get_version(self, actor_id: str) -> Optional[int]:
+        """指定された actor_id の Actor の現在のバージョンを取得する"""
+        return await run_in_threadpool(self.repository.get_version, actor_id)
+
+    async def get_many(self, actor_ids: List[str]) -> List[Actor]:
+        """指定された複数の actor_id の Actor をまとめて取得する"""
+        return await run_in_threadpool(self.repository.get_many, actor_ids)
+
+    async def update(self, actor: Actor) -> Actor:
+        """既存の Actor を更新する"""
+        return await run_in_threadpool(self.repository.update, actor)
+
+    async def delete(self, actor_id: str) -> bool:
+        """指定された actor_id の Actor を論理削除する"""
+        return await run_in_threadpool(self.repository.delete, actor_id)
@@ -0,0 +1,40 @@
+"""同期 Cast リポジトリをスレッドプールで実行する非同期アダプター"""
+from typing import List
+from fastapi.concurrency import run_in_threadpool
+
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.cast_repository import CastRepository
+
+
+class ThreadPoolCastRepository(AsyncCastRepository):
+    """
+    同期的な CastRepository を AsyncCastRepository として利用するためのアダプター
+
+    ブロッキングする DB・AWS API 呼び出しでイベントループを止めないよう、
+    各操作をスレッドプール（THREADPOOL_MAX_WORKERS で上限を設定）で実行する。
+    """
+
+    def __init__(self, repository: CastRepository):
+        """
+        Args:
+            repository: ラップする同期 Cast リポジトリ
+        """
+        self.repository = repository
+
+    async def add(self, film_id: str, actor_id: str) -> None:
+        """アクターを映画の出演者として登録する"""
+        await run_in_threadpool(self.repository.add, film_id, actor_id)
+
+    async def remove(self, film_id: str, actor_id: str) -> bool:
+        """アクターを映画の出演者から外す"""
+        return await run_in_threadpool(self.repository.remove, film_id, actor_id)
+
+    async def get_actors(self, film_id: str) -> List[Actor]:
+        """映画の削除されていない出演者をまとめて取得する"""
+        return await run_in_threadpool(self.repository.get_actors, film_id)
+
+    async def get_films(self, actor_id: str) -> List[Film]:
+        """アクターの削除されていない出演作をまとめて取得する"""
+        return await run_in_threadpool(self.repository.get_films, actor_id)
@@ -0,0 +1,77 @@
+"""同期 Film リポジトリをスレッドプールで実行する非同期アダプター"""
+from typing import List, Optional, AsyncIterator
+from fastapi.concurrency import run_in_threadpool
+
+from backend.entities.film import Film
+from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.pagination import Page
+from backend.repositories.streaming import iterate_in_threadpool
+from backend.config.settings import settings
+
+
+class ThreadPoolFilmRepository(AsyncFilmRepository):
+    """
+    同期的な FilmRepository を AsyncFilmRepository として利用するためのアダプター
+
+    ブロッキングする DB・AWS API 呼び出しでイベントループを止めないよう、
+    各操作をスレッドプール（THREADPOOL_MAX_WORKERS で上限を設定）で実行する。
+    """
+
+    def __init__(self, repository: FilmRepository):
+        """
+        Args:
+            repository: ラップする同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def create(self, film: Film) -> Film:
+        """新しい Film を作成する"""
+        return await run_in_threadpool(self.repository.create, film)
+
+    async def create_many(self, films: List[Film]) -> List[Film]:
+        """複数の Film をまとめて作成する"""
+        return await run_in_threadpool(self.repository.create_many, films)
+
+    async def get_all(self, query: Optional[FilmQuery] = None) -> List[Film]:
+        """削除されていない Film を query の条件と並び順で全て取得する"""
+        return await run_in_threadpool(self.repository.get_all, query)
+
+    async def iter_all(self) -> AsyncIterator[Film]:
+        """削除されていない全ての Film を API_STREAM_BATCH_SIZE 件ずつスレッドプールで取り出して返す"""
+        async for film in iterate_in_threadpool(self.repository.iter_all(), settings.api_stream_batch_size):
+            yield film
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """削除されていない Film を query の条件と並び順で 1 ページ分取得する"""
+        return await run_in_threadpool(self.repository.get_page, limit, cursor, query)
+
+    async def search(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """タイトルと説明文に text を含む Film を関連度の高い順に 1 ページ分取得する"""
+        return await run_in_threadpool(self.repository.search, text, limit, cursor)
+
+    async def get_by_id(self, film_id: str) -> Optional[Film]:
+        """指定された film_id の Film を取得する"""
+        return await run_in_threadpool(self.repository.get_by_id, film_id)
+
+    async def get_version(self, film_id: str) -> Optional[int]:
+        """指定された film_id の Film の現在のバージョンを取得する"""
+        return await run_in_threadpool(self.repository.get_version, film_id)
+
+    async def get_many(self, film_ids: List[str]) -> List[Film]:
+        """指定された複数の film_id の Film をまとめて取得する"""
+        return await run_in_threadpool(self.repository.get_many, film_ids)
+
+    async def update(self, film: Film) -> Film:
+        """既存の Film を更新する"""
+        return await run_in_threadpool(self.repository.update, film)
+
+    async def delete(self, film_id: str) -> bool:
+        """指定された film_id の Film を論理削除する"""
+        return await run_in_threadpool(self.repository.delete, film_id)
@@ -1,5 +1,5 @@
 """Actor API スキーマ"""
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -7,6 +7,8 @@ class ActorRequest(BaseModel):
     """Actor 作成・更新リクエストモデル"""
     first_name: str
     last_name: str
+    # 更新時に条件にするバージョン（作成時は無視。If-Match ヘッダーが優先される）
+    version: Optional[int] = None
 
 
 class ActorResponse(BaseModel):
@@ -16,12 +18,56 @@ class ActorResponse(BaseModel):
     last_name: str
     last_update: str
     delete_flag: bool
+    version: int  # 楽観的ロック用のバージョン
 
     class Config:
         """Pydantic 設定"""
         from_attributes = True
 
 
+class ActorsBatchRequest(BaseModel):
+    """Actor 一括作成リクエストモデル"""
+    actors: List[ActorRequest]
+
+
+class ActorBatchResult(BaseModel):
+    """Actor 一括作成の 1 件分の結果"""
+    index: int  # リクエストの actors 内の位置
+    status: int  # 201（作成済み）または 400（検証エラー）
+    actor: Optional[ActorResponse] = None
+    error: Optional[str] = None
+
+
+class ActorsBatchResponse(BaseModel):
+    """Actor 一括作成レスポンスモデル"""
+    results: List[ActorBatchResult]
+    created: int
+    failed: int
+
+
+class ActorsBatchGetRequest(BaseModel):
+    """Actor 一括取得リクエストモデル"""
+    actor_ids: List[str]
+
+
+class ActorsBatchGetResponse(BaseModel):
+    """Actor 一括取得レスポンスモデル"""
+    actors: List[ActorResponse]  # リクエストの actor_ids の順序（重複は 1 件にまとめる）
+    not_found: List[str]  # 見つからなかった actor_id
+
+
 class ActorsListResponse(BaseModel):
-    """Films リストレスポンスモデル"""
+    """Actors リストレスポンスモデル"""
     actors: List[ActorResponse]
+    next_cursor: Optional[str] = None  # 次のページのカーソル。最終ページの場合は None
+
+
+class ActorSuggestion(BaseModel):
+    """Actor サジェストの 1 件"""
+    actor_id: str
+    name: str  # 「名 姓」
+
+
+class ActorSuggestionsResponse(BaseModel):
+    """Actor サジェストレスポンスモデル"""
+    suggestions: List[ActorSuggestion]  # 氏名の辞書順
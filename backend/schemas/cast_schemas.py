@@ -0,0 +1,15 @@
+"""Cast（映画とアクターの出演関係）関連のスキーマ"""
+from typing import List, Optional
+
+from backend.schemas.actor_schemas import ActorResponse
+from backend.schemas.film_schemas import FilmResponse
+
+
+class FilmWithActorsResponse(FilmResponse):
+    """出演者を展開した Film レスポンスモデル（expand=actors）"""
+    actors: Optional[List[ActorResponse]] = None  # 削除されていない出演者（姓・名の順）
+
+
+class ActorWithFilmsResponse(ActorResponse):
+    """出演作を展開した Actor レスポンスモデル（expand=films）"""
+    films: Optional[List[FilmResponse]] = None  # 削除されていない出演作（タイトルの順）
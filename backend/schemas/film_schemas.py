@@ -12,6 +12,8 @@ class FilmRequest(BaseModel):
     description: Optional[str] = None
     image_path: Optional[str] = None
     release_year: Optional[int] = None
+    # 更新時に条件にするバージョン（作成時は無視。If-Match ヘッダーが優先される）
+    version: Optional[int] = None
 
 
 class FilmResponse(BaseModel):
@@ -24,12 +26,56 @@ class FilmResponse(BaseModel):
     release_year: Optional[int] = None
     last_update: str
     delete_flag: bool
+    version: int  # 楽観的ロック用のバージョン
 
     class Config:
         """Pydantic 設定"""
         from_attributes = True
 
 
+class FilmsBatchRequest(BaseModel):
+    """Film 一括作成リクエストモデル"""
+    films: List[FilmRequest]
+
+
+class FilmBatchResult(BaseModel):
+    """Film 一括作成の 1 件分の結果"""
+    index: int  # リクエストの films 内の位置
+    status: int  # 201（作成済み）または 400（検証エラー）
+    film: Optional[FilmResponse] = None
+    error: Optional[str] = None
+
+
+class FilmsBatchResponse(BaseModel):
+    """Film 一括作成レスポンスモデル"""
+    results: List[FilmBatchResult]
+    created: int
+    failed: int
+
+
+class FilmsBatchGetRequest(BaseModel):
+    """Film 一括取得リクエストモデル"""
+    film_ids: List[str]
+
+
+class FilmsBatchGetResponse(BaseModel):
+    """Film 一括取得レスポンスモデル"""
+    films: List[FilmResponse]  # リクエストの film_ids の順序（重複は 1 件にまとめる）
+    not_found: List[str]  # 見つからなかった film_id
+
+
 class FilmsListResponse(BaseModel):
     """Films リストレスポンスモデル"""
     films: List[FilmResponse]
+    next_cursor: Optional[str] = None  # 次のページのカーソル。最終ページの場合は None
+
+
+class FilmSuggestion(BaseModel):
+    """Film サジェストの 1 件"""
+    film_id: str
+    title: str
+
+
+class FilmSuggestionsResponse(BaseModel):
+    """Film サジェストレスポンスモデル"""
+    suggestions: List[FilmSuggestion]  # タイトルの辞書順
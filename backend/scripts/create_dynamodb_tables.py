@@ -1,6 +1,8 @@
 """DynamoDB テーブル作成スクリプト
 
-Films と Actors テーブルを作成し、delete_flag-index GSI を設定します。
+Films と Actors テーブルを作成し、active_shard-index GSI を設定します。
+Films テーブルには一覧の絞り込み・並び替え用の GSI（FILM_QUERY_INDEXES）も設定します。
+出演関係を保持する FilmActors テーブルには、逆向きの actor_id-film_id-index GSI を設定します。
 """
 import boto3
 from botocore.exceptions import ClientError
@@ -11,6 +13,56 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from backend.config.settings import settings
+from backend.repositories.dynamodb_film_indexes import (
+    film_query_attribute_definitions,
+    film_query_index_definitions
+)
+from backend.repositories.dynamodb_cast_repository import FILM_ACTORS_BY_ACTOR_INDEX
+from backend.repositories.dynamodb_shards import ACTIVE_SHARD_INDEX
+
+# GSI のスループット（プロビジョニングモードのテーブル用）
+INDEX_PROVISIONED_THROUGHPUT = {
+    'ReadCapacityUnits': 5,
+    'WriteCapacityUnits': 5
+}
+
+# active_shard-index のキー属性。active_shard は削除されていないアイテムだけが持つ
+ACTIVE_SHARD_ATTRIBUTE_DEFINITIONS = [
+    {
+        'AttributeName': 'active_shard',
+        'AttributeType': 'N'
+    },
+    {
+        'AttributeName': 'last_update',
+        'AttributeType': 'S'  # ISO 8601 文字列（辞書順で時刻順になる）
+    }
+]
+
+
+def active_shard_index():
+    """
+    削除されていないアイテムを DYNAMODB_ACTIVE_SHARDS 個のパーティションに分散する疎な GSI の定義
+
+    パーティションキーが 1 種類の値に偏らないため、読み書きが 1 パーティションの上限に
+    制限されない。last_update をソートキーにして各シャードを新しい順に読み出す。
+    """
+    return {
+        'IndexName': ACTIVE_SHARD_INDEX,
+        'KeySchema': [
+            {
+                'AttributeName': 'active_shard',
+                'KeyType': 'HASH'
+            },
+            {
+                'AttributeName': 'last_update',
+                'KeyType': 'RANGE'
+            }
+        ],
+        'Projection': {
+            'ProjectionType': 'ALL'
+        },
+        'ProvisionedThroughput': dict(INDEX_PROVISIONED_THROUGHPUT)
+    }
 
 
 def create_films_table(dynamodb):
@@ -29,28 +81,12 @@ def create_films_table(dynamodb):
                     'AttributeName': 'film_id',
                     'AttributeType': 'S'
                 },
-                {
-                    'AttributeName': 'delete_flag',
-                    'AttributeType': 'N'  # DynamoDB では boolean は数値として扱う
-                }
+                # active_shard / last_update を含む
+                *film_query_attribute_definitions()
             ],
             GlobalSecondaryIndexes=[
-                {
-                    'IndexName': 'delete_flag-index',
-                    'KeySchema': [
-                        {
-                            'AttributeName': 'delete_flag',
-                            'KeyType': 'HASH'
-                        }
-                    ],
-                    'Projection': {
-                        'ProjectionType': 'ALL'
-                    },
-                    'ProvisionedThroughput': {
-                        'ReadCapacityUnits': 5,
-                        'WriteCapacityUnits': 5
-                    }
-                }
+                active_shard_index(),
+                *film_query_index_definitions(INDEX_PROVISIONED_THROUGHPUT).values()
             ],
             ProvisionedThroughput={
                 'ReadCapacityUnits': 5,
@@ -87,27 +123,73 @@ def create_actors_table(dynamodb):
                     'AttributeName': 'actor_id',
                     'AttributeType': 'S'
                 },
+                *ACTIVE_SHARD_ATTRIBUTE_DEFINITIONS
+            ],
+            GlobalSecondaryIndexes=[
+                active_shard_index()
+            ],
+            ProvisionedThroughput={
+                'ReadCapacityUnits': 5,
+                'WriteCapacityUnits': 5
+            }
+        )
+        
+        # テーブルが作成されるまで待機
+        table.wait_until_exists()
+        print(f"✓ Actors テーブル '{settings.dynamodb_actors_table}' を作成しました")
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print(f"! Actors テーブル '{settings.dynamodb_actors_table}' は既に存在します")
+            return True
+        else:
+            print(f"✗ Actors テーブルの作成に失敗しました: {e.response['Error']['Message']}")
+            return False
+
+
+def create_film_actors_table(dynamodb):
+    """FilmActors テーブル（映画とアクターの出演関係の隣接リスト）を作成"""
+    try:
+        table = dynamodb.create_table(
+            TableName=settings.dynamodb_film_actors_table,
+            KeySchema=[
+                {
+                    'AttributeName': 'film_id',
+                    'KeyType': 'HASH'  # Partition key
+                },
+                {
+                    'AttributeName': 'actor_id',
+                    'KeyType': 'RANGE'  # Sort key
+                }
+            ],
+            AttributeDefinitions=[
+                {
+                    'AttributeName': 'film_id',
+                    'AttributeType': 'S'
+                },
                 {
-                    'AttributeName': 'delete_flag',
-                    'AttributeType': 'N'  # DynamoDB では boolean は数値として扱う
+                    'AttributeName': 'actor_id',
+                    'AttributeType': 'S'
                 }
             ],
             GlobalSecondaryIndexes=[
                 {
-                    'IndexName': 'delete_flag-index',
+                    # アクターの出演作を引く逆向きのインデックス（film_id だけを読むため KEYS_ONLY）
+                    'IndexName': FILM_ACTORS_BY_ACTOR_INDEX,
                     'KeySchema': [
                         {
-                            'AttributeName': 'delete_flag',
+                            'AttributeName': 'actor_id',
                             'KeyType': 'HASH'
+                        },
+                        {
+                            'AttributeName': 'film_id',
+                            'KeyType': 'RANGE'
                         }
                     ],
                     'Projection': {
-                        'ProjectionType': 'ALL'
+                        'ProjectionType': 'KEYS_ONLY'
                     },
-                    'ProvisionedThroughput': {
-                        'ReadCapacityUnits': 5,
-                        'WriteCapacityUnits': 5
-                    }
+                    'ProvisionedThroughput': dict(INDEX_PROVISIONED_THROUGHPUT)
                 }
             ],
             ProvisionedThroughput={
@@ -118,24 +200,19 @@ def create_actors_table(dynamodb):
         
         # テーブルが作成されるまで待機
         table.wait_until_exists()
-        print(f"✓ Actors テーブル '{settings.dynamodb_actors_table}' を作成しました")
+        print(f"✓ FilmActors テーブル '{settings.dynamodb_film_actors_table}' を作成しました")
         return True
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
-            print(f"! Actors テーブル '{settings.dynamodb_actors_table}' は既に存在します")
+            print(f"! FilmActors テーブル '{settings.dynamodb_film_actors_table}' は既に存在します")
             return True
         else:
-            print(f"✗ Actors テーブルの作成に失敗しました: {e.response['Error']['Message']}")
+            print(f"✗ FilmActors テーブルの作成に失敗しました: {e.response['Error']['Message']}")
             return False
 
 
-def main():
-    """メイン処理"""
-    print("DynamoDB テーブル作成スクリプト")
-    print("=" * 50)
-    print(f"リージョン: {settings.aws_region}")
-    
-    # DynamoDB クライアントを初期化
+def dynamodb_resource_kwargs():
+    """設定から boto3.resource('dynamodb') の引数を組み立てる"""
     dynamodb_config = {
         'region_name': settings.aws_region
     }
@@ -146,6 +223,19 @@ def main():
     
     if settings.dynamodb_endpoint_url:
         dynamodb_config['endpoint_url'] = settings.dynamodb_endpoint_url
+    
+    return dynamodb_config
+
+
+def main():
+    """メイン処理"""
+    print("DynamoDB テーブル作成スクリプト")
+    print("=" * 50)
+    print(f"リージョン: {settings.aws_region}")
+    
+    # DynamoDB クライアントを初期化
+    dynamodb_config = dynamodb_resource_kwargs()
+    if settings.dynamodb_endpoint_url:
         print(f"エンドポイント: {settings.dynamodb_endpoint_url}")
     
     print("=" * 50)
@@ -160,9 +250,12 @@ def main():
         # Actors テーブルを作成
         actors_success = create_actors_table(dynamodb)
         
+        # FilmActors テーブルを作成
+        film_actors_success = create_film_actors_table(dynamodb)
+        
         print()
         print("=" * 50)
-        if films_success and actors_success:
+        if films_success and actors_success and film_actors_success:
             print("✓ すべてのテーブルが正常に作成されました")
             return 0
         else:
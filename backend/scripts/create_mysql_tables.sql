@@ -11,7 +11,18 @@ CREATE TABLE IF NOT EXISTS films (
     rating ENUM('G', 'PG', 'PG-13', 'R', 'NC-17') NOT NULL,
     last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     delete_flag BOOLEAN NOT NULL DEFAULT FALSE,
-    INDEX idx_delete_flag (delete_flag)
+    -- 楽観的ロック用のバージョン（更新・削除のたびに 1 ずつ増える）
+    version INT NOT NULL DEFAULT 1,
+    -- 一覧取得のキーセットページネーション用
+    INDEX idx_films_delete_flag_last_update (delete_flag, last_update, film_id),
+    -- 一覧の絞り込み（rating）・並び替え（title / release_year）用
+    INDEX idx_films_delete_flag_rating_last_update (delete_flag, rating, last_update, film_id),
+    INDEX idx_films_delete_flag_title (delete_flag, title, film_id),
+    INDEX idx_films_delete_flag_rating_title (delete_flag, rating, title, film_id),
+    INDEX idx_films_delete_flag_release_year (delete_flag, release_year, film_id),
+    INDEX idx_films_delete_flag_rating_release_year (delete_flag, rating, release_year, film_id),
+    -- 全文検索用（ngram パーサーで日本語のタイトルも ngram_token_size 文字単位で索引付けする）
+    FULLTEXT INDEX ft_films_title_description (title, description) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- actors テーブルの作成
@@ -21,5 +32,43 @@ CREATE TABLE IF NOT EXISTS actors (
     last_name VARCHAR(100) NOT NULL,
     last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     delete_flag BOOLEAN NOT NULL DEFAULT FALSE,
-    INDEX idx_delete_flag (delete_flag)
+    -- 楽観的ロック用のバージョン（更新・削除のたびに 1 ずつ増える）
+    version INT NOT NULL DEFAULT 1,
+    -- 一覧取得のキーセットページネーション用
+    INDEX idx_actors_delete_flag_last_update (delete_flag, last_update, actor_id),
+    -- 全文検索用（ngram パーサーで日本語の姓名も ngram_token_size 文字単位で索引付けする）
+    FULLTEXT INDEX ft_actors_first_name_last_name (first_name, last_name) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- film_actors テーブル（映画とアクターの出演関係）の作成
+CREATE TABLE IF NOT EXISTS film_actors (
+    film_id VARCHAR(36) NOT NULL,
+    actor_id VARCHAR(36) NOT NULL,
+    last_update TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- 映画の出演者の取得用
+    PRIMARY KEY (film_id, actor_id),
+    -- アクターの出演作の取得用
+    INDEX idx_film_actors_actor_id_film_id (actor_id, film_id),
+    FOREIGN KEY (film_id) REFERENCES films (film_id),
+    FOREIGN KEY (actor_id) REFERENCES actors (actor_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 既存のテーブルに適用する場合（idx_delete_flag は新しいインデックスの先頭列で代替される）
+-- ALTER TABLE films ADD INDEX idx_films_delete_flag_last_update (delete_flag, last_update, film_id), DROP INDEX idx_delete_flag;
+-- ALTER TABLE actors ADD INDEX idx_actors_delete_flag_last_update (delete_flag, last_update, actor_id), DROP INDEX idx_delete_flag;
+
+-- 既存のテーブルに楽観的ロック用の version 列を追加する場合（既存の行は version = 1 になる）
+-- ALTER TABLE films ADD COLUMN version INT NOT NULL DEFAULT 1 AFTER delete_flag;
+-- ALTER TABLE actors ADD COLUMN version INT NOT NULL DEFAULT 1 AFTER delete_flag;
+
+-- 既存のテーブルに一覧の絞り込み・並び替え用のインデックスを追加する場合
+-- ALTER TABLE films
+--     ADD INDEX idx_films_delete_flag_rating_last_update (delete_flag, rating, last_update, film_id),
+--     ADD INDEX idx_films_delete_flag_title (delete_flag, title, film_id),
+--     ADD INDEX idx_films_delete_flag_rating_title (delete_flag, rating, title, film_id),
+--     ADD INDEX idx_films_delete_flag_release_year (delete_flag, release_year, film_id),
+--     ADD INDEX idx_films_delete_flag_rating_release_year (delete_flag, rating, release_year, film_id);
+
+-- 既存のテーブルに全文検索用のインデックスを追加する場合（行数に比例して時間がかかる）
+-- ALTER TABLE films ADD FULLTEXT INDEX ft_films_title_description (title, description) WITH PARSER ngram;
+-- ALTER TABLE actors ADD FULLTEXT INDEX ft_actors_first_name_last_name (first_name, last_name) WITH PARSER ngram;
@@ -0,0 +1,205 @@
+"""DynamoDB active_shard-index 移行スクリプト
+
+既存の Films / Actors テーブルの削除されていないアイテムに active_shard 属性を
+書き込み（削除済みのアイテムからは取り除き）、active_shard-index GSI を追加します。
+何度実行しても同じ結果になります。
+
+使い方:
+    python backend/scripts/migrate_dynamodb_active_shard.py [--dry-run] [--drop-legacy-index]
+"""
+import argparse
+import sys
+import os
+import time
+
+import boto3
+from botocore.exceptions import ClientError
+
+# backend ディレクトリをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.config.settings import settings
+from backend.repositories.dynamodb_shards import active_shard
+from backend.scripts.create_dynamodb_tables import (
+    ACTIVE_SHARD_ATTRIBUTE_DEFINITIONS,
+    active_shard_index,
+    dynamodb_resource_kwargs
+)
+
+# 旧設計の delete_flag をパーティションキーとする GSI
+LEGACY_INDEX = 'delete_flag-index'
+
+# GSI の作成・削除の完了を確認する間隔（秒）
+POLL_INTERVAL = 5
+
+
+def backfill(table, key_name, dry_run):
+    """
+    全アイテムを Scan し、active_shard を現在の設定に合わせる
+
+    削除されていないアイテムには active_shard(ID) を書き込み、削除済みのアイテムからは
+    active_shard を取り除く。書き込みは条件付きで、Scan 後に削除されたアイテムに
+    active_shard を書き込むことはない。
+
+    Returns:
+        (確認したアイテム数, 更新したアイテム数)
+    """
+    scan_kwargs = {
+        'ProjectionExpression': '#key, delete_flag, active_shard',
+        'ExpressionAttributeNames': {'#key': key_name}
+    }
+    scanned = 0
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            scanned += 1
+            entity_id = item[key_name]
+            current = item.get('active_shard')
+            desired = None if item.get('delete_flag', False) else active_shard(entity_id)
+            if current is not None and desired is not None and int(current) == desired:
+                continue
+            if current is None and desired is None:
+                continue
+            updated += 1
+            if dry_run:
+                continue
+            try:
+                if desired is None:
+                    table.update_item(
+                        Key={key_name: entity_id},
+                        UpdateExpression='REMOVE active_shard',
+                        ConditionExpression='attribute_exists(#key)',
+                        ExpressionAttributeNames={'#key': key_name}
+                    )
+                else:
+                    table.update_item(
+                        Key={key_name: entity_id},
+                        UpdateExpression='SET active_shard = :shard',
+                        ConditionExpression='attribute_exists(#key) AND delete_flag = :false',
+                        ExpressionAttributeNames={'#key': key_name},
+                        ExpressionAttributeValues={':shard': desired, ':false': False}
+                    )
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                # Scan 後に削除・変更されたアイテムは次回の実行で揃える
+                updated -= 1
+        if 'LastEvaluatedKey' not in response:
+            return scanned, updated
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def index_statuses(client, table_name):
+    """テーブルの GSI 名とステータスの辞書を返す"""
+    description = client.describe_table(TableName=table_name)['Table']
+    return {
+        index['IndexName']: index.get('IndexStatus', 'ACTIVE')
+        for index in description.get('GlobalSecondaryIndexes', [])
+    }, description
+
+
+def create_index(client, table_name, index, attribute_definitions, dry_run):
+    """
+    GSI がなければ追加し、ACTIVE になるまで待機する
+
+    Args:
+        client: boto3 の DynamoDB クライアント
+        table_name: テーブル名
+        index: GlobalSecondaryIndexUpdates の Create に渡す GSI の定義
+        attribute_definitions: GSI のキー属性の AttributeDefinitions
+        dry_run: True の場合は作成しない
+    """
+    index_name = index['IndexName']
+    statuses, description = index_statuses(client, table_name)
+    if index_name in statuses:
+        print(f"  ! {index_name} は既に存在します（{statuses[index_name]}）")
+    elif dry_run:
+        print(f"  - {index_name} を作成します（dry-run）")
+        return
+    else:
+        index = dict(index)
+        billing_mode = description.get('BillingModeSummary', {}).get('BillingMode')
+        if billing_mode == 'PAY_PER_REQUEST':
+            # オンデマンドのテーブルではスループットを指定できない
+            index.pop('ProvisionedThroughput', None)
+        client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=attribute_definitions,
+            GlobalSecondaryIndexUpdates=[{'Create': index}]
+        )
+        print(f"  ✓ {index_name} の作成を開始しました")
+
+    while True:
+        statuses, _ = index_statuses(client, table_name)
+        if statuses.get(index_name) == 'ACTIVE':
+            print(f"  ✓ {index_name} が利用可能になりました")
+            return
+        time.sleep(POLL_INTERVAL)
+
+
+def drop_legacy_index(client, table_name, dry_run):
+    """旧設計の delete_flag-index を削除する"""
+    statuses, _ = index_statuses(client, table_name)
+    if LEGACY_INDEX not in statuses:
+        return
+    if dry_run:
+        print(f"  - {LEGACY_INDEX} を削除します（dry-run）")
+        return
+    client.update_table(
+        TableName=table_name,
+        GlobalSecondaryIndexUpdates=[{'Delete': {'IndexName': LEGACY_INDEX}}]
+    )
+    print(f"  ✓ {LEGACY_INDEX} の削除を開始しました")
+
+
+def migrate_table(dynamodb, table_name, key_name, args):
+    """1 つのテーブルを移行する"""
+    print(f"{table_name}:")
+    table = dynamodb.Table(table_name)
+    scanned, updated = backfill(table, key_name, args.dry_run)
+    suffix = "（dry-run）" if args.dry_run else ""
+    print(f"  ✓ {scanned} 件を確認し、{updated} 件の active_shard を更新しました{suffix}")
+    create_index(
+        dynamodb.meta.client,
+        table_name,
+        active_shard_index(),
+        ACTIVE_SHARD_ATTRIBUTE_DEFINITIONS,
+        args.dry_run
+    )
+    if args.drop_legacy_index:
+        drop_legacy_index(dynamodb.meta.client, table_name, args.dry_run)
+
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description="DynamoDB active_shard-index 移行スクリプト")
+    parser.add_argument('--dry-run', action='store_true', help="更新せずに件数だけを表示する")
+    parser.add_argument(
+        '--drop-legacy-index',
+        action='store_true',
+        help=f"移行後に {LEGACY_INDEX} を削除する（新しいバージョンのデプロイ後に指定）"
+    )
+    args = parser.parse_args()
+
+    print("DynamoDB active_shard-index 移行スクリプト")
+    print("=" * 50)
+    print(f"リージョン: {settings.aws_region}")
+    print(f"シャード数: {settings.dynamodb_active_shards}")
+    print("=" * 50)
+    print()
+
+    try:
+        dynamodb = boto3.resource('dynamodb', **dynamodb_resource_kwargs())
+        migrate_table(dynamodb, settings.dynamodb_films_table, 'film_id', args)
+        migrate_table(dynamodb, settings.dynamodb_actors_table, 'actor_id', args)
+        print()
+        print("✓ 移行が完了しました")
+        return 0
+    except ClientError as e:
+        print(f"✗ 移行に失敗しました: {e.response['Error']['Message']}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""DynamoDB 映画一覧の絞り込み・並び替え用 GSI 移行スクリプト
+
+既存の Films テーブルのアイテムに release_year_key 属性を、削除されていないアイテムには
+active_rating 属性（「rating#シャード番号」）を書き込み（削除済みのアイテムからは active_rating を
+取り除き）、FILM_QUERY_INDEXES の GSI を 1 つずつ追加します。何度実行しても同じ結果になります。
+active_shard-index は migrate_dynamodb_active_shard.py で先に移行してください。
+
+使い方:
+    python backend/scripts/migrate_dynamodb_film_query_indexes.py [--dry-run]
+"""
+import argparse
+import sys
+import os
+
+import boto3
+from botocore.exceptions import ClientError
+
+# backend ディレクトリをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.config.settings import settings
+from backend.repositories.dynamodb_film_indexes import (
+    ACTIVE_RATING_ATTRIBUTE,
+    FILM_QUERY_ATTRIBUTE_TYPES,
+    NO_RELEASE_YEAR,
+    RELEASE_YEAR_KEY_ATTRIBUTE,
+    active_rating_key,
+    film_query_index_definitions
+)
+from backend.repositories.dynamodb_shards import active_shard
+from backend.scripts.create_dynamodb_tables import INDEX_PROVISIONED_THROUGHPUT, dynamodb_resource_kwargs
+from backend.scripts.migrate_dynamodb_active_shard import create_index
+
+
+def _update_item(table, item, desired_rating, desired_year_key):
+    """
+    1 件のアイテムの active_rating / release_year_key を書き込む
+
+    Scan 時点から delete_flag・rating・release_year が変わっていないことを条件にする。
+    """
+    film_id = item['film_id']
+    values = {':year_key': desired_year_key, ':deleted': item.get('delete_flag', False)}
+    condition = 'attribute_exists(film_id) AND delete_flag = :deleted'
+    if 'release_year' in item:
+        condition += ' AND release_year = :release_year'
+        values[':release_year'] = item['release_year']
+    else:
+        condition += ' AND attribute_not_exists(release_year)'
+
+    if desired_rating is None:
+        update_expression = f'SET {RELEASE_YEAR_KEY_ATTRIBUTE} = :year_key REMOVE {ACTIVE_RATING_ATTRIBUTE}'
+    else:
+        update_expression = f'SET {RELEASE_YEAR_KEY_ATTRIBUTE} = :year_key, {ACTIVE_RATING_ATTRIBUTE} = :active_rating'
+        condition += ' AND rating = :rating'
+        values[':active_rating'] = desired_rating
+        values[':rating'] = item['rating']
+    table.update_item(
+        Key={'film_id': film_id},
+        UpdateExpression=update_expression,
+        ConditionExpression=condition,
+        ExpressionAttributeValues=values
+    )
+
+
+def backfill(table, dry_run):
+    """
+    全アイテムを Scan し、active_rating / release_year_key を現在の値に合わせる
+
+    Returns:
+        (確認したアイテム数, 更新したアイテム数)
+    """
+    scan_kwargs = {
+        'ProjectionExpression': (
+            f'film_id, delete_flag, rating, release_year, {ACTIVE_RATING_ATTRIBUTE}, {RELEASE_YEAR_KEY_ATTRIBUTE}'
+        )
+    }
+    scanned = 0
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            scanned += 1
+            desired_rating = (
+                None if item.get('delete_flag', False)
+                else active_rating_key(item['rating'], active_shard(item['film_id']))
+            )
+            release_year = item.get('release_year')
+            desired_year_key = int(release_year) if release_year is not None else NO_RELEASE_YEAR
+            current_year_key = item.get(RELEASE_YEAR_KEY_ATTRIBUTE)
+            if (
+                item.get(ACTIVE_RATING_ATTRIBUTE) == desired_rating
+                and current_year_key is not None
+                and int(current_year_key) == desired_year_key
+            ):
+                continue
+            updated += 1
+            if dry_run:
+                continue
+            try:
+                _update_item(table, item, desired_rating, desired_year_key)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                # Scan 後に更新・削除されたアイテムは新しいバージョンが書き込んでいるか、次回の実行で揃える
+                updated -= 1
+        if 'LastEvaluatedKey' not in response:
+            return scanned, updated
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description="DynamoDB 映画一覧の絞り込み・並び替え用 GSI 移行スクリプト")
+    parser.add_argument('--dry-run', action='store_true', help="更新せずに件数だけを表示する")
+    args = parser.parse_args()
+
+    print("DynamoDB 映画一覧の絞り込み・並び替え用 GSI 移行スクリプト")
+    print("=" * 50)
+    print(f"リージョン: {settings.aws_region}")
+    print(f"テーブル: {settings.dynamodb_films_table}")
+    print("=" * 50)
+    print()
+
+    try:
+        dynamodb = boto3.resource('dynamodb', **dynamodb_resource_kwargs())
+        table_name = settings.dynamodb_films_table
+        scanned, updated = backfill(dynamodb.Table(table_name), args.dry_run)
+        suffix = "（dry-run）" if args.dry_run else ""
+        print(f"  ✓ {scanned} 件を確認し、{updated} 件の {ACTIVE_RATING_ATTRIBUTE} / {RELEASE_YEAR_KEY_ATTRIBUTE} を更新しました{suffix}")
+
+        # GSI の追加は 1 回の UpdateTable につき 1 つまでのため、1 つずつ作成して待機する
+        for index in film_query_index_definitions(INDEX_PROVISIONED_THROUGHPUT).values():
+            attribute_definitions = [
+                {'AttributeName': key['AttributeName'], 'AttributeType': FILM_QUERY_ATTRIBUTE_TYPES[key['AttributeName']]}
+                for key in index['KeySchema']
+            ]
+            create_index(dynamodb.meta.client, table_name, index, attribute_definitions, args.dry_run)
+        print()
+        print("✓ 移行が完了しました")
+        return 0
+    except ClientError as e:
+        print(f"✗ 移行に失敗しました: {e.response['Error']['Message']}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""インプロセスの全文検索インデックスとサジェスト"""
+from .inverted_index import InvertedIndex, SearchHit
+from .prefix_index import PrefixIndex, Suggestion, suggest_key
+from .tokenizer import normalize, tokenize
+
+__all__ = [
+    "InvertedIndex",
+    "PrefixIndex",
+    "SearchHit",
+    "Suggestion",
+    "normalize",
+    "suggest_key",
+    "tokenize",
+]
@@ -0,0 +1,262 @@
+"""BM25 でランキングするインプロセスの転置インデックス"""
+import heapq
+import math
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from backend.search.tokenizer import normalize, tokenize
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """
+    検索結果の 1 件
+
+    Attributes:
+        doc_id: ドキュメントの ID
+        score: BM25 の関連度スコア
+    """
+    doc_id: str
+    score: float
+
+
+class InvertedIndex:
+    """
+    ドキュメントの複数のフィールドを索引付けし、BM25 で関連度を計算する転置インデックス
+
+    フィールドごとの重みを掛けた出現回数を 1 つの文書として BM25 を計算する（BM25F の簡易版）。
+    検索語の最後の語は前方一致で展開し、入力途中の語でも一致させる。
+    リクエストを処理するスレッドから同時に使えるよう、操作は全てロックで保護する。
+    """
+
+    def __init__(
+        self,
+        field_weights: Mapping[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_prefix_expansions: int = 50
+    ):
+        """
+        Args:
+            field_weights: 索引付けするフィールド名と重み
+            k1: BM25 の出現回数の飽和パラメータ
+            b: BM25 の文書長の正規化パラメータ
+            max_prefix_expansions: 前方一致で展開する語の最大数（辞書順で先頭から）
+        """
+        self.field_weights = dict(field_weights)
+        self.k1 = k1
+        self.b = b
+        self.max_prefix_expansions = max_prefix_expansions
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._documents: Dict[str, Dict[str, float]] = {}
+        self._lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        # 前方一致用の語の昇順リスト。最初の前方一致検索まで作らない（一括構築中に挿入のコストを払わない）
+        self._sorted_terms: Optional[List[str]] = None
+        # 再構築中に受け付けた変更（finish_rebuild で新しいインデックスに適用する）
+        self._journal: Optional[List[Tuple[str, Optional[Mapping[str, Optional[str]]]]]] = None
+
+    def __len__(self) -> int:
+        """索引付けされているドキュメント数"""
+        return len(self._documents)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        統計情報を返す
+
+        Returns:
+            Dict[str, int]: 索引付けされているドキュメント数と語の種類の数
+        """
+        with self._lock:
+            return {"documents": len(self._documents), "terms": len(self._postings)}
+
+    def add(self, doc_id: str, fields: Mapping[str, Optional[str]]) -> None:
+        """
+        ドキュメントを索引付けする（同じ ID のドキュメントがあれば置き換える）
+
+        Args:
+            doc_id: ドキュメントの ID
+            fields: フィールド名と値（field_weights にないフィールドと None は無視する）
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((doc_id, dict(fields)))
+            self._remove(doc_id)
+            self._add(doc_id, fields)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        ドキュメントをインデックスから取り除く（索引付けされていなければ何もしない）
+
+        Args:
+            doc_id: ドキュメントの ID
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((doc_id, None))
+            self._remove(doc_id)
+
+    def search(
+        self,
+        text: str,
+        limit: int,
+        after: Optional[Tuple[float, str]] = None
+    ) -> Tuple[List[SearchHit], bool]:
+        """
+        text に一致するドキュメントを関連度の高い順に最大 limit 件返す
+
+        検索語のいずれかのトークンを含むドキュメントが一致する（OR 検索）。同じスコアのドキュメントは
+        ID の降順に並ぶ。text が空白で終わっていない場合、最後のトークンは前方一致で検索する。
+
+        Args:
+            text: 検索語
+            limit: 返す最大件数
+            after: この (スコア, ID) より後のドキュメントだけを返す（前のページの末尾）
+
+        Returns:
+            (検索結果のリスト, limit 件より後にも一致するドキュメントがある場合 True)
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return [], False
+        prefix = None
+        if not normalize(text)[-1:].isspace():
+            prefix = tokens.pop()
+        with self._lock:
+            scores = self._score(set(tokens) - {prefix}, prefix)
+        candidates = scores.items()
+        if after is not None:
+            candidates = [(doc_id, score) for doc_id, score in candidates if (score, doc_id) < after]
+        top = heapq.nlargest(limit + 1, candidates, key=lambda item: (item[1], item[0]))
+        hits = [SearchHit(doc_id, score) for doc_id, score in top[:limit]]
+        return hits, len(top) > limit
+
+    def begin_rebuild(self) -> "InvertedIndex":
+        """
+        インデックスの再構築を始め、同じ設定の空のインデックスを返す
+
+        返されたインデックスに全ドキュメントを add してから finish_rebuild に渡す。
+        その間もこのインデックスは検索・更新でき、受け付けた変更は finish_rebuild で
+        新しいインデックスにも適用される。
+        """
+        with self._lock:
+            self._journal = []
+        return InvertedIndex(self.field_weights, self.k1, self.b, self.max_prefix_expansions)
+
+    def finish_rebuild(self, rebuilt: "InvertedIndex") -> None:
+        """
+        begin_rebuild で作成して構築し終えたインデックスの内容に置き換える
+
+        Args:
+            rebuilt: begin_rebuild が返したインデックス
+        """
+        with self._lock:
+            for doc_id, fields in self._journal or []:
+                rebuilt._remove(doc_id)
+                if fields is not None:
+                    rebuilt._add(doc_id, fields)
+            self._postings = rebuilt._postings
+            self._documents = rebuilt._documents
+            self._lengths = rebuilt._lengths
+            self._total_length = rebuilt._total_length
+            self._sorted_terms = None
+            self._journal = None
+
+    def abort_rebuild(self) -> None:
+        """begin_rebuild で始めた再構築を取り止める"""
+        with self._lock:
+            self._journal = None
+
+    def _add(self, doc_id: str, fields: Mapping[str, Optional[str]]) -> None:
+        """ドキュメントを索引付けする（ロックを取得した状態で呼び出す）"""
+        frequencies: Counter = Counter()
+        for name, weight in self.field_weights.items():
+            value = fields.get(name)
+            if value:
+                for token in tokenize(value):
+                    frequencies[token] += weight
+        if not frequencies:
+            return
+        terms = dict(frequencies)
+        length = sum(terms.values())
+        self._documents[doc_id] = terms
+        self._lengths[doc_id] = length
+        self._total_length += length
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if self._sorted_terms is not None:
+                    insort(self._sorted_terms, term)
+            postings[doc_id] = frequency
+
+    def _remove(self, doc_id: str) -> None:
+        """ドキュメントをインデックスから取り除く（ロックを取得した状態で呼び出す）"""
+        terms = self._documents.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                if self._sorted_terms is not None:
+                    del self._sorted_terms[bisect_left(self._sorted_terms, term)]
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """prefix で始まる語を辞書順に最大 max_prefix_expansions 件返す（ロックを取得した状態で呼び出す）"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = []
+        position = bisect_left(self._sorted_terms, prefix)
+        while (
+            position < len(self._sorted_terms)
+            and len(terms) < self.max_prefix_expansions
+            and self._sorted_terms[position].startswith(prefix)
+        ):
+            terms.append(self._sorted_terms[position])
+            position += 1
+        return terms
+
+    def _score(self, terms: set, prefix: Optional[str]) -> Dict[str, float]:
+        """
+        ドキュメントごとの BM25 スコアを計算する（ロックを取得した状態で呼び出す）
+
+        terms のスコアは合計し、前方一致で展開した語はドキュメントごとに最も高いスコアだけを加える。
+        """
+        scores: Dict[str, float] = {}
+        if not self._documents:
+            return scores
+        average_length = self._total_length / len(self._documents)
+        for term in terms:
+            for doc_id, score in self._term_scores(term, average_length).items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        if prefix is not None:
+            best: Dict[str, float] = {}
+            for term in self._expand_prefix(prefix):
+                for doc_id, score in self._term_scores(term, average_length).items():
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        return scores
+
+    def _term_scores(self, term: str, average_length: float) -> Dict[str, float]:
+        """1 つの語のドキュメントごとの BM25 スコアを返す（ロックを取得した状態で呼び出す）"""
+        postings = self._postings.get(term)
+        if not postings:
+            return {}
+        document_count = len(self._documents)
+        idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+        k1, b = self.k1, self.b
+        lengths = self._lengths
+        scores = {}
+        for doc_id, frequency in postings.items():
+            norm = k1 * (1 - b + b * lengths[doc_id] / average_length)
+            scores[doc_id] = idf * frequency * (k1 + 1) / (frequency + norm)
+        return scores
@@ -0,0 +1,293 @@
+"""前方一致のサジェスト（入力補完）に使うインプロセスのソート済み配列"""
+import heapq
+import re
+import threading
+from array import array
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from backend.search.tokenizer import normalize
+
+# レコード（キー・ID・表示用の値）の区切り。キーの制御文字は空白に置き換えるため、キーには現れない
+_SEPARATOR = "\x1f"
+_SEPARATOR_BYTES = _SEPARATOR.encode("utf-8")
+_CONTROL_CHARACTERS = re.compile(r"[\x00-\x1f\x7f]")
+
+
+def suggest_key(text: str) -> str:
+    """
+    前方一致の比較に使うキーを返す（NFKC 正規化・小文字化し、連続する空白を 1 つにまとめる）
+
+    Args:
+        text: タイトル・氏名または入力途中の文字列
+
+    Returns:
+        正規化したキー
+    """
+    return " ".join(_CONTROL_CHARACTERS.sub(" ", normalize(text)).split())
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """
+    サジェストの 1 件
+
+    Attributes:
+        doc_id: エンティティの ID
+        value: 表示用の文字列（映画のタイトル、アクターの氏名など）
+    """
+    doc_id: str
+    value: str
+
+
+class PrefixIndexBuilder:
+    """PrefixIndex.begin_rebuild が返す、再構築中のドキュメントを集める入れ物"""
+
+    def __init__(self):
+        self._documents: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+
+    def __len__(self) -> int:
+        """集めたドキュメント数"""
+        return len(self._documents)
+
+    def add(self, doc_id: str, keys: Sequence[str], value: str) -> None:
+        """
+        ドキュメントを追加する（同じ ID のドキュメントがあれば置き換える）
+
+        Args:
+            doc_id: ドキュメントの ID
+            keys: 前方一致で検索する文字列（アクターの「名 姓」「姓 名」など、複数指定できる）
+            value: サジェストとして返す表示用の文字列
+        """
+        self._documents[doc_id] = (tuple(keys), value)
+
+    def remove(self, doc_id: str) -> None:
+        """ドキュメントを取り除く"""
+        self._documents.pop(doc_id, None)
+
+    def records(self) -> List[str]:
+        """全ドキュメントのレコードを昇順に並べて返す"""
+        records = []
+        for doc_id, (keys, value) in self._documents.items():
+            records.extend(_records(doc_id, keys, value))
+        records.sort()
+        return records
+
+
+def _records(doc_id: str, keys: Sequence[str], value: str) -> List[str]:
+    """ドキュメントのレコード「キー \\x1f ID \\x1f 値」を返す（正規化して空になるキーと重複は除く）"""
+    normalized = {suggest_key(key) for key in keys}
+    return [_SEPARATOR.join((key, doc_id, value)) for key in normalized if key]
+
+
+def _parse(record: str) -> Tuple[str, str, str]:
+    """レコードを (キー, ID, 値) に分ける"""
+    key, doc_id, value = record.split(_SEPARATOR, 2)
+    return key, doc_id, value
+
+
+class PrefixIndex:
+    """
+    入力途中の文字列に前方一致するドキュメントを辞書順に返すインデックス
+
+    全レコード「キー \\x1f ID \\x1f 値」を昇順に UTF-8 で連結した 1 つのバイト列と、各レコードの
+    開始位置・ID 順の並びを持つ array で保持する（1 件あたりレコード長 + 8 バイト程度）。
+    検索は開始位置の二分探索で O(log n + limit)。UTF-8 のバイト順はコードポイント順と一致するため、
+    前方一致するレコードは連続した範囲になる。
+
+    構築後の追加・更新は小さなソート済みリスト、削除は基底のレコード番号の集合で表し、
+    検索時に基底と合わせる。再構築（begin_rebuild / finish_rebuild）で基底に取り込まれる。
+    リクエストを処理するスレッドから同時に使えるよう、操作は全てロックで保護する。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blob = b""
+        self._offsets = array("I", [0])
+        # レコード番号を ID の昇順に並べたもの（ID から基底のレコードを探すのに使う）
+        self._by_id = array("I")
+        self._added: List[str] = []
+        self._added_by_id: Dict[str, List[str]] = {}
+        self._removed: Set[int] = set()
+        # 再構築中に受け付けた変更（finish_rebuild で新しい基底に適用する）
+        self._journal: Optional[List[Tuple[str, Optional[Tuple[Tuple[str, ...], str]]]]] = None
+
+    def __len__(self) -> int:
+        """レコード数（アクターのように 1 件で複数のキーを持つドキュメントは複数と数える）"""
+        return len(self._offsets) - 1 - len(self._removed) + len(self._added)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        統計情報を返す
+
+        Returns:
+            Dict[str, int]: レコード数、基底のバイト数、基底に取り込まれていない追加・削除の数
+        """
+        with self._lock:
+            return {
+                "records": len(self),
+                "bytes": len(self._blob) + self._offsets.itemsize * (len(self._offsets) + len(self._by_id)),
+                "pending_added": len(self._added),
+                "pending_removed": len(self._removed),
+            }
+
+    def add(self, doc_id: str, keys: Sequence[str], value: str) -> None:
+        """
+        ドキュメントを追加する（同じ ID のドキュメントがあれば置き換える）
+
+        Args:
+            doc_id: ドキュメントの ID
+            keys: 前方一致で検索する文字列（複数指定できる）
+            value: サジェストとして返す表示用の文字列
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((doc_id, (tuple(keys), value)))
+            self._remove(doc_id)
+            self._add(doc_id, keys, value)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        ドキュメントを取り除く（なければ何もしない）
+
+        Args:
+            doc_id: ドキュメントの ID
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((doc_id, None))
+            self._remove(doc_id)
+
+    def suggest(self, prefix: str, limit: int) -> List[Suggestion]:
+        """
+        キーが prefix で始まるドキュメントをキーの辞書順（同じキーは ID 順）に最大 limit 件返す
+
+        複数のキーが一致するドキュメントは 1 件として返す。
+
+        Args:
+            prefix: 入力途中の文字列
+            limit: 返す最大件数
+
+        Returns:
+            サジェストのリスト
+        """
+        key = suggest_key(prefix)
+        if not key:
+            return []
+        suggestions: List[Suggestion] = []
+        seen: Set[str] = set()
+        with self._lock:
+            for record in heapq.merge(self._base_matches(key), self._added_matches(key)):
+                _, doc_id, value = _parse(record)
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                suggestions.append(Suggestion(doc_id, value))
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
+
+    def begin_rebuild(self) -> PrefixIndexBuilder:
+        """
+        インデックスの再構築を始め、ドキュメントを集める PrefixIndexBuilder を返す
+
+        返された PrefixIndexBuilder に全ドキュメントを add してから finish_rebuild に渡す。
+        その間もこのインデックスは検索・更新でき、受け付けた変更は finish_rebuild で
+        新しい基底にも適用される。
+        """
+        with self._lock:
+            self._journal = []
+        return PrefixIndexBuilder()
+
+    def finish_rebuild(self, builder: PrefixIndexBuilder) -> None:
+        """
+        builder のドキュメントで基底を作り直す
+
+        並べ替えと連結はロックの外で行い、検索を止めるのは差し替えの間だけにする。
+
+        Args:
+            builder: begin_rebuild が返した PrefixIndexBuilder
+        """
+        records = builder.records()
+        encoded = [record.encode("utf-8") for record in records]
+        offsets = array("I", [0])
+        position = 0
+        for record in encoded:
+            position += len(record)
+            offsets.append(position)
+        blob = b"".join(encoded)
+        ids = [record.split(_SEPARATOR, 2)[1] for record in records]
+        by_id = array("I", sorted(range(len(ids)), key=ids.__getitem__))
+        del encoded, ids
+
+        with self._lock:
+            self._blob, self._offsets, self._by_id = blob, offsets, by_id
+            self._added, self._added_by_id, self._removed = [], {}, set()
+            for doc_id, document in self._journal or []:
+                self._remove(doc_id)
+                if document is not None:
+                    self._add(doc_id, *document)
+            self._journal = None
+
+    def abort_rebuild(self) -> None:
+        """begin_rebuild で始めた再構築を取り止める"""
+        with self._lock:
+            self._journal = None
+
+    def _record(self, number: int) -> bytes:
+        """基底の number 番目のレコードを返す（ロックを取得した状態で呼び出す）"""
+        return self._blob[self._offsets[number]:self._offsets[number + 1]]
+
+    def _record_id(self, number: int) -> str:
+        """基底の number 番目のレコードの ID を返す（ロックを取得した状態で呼び出す）"""
+        return self._record(number).split(_SEPARATOR_BYTES, 2)[1].decode("utf-8")
+
+    def _base_matches(self, key: str) -> Iterator[str]:
+        """基底のレコードのうちキーが key で始まるものを昇順に返す（ロックを取得した状態で呼び出す）"""
+        prefix = key.encode("utf-8")
+        low, high = 0, len(self._offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        for number in range(low, len(self._offsets) - 1):
+            record = self._record(number)
+            if not record.startswith(prefix):
+                return
+            if number not in self._removed:
+                yield record.decode("utf-8")
+
+    def _added_matches(self, key: str) -> Iterator[str]:
+        """追加されたレコードのうちキーが key で始まるものを昇順に返す（ロックを取得した状態で呼び出す）"""
+        for position in range(bisect_left(self._added, key), len(self._added)):
+            record = self._added[position]
+            if not record.startswith(key):
+                return
+            yield record
+
+    def _add(self, doc_id: str, keys: Sequence[str], value: str) -> None:
+        """ドキュメントのレコードを追加する（ロックを取得した状態で呼び出す）"""
+        records = _records(doc_id, keys, value)
+        for record in records:
+            insort(self._added, record)
+        if records:
+            self._added_by_id[doc_id] = records
+
+    def _remove(self, doc_id: str) -> None:
+        """ドキュメントのレコードを取り除く（ロックを取得した状態で呼び出す）"""
+        for record in self._added_by_id.pop(doc_id, []):
+            del self._added[bisect_left(self._added, record)]
+
+        low, high = 0, len(self._by_id)
+        while low < high:
+            middle = (low + high) // 2
+            if self._record_id(self._by_id[middle]) < doc_id:
+                low = middle + 1
+            else:
+                high = middle
+        while low < len(self._by_id) and self._record_id(self._by_id[low]) == doc_id:
+            self._removed.add(self._by_id[low])
+            low += 1
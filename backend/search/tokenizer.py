@@ -0,0 +1,44 @@
+"""全文検索インデックスのトークナイザー"""
+import re
+import unicodedata
+from typing import List
+
+# 分かち書きしない文字（ひらがな・カタカナ・CJK 統合漢字・ハングル）の範囲
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+
+# CJK の連続部分、またはそれ以外の英数字の連続部分（単語）
+_TOKEN_PATTERN = re.compile(f"([{_CJK_RANGES}]+)|([^\\W_{_CJK_RANGES}]+)")
+
+
+def normalize(text: str) -> str:
+    """
+    検索用に文字列を正規化する（NFKC 正規化と小文字化）
+
+    全角英数字・半角カタカナなどの表記の揺れを吸収する。
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    文字列をインデックスのトークンに分割する
+
+    英数字は単語単位、ひらがな・カタカナ・漢字・ハングルは連続部分を 2 文字ずつずらした bi-gram に分割する
+    （1 文字だけの連続部分はその 1 文字をトークンにする）。MySQL の ngram パーサー（ngram_token_size=2）と
+    同じ考え方で、単語の区切りのない日本語でも部分一致で検索できる。
+
+    Args:
+        text: 分割する文字列
+
+    Returns:
+        出現順のトークンのリスト（重複を含む）
+    """
+    tokens: List[str] = []
+    for cjk, word in _TOKEN_PATTERN.findall(normalize(text)):
+        if word:
+            tokens.append(word)
+        elif len(cjk) == 1:
+            tokens.append(cjk)
+        else:
+            tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return tokens
@@ -1,25 +1,211 @@
 """認証ミドルウェアと依存性注入"""
-from typing import Dict, Any
-from fastapi import Depends, HTTPException, status
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jose import jwt
+from jose.exceptions import JWTError
 
 from backend.services.auth_service import AuthService
-from backend.services.cognito_auth_service import CognitoAuthService
-from backend.exceptions import AuthenticationError
+from backend.exceptions import AuthenticationError, AuthServiceUnavailableError
+from backend.config.settings import settings
 
 
 # HTTPBearer スキームを定義
 security = HTTPBearer()
 
 
-def get_auth_service() -> AuthService:
+class TokenCache:
+    """
+    検証済みトークンのインプロセスキャッシュ
+
+    同じトークンが短時間に何度も検証されるのを避けるため、検証結果を
+    トークンのハッシュをキーとして保持する。有効なトークンは
+    min(トークンの exp, ttl_seconds) まで、拒否されたトークン（署名・期限・発行者などの
+    検証で無効と確定したもの）は negative_ttl_seconds の間だけ保持し、max_entries を超えた場合は
+    最も長く使われていないエントリから削除する（LRU）。
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int, negative_ttl_seconds: int):
+        """
+        Args:
+            max_entries: 保持する最大エントリ数
+            ttl_seconds: 有効なトークンを保持する最大秒数
+            negative_ttl_seconds: 拒否されたトークンを保持する秒数
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        # key -> (有効期限, ユーザー情報, エラーメッセージ)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]], Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        """トークンそのものを保持しないようハッシュ値をキーにする"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        キャッシュされた検証結果を取得する
+
+        Args:
+            token: アクセストークン
+
+        Returns:
+            (ユーザー情報, エラーメッセージ) のタプル。キャッシュにない場合は None
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, user_info, error = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if error is not None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return user_info, error
+
+    def set_valid(self, token: str, user_info: Dict[str, Any]) -> None:
+        """
+        有効なトークンの検証結果を保存する
+
+        Args:
+            token: アクセストークン
+            user_info: 検証結果のユーザー情報
+        """
+        expires_at = time.time() + self.ttl_seconds
+        exp = user_info.get("exp") or self._unverified_exp(token)
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        self._put(token, (expires_at, user_info, None))
+
+    def set_invalid(self, token: str, error: str) -> None:
+        """
+        拒否されたトークンを短時間保存する
+
+        Args:
+            token: アクセストークン
+            error: クライアントに返すエラーメッセージ
+        """
+        self._put(token, (time.time() + self.negative_ttl_seconds, None, error))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        キャッシュの統計情報を返す
+
+        Returns:
+            Dict[str, int]: エントリ数とヒット／ミス数
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """全エントリを削除する"""
+        with self._lock:
+            self._entries.clear()
+
+    def _put(self, token: str, entry: Tuple[float, Optional[Dict[str, Any]], Optional[str]]) -> None:
+        """エントリを保存し、上限を超えた分を LRU で削除する"""
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _unverified_exp(token: str) -> Optional[int]:
+        """検証済みトークンから exp クレームを読み取る（署名は検証済みの前提）"""
+        try:
+            return jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            return None
+
+
+# プロセス内で共有するトークンキャッシュ
+token_cache = TokenCache(
+    max_entries=settings.auth_token_cache_max_entries,
+    ttl_seconds=settings.auth_token_cache_ttl,
+    negative_ttl_seconds=settings.auth_token_cache_negative_ttl,
+)
+
+
+def get_auth_service(request: Request) -> AuthService:
     """
     認証サービスのインスタンスを取得する依存性注入関数
 
+    インスタンスはアプリケーションの起動時に作成され app.state に格納されている。
+    テストでは app.dependency_overrides[get_auth_service] で差し替えられる。
+
+    Args:
+        request: 現在のリクエスト
+
     Returns:
         AuthService: 認証サービスのインスタンス
     """
-    return CognitoAuthService()
+    return request.app.state.auth_service
+
+
+async def _validate_token_cached(token: str, auth_service: AuthService) -> Dict[str, Any]:
+    """
+    トークンキャッシュを使用してトークンを検証する
+
+    キャッシュミス時の検証（JWKS の取得や GetUser API 呼び出しを伴う場合がある）は
+    イベントループをブロックしないようスレッドプールで実行する。JWKS や Cognito への
+    問い合わせが一時的に失敗した場合（AuthServiceUnavailableError）は、有効なトークンまで
+    拒否し続けないよう結果をキャッシュせずにそのまま送出する。
+
+    Args:
+        token: アクセストークン
+        auth_service: 認証サービスのインスタンス
+
+    Returns:
+        Dict[str, Any]: ユーザー情報
+
+    Raises:
+        AuthServiceUnavailableError: 認証基盤への問い合わせが一時的に失敗した場合
+        AuthenticationError: トークンが無効または期限切れの場合
+    """
+    cached = token_cache.get(token)
+    if cached is not None:
+        user_info, error = cached
+        if error is not None:
+            raise AuthenticationError(error)
+        return dict(user_info)
+
+    try:
+        user_info = await run_in_threadpool(auth_service.validate_token, token)
+    except AuthenticationError as e:
+        token_cache.set_invalid(token, str(e))
+        raise
+
+    token_cache.set_valid(token, user_info)
+    return dict(user_info)
 
 
 async def get_current_user(
@@ -37,14 +223,21 @@ async def get_current_user(
         Dict[str, Any]: 現在のユーザー情報
 
     Raises:
-        HTTPException: 認証に失敗した場合
+        HTTPException: 認証に失敗した場合（401）、または認証基盤に一時的に問い合わせできない場合（503）
     """
     token = credentials.credentials
 
     try:
-        user_info = auth_service.validate_token(token)
+        user_info = await _validate_token_cached(token, auth_service)
         return user_info
 
+    except AuthServiceUnavailableError as e:
+        # トークンの拒否ではないため 401 にしない（クライアントがログアウトしないよう 503 で再試行を促す）
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.auth_unavailable_retry_after)},
+        )
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -81,7 +274,7 @@ async def get_optional_current_user(
     token = credentials.credentials
 
     try:
-        user_info = auth_service.validate_token(token)
+        user_info = await _validate_token_cached(token, auth_service)
         return user_info
     except Exception:
         return None
@@ -39,6 +39,22 @@ class AuthService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_user_info(self, token: str) -> Dict[str, Any]:
+        """
+        アクセストークンに対応するユーザーのプロフィール属性を取得する
+
+        Args:
+            token: アクセストークン
+
+        Returns:
+            email などのユーザー属性を含む辞書
+
+        Raises:
+            AuthenticationError: トークンが無効または期限切れの場合
+        """
+        pass
+
     @abstractmethod
     def forgot_password(self, username: str) -> Dict[str, str]:
         """
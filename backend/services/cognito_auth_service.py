@@ -2,9 +2,13 @@
 import boto3
 from typing import Dict, Any
 from botocore.exceptions import ClientError
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
 
+from backend.config.aws import aws_session_kwargs, build_botocore_config
 from backend.services.auth_service import AuthService
-from backend.exceptions import AuthenticationError
+from backend.services.jwks_cache import get_jwks_cache
+from backend.exceptions import AuthenticationError, AuthServiceUnavailableError
 from backend.config.settings import settings
 
 
@@ -12,18 +16,24 @@ class CognitoAuthService(AuthService):
     """AWS Cognito を使用した認証サービス"""
 
     def __init__(self):
-        """CognitoAuthService を初期化"""
+        """
+        CognitoAuthService を初期化
+
+        boto3 クライアントの作成はコストが高いため、リクエストごとではなく
+        アプリケーションの起動時に一度だけインスタンス化する（get_auth_service 参照）。
+        """
         self.region = settings.cognito_region or settings.aws_region
         self.user_pool_id = settings.cognito_user_pool_id
         self.client_id = settings.cognito_client_id
+        self.issuer = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
+        self.jwks_cache = get_jwks_cache(
+            f"{self.issuer}/.well-known/jwks.json",
+            settings.cognito_jwks_cache_ttl
+        )
 
-        # boto3 クライアントを作成
-        session_kwargs = {"region_name": self.region}
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
-            session_kwargs["aws_access_key_id"] = settings.aws_access_key_id
-            session_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-
-        self.client = boto3.client("cognito-idp", **session_kwargs)
+        # boto3 クライアントを作成（スレッドセーフなのでアプリケーション全体で共有する）
+        session = boto3.session.Session(**aws_session_kwargs(self.region))
+        self.client = session.client("cognito-idp", config=build_botocore_config())
 
     def authenticate(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -91,11 +101,93 @@ class CognitoAuthService(AuthService):
         """
         アクセストークンを検証する
 
+        COGNITO_TOKEN_VALIDATION=jwks（デフォルト）の場合はユーザープールの JWKS を
+        使って署名・exp・iss・client_id・token_use をローカルで検証し、Cognito への
+        API 呼び出しを行わない。この場合 email などのプロフィール属性は含まれないため、
+        必要な場合は get_user_info() を使用する。
+        COGNITO_TOKEN_VALIDATION=remote の場合は GetUser API で検証する。
+
         Args:
             token: 検証するアクセストークン
 
         Returns:
             トークンから抽出したユーザー情報を含む辞書
+            {
+                "username": str,
+                "sub": str,
+                "exp": int (jwks の場合),
+                ...
+            }
+
+        Raises:
+            AuthServiceUnavailableError: JWKS の取得や Cognito への問い合わせが一時的に失敗した場合
+            AuthenticationError: トークンが無効または期限切れの場合
+        """
+        if settings.cognito_token_validation == "remote":
+            return self.get_user_info(token)
+        return self._verify_access_token(token)
+
+    def _verify_access_token(self, token: str) -> Dict[str, Any]:
+        """
+        アクセストークンの署名とクレームを JWKS を使ってローカルで検証する
+
+        Args:
+            token: 検証するアクセストークン
+
+        Returns:
+            トークンのクレームから作成したユーザー情報を含む辞書
+
+        Raises:
+            AuthServiceUnavailableError: JWKS の取得に失敗した場合
+            AuthenticationError: トークンが無効または期限切れの場合
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise AuthenticationError("トークンが無効または期限切れです")
+
+        kid = header.get("kid")
+        if not kid:
+            raise AuthenticationError("トークンが無効または期限切れです")
+
+        key = self.jwks_cache.get_key(kid)
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                issuer=self.issuer,
+                # アクセストークンには aud が含まれないため client_id で検証する
+                options={"verify_aud": False},
+            )
+        except ExpiredSignatureError:
+            raise AuthenticationError("トークンの有効期限が切れています")
+        except JWTError:
+            raise AuthenticationError("トークンが無効または期限切れです")
+
+        if claims.get("token_use") != "access":
+            raise AuthenticationError("アクセストークンではありません")
+        if claims.get("client_id") != self.client_id:
+            raise AuthenticationError("トークンのクライアント ID が一致しません")
+
+        return {
+            "username": claims.get("username"),
+            "sub": claims.get("sub"),
+            "exp": claims.get("exp"),
+            "scope": claims.get("scope"),
+            "groups": claims.get("cognito:groups", []),
+        }
+
+    def get_user_info(self, token: str) -> Dict[str, Any]:
+        """
+        GetUser API を使用してアクセストークンを検証し、ユーザー属性を取得する
+
+        Args:
+            token: アクセストークン
+
+        Returns:
+            ユーザー情報を含む辞書
             {
                 "username": str,
                 "sub": str,
@@ -104,6 +196,7 @@ class CognitoAuthService(AuthService):
             }
 
         Raises:
+            AuthServiceUnavailableError: スロットリングやネットワークエラーで Cognito に問い合わせできなかった場合
             AuthenticationError: トークンが無効または期限切れの場合
         """
         try:
@@ -132,10 +225,11 @@ class CognitoAuthService(AuthService):
             elif error_code == "UserNotFoundException":
                 raise AuthenticationError("ユーザーが見つかりません")
             else:
-                raise AuthenticationError(f"トークン検証エラー: {error_message}")
+                # スロットリングや Cognito 側の障害はトークンの拒否ではない
+                raise AuthServiceUnavailableError(f"トークン検証エラー: {error_message}")
 
         except Exception as e:
-            raise AuthenticationError(f"予期しないエラーが発生しました: {str(e)}")
+            raise AuthServiceUnavailableError(f"予期しないエラーが発生しました: {str(e)}")
 
     def forgot_password(self, username: str) -> Dict[str, str]:
         """
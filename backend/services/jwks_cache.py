@@ -0,0 +1,133 @@
+"""Cognito ユーザープールの JWKS（公開鍵セット）キャッシュ"""
+import json
+import threading
+import time
+import urllib.request
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from backend.exceptions import AuthenticationError, AuthServiceUnavailableError
+
+
+class JWKSCache:
+    """
+    JWKS をメモリ上にキャッシュし、kid から公開鍵を引けるようにする
+
+    キャッシュは TTL で失効し、未知の kid を受け取った場合（鍵のローテーション）
+    にも再取得する。不正な kid を大量に送られても JWKS エンドポイントへの
+    リクエストが集中しないよう、kid ミスによる再取得の間隔は制限する。
+
+    再取得は 1 スレッドだけが行い（シングルフライト）、HTTP リクエストの間は
+    ロックを保持しない。他のスレッドは手元の鍵で検証を続け、手元の鍵では
+    検証できない場合だけ取得の完了を最大 timeout 秒待つ。
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl_seconds: int = 3600,
+        min_refresh_interval: int = 60,
+        timeout: float = 5.0,
+    ):
+        """
+        Args:
+            jwks_url: JWKS エンドポイントの URL
+            ttl_seconds: キャッシュの有効期間（秒）
+            min_refresh_interval: kid ミス時に再取得する最小間隔（秒）
+            timeout: JWKS 取得時のタイムアウト（秒）
+        """
+        self.jwks_url = jwks_url
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        # 直近の取得が失敗した場合のエラーメッセージ（成功すると None に戻る）
+        self._last_error: Optional[str] = None
+        # 取得中の場合に完了を通知する Event
+        self._refreshing: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+
+    def get_key(self, kid: str) -> Dict[str, Any]:
+        """
+        kid に対応する JWK を取得する
+
+        Args:
+            kid: JWT ヘッダーの kid
+
+        Returns:
+            Dict[str, Any]: JWK
+
+        Raises:
+            AuthServiceUnavailableError: JWKS の取得に失敗し、対応する鍵が見つからない場合
+            AuthenticationError: 取得した JWKS に対応する鍵が見つからない場合
+        """
+        with self._lock:
+            now = time.monotonic()
+            needs_refresh = (
+                not self._keys
+                or now - self._fetched_at >= self.ttl_seconds
+                or (kid not in self._keys and now - self._fetched_at >= self.min_refresh_interval)
+            )
+            refreshing = self._refreshing
+            is_leader = needs_refresh and refreshing is None
+            if is_leader:
+                refreshing = self._refreshing = threading.Event()
+            key = self._keys.get(kid)
+
+        if is_leader:
+            self._refresh(now, refreshing)
+        elif key is None and refreshing is not None:
+            # 他のスレッドが取得中で、手元の鍵では検証できない場合だけ完了を待つ
+            refreshing.wait(self.timeout)
+
+        with self._lock:
+            key = self._keys.get(kid)
+            last_error = self._last_error
+            timed_out = refreshing is not None and not refreshing.is_set()
+
+        if key is None:
+            if last_error is not None:
+                raise AuthServiceUnavailableError(f"公開鍵の取得に失敗しました: {last_error}")
+            if timed_out:
+                raise AuthServiceUnavailableError("公開鍵の取得がタイムアウトしました")
+            raise AuthenticationError("トークンの署名鍵が見つかりません")
+        return key
+
+    def _refresh(self, now: float, refreshing: threading.Event) -> None:
+        """JWKS エンドポイントから鍵セットを再取得し、待っているスレッドに完了を通知する（ロックは取得しないで呼び出す）"""
+        try:
+            with urllib.request.urlopen(self.jwks_url, timeout=self.timeout) as response:
+                jwks = json.loads(response.read())
+            keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        except Exception as e:
+            with self._lock:
+                if self._keys:
+                    # 取得に失敗しても既存の鍵で検証を続け、min_refresh_interval 後に再試行する
+                    self._fetched_at = now - self.ttl_seconds + self.min_refresh_interval
+                self._last_error = str(e)
+                self._refreshing = None
+            refreshing.set()
+            return
+
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = now
+            self._last_error = None
+            self._refreshing = None
+        refreshing.set()
+
+
+@lru_cache(maxsize=None)
+def get_jwks_cache(jwks_url: str, ttl_seconds: int = 3600) -> JWKSCache:
+    """
+    JWKS URL ごとにプロセス内で共有される JWKSCache を返す
+
+    Args:
+        jwks_url: JWKS エンドポイントの URL
+        ttl_seconds: キャッシュの有効期間（秒）
+
+    Returns:
+        JWKSCache: 共有キャッシュ
+    """
+    return JWKSCache(jwks_url, ttl_seconds=ttl_seconds)
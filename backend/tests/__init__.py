@@ -0,0 +1 @@
+"""テストモジュール"""
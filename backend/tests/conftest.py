@@ -0,0 +1,6 @@
+"""pytest の共通設定"""
+import os
+
+# Settings の必須項目（テストでは Cognito に接続しない）。backend をインポートする前に設定する
+os.environ.setdefault("COGNITO_USER_POOL_ID", "ap-northeast-1_test")
+os.environ.setdefault("COGNITO_CLIENT_ID", "test-client-id")
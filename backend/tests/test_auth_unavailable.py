@@ -0,0 +1,90 @@
+"""認証基盤の一時的な障害が 401 ではなく 503 になり、拒否としてキャッシュされないことのテスト"""
+from datetime import datetime
+from typing import Any, Dict
+from unittest.mock import create_autospec
+
+import httpx
+import pytest
+
+from backend.config.settings import settings
+from backend.controllers.dependencies import get_cast_repository, get_film_repository
+from backend.entities.film import Film
+from backend.entities.rating import Rating
+from backend.exceptions import AuthenticationError, AuthServiceUnavailableError
+from backend.main import app
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.services.auth_middleware import get_auth_service, token_cache
+from backend.services.auth_service import AuthService
+
+TOKEN = "test-access-token"
+
+
+async def get_film(film_id: str) -> Film:
+    """get_by_id の代わりに Film を返す"""
+    return Film(film_id=film_id, title="Film", rating=Rating.G, last_update=datetime.now())
+
+
+@pytest.fixture
+def auth_service():
+    """validate_token の結果をテストごとに差し替える認証サービス"""
+    return create_autospec(AuthService, instance=True)
+
+
+@pytest.fixture
+def auth_app(auth_service):
+    """認証サービスとリポジトリを差し替え、トークンキャッシュを空にしたアプリケーション"""
+    repository = create_autospec(AsyncFilmRepository, instance=True)
+    repository.get_by_id.side_effect = get_film
+    app.dependency_overrides[get_film_repository] = lambda: repository
+    app.dependency_overrides[get_cast_repository] = lambda: create_autospec(AsyncCastRepository, instance=True)
+    app.dependency_overrides[get_auth_service] = lambda: auth_service
+    token_cache.clear()
+    yield app
+    app.dependency_overrides.clear()
+    token_cache.clear()
+
+
+async def get_film_with_token(client: httpx.AsyncClient) -> httpx.Response:
+    """Bearer トークン付きで認証が必要なエンドポイントを呼び出す"""
+    return await client.get("/api/films/film-1", headers={"Authorization": f"Bearer {TOKEN}"})
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_returns_503_without_negative_cache(auth_app, auth_service):
+    """JWKS / Cognito の一時的な障害は 503 + Retry-After になり、回復後の同じトークンは通る"""
+    auth_service.validate_token.side_effect = AuthServiceUnavailableError("公開鍵の取得がタイムアウトしました")
+
+    async with httpx.AsyncClient(app=auth_app, base_url="http://test") as client:
+        response = await get_film_with_token(client)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(settings.auth_unavailable_retry_after)
+        # WWW-Authenticate 付きの 401 ではないため、クライアントはトークンを破棄しない
+        assert "WWW-Authenticate" not in response.headers
+        assert token_cache.get(TOKEN) is None
+
+        user_info: Dict[str, Any] = {"username": "test-user", "sub": "sub-1"}
+        auth_service.validate_token.side_effect = None
+        auth_service.validate_token.return_value = user_info
+        response = await get_film_with_token(client)
+
+    assert response.status_code == 200
+    assert auth_service.validate_token.call_count == 2
+    assert token_cache.get(TOKEN) == (user_info, None)
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_returns_401_and_is_cached(auth_app, auth_service):
+    """検証で無効と確定したトークンは 401 になり、拒否結果がキャッシュされる"""
+    auth_service.validate_token.side_effect = AuthenticationError("トークンの有効期限が切れています")
+
+    async with httpx.AsyncClient(app=auth_app, base_url="http://test") as client:
+        first = await get_film_with_token(client)
+        second = await get_film_with_token(client)
+
+    assert [first.status_code, second.status_code] == [401, 401]
+    assert first.headers["WWW-Authenticate"] == "Bearer"
+    assert second.json()["detail"] == "トークンの有効期限が切れています"
+    # 2 回目はキャッシュから拒否し、認証サービスを呼ばない
+    assert auth_service.validate_token.call_count == 1
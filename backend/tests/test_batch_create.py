@@ -0,0 +1,115 @@
+"""POST /api/films:batch と POST /api/actors:batch の要素ごとの結果のテスト"""
+from typing import List
+from unittest.mock import create_autospec
+
+import httpx
+import pytest
+
+from backend.controllers.dependencies import get_actor_repository, get_film_repository
+from backend.entities.actor import Actor
+from backend.entities.film import Film
+from backend.main import app
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.services.auth_middleware import get_current_user
+
+
+async def created_films(films: List[Film]) -> List[Film]:
+    """create_many の代わりに、受け取った Film をそのまま作成済みとして返す"""
+    return films
+
+
+async def created_actors(actors: List[Actor]) -> List[Actor]:
+    """create_many の代わりに、受け取った Actor をそのまま作成済みとして返す"""
+    return actors
+
+
+@pytest.fixture
+def film_repository():
+    """create_many だけを実装した非同期 Film リポジトリ"""
+    repository = create_autospec(AsyncFilmRepository, instance=True)
+    repository.create_many.side_effect = created_films
+    return repository
+
+
+@pytest.fixture
+def actor_repository():
+    """create_many だけを実装した非同期 Actor リポジトリ"""
+    repository = create_autospec(AsyncActorRepository, instance=True)
+    repository.create_many.side_effect = created_actors
+    return repository
+
+
+@pytest.fixture
+def batch_app(film_repository, actor_repository):
+    """Film / Actor リポジトリを差し替え、認証を省略したアプリケーション"""
+    app.dependency_overrides[get_film_repository] = lambda: film_repository
+    app.dependency_overrides[get_actor_repository] = lambda: actor_repository
+    app.dependency_overrides[get_current_user] = lambda: {"username": "test-user"}
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_create_films_batch_reports_each_item(batch_app, film_repository):
+    """検証に通った映画だけを 1 回で書き込み、要素ごとに 201 / 400 を返す"""
+    films = [
+        {"title": "Valid One", "rating": "G", "release_year": 2001},
+        {"title": "  ", "rating": "PG"},
+        {"title": "Valid Two", "rating": "R"},
+        {"title": "Too Old", "rating": "G", "release_year": 1700},
+    ]
+    async with httpx.AsyncClient(app=batch_app, base_url="http://test") as client:
+        response = await client.post("/api/films:batch", json={"films": films})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["index"] for item in body["results"]] == [0, 1, 2, 3]
+    assert [item["status"] for item in body["results"]] == [201, 400, 201, 400]
+    assert body["results"][0]["film"]["title"] == "Valid One"
+    assert body["results"][0]["film"]["release_year"] == 2001
+    assert body["results"][2]["film"]["title"] == "Valid Two"
+    assert body["results"][1]["error"] == "Title cannot be empty"
+    assert body["results"][3]["error"] == "Release year must be between 1800 and 2100"
+    assert body["results"][1]["film"] is None
+    assert (body["created"], body["failed"]) == (2, 2)
+
+    film_repository.create_many.assert_awaited_once()
+    written = film_repository.create_many.await_args.args[0]
+    assert [film.title for film in written] == ["Valid One", "Valid Two"]
+
+
+@pytest.mark.asyncio
+async def test_create_actors_batch_reports_each_item(batch_app, actor_repository):
+    """検証に通ったアクターだけを 1 回で書き込み、要素ごとに 201 / 400 を返す"""
+    actors = [
+        {"first_name": "", "last_name": "Nobody"},
+        {"first_name": "Penelope", "last_name": "Guiness"},
+        {"first_name": "Nick", "last_name": " "},
+    ]
+    async with httpx.AsyncClient(app=batch_app, base_url="http://test") as client:
+        response = await client.post("/api/actors:batch", json={"actors": actors})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["results"]] == [400, 201, 400]
+    assert body["results"][0]["error"] == "First name cannot be empty"
+    assert body["results"][2]["error"] == "Last name cannot be empty"
+    assert body["results"][1]["actor"]["first_name"] == "Penelope"
+    assert body["results"][1]["actor"]["version"] == 1
+    assert (body["created"], body["failed"]) == (1, 2)
+
+    actor_repository.create_many.assert_awaited_once()
+    written = actor_repository.create_many.await_args.args[0]
+    assert [actor.last_name for actor in written] == ["Guiness"]
+
+
+@pytest.mark.asyncio
+async def test_create_films_batch_all_invalid_skips_write(batch_app, film_repository):
+    """全件が検証エラーならリポジトリに書き込まない"""
+    async with httpx.AsyncClient(app=batch_app, base_url="http://test") as client:
+        response = await client.post("/api/films:batch", json={"films": [{"title": "", "rating": "G"}]})
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["results"]] == [400]
+    film_repository.create_many.assert_not_awaited()
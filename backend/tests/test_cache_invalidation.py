@@ -0,0 +1,147 @@
+"""読み込み中に無効化されたキャッシュが古い値を返さないことのテスト（世代番号・epoch）"""
+import asyncio
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional
+from unittest.mock import create_autospec
+
+import pytest
+
+from backend.cache import LRUTTLCache, SingleFlight, VersionedCache
+from backend.entities.film import Film
+from backend.entities.rating import Rating
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.cached_film_repository import CachedFilmRepository
+
+
+class BlockingLoader:
+    """
+    呼び出されると started を立て、release が立つまで値を返さない loader
+
+    読み込みの途中で無効化する順序をテストから決定的に制御する。
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return self.value
+
+
+async def returns(value):
+    """すぐに value を返す loader"""
+    return value
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_serves_cached_value_within_generation():
+    """世代が変わらなければ 2 回目以降は loader を呼ばずにキャッシュを返す"""
+    cache = VersionedCache(max_entries=10, ttl_seconds=60)
+    loader = BlockingLoader(["film-1"])
+    loader.release.set()
+
+    assert await cache.get_or_load("page", loader) == ["film-1"]
+    assert await cache.get_or_load("page", loader) == ["film-1"]
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_drops_result_of_load_started_before_bump():
+    """読み込み中に bump() された場合、その結果は新しい世代の読み手に返らない"""
+    cache = VersionedCache(max_entries=10, ttl_seconds=60)
+    stale_loader = BlockingLoader(["stale"])
+
+    stale_read = asyncio.create_task(cache.get_or_load("page", stale_loader))
+    await stale_loader.started.wait()
+    cache.bump()
+
+    # bump() の後の読み手は、実行中の古い世代の読み込みにまとめられない
+    fresh_read = asyncio.create_task(cache.get_or_load("page", lambda: returns(["fresh"])))
+    stale_loader.release.set()
+
+    assert await stale_read == ["stale"]
+    assert await fresh_read == ["fresh"]
+    # 古い読み込みの完了後も、現在の世代では古い値を返さない
+    assert await cache.get_or_load("page", lambda: returns(["unused"])) == ["fresh"]
+    assert stale_loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_reloads_after_bump_once_stale_load_finished():
+    """読み込み中に bump() され、その後に誰も読まなかった場合も、次の読み手は読み込み直す"""
+    cache = VersionedCache(max_entries=10, ttl_seconds=60)
+    stale_loader = BlockingLoader(["stale"])
+
+    stale_read = asyncio.create_task(cache.get_or_load("page", stale_loader))
+    await stale_loader.started.wait()
+    cache.bump()
+    stale_loader.release.set()
+    await stale_read
+
+    assert await cache.get_or_load("page", lambda: returns(["fresh"])) == ["fresh"]
+
+
+def test_lru_ttl_cache_rejects_set_after_invalidate():
+    """読み込み開始時の epoch から invalidate() された場合、if_epoch 付きの set は保存しない"""
+    cache: LRUTTLCache[str] = LRUTTLCache(max_entries=10, ttl_seconds=60)
+
+    epoch = cache.epoch
+    cache.invalidate("film-1")
+    cache.set("film-1", "stale", if_epoch=epoch)
+    assert cache.get("film-1") is None
+
+    epoch = cache.epoch
+    cache.set("film-1", "fresh", if_epoch=epoch)
+    assert cache.get("film-1") == "fresh"
+
+
+def make_film(version: int) -> Film:
+    """指定したバージョンの Film を作成する"""
+    return Film(
+        film_id="film-1", title=f"Version {version}", rating=Rating.G,
+        last_update=datetime(2024, 1, 1), version=version
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_does_not_cache_read_overlapping_update():
+    """get_by_id の読み込み中に update() された場合、読み込んだ古い Film をキャッシュに残さない"""
+    stored = {"film": make_film(1)}
+    stale_loader = BlockingLoader(None)
+
+    async def get_by_id(film_id: str) -> Optional[Film]:
+        film = stored["film"]
+        if stale_loader.calls == 0:
+            # 最初の読み込みだけ、更新前の値を読んだ状態で止める
+            await stale_loader()
+        return film
+
+    async def update(film: Film) -> Film:
+        stored["film"] = replace(film, version=film.version + 1)
+        return stored["film"]
+
+    inner = create_autospec(AsyncFilmRepository, instance=True)
+    inner.get_by_id.side_effect = get_by_id
+    inner.update.side_effect = update
+    repository = CachedFilmRepository(
+        inner, cache=LRUTTLCache(max_entries=10, ttl_seconds=60), single_flight=SingleFlight()
+    )
+
+    stale_read = asyncio.create_task(repository.get_by_id("film-1"))
+    await stale_loader.started.wait()
+    await repository.update(replace(make_film(1), title="Version 2"))
+
+    # 更新後の読み手は、実行中の更新前の読み込みにまとめられない
+    fresh_read = asyncio.create_task(repository.get_by_id("film-1"))
+    stale_loader.release.set()
+
+    assert (await stale_read).version == 1
+    assert (await fresh_read).version == 2
+    assert (await repository.get_by_id("film-1")).version == 2
+    assert repository.cache.get("film-1").version == 2
@@ -0,0 +1,147 @@
+"""PUT /api/films/{film_id} の楽観的ロック（If-Match と version）のテスト（MySQL・DynamoDB）"""
+from dataclasses import replace
+
+import boto3
+import httpx
+import pytest
+import pytest_asyncio
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.config.settings import settings
+from backend.controllers.dependencies import film_cache, film_list_cache
+from backend.main import app
+from backend.repositories.dynamodb_connection import DynamoDBConnection
+from backend.repositories.dynamodb_film_repository import DynamoDBFilmRepository
+from backend.repositories.models import Base
+from backend.repositories.mysql_film_repository import MySQLFilmRepository
+from backend.scripts.create_dynamodb_tables import create_films_table
+from backend.services.auth_middleware import get_current_user
+
+FILM = {"title": "Academy Dinosaur", "rating": "PG", "release_year": 2006}
+
+
+@pytest.fixture
+def mysql_backend(monkeypatch):
+    """インメモリの SQLite を MySQL の代わりに使うアプリケーションと、キャッシュを通さない同期リポジトリ"""
+    monkeypatch.setattr(settings, "database_type", "mysql")
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    app.state.mysql_engine = engine
+    yield MySQLFilmRepository(engine)
+    del app.state.mysql_engine
+    engine.dispose()
+
+
+@pytest.fixture
+def dynamodb_backend(monkeypatch):
+    """moto の DynamoDB を使うアプリケーションと、キャッシュを通さない同期リポジトリ"""
+    monkeypatch.setattr(settings, "database_type", "dynamodb")
+    monkeypatch.setattr(settings, "dynamodb_endpoint_url", None)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        assert create_films_table(boto3.resource("dynamodb", region_name=settings.aws_region))
+        connection = DynamoDBConnection()
+        app.state.dynamodb = connection
+        yield DynamoDBFilmRepository(connection)
+        del app.state.dynamodb
+
+
+@pytest.fixture(params=["mysql", "dynamodb"])
+def raw_repository(request):
+    """各データベースタイプのアプリケーションを用意し、キャッシュを通さない同期 Film リポジトリを返す"""
+    film_cache.clear()
+    film_list_cache.clear()
+    app.dependency_overrides[get_current_user] = lambda: {"username": "test-user"}
+    yield request.getfixturevalue(f"{request.param}_backend")
+    app.dependency_overrides.clear()
+    film_cache.clear()
+    film_list_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def client(raw_repository):
+    """アプリケーションを呼び出す HTTP クライアント"""
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+async def create_film(client: httpx.AsyncClient) -> str:
+    """映画を作成して film_id を返す（version は 1）"""
+    response = await client.post("/api/films", json=FILM)
+    assert response.status_code == 201
+    assert response.json()["version"] == 1
+    return response.json()["film_id"]
+
+
+@pytest.mark.asyncio
+async def test_if_match_takes_precedence_over_body_version(client):
+    """If-Match とボディの version の両方がある場合は If-Match を条件にする"""
+    film_id = await create_film(client)
+
+    response = await client.put(
+        f"/api/films/{film_id}", json={**FILM, "title": "Second", "version": 99}, headers={"If-Match": '"v1"'}
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert response.headers["ETag"] == '"v2"'
+
+    # ボディの version は現在のバージョンでも、古い If-Match が優先されて競合になる
+    response = await client.put(
+        f"/api/films/{film_id}", json={**FILM, "title": "Third", "version": 2}, headers={"If-Match": '"v1"'}
+    )
+    assert response.status_code == 409
+    assert (await client.get(f"/api/films/{film_id}")).json()["title"] == "Second"
+
+
+@pytest.mark.asyncio
+async def test_stale_version_returns_409(client):
+    """読み込んだ後に他の更新があった version（ボディ・If-Match とも）は 409 になり、上書きしない"""
+    film_id = await create_film(client)
+    response = await client.put(f"/api/films/{film_id}", json={**FILM, "title": "Second", "version": 1})
+    assert response.status_code == 200
+
+    stale_body = await client.put(f"/api/films/{film_id}", json={**FILM, "title": "Lost", "version": 1})
+    stale_header = await client.put(
+        f"/api/films/{film_id}", json={**FILM, "title": "Lost"}, headers={"If-Match": '"v1"'}
+    )
+
+    assert [stale_body.status_code, stale_header.status_code] == [409, 409]
+    assert stale_body.json()["error_code"] == "CONFLICT"
+    response = await client.get(f"/api/films/{film_id}")
+    assert (response.json()["title"], response.json()["version"]) == ("Second", 2)
+
+
+@pytest.mark.asyncio
+async def test_missing_film_returns_404_not_409(client):
+    """条件付き更新が行を更新しなかった場合、存在しない映画は 404、バージョン違いは 409 になる"""
+    film_id = await create_film(client)
+
+    missing_with_version = await client.put("/api/films/missing", json=FILM, headers={"If-Match": '"v1"'})
+    missing_without_version = await client.put("/api/films/missing", json=FILM)
+    conflict = await client.put(f"/api/films/{film_id}", json=FILM, headers={"If-Match": '"v5"'})
+
+    assert [missing_with_version.status_code, missing_without_version.status_code] == [404, 404]
+    assert missing_with_version.json()["error_code"] == "NOT_FOUND"
+    assert conflict.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_update_without_if_match_after_cached_read(client, raw_repository):
+    """If-Match も version もない更新は、キャッシュの古いバージョンではなく現在のバージョンを条件にする"""
+    film_id = await create_film(client)
+    assert (await client.get(f"/api/films/{film_id}")).headers["ETag"] == '"v1"'
+
+    # 他のプロセスによる更新（このプロセスのキャッシュは無効化されない）
+    film = raw_repository.get_by_id(film_id)
+    raw_repository.update(replace(film, title="Updated elsewhere"))
+    assert (await client.get(f"/api/films/{film_id}")).headers["ETag"] == '"v1"'
+
+    response = await client.put(f"/api/films/{film_id}", json={**FILM, "title": "Latest"})
+
+    assert response.status_code == 200
+    assert response.json()["version"] == 3
+    response = await client.get(f"/api/films/{film_id}")
+    assert (response.json()["title"], response.headers["ETag"]) == ("Latest", '"v3"')
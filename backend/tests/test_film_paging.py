@@ -0,0 +1,338 @@
+"""DynamoDB のシャード化した GSI のページングが MySQL のキーセットページネーションと一致することのテスト"""
+import hashlib
+import itertools
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.config.settings import settings
+from backend.entities.film import Film
+from backend.entities.rating import Rating
+from backend.repositories.dynamodb_async_film_repository import DynamoDBAsyncFilmRepository
+from backend.repositories.dynamodb_film_indexes import (
+    NO_RELEASE_YEAR,
+    film_index_position,
+    film_item_cursor,
+    film_query_index_definitions
+)
+from backend.repositories.dynamodb_film_repository import DynamoDBFilmRepository, FilmItemMapper
+from backend.repositories.dynamodb_shards import ACTIVE_SHARD_INDEX, active_shard
+from backend.repositories.film_query import FilmQuery, FilmSort, SortOrder
+from backend.repositories.models import Base
+from backend.repositories.mysql_film_repository import MySQLFilmRepository
+
+TABLE_NAME = "films"
+SHARDS = 3
+FILM_COUNT = 40
+PAGE_LIMITS = [1, 2, 3, 7]
+
+# 同じ値の映画が複数のシャードにまたがるよう、ソートキーの値は少数にする
+LAST_UPDATES = [datetime(2024, 1, 1, 12, 0, 0), datetime(2024, 1, 2, 12, 0, 0), datetime(2024, 1, 3, 12, 0, 0)]
+TITLES = ["ALPHA", "BRAVO", "CHARLIE", "DELTA"]
+RELEASE_YEARS = [None, 1999, 2000, 2001, 2000]
+RATINGS = [Rating.G, Rating.PG, Rating.R]
+
+# 絞り込み・並び替え条件の全ての組み合わせ
+QUERIES = [
+    FilmQuery(rating=rating, year_from=year_from, year_to=year_to, sort=sort, order=order)
+    for rating, (year_from, year_to), sort, order in itertools.product(
+        [None, Rating.G],
+        [(None, None), (2000, None), (None, 2000), (1999, 2000)],
+        list(FilmSort),
+        list(SortOrder)
+    )
+]
+
+
+def make_films() -> List[Film]:
+    """ソートキーの値が重複する映画を作成する"""
+    return [
+        Film(
+            film_id=f"film-{i:02d}",
+            title=TITLES[i % len(TITLES)],
+            rating=RATINGS[i % len(RATINGS)],
+            last_update=LAST_UPDATES[i % len(LAST_UPDATES)],
+            release_year=RELEASE_YEARS[i % len(RELEASE_YEARS)],
+        )
+        for i in range(FILM_COUNT)
+    ]
+
+
+def expected_ids(films: List[Film], query: FilmQuery) -> List[str]:
+    """query の条件と並び順（公開年のない映画は最も小さい値、同じ値は film_id の順）の film_id"""
+    def matches(film: Film) -> bool:
+        if query.rating is not None and film.rating != query.rating:
+            return False
+        if query.has_year_range and film.release_year is None:
+            return False
+        if query.year_from is not None and film.release_year < query.year_from:
+            return False
+        return query.year_to is None or film.release_year <= query.year_to
+
+    def sort_value(film: Film) -> Any:
+        if query.sort == FilmSort.TITLE:
+            return film.title
+        if query.sort == FilmSort.RELEASE_YEAR:
+            return film.release_year if film.release_year is not None else NO_RELEASE_YEAR
+        return film.last_update
+
+    ordered = sorted((film for film in films if matches(film)), key=lambda film: (sort_value(film), film.film_id))
+    if query.descending:
+        ordered.reverse()
+    return [film.film_id for film in ordered]
+
+
+def _to_dynamodb(value: Any) -> Any:
+    """boto3 の読み出し結果と同じく、数値を Decimal にする"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return Decimal(value)
+    return value
+
+
+def _tie_order(film_id: str) -> str:
+    """同じソートキーのアイテムの GSI 上の順序（film_id の順とは異なる不定の順序を模す）"""
+    return hashlib.md5(film_id.encode("utf-8")).hexdigest()
+
+
+class StubFilmsTable:
+    """
+    Films テーブルの GSI への Query を模すスタブ
+
+    film_query_index_definitions の射影どおりの属性を返し、Limit と
+    ExclusiveStartKey / LastEvaluatedKey でページを分ける。同じソートキーのアイテムは
+    film_id の順ではなく _tie_order の順に返す。
+    """
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.name = TABLE_NAME
+        self.items = {item["film_id"]: {key: _to_dynamodb(value) for key, value in item.items()} for item in items}
+        self.projections = {
+            name: definition["Projection"] for name, definition in film_query_index_definitions().items()
+        }
+        self.query_count = 0
+
+    def _project(self, index_name: str, item: Dict[str, Any], key_names: List[str]) -> Dict[str, Any]:
+        """GSI に射影された属性だけを返す"""
+        if index_name == ACTIVE_SHARD_INDEX:
+            return dict(item)
+        names = ["film_id", *key_names, *self.projections[index_name].get("NonKeyAttributes", [])]
+        return {name: item[name] for name in names if name in item}
+
+    def query(
+        self,
+        IndexName: str,
+        KeyConditionExpression: str,
+        ExpressionAttributeNames: Dict[str, str],
+        ExpressionAttributeValues: Dict[str, Any],
+        ScanIndexForward: bool = True,
+        Limit: Optional[int] = None,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        self.query_count += 1
+        partition_attribute, sort_attribute = ExpressionAttributeNames["#pk"], ExpressionAttributeNames["#sk"]
+        lower, upper = ExpressionAttributeValues.get(":lower"), ExpressionAttributeValues.get(":upper")
+        matched = [
+            item for item in self.items.values()
+            if item.get(partition_attribute) == ExpressionAttributeValues[":pk"]
+            and sort_attribute in item
+            and (lower is None or item[sort_attribute] >= lower)
+            and (upper is None or item[sort_attribute] <= upper)
+        ]
+        matched.sort(key=lambda item: (item[sort_attribute], _tie_order(item["film_id"])), reverse=not ScanIndexForward)
+        if ExclusiveStartKey is not None:
+            ids = [item["film_id"] for item in matched]
+            matched = matched[ids.index(ExclusiveStartKey["film_id"]) + 1:]
+
+        response: Dict[str, Any] = {}
+        if Limit is not None and len(matched) >= Limit:
+            # DynamoDB は Limit 件に達すると、残りがなくても LastEvaluatedKey を返す
+            matched = matched[:Limit]
+            last = matched[-1]
+            response["LastEvaluatedKey"] = {
+                name: last[name] for name in ("film_id", partition_attribute, sort_attribute)
+            }
+        response["Items"] = [self._project(IndexName, item, [partition_attribute, sort_attribute]) for item in matched]
+        return response
+
+
+class StubResource:
+    """BatchGetItem を模すスタブ（結果の順序はキーの順序と異なる）"""
+
+    def __init__(self, table: StubFilmsTable):
+        self.table = table
+
+    def batch_get_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        keys = RequestItems[self.table.name]["Keys"]
+        items = [dict(self.table.items[key["film_id"]]) for key in reversed(keys)]
+        return {"Responses": {self.table.name: items}, "UnprocessedKeys": {}}
+
+
+class AsyncStubFilmsTable:
+    """StubFilmsTable を aioboto3 の Table リソースと同じ非同期のインターフェースで呼ぶ"""
+
+    def __init__(self, table: StubFilmsTable):
+        self.name = table.name
+        self._table = table
+
+    async def query(self, **kwargs: Any) -> Dict[str, Any]:
+        return self._table.query(**kwargs)
+
+
+class AsyncStubResource:
+    """StubResource の非同期版"""
+
+    def __init__(self, resource: StubResource):
+        self._resource = resource
+
+    async def batch_get_item(self, **kwargs: Any) -> Dict[str, Any]:
+        return self._resource.batch_get_item(**kwargs)
+
+
+class StubConnection:
+    """DynamoDBConnection / AsyncDynamoDBConnection の代わりにスタブの Table と Resource を返す"""
+
+    def __init__(self, table: Any, resource: Any):
+        self._table = table
+        self.resource = resource
+
+    def table(self, table_name: str) -> Any:
+        return self._table
+
+
+@pytest.fixture
+def films(monkeypatch) -> List[Film]:
+    """SHARDS 個のシャードに分散した映画"""
+    monkeypatch.setattr(settings, "dynamodb_active_shards", SHARDS)
+    monkeypatch.setattr(settings, "dynamodb_films_table", TABLE_NAME)
+    films = make_films()
+    # 同じ last_update・タイトル・公開年の映画が複数のシャードにまたがっている
+    for attribute in ("last_update", "title", "release_year"):
+        shards_by_value: Dict[Any, set] = {}
+        for film in films:
+            shards_by_value.setdefault(getattr(film, attribute), set()).add(active_shard(film.film_id))
+        assert all(len(shards) > 1 for shards in shards_by_value.values())
+    return films
+
+
+@pytest.fixture
+def stub_table(films) -> StubFilmsTable:
+    """映画を書き込んだスタブの Films テーブル"""
+    mapper = FilmItemMapper()
+    return StubFilmsTable([mapper._entity_to_item(film) for film in films])
+
+
+@pytest.fixture
+def dynamodb_repository(stub_table) -> DynamoDBFilmRepository:
+    """スタブの Films テーブルを読む DynamoDBFilmRepository"""
+    return DynamoDBFilmRepository(StubConnection(stub_table, StubResource(stub_table)))
+
+
+@pytest.fixture
+def dynamodb_async_repository(stub_table) -> DynamoDBAsyncFilmRepository:
+    """スタブの Films テーブルを読む DynamoDBAsyncFilmRepository"""
+    return DynamoDBAsyncFilmRepository(
+        StubConnection(AsyncStubFilmsTable(stub_table), AsyncStubResource(StubResource(stub_table)))
+    )
+
+
+@pytest.fixture
+def mysql_repository(films) -> MySQLFilmRepository:
+    """インメモリの SQLite に映画を書き込んだ MySQLFilmRepository（キーセットページネーションの基準）"""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    repository = MySQLFilmRepository(engine)
+    repository.create_many(films)
+    yield repository
+    engine.dispose()
+
+
+def collect_pages(get_page, limit: int, query: FilmQuery):
+    """next_cursor をたどって全ページを読み、film_id とカーソルのリストを返す"""
+    ids: List[str] = []
+    cursors: List[str] = []
+    cursor = None
+    for _ in range(FILM_COUNT + 2):
+        page = get_page(limit, cursor, query)
+        assert len(page.items) <= limit
+        ids.extend(film.film_id for film in page.items)
+        if page.next_cursor is None:
+            return ids, cursors
+        cursors.append(page.next_cursor)
+        cursor = page.next_cursor
+    pytest.fail(f"ページングが終わらない: {query}")
+
+
+@pytest.mark.parametrize("query", QUERIES, ids=repr)
+def test_dynamodb_pages_match_mysql_keyset_pages(query, films, dynamodb_repository, mysql_repository):
+    """全ての絞り込み・並び替え条件で、重複・欠落なく MySQL と同じ順序・同じカーソルでページングする"""
+    expected = expected_ids(films, query)
+    assert expected, "条件に合う映画がない組み合わせはテストにならない"
+
+    for limit in PAGE_LIMITS:
+        mysql_ids, mysql_cursors = collect_pages(mysql_repository.get_page, limit, query)
+        dynamodb_ids, dynamodb_cursors = collect_pages(dynamodb_repository.get_page, limit, query)
+
+        assert mysql_ids == expected
+        assert dynamodb_ids == expected
+        assert len(set(dynamodb_ids)) == len(dynamodb_ids)
+        assert dynamodb_cursors == mysql_cursors
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", QUERIES, ids=repr)
+async def test_dynamodb_async_pages_match_expected_order(query, films, dynamodb_async_repository):
+    """非同期リポジトリも同じ順序で重複・欠落なくページングする"""
+    ids: List[str] = []
+    cursor = None
+    for _ in range(FILM_COUNT + 2):
+        page = await dynamodb_async_repository.get_page(2, cursor, query)
+        ids.extend(film.film_id for film in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert ids == expected_ids(films, query)
+
+
+def test_ties_are_read_past_the_limit(films, stub_table, dynamodb_repository):
+    """同じソートキーのアイテムが Limit を超えて続く場合は、読み切ってから ID で並べる"""
+    query = FilmQuery()
+    page = dynamodb_repository.get_page(1, None, query)
+
+    assert [film.film_id for film in page.items] == expected_ids(films, query)[:1]
+    # 各シャードで同じ last_update のアイテムを Limit（2 件）ずつ複数回 Query している
+    assert stub_table.query_count > SHARDS
+
+
+@pytest.mark.parametrize("query", [
+    FilmQuery(),
+    FilmQuery(sort=FilmSort.LAST_UPDATE, order=SortOrder.ASC),
+    FilmQuery(sort=FilmSort.TITLE),
+    FilmQuery(sort=FilmSort.RELEASE_YEAR),
+    FilmQuery(sort=FilmSort.RELEASE_YEAR, order=SortOrder.ASC),
+], ids=repr)
+def test_film_item_cursor_round_trips_to_index_position(query, stub_table):
+    """film_item_cursor のカーソルは film_index_position で GSI のソートキーの値に戻る"""
+    for item in stub_table.items.values():
+        sort_value = {
+            FilmSort.LAST_UPDATE: item["last_update"],
+            FilmSort.TITLE: item["title"],
+            FilmSort.RELEASE_YEAR: item["release_year_key"],
+        }[query.sort]
+        assert film_index_position(query, film_item_cursor(query, item)) == (sort_value, item["film_id"])
+
+
+def test_film_item_cursor_encodes_missing_release_year_as_null():
+    """公開年のないアイテム（release_year_key が NO_RELEASE_YEAR）のカーソルは MySQL と同じく null になる"""
+    query = FilmQuery(sort=FilmSort.RELEASE_YEAR)
+    item = {"film_id": "film-00", "release_year_key": Decimal(NO_RELEASE_YEAR)}
+
+    cursor = film_item_cursor(query, item)
+
+    assert film_index_position(query, cursor) == (NO_RELEASE_YEAR, "film-00")
+    assert cursor == film_item_cursor(query, {"film_id": "film-00", "release_year_key": NO_RELEASE_YEAR})
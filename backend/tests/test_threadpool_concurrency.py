@@ -0,0 +1,57 @@
+"""同期リポジトリの呼び出しがイベントループを止めないことのテスト"""
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import create_autospec
+
+import httpx
+import pytest
+
+from backend.controllers.dependencies import get_cast_repository, get_film_repository
+from backend.entities.film import Film
+from backend.entities.rating import Rating
+from backend.main import app
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.film_repository import FilmRepository
+from backend.repositories.threadpool_film_repository import ThreadPoolFilmRepository
+from backend.services.auth_middleware import get_current_user
+
+SLEEP_SECONDS = 0.5
+CONCURRENT_REQUESTS = 8
+
+
+def slow_get_by_id(film_id: str) -> Film:
+    """ブロッキングする sleep の後に Film を返す（イベントループ上で呼ばれると他のリクエストが止まる）"""
+    time.sleep(SLEEP_SECONDS)
+    return Film(film_id=film_id, title="Slow", rating=Rating.G, last_update=datetime.now())
+
+
+@pytest.fixture
+def slow_app():
+    """Film リポジトリを get_by_id が遅い同期リポジトリ（スレッドプール経由）に差し替えたアプリケーション"""
+    repository = create_autospec(FilmRepository, instance=True)
+    repository.get_by_id.side_effect = slow_get_by_id
+    app.dependency_overrides[get_film_repository] = lambda: ThreadPoolFilmRepository(repository)
+    # expand を指定しないため出演関係は読まれない
+    app.dependency_overrides[get_cast_repository] = lambda: create_autospec(AsyncCastRepository, instance=True)
+    app.dependency_overrides[get_current_user] = lambda: {"username": "test-user"}
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_slow_requests_overlap(slow_app):
+    """遅い同期リポジトリへの同時リクエストが直列にならず、ほぼ 1 回分の時間で終わる"""
+    async with httpx.AsyncClient(app=slow_app, base_url="http://test") as client:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(
+            client.get(f"/api/films/film-{i}") for i in range(CONCURRENT_REQUESTS)
+        ))
+        elapsed = time.perf_counter() - started
+
+    assert [response.status_code for response in responses] == [200] * CONCURRENT_REQUESTS
+    assert [response.json()["film_id"] for response in responses] == [
+        f"film-{i}" for i in range(CONCURRENT_REQUESTS)
+    ]
+    # 直列なら SLEEP_SECONDS * CONCURRENT_REQUESTS（4 秒）かかる
+    assert elapsed < SLEEP_SECONDS * 2
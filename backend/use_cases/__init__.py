@@ -1,9 +1,10 @@
 """ユースケース層"""
-from .create_film_use_case import CreateFilmUseCase
-from .get_films_use_case import GetFilmsUseCase
-from .get_film_by_id_use_case import GetFilmByIdUseCase
-from .update_film_use_case import UpdateFilmUseCase
-from .delete_film_use_case import DeleteFilmUseCase
+from .create_film_use_case import CreateFilmUseCase, AsyncCreateFilmUseCase
+from .get_films_use_case import GetFilmsUseCase, AsyncGetFilmsUseCase
+from .get_film_by_id_use_case import GetFilmByIdUseCase, AsyncGetFilmByIdUseCase
+from .update_film_use_case import UpdateFilmUseCase, AsyncUpdateFilmUseCase
+from .delete_film_use_case import DeleteFilmUseCase, AsyncDeleteFilmUseCase
+from .search_films_use_case import SearchFilmsUseCase, AsyncSearchFilmsUseCase
 
 __all__ = [
     "CreateFilmUseCase",
@@ -11,4 +12,11 @@ __all__ = [
     "GetFilmByIdUseCase",
     "UpdateFilmUseCase",
     "DeleteFilmUseCase",
+    "SearchFilmsUseCase",
+    "AsyncCreateFilmUseCase",
+    "AsyncGetFilmsUseCase",
+    "AsyncGetFilmByIdUseCase",
+    "AsyncUpdateFilmUseCase",
+    "AsyncDeleteFilmUseCase",
+    "AsyncSearchFilmsUseCase",
 ]
@@ -0,0 +1,80 @@
+"""映画の出演者登録ユースケース"""
+from backend.exceptions import NotFoundError
+from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.cast_repository import CastRepository
+from backend.repositories.film_repository import FilmRepository
+
+
+class AddFilmActorUseCase:
+    """アクターを映画の出演者として登録するユースケース"""
+
+    def __init__(
+        self,
+        film_repository: FilmRepository,
+        actor_repository: ActorRepository,
+        cast_repository: CastRepository
+    ):
+        """
+        Args:
+            film_repository: Film リポジトリ
+            actor_repository: Actor リポジトリ
+            cast_repository: Cast リポジトリ
+        """
+        self.film_repository = film_repository
+        self.actor_repository = actor_repository
+        self.cast_repository = cast_repository
+
+    def execute(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（既に登録されている場合は何もしない）
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Raises:
+            NotFoundError: 映画またはアクターが見つからないか削除済みの場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        film = self.film_repository.get_by_id(film_id)
+        if film is None or film.delete_flag:
+            raise NotFoundError(f"Film with id {film_id} not found")
+        actor = self.actor_repository.get_by_id(actor_id)
+        if actor is None or actor.delete_flag:
+            raise NotFoundError(f"Actor with id {actor_id} not found")
+        self.cast_repository.add(film_id, actor_id)
+
+
+class AsyncAddFilmActorUseCase(AddFilmActorUseCase):
+    """アクターを映画の出演者として登録するユースケース（非同期リポジトリ版）"""
+
+    def __init__(
+        self,
+        film_repository: AsyncFilmRepository,
+        actor_repository: AsyncActorRepository,
+        cast_repository: AsyncCastRepository
+    ):
+        """
+        Args:
+            film_repository: 非同期 Film リポジトリ
+            actor_repository: 非同期 Actor リポジトリ
+            cast_repository: 非同期 Cast リポジトリ
+        """
+        self.film_repository = film_repository
+        self.actor_repository = actor_repository
+        self.cast_repository = cast_repository
+
+    async def execute(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者として登録する（引数・例外は AddFilmActorUseCase.execute と同じ）
+        """
+        film = await self.film_repository.get_by_id(film_id)
+        if film is None or film.delete_flag:
+            raise NotFoundError(f"Film with id {film_id} not found")
+        actor = await self.actor_repository.get_by_id(actor_id)
+        if actor is None or actor.delete_flag:
+            raise NotFoundError(f"Actor with id {actor_id} not found")
+        await self.cast_repository.add(film_id, actor_id)
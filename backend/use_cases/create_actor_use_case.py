@@ -1,10 +1,12 @@
 """アクター作成ユースケース"""
 from datetime import datetime
+from typing import Any, Dict, List, Sequence, Union
 from uuid import uuid4
 
 from backend.entities.actor import Actor
 from backend.exceptions import ValidationError
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
 
 
 class CreateActorUseCase:
@@ -36,6 +38,59 @@ class CreateActorUseCase:
             ValidationError: 入力データの検証に失敗した場合
             DatabaseError: データベース操作に失敗した場合
         """
+        actor = self._build_actor(first_name, last_name)
+
+        # リポジトリを使用して Actor を作成
+        return self.repository.create(actor)
+
+    def execute_many(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Actor, ValidationError]]:
+        """
+        複数のアクターをまとめて作成する
+
+        各入力を execute と同じ規則で検証し、検証に通ったものだけを
+        1 回の create_many で書き込む。
+
+        Args:
+            inputs: execute のキーワード引数（first_name, last_name）の辞書のリスト
+
+        Returns:
+            入力と同じ順序の、作成された Actor エンティティまたは ValidationError のリスト
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        results = self._build_actors(inputs)
+        actors = [result for result in results if isinstance(result, Actor)]
+        if not actors:
+            return results
+        return self._merge_created(results, self.repository.create_many(actors))
+
+    def _build_actors(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Actor, ValidationError]]:
+        """入力ごとに Actor を組み立て、検証に失敗したものは ValidationError を返す"""
+        results: List[Union[Actor, ValidationError]] = []
+        for kwargs in inputs:
+            try:
+                results.append(self._build_actor(**kwargs))
+            except ValidationError as e:
+                results.append(e)
+        return results
+
+    def _merge_created(
+        self,
+        results: List[Union[Actor, ValidationError]],
+        created: List[Actor]
+    ) -> List[Union[Actor, ValidationError]]:
+        """_build_actors の結果の Actor を、リポジトリが返した作成済みの Actor に置き換える"""
+        created_iter = iter(created)
+        return [next(created_iter) if isinstance(result, Actor) else result for result in results]
+
+    def _build_actor(self, first_name: str, last_name: str) -> Actor:
+        """
+        入力データを検証し、新しい Actor エンティティを組み立てる
+
+        Raises:
+            ValidationError: 入力データの検証に失敗した場合
+        """
         # 入力データの検証
         self._validate_input(first_name, last_name)
 
@@ -54,8 +109,7 @@ class CreateActorUseCase:
             delete_flag=False
         )
 
-        # リポジトリを使用して Actor を作成
-        return self.repository.create(actor)
+        return actor
 
     def _validate_input(self, first_name: str, last_name: str) -> None:
         """
@@ -75,3 +129,41 @@ class CreateActorUseCase:
         # last_name が空でないことを検証
         if not last_name or not last_name.strip():
             raise ValidationError("Last name cannot be empty")
+
+
+class AsyncCreateActorUseCase(CreateActorUseCase):
+    """アクターを作成するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        first_name: str,
+        last_name: str
+    ) -> Actor:
+        """
+        新しいアクターを作成する（引数・例外は CreateActorUseCase.execute と同じ）
+
+        Returns:
+            作成された Actor エンティティ
+        """
+        actor = self._build_actor(first_name, last_name)
+        return await self.repository.create(actor)
+
+    async def execute_many(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Actor, ValidationError]]:
+        """
+        複数のアクターをまとめて作成する（引数・戻り値・例外は CreateActorUseCase.execute_many と同じ）
+
+        Returns:
+            入力と同じ順序の、作成された Actor エンティティまたは ValidationError のリスト
+        """
+        results = self._build_actors(inputs)
+        actors = [result for result in results if isinstance(result, Actor)]
+        if not actors:
+            return results
+        return self._merge_created(results, await self.repository.create_many(actors))
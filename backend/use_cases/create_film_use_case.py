@@ -1,12 +1,13 @@
 """映画作成ユースケース"""
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import uuid4
 
 from backend.entities.film import Film
 from backend.entities.rating import Rating
 from backend.exceptions import ValidationError
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
 
 
 class CreateFilmUseCase:
@@ -44,6 +45,66 @@ class CreateFilmUseCase:
             ValidationError: 入力データの検証に失敗した場合
             DatabaseError: データベース操作に失敗した場合
         """
+        film = self._build_film(title, rating, description, image_path, release_year)
+
+        # リポジトリを使用して Film を作成
+        return self.repository.create(film)
+
+    def execute_many(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Film, ValidationError]]:
+        """
+        複数の映画をまとめて作成する
+
+        各入力を execute と同じ規則で検証し、検証に通ったものだけを
+        1 回の create_many で書き込む。
+
+        Args:
+            inputs: execute のキーワード引数（title, rating など）の辞書のリスト
+
+        Returns:
+            入力と同じ順序の、作成された Film エンティティまたは ValidationError のリスト
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        results = self._build_films(inputs)
+        films = [result for result in results if isinstance(result, Film)]
+        if not films:
+            return results
+        return self._merge_created(results, self.repository.create_many(films))
+
+    def _build_films(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Film, ValidationError]]:
+        """入力ごとに Film を組み立て、検証に失敗したものは ValidationError を返す"""
+        results: List[Union[Film, ValidationError]] = []
+        for kwargs in inputs:
+            try:
+                results.append(self._build_film(**kwargs))
+            except ValidationError as e:
+                results.append(e)
+        return results
+
+    def _merge_created(
+        self,
+        results: List[Union[Film, ValidationError]],
+        created: List[Film]
+    ) -> List[Union[Film, ValidationError]]:
+        """_build_films の結果の Film を、リポジトリが返した作成済みの Film に置き換える"""
+        created_iter = iter(created)
+        return [next(created_iter) if isinstance(result, Film) else result for result in results]
+
+    def _build_film(
+        self,
+        title: str,
+        rating: Rating,
+        description: Optional[str] = None,
+        image_path: Optional[str] = None,
+        release_year: Optional[int] = None
+    ) -> Film:
+        """
+        入力データを検証し、新しい Film エンティティを組み立てる
+
+        Raises:
+            ValidationError: 入力データの検証に失敗した場合
+        """
         # 入力データの検証
         self._validate_input(title, rating, release_year)
 
@@ -65,8 +126,7 @@ class CreateFilmUseCase:
             delete_flag=False
         )
 
-        # リポジトリを使用して Film を作成
-        return self.repository.create(film)
+        return film
 
     def _validate_input(self, title: str, rating: Rating, release_year: Optional[int] = None) -> None:
         """
@@ -92,3 +152,44 @@ class CreateFilmUseCase:
         if release_year is not None:
             if not isinstance(release_year, int) or release_year < 1800 or release_year > 2100:
                 raise ValidationError("Release year must be between 1800 and 2100")
+
+
+class AsyncCreateFilmUseCase(CreateFilmUseCase):
+    """映画を作成するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        title: str,
+        rating: Rating,
+        description: Optional[str] = None,
+        image_path: Optional[str] = None,
+        release_year: Optional[int] = None
+    ) -> Film:
+        """
+        新しい映画を作成する（引数・例外は CreateFilmUseCase.execute と同じ）
+
+        Returns:
+            作成された Film エンティティ
+        """
+        film = self._build_film(title, rating, description, image_path, release_year)
+        return await self.repository.create(film)
+
+    async def execute_many(self, inputs: Sequence[Dict[str, Any]]) -> List[Union[Film, ValidationError]]:
+        """
+        複数の映画をまとめて作成する（引数・戻り値・例外は CreateFilmUseCase.execute_many と同じ）
+
+        Returns:
+            入力と同じ順序の、作成された Film エンティティまたは ValidationError のリスト
+        """
+        results = self._build_films(inputs)
+        films = [result for result in results if isinstance(result, Film)]
+        if not films:
+            return results
+        return self._merge_created(results, await self.repository.create_many(films))
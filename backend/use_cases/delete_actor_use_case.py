@@ -1,6 +1,7 @@
 """アクター削除ユースケース"""
 from backend.exceptions import NotFoundError
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
 
 
 class DeleteActorUseCase:
@@ -24,7 +25,7 @@ class DeleteActorUseCase:
             削除が成功した場合 True
 
         Raises:
-            NotFoundError: アクターが見つからない場合
+            NotFoundError: アクターが見つからないか既に削除済みの場合
             DatabaseError: データベース操作に失敗した場合
         """
         # リポジトリを使用して削除
@@ -34,3 +35,35 @@ class DeleteActorUseCase:
             raise NotFoundError(f"Actor with id {actor_id} not found")
 
         return result
+
+
+class AsyncDeleteActorUseCase(DeleteActorUseCase):
+    """アクターを論理削除するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, actor_id: str) -> bool:
+        """
+        指定された actor_id のアクターを論理削除する (delete_flag=True)
+
+        Args:
+            actor_id: 削除するアクターの ID
+
+        Returns:
+            削除が成功した場合 True
+
+        Raises:
+            NotFoundError: アクターが見つからないか既に削除済みの場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        result = await self.repository.delete(actor_id)
+
+        if not result:
+            raise NotFoundError(f"Actor with id {actor_id} not found")
+
+        return result
@@ -1,6 +1,7 @@
 """映画削除ユースケース"""
 from backend.exceptions import NotFoundError
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
 
 
 class DeleteFilmUseCase:
@@ -24,7 +25,7 @@ class DeleteFilmUseCase:
             削除が成功した場合 True
 
         Raises:
-            NotFoundError: 映画が見つからない場合
+            NotFoundError: 映画が見つからないか既に削除済みの場合
             DatabaseError: データベース操作に失敗した場合
         """
         # リポジトリを使用して削除
@@ -34,3 +35,35 @@ class DeleteFilmUseCase:
             raise NotFoundError(f"Film with id {film_id} not found")
 
         return result
+
+
+class AsyncDeleteFilmUseCase(DeleteFilmUseCase):
+    """映画を論理削除するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, film_id: str) -> bool:
+        """
+        指定された film_id の映画を論理削除する (delete_flag=True)
+
+        Args:
+            film_id: 削除する映画の ID
+
+        Returns:
+            削除が成功した場合 True
+
+        Raises:
+            NotFoundError: 映画が見つからないか既に削除済みの場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        result = await self.repository.delete(film_id)
+
+        if not result:
+            raise NotFoundError(f"Film with id {film_id} not found")
+
+        return result
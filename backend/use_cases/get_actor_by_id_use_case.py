@@ -1,7 +1,10 @@
 """アクター取得ユースケース"""
+from typing import List
+
 from backend.entities.actor import Actor
 from backend.exceptions import NotFoundError
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
 
 
 class GetActorByIdUseCase:
@@ -34,3 +37,59 @@ class GetActorByIdUseCase:
             raise NotFoundError(f"Actor with id {actor_id} not found")
 
         return actor
+
+    def execute_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id のアクターをまとめて取得する
+
+        Args:
+            actor_ids: 取得するアクターの ID のリスト
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.get_many(actor_ids)
+
+
+class AsyncGetActorByIdUseCase(GetActorByIdUseCase):
+    """指定された ID のアクターを取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, actor_id: str) -> Actor:
+        """
+        指定された actor_id のアクターを取得する
+
+        Args:
+            actor_id: 取得するアクターの ID
+
+        Returns:
+            Actor エンティティ
+
+        Raises:
+            NotFoundError: アクターが見つからない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        actor = await self.repository.get_by_id(actor_id)
+
+        if actor is None:
+            raise NotFoundError(f"Actor with id {actor_id} not found")
+
+        return actor
+
+    async def execute_many(self, actor_ids: List[str]) -> List[Actor]:
+        """
+        指定された複数の actor_id のアクターをまとめて取得する（引数・戻り値・例外は GetActorByIdUseCase.execute_many と同じ）
+
+        Returns:
+            actor_ids の順序に並べた Actor エンティティのリスト（見つからない ID は含まない）
+        """
+        return await self.repository.get_many(actor_ids)
@@ -0,0 +1,60 @@
+"""アクターの出演作取得ユースケース"""
+from typing import List
+
+from backend.entities.film import Film
+from backend.repositories.cast_repository import CastRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
+
+
+def _sort_by_title(films: List[Film]) -> List[Film]:
+    """映画をタイトル順（同じタイトルは film_id 順）に並べる"""
+    return sorted(films, key=lambda film: (film.title, film.film_id))
+
+
+class GetActorFilmsUseCase:
+    """アクターの出演作を取得するユースケース"""
+
+    def __init__(self, repository: CastRepository):
+        """
+        Args:
+            repository: Cast リポジトリ
+        """
+        self.repository = repository
+
+    def execute(self, actor_id: str) -> List[Film]:
+        """
+        指定された actor_id のアクターの削除されていない出演作をタイトル順に取得する
+
+        出演作の数によらず、出演関係の読み出しと Film の取得はそれぞれ 1 回にまとめる。
+
+        Args:
+            actor_id: アクターの ID
+
+        Returns:
+            Film エンティティのリスト（アクターが存在しない場合は空）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return _sort_by_title(self.repository.get_films(actor_id))
+
+
+class AsyncGetActorFilmsUseCase(GetActorFilmsUseCase):
+    """アクターの出演作を取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncCastRepository):
+        """
+        Args:
+            repository: 非同期 Cast リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, actor_id: str) -> List[Film]:
+        """
+        指定された actor_id のアクターの削除されていない出演作をタイトル順に取得する
+        （引数・戻り値・例外は GetActorFilmsUseCase.execute と同じ）
+
+        Returns:
+            Film エンティティのリスト（アクターが存在しない場合は空）
+        """
+        return _sort_by_title(await self.repository.get_films(actor_id))
@@ -1,12 +1,14 @@
 """アクター一覧取得ユースケース"""
-from typing import List
+from typing import AsyncIterator, Iterator, Optional
 
 from backend.entities.actor import Actor
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.pagination import Page
 
 
 class GetActorsUseCase:
-    """削除されていない全てのアクターを取得するユースケース"""
+    """削除されていないアクターをページ単位で取得するユースケース"""
 
     def __init__(self, repository: ActorRepository):
         """
@@ -15,14 +17,71 @@ class GetActorsUseCase:
         """
         self.repository = repository
 
-    def execute(self) -> List[Actor]:
+    def execute(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
         """
-        削除されていない全てのアクターを取得する (delete_flag=False)
+        削除されていないアクターを 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.get_page(limit, cursor)
+
+    def stream(self) -> Iterator[Actor]:
+        """
+        削除されていない全てのアクターを 1 件ずつ返す (delete_flag=False)
+
+        Returns:
+            Actor エンティティのイテレーター
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.iter_all()
+
+
+class AsyncGetActorsUseCase(GetActorsUseCase):
+    """削除されていないアクターをページ単位で取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        削除されていないアクターを 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return await self.repository.get_page(limit, cursor)
+
+    def stream(self) -> AsyncIterator[Actor]:
+        """
+        削除されていない全てのアクターを 1 件ずつ返す (delete_flag=False)
 
         Returns:
-            Actor エンティティのリスト
+            Actor エンティティの非同期イテレーター
 
         Raises:
             DatabaseError: データベース操作に失敗した場合
         """
-        return self.repository.get_all()
+        return self.repository.iter_all()
@@ -0,0 +1,60 @@
+"""映画の出演者取得ユースケース"""
+from typing import List
+
+from backend.entities.actor import Actor
+from backend.repositories.cast_repository import CastRepository
+from backend.repositories.async_cast_repository import AsyncCastRepository
+
+
+def _sort_by_name(actors: List[Actor]) -> List[Actor]:
+    """アクターを姓・名の順（同じ氏名は actor_id 順）に並べる"""
+    return sorted(actors, key=lambda actor: (actor.last_name, actor.first_name, actor.actor_id))
+
+
+class GetFilmActorsUseCase:
+    """映画の出演者を取得するユースケース"""
+
+    def __init__(self, repository: CastRepository):
+        """
+        Args:
+            repository: Cast リポジトリ
+        """
+        self.repository = repository
+
+    def execute(self, film_id: str) -> List[Actor]:
+        """
+        指定された film_id の映画の削除されていない出演者を姓・名の順に取得する
+
+        出演者の数によらず、出演関係の読み出しと Actor の取得はそれぞれ 1 回にまとめる。
+
+        Args:
+            film_id: 映画の ID
+
+        Returns:
+            Actor エンティティのリスト（映画が存在しない場合は空）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return _sort_by_name(self.repository.get_actors(film_id))
+
+
+class AsyncGetFilmActorsUseCase(GetFilmActorsUseCase):
+    """映画の出演者を取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncCastRepository):
+        """
+        Args:
+            repository: 非同期 Cast リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, film_id: str) -> List[Actor]:
+        """
+        指定された film_id の映画の削除されていない出演者を姓・名の順に取得する
+        （引数・戻り値・例外は GetFilmActorsUseCase.execute と同じ）
+
+        Returns:
+            Actor エンティティのリスト（映画が存在しない場合は空）
+        """
+        return _sort_by_name(await self.repository.get_actors(film_id))
@@ -1,7 +1,10 @@
 """映画取得ユースケース"""
+from typing import List
+
 from backend.entities.film import Film
 from backend.exceptions import NotFoundError
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
 
 
 class GetFilmByIdUseCase:
@@ -34,3 +37,59 @@ class GetFilmByIdUseCase:
             raise NotFoundError(f"Film with id {film_id} not found")
 
         return film
+
+    def execute_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の映画をまとめて取得する
+
+        Args:
+            film_ids: 取得する映画の ID のリスト
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+
+        Raises:
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.get_many(film_ids)
+
+
+class AsyncGetFilmByIdUseCase(GetFilmByIdUseCase):
+    """指定された ID の映画を取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, film_id: str) -> Film:
+        """
+        指定された film_id の映画を取得する
+
+        Args:
+            film_id: 取得する映画の ID
+
+        Returns:
+            Film エンティティ
+
+        Raises:
+            NotFoundError: 映画が見つからない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        film = await self.repository.get_by_id(film_id)
+
+        if film is None:
+            raise NotFoundError(f"Film with id {film_id} not found")
+
+        return film
+
+    async def execute_many(self, film_ids: List[str]) -> List[Film]:
+        """
+        指定された複数の film_id の映画をまとめて取得する（引数・戻り値・例外は GetFilmByIdUseCase.execute_many と同じ）
+
+        Returns:
+            film_ids の順序に並べた Film エンティティのリスト（見つからない ID は含まない）
+        """
+        return await self.repository.get_many(film_ids)
@@ -1,12 +1,36 @@
 """映画一覧取得ユースケース"""
-from typing import List
+from typing import AsyncIterator, Iterator, Optional
 
 from backend.entities.film import Film
+from backend.exceptions import ValidationError
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.film_query import FilmQuery
+from backend.repositories.pagination import Page
+from backend.config.settings import settings
+
+
+def _validate_query(query: Optional[FilmQuery]) -> FilmQuery:
+    """
+    絞り込み条件を検証する
+
+    Args:
+        query: 絞り込み・並び替え条件（None の場合は既定の条件）
+
+    Returns:
+        検証済みの FilmQuery
+
+    Raises:
+        ValidationError: year_from が year_to より大きい場合
+    """
+    query = query or FilmQuery()
+    if query.year_from is not None and query.year_to is not None and query.year_from > query.year_to:
+        raise ValidationError("year_from は year_to 以下で指定してください")
+    return query
 
 
 class GetFilmsUseCase:
-    """削除されていない全ての映画を取得するユースケース"""
+    """削除されていない映画をページ単位で取得するユースケース"""
 
     def __init__(self, repository: FilmRepository):
         """
@@ -15,14 +39,119 @@ class GetFilmsUseCase:
         """
         self.repository = repository
 
-    def execute(self) -> List[Film]:
+    def execute(self, limit: int, cursor: Optional[str] = None, query: Optional[FilmQuery] = None) -> Page[Film]:
+        """
+        削除されていない映画を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合、または絞り込み条件が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.get_page(limit, cursor, _validate_query(query))
+
+    def stream(self, query: Optional[FilmQuery] = None) -> Iterator[Film]:
+        """
+        削除されていない映画を query の条件で全て 1 件ずつ返す (delete_flag=False)
+
+        既定の条件ではリポジトリの iter_all を、絞り込み・並び替えを指定した場合は
+        API_STREAM_BATCH_SIZE 件ずつのページを順に読み出す。
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件）
+
+        Returns:
+            Film エンティティのイテレーター
+
+        Raises:
+            ValidationError: 絞り込み条件が不正な場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        query = _validate_query(query)
+        if query == FilmQuery():
+            return self.repository.iter_all()
+        return self._iter_pages(query)
+
+    def _iter_pages(self, query: FilmQuery) -> Iterator[Film]:
+        """query の条件に合う映画をページ単位で読み出して 1 件ずつ返す"""
+        cursor = None
+        while True:
+            page = self.repository.get_page(settings.api_stream_batch_size, cursor, query)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+
+class AsyncGetFilmsUseCase(GetFilmsUseCase):
+    """削除されていない映画をページ単位で取得するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        query: Optional[FilmQuery] = None
+    ) -> Page[Film]:
+        """
+        削除されていない映画を query の条件と並び順で 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            limit: 1 ページあたりの最大件数
+            cursor: 前のページで返された next_cursor。先頭ページの場合は None
+            query: 絞り込み・並び替え条件（省略時は全件を last_update の降順）
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: cursor の形式が不正な場合、または絞り込み条件が不正な場合
+            DatabaseError: データベース操作に失敗した場合
         """
-        削除されていない全ての映画を取得する (delete_flag=False)
+        return await self.repository.get_page(limit, cursor, _validate_query(query))
+
+    def stream(self, query: Optional[FilmQuery] = None) -> AsyncIterator[Film]:
+        """
+        削除されていない映画を query の条件で全て 1 件ずつ返す (delete_flag=False)
+
+        既定の条件ではリポジトリの iter_all を、絞り込み・並び替えを指定した場合は
+        API_STREAM_BATCH_SIZE 件ずつのページを順に読み出す。
+
+        Args:
+            query: 絞り込み・並び替え条件（省略時は全件）
 
         Returns:
-            Film エンティティのリスト
+            Film エンティティの非同期イテレーター
 
         Raises:
+            ValidationError: 絞り込み条件が不正な場合
             DatabaseError: データベース操作に失敗した場合
         """
-        return self.repository.get_all()
+        query = _validate_query(query)
+        if query == FilmQuery():
+            return self.repository.iter_all()
+        return self._iter_pages(query)
+
+    async def _iter_pages(self, query: FilmQuery) -> AsyncIterator[Film]:
+        """query の条件に合う映画をページ単位で読み出して 1 件ずつ返す"""
+        cursor = None
+        while True:
+            page = await self.repository.get_page(settings.api_stream_batch_size, cursor, query)
+            for film in page.items:
+                yield film
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
@@ -0,0 +1,48 @@
+"""映画の出演者解除ユースケース"""
+from backend.exceptions import NotFoundError
+from backend.repositories.async_cast_repository import AsyncCastRepository
+from backend.repositories.cast_repository import CastRepository
+
+
+class RemoveFilmActorUseCase:
+    """アクターを映画の出演者から外すユースケース"""
+
+    def __init__(self, repository: CastRepository):
+        """
+        Args:
+            repository: Cast リポジトリ
+        """
+        self.repository = repository
+
+    def execute(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者から外す
+
+        Args:
+            film_id: 映画の ID
+            actor_id: アクターの ID
+
+        Raises:
+            NotFoundError: アクターが映画の出演者として登録されていない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        if not self.repository.remove(film_id, actor_id):
+            raise NotFoundError(f"Actor with id {actor_id} is not in the cast of film {film_id}")
+
+
+class AsyncRemoveFilmActorUseCase(RemoveFilmActorUseCase):
+    """アクターを映画の出演者から外すユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncCastRepository):
+        """
+        Args:
+            repository: 非同期 Cast リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, film_id: str, actor_id: str) -> None:
+        """
+        アクターを映画の出演者から外す（引数・例外は RemoveFilmActorUseCase.execute と同じ）
+        """
+        if not await self.repository.remove(film_id, actor_id):
+            raise NotFoundError(f"Actor with id {actor_id} is not in the cast of film {film_id}")
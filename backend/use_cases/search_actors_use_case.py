@@ -0,0 +1,81 @@
+"""アクター検索ユースケース"""
+from typing import Optional
+
+from backend.entities.actor import Actor
+from backend.exceptions import ValidationError
+from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
+from backend.repositories.pagination import Page
+
+
+def _normalize_text(text: str) -> str:
+    """
+    検索語の前後の空白を取り除く
+
+    Raises:
+        ValidationError: 検索語が空の場合
+    """
+    text = text.strip()
+    if not text:
+        raise ValidationError("検索語を指定してください")
+    return text
+
+
+class SearchActorsUseCase:
+    """姓名でアクターを全文検索するユースケース"""
+
+    def __init__(self, repository: ActorRepository):
+        """
+        Args:
+            repository: Actor リポジトリ
+        """
+        self.repository = repository
+
+    def execute(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に検索語を含むアクターを関連度の高い順に 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: 検索語が空の場合、cursor の形式が不正な場合、
+                またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.search(_normalize_text(text), limit, cursor)
+
+
+class AsyncSearchActorsUseCase(SearchActorsUseCase):
+    """姓名でアクターを全文検索するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Actor]:
+        """
+        姓名に検索語を含むアクターを関連度の高い順に 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Actor エンティティのページ
+
+        Raises:
+            ValidationError: 検索語が空の場合、cursor の形式が不正な場合、
+                またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return await self.repository.search(_normalize_text(text), limit, cursor)
@@ -0,0 +1,81 @@
+"""映画検索ユースケース"""
+from typing import Optional
+
+from backend.entities.film import Film
+from backend.exceptions import ValidationError
+from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
+from backend.repositories.pagination import Page
+
+
+def _normalize_text(text: str) -> str:
+    """
+    検索語の前後の空白を取り除く
+
+    Raises:
+        ValidationError: 検索語が空の場合
+    """
+    text = text.strip()
+    if not text:
+        raise ValidationError("検索語を指定してください")
+    return text
+
+
+class SearchFilmsUseCase:
+    """タイトルと説明文で映画を全文検索するユースケース"""
+
+    def __init__(self, repository: FilmRepository):
+        """
+        Args:
+            repository: Film リポジトリ
+        """
+        self.repository = repository
+
+    def execute(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に検索語を含む映画を関連度の高い順に 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: 検索語が空の場合、cursor の形式が不正な場合、
+                またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return self.repository.search(_normalize_text(text), limit, cursor)
+
+
+class AsyncSearchFilmsUseCase(SearchFilmsUseCase):
+    """タイトルと説明文で映画を全文検索するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(self, text: str, limit: int, cursor: Optional[str] = None) -> Page[Film]:
+        """
+        タイトルと説明文に検索語を含む映画を関連度の高い順に 1 ページ分取得する (delete_flag=False)
+
+        Args:
+            text: 検索語
+            limit: 1 ページあたりの最大件数
+            cursor: 同じ検索語の前のページで返された next_cursor。先頭ページの場合は None
+
+        Returns:
+            Film エンティティのページ
+
+        Raises:
+            ValidationError: 検索語が空の場合、cursor の形式が不正な場合、
+                またはデータベースが全文検索に対応していない場合
+            DatabaseError: データベース操作に失敗した場合
+        """
+        return await self.repository.search(_normalize_text(text), limit, cursor)
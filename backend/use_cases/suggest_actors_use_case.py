@@ -0,0 +1,39 @@
+"""アクター氏名のサジェストユースケース"""
+from typing import List, Optional
+
+from backend.exceptions import ValidationError
+from backend.search import PrefixIndex, Suggestion
+
+
+class SuggestActorsUseCase:
+    """入力途中の文字列で始まるアクターの氏名を返すユースケース"""
+
+    def __init__(self, index: Optional[PrefixIndex]):
+        """
+        Args:
+            index: 氏名のサジェストのインデックス（SUGGEST_ENABLED が無効の場合は None）
+        """
+        self.index = index
+
+    def execute(self, prefix: str, limit: int) -> List[Suggestion]:
+        """
+        「名 姓」または「姓 名」が prefix で始まる削除されていないアクターを氏名の辞書順に最大 limit 件取得する
+
+        大文字・小文字、全角・半角の違いは区別しない。データベースにはアクセスしない。
+
+        Args:
+            prefix: 入力途中の氏名
+            limit: 返す最大件数
+
+        Returns:
+            サジェストのリスト（doc_id は actor_id、value は「名 姓」）
+
+        Raises:
+            ValidationError: prefix が空の場合、またはサジェストが無効の場合
+        """
+        if self.index is None:
+            raise ValidationError("サジェストは SUGGEST_ENABLED が無効のため利用できません")
+        prefix = prefix.strip()
+        if not prefix:
+            raise ValidationError("入力途中の文字列を指定してください")
+        return self.index.suggest(prefix, limit)
@@ -0,0 +1,39 @@
+"""映画タイトルのサジェストユースケース"""
+from typing import List, Optional
+
+from backend.exceptions import ValidationError
+from backend.search import PrefixIndex, Suggestion
+
+
+class SuggestFilmsUseCase:
+    """入力途中の文字列で始まる映画タイトルを返すユースケース"""
+
+    def __init__(self, index: Optional[PrefixIndex]):
+        """
+        Args:
+            index: タイトルのサジェストのインデックス（SUGGEST_ENABLED が無効の場合は None）
+        """
+        self.index = index
+
+    def execute(self, prefix: str, limit: int) -> List[Suggestion]:
+        """
+        タイトルが prefix で始まる削除されていない映画をタイトルの辞書順に最大 limit 件取得する
+
+        大文字・小文字、全角・半角の違いは区別しない。データベースにはアクセスしない。
+
+        Args:
+            prefix: 入力途中のタイトル
+            limit: 返す最大件数
+
+        Returns:
+            サジェストのリスト（doc_id は film_id、value はタイトル）
+
+        Raises:
+            ValidationError: prefix が空の場合、またはサジェストが無効の場合
+        """
+        if self.index is None:
+            raise ValidationError("サジェストは SUGGEST_ENABLED が無効のため利用できません")
+        prefix = prefix.strip()
+        if not prefix:
+            raise ValidationError("入力途中の文字列を指定してください")
+        return self.index.suggest(prefix, limit)
@@ -1,9 +1,11 @@
 """アクター更新ユースケース"""
 from datetime import datetime
+from typing import Optional
 
 from backend.entities.actor import Actor
-from backend.exceptions import ValidationError
+from backend.exceptions import NotFoundError, ValidationError
 from backend.repositories.actor_repository import ActorRepository
+from backend.repositories.async_actor_repository import AsyncActorRepository
 
 
 class UpdateActorUseCase:
@@ -21,25 +23,53 @@ class UpdateActorUseCase:
         actor_id: str,
         first_name: str,
         last_name: str,
-        delete_flag: bool = False
+        delete_flag: bool = False,
+        expected_version: Optional[int] = None
     ) -> Actor:
         """
-        既存のアクター情報を更新する
+        既存のアクター情報を expected_version を条件に更新する（楽観的ロック）
+
+        expected_version を省略した場合は現在のバージョンをキャッシュを通さずに読み込んで条件にする
+        （キャッシュの古いバージョンを条件にすると競合でないのに ConflictError になるため）。
+        その場合も読み込みから更新までの間に他の更新があれば競合として扱う。
 
         Args:
             actor_id: 更新するアクターの ID
             first_name: アクターの名
             last_name: アクターの姓
             delete_flag: 削除フラグ
+            expected_version: クライアントが読み込んだ時点のバージョン（オプション）
 
         Returns:
-            更新された Actor エンティティ
+            更新された Actor エンティティ（version は更新後のバージョン）
 
         Raises:
             ValidationError: 入力データの検証に失敗した場合
             NotFoundError: アクターが見つからない場合
+            ConflictError: アクターが expected_version から変更されている場合
             DatabaseError: データベース操作に失敗した場合
         """
+        actor = self._build_actor(actor_id, first_name, last_name, delete_flag)
+        if expected_version is None:
+            expected_version = self._current_version(self.repository.get_version(actor_id), actor_id)
+        actor.version = expected_version
+
+        # リポジトリを使用して Actor を条件付きで更新
+        return self.repository.update(actor)
+
+    def _build_actor(
+        self,
+        actor_id: str,
+        first_name: str,
+        last_name: str,
+        delete_flag: bool = False
+    ) -> Actor:
+        """
+        入力データを検証し、更新後の Actor エンティティを組み立てる
+
+        Raises:
+            ValidationError: 入力データの検証に失敗した場合
+        """
         # 入力データの検証
         self._validate_input(first_name, last_name)
 
@@ -55,8 +85,18 @@ class UpdateActorUseCase:
             delete_flag=delete_flag
         )
 
-        # リポジトリを使用して Actor を更新
-        return self.repository.update(actor)
+        return actor
+
+    def _current_version(self, version: Optional[int], actor_id: str) -> int:
+        """
+        キャッシュを通さずに読み込んだ Actor の現在のバージョンを返す
+
+        Raises:
+            NotFoundError: アクターが見つからない場合
+        """
+        if version is None:
+            raise NotFoundError(f"Actor with id {actor_id} not found")
+        return version
 
     def _validate_input(self, first_name: str, last_name: str) -> None:
         """
@@ -76,3 +116,34 @@ class UpdateActorUseCase:
         # last_name が空でないことを検証
         if not last_name or not last_name.strip():
             raise ValidationError("Last name cannot be empty")
+
+
+class AsyncUpdateActorUseCase(UpdateActorUseCase):
+    """アクター情報を更新するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncActorRepository):
+        """
+        Args:
+            repository: 非同期 Actor リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        actor_id: str,
+        first_name: str,
+        last_name: str,
+        delete_flag: bool = False,
+        expected_version: Optional[int] = None
+    ) -> Actor:
+        """
+        既存のアクター情報を expected_version を条件に更新する（引数・例外は UpdateActorUseCase.execute と同じ）
+
+        Returns:
+            更新された Actor エンティティ（version は更新後のバージョン）
+        """
+        actor = self._build_actor(actor_id, first_name, last_name, delete_flag)
+        if expected_version is None:
+            expected_version = self._current_version(await self.repository.get_version(actor_id), actor_id)
+        actor.version = expected_version
+        return await self.repository.update(actor)
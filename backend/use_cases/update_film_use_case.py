@@ -4,8 +4,9 @@ from typing import Optional
 
 from backend.entities.film import Film
 from backend.entities.rating import Rating
-from backend.exceptions import ValidationError
+from backend.exceptions import NotFoundError, ValidationError
 from backend.repositories.film_repository import FilmRepository
+from backend.repositories.async_film_repository import AsyncFilmRepository
 
 
 class UpdateFilmUseCase:
@@ -26,10 +27,15 @@ class UpdateFilmUseCase:
         description: Optional[str] = None,
         image_path: Optional[str] = None,
         release_year: Optional[int] = None,
-        delete_flag: bool = False
+        delete_flag: bool = False,
+        expected_version: Optional[int] = None
     ) -> Film:
         """
-        既存の映画情報を更新する
+        既存の映画情報を expected_version を条件に更新する（楽観的ロック）
+
+        expected_version を省略した場合は現在のバージョンをキャッシュを通さずに読み込んで条件にする
+        （キャッシュの古いバージョンを条件にすると競合でないのに ConflictError になるため）。
+        その場合も読み込みから更新までの間に他の更新があれば競合として扱う。
 
         Args:
             film_id: 更新する映画の ID
@@ -39,15 +45,43 @@ class UpdateFilmUseCase:
             image_path: 画像パス（オプション）
             release_year: 公開年（オプション）
             delete_flag: 削除フラグ
+            expected_version: クライアントが読み込んだ時点のバージョン（オプション）
 
         Returns:
-            更新された Film エンティティ
+            更新された Film エンティティ（version は更新後のバージョン）
 
         Raises:
             ValidationError: 入力データの検証に失敗した場合
             NotFoundError: 映画が見つからない場合
+            ConflictError: 映画が expected_version から変更されている場合
             DatabaseError: データベース操作に失敗した場合
         """
+        film = self._build_film(
+            film_id, title, rating, description, image_path, release_year, delete_flag
+        )
+        if expected_version is None:
+            expected_version = self._current_version(self.repository.get_version(film_id), film_id)
+        film.version = expected_version
+
+        # リポジトリを使用して Film を条件付きで更新
+        return self.repository.update(film)
+
+    def _build_film(
+        self,
+        film_id: str,
+        title: str,
+        rating: Rating,
+        description: Optional[str] = None,
+        image_path: Optional[str] = None,
+        release_year: Optional[int] = None,
+        delete_flag: bool = False
+    ) -> Film:
+        """
+        入力データを検証し、更新後の Film エンティティを組み立てる
+
+        Raises:
+            ValidationError: 入力データの検証に失敗した場合
+        """
         # 入力データの検証
         self._validate_input(title, rating, release_year)
 
@@ -66,8 +100,18 @@ class UpdateFilmUseCase:
             delete_flag=delete_flag
         )
 
-        # リポジトリを使用して Film を更新
-        return self.repository.update(film)
+        return film
+
+    def _current_version(self, version: Optional[int], film_id: str) -> int:
+        """
+        キャッシュを通さずに読み込んだ Film の現在のバージョンを返す
+
+        Raises:
+            NotFoundError: 映画が見つからない場合
+        """
+        if version is None:
+            raise NotFoundError(f"Film with id {film_id} not found")
+        return version
 
     def _validate_input(self, title: str, rating: Rating, release_year: Optional[int] = None) -> None:
         """
@@ -93,3 +137,39 @@ class UpdateFilmUseCase:
         if release_year is not None:
             if not isinstance(release_year, int) or release_year < 1800 or release_year > 2100:
                 raise ValidationError("Release year must be between 1800 and 2100")
+
+
+class AsyncUpdateFilmUseCase(UpdateFilmUseCase):
+    """映画情報を更新するユースケース（非同期リポジトリ版）"""
+
+    def __init__(self, repository: AsyncFilmRepository):
+        """
+        Args:
+            repository: 非同期 Film リポジトリ
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        film_id: str,
+        title: str,
+        rating: Rating,
+        description: Optional[str] = None,
+        image_path: Optional[str] = None,
+        release_year: Optional[int] = None,
+        delete_flag: bool = False,
+        expected_version: Optional[int] = None
+    ) -> Film:
+        """
+        既存の映画情報を expected_version を条件に更新する（引数・例外は UpdateFilmUseCase.execute と同じ）
+
+        Returns:
+            更新された Film エンティティ（version は更新後のバージョン）
+        """
+        film = self._build_film(
+            film_id, title, rating, description, image_path, release_year, delete_flag
+        )
+        if expected_version is None:
+            expected_version = self._current_version(await self.repository.get_version(film_id), film_id)
+        film.version = expected_version
+        return await self.repository.update(film)
@@ -4,5 +4,5 @@
  */
 
 export { useAuth } from "./useAuth";
-export { useFilms, useFilm, useCreateFilm, useUpdateFilm, useDeleteFilm } from "./useFilms";
-export { useActors, useActor, useCreateActor, useUpdateActor, useDeleteActor } from "./useActors";
+export { useFilms, useFilmSearch, useFilmSuggestions, useFilm, useFilmWithActors, useCreateFilm, useUpdateFilm, useDeleteFilm, useAddFilmActor, useRemoveFilmActor } from "./useFilms";
+export { useActors, useActorSearch, useActorSuggestions, useActor, useActorWithFilms, useCreateActor, useUpdateActor, useDeleteActor } from "./useActors";
@@ -1,7 +1,10 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { keepPreviousData, useInfiniteQuery, useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import {
   getActors,
+  searchActors,
+  suggestActors,
   getActorById,
+  getActorWithFilms,
   createActor,
   updateActor,
   deleteActor,
@@ -16,12 +19,42 @@ import type { Actor, ActorCreateRequest, ActorUpdateRequest } from "../types";
 const ACTORS_QUERY_KEY = ["actors"];
 
 /**
- * Hook to fetch all actors
+ * Hook to fetch actors page by page (cursor pagination)
+ * Use fetchNextPage / hasNextPage to load more
  */
 export const useActors = () => {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ACTORS_QUERY_KEY,
-    queryFn: getActors,
+    queryFn: ({ pageParam }) => getActors({ cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+  });
+};
+
+/**
+ * Hook to search actors by first and last name, most relevant first
+ * Disabled while the search text is empty
+ */
+export const useActorSearch = (q: string) => {
+  return useInfiniteQuery({
+    queryKey: [...ACTORS_QUERY_KEY, "search", q],
+    queryFn: ({ pageParam }) => searchActors(q, { cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    enabled: q.length > 0,
+  });
+};
+
+/**
+ * Hook to fetch names starting with the typed prefix, for autocomplete
+ * Keeps showing the previous suggestions while the next ones load; disabled while the prefix is empty
+ */
+export const useActorSuggestions = (prefix: string) => {
+  return useQuery({
+    queryKey: [...ACTORS_QUERY_KEY, "suggest", prefix],
+    queryFn: () => suggestActors(prefix),
+    enabled: prefix.length > 0,
+    placeholderData: keepPreviousData,
   });
 };
 
@@ -36,6 +69,17 @@ export const useActor = (actorId: string) => {
   });
 };
 
+/**
+ * Hook to fetch an actor together with the films they appear in (one request)
+ */
+export const useActorWithFilms = (actorId: string) => {
+  return useQuery({
+    queryKey: [...ACTORS_QUERY_KEY, actorId, "films"],
+    queryFn: () => getActorWithFilms(actorId),
+    enabled: !!actorId,
+  });
+};
+
 /**
  * Hook to create a new actor
  */
@@ -58,8 +102,15 @@ export const useUpdateActor = () => {
   const queryClient = useQueryClient();
 
   return useMutation({
-    mutationFn: ({ actorId, actorData }: { actorId: string; actorData: ActorUpdateRequest }) =>
-      updateActor(actorId, actorData),
+    mutationFn: ({
+      actorId,
+      actorData,
+      version,
+    }: {
+      actorId: string;
+      actorData: ActorUpdateRequest;
+      version?: number;
+    }) => updateActor(actorId, actorData, version),
     onSuccess: (updatedActor: Actor) => {
       // Invalidate actors list
       queryClient.invalidateQueries({ queryKey: ACTORS_QUERY_KEY });
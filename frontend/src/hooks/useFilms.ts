@@ -1,12 +1,17 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { keepPreviousData, useInfiniteQuery, useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import {
   getFilms,
+  searchFilms,
+  suggestFilms,
   getFilmById,
+  getFilmWithActors,
   createFilm,
   updateFilm,
   deleteFilm,
+  addFilmActor,
+  removeFilmActor,
 } from "../services/filmService";
-import type { Film, FilmCreateRequest, FilmUpdateRequest } from "../types";
+import type { Film, FilmCreateRequest, FilmListFilters, FilmUpdateRequest } from "../types";
 
 /**
  * Custom hook for managing films using TanStack Query
@@ -16,12 +21,43 @@ import type { Film, FilmCreateRequest, FilmUpdateRequest } from "../types";
 const FILMS_QUERY_KEY = ["films"];
 
 /**
- * Hook to fetch all films
+ * Hook to fetch films page by page (cursor pagination)
+ * Filters and sort order are applied by the server; changing them starts again from the first page
+ * Use fetchNextPage / hasNextPage to load more
  */
-export const useFilms = () => {
+export const useFilms = (filters: FilmListFilters = {}) => {
+  return useInfiniteQuery({
+    queryKey: [...FILMS_QUERY_KEY, "list", filters],
+    queryFn: ({ pageParam }) => getFilms({ ...filters, cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+  });
+};
+
+/**
+ * Hook to search films by title and description, most relevant first
+ * Disabled while the search text is empty
+ */
+export const useFilmSearch = (q: string) => {
+  return useInfiniteQuery({
+    queryKey: [...FILMS_QUERY_KEY, "search", q],
+    queryFn: ({ pageParam }) => searchFilms(q, { cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    enabled: q.length > 0,
+  });
+};
+
+/**
+ * Hook to fetch titles starting with the typed prefix, for autocomplete
+ * Keeps showing the previous suggestions while the next ones load; disabled while the prefix is empty
+ */
+export const useFilmSuggestions = (prefix: string) => {
   return useQuery({
-    queryKey: FILMS_QUERY_KEY,
-    queryFn: getFilms,
+    queryKey: [...FILMS_QUERY_KEY, "suggest", prefix],
+    queryFn: () => suggestFilms(prefix),
+    enabled: prefix.length > 0,
+    placeholderData: keepPreviousData,
   });
 };
 
@@ -36,6 +72,17 @@ export const useFilm = (filmId: string) => {
   });
 };
 
+/**
+ * Hook to fetch a film together with its cast (one request)
+ */
+export const useFilmWithActors = (filmId: string) => {
+  return useQuery({
+    queryKey: [...FILMS_QUERY_KEY, filmId, "actors"],
+    queryFn: () => getFilmWithActors(filmId),
+    enabled: !!filmId,
+  });
+};
+
 /**
  * Hook to create a new film
  */
@@ -58,8 +105,15 @@ export const useUpdateFilm = () => {
   const queryClient = useQueryClient();
 
   return useMutation({
-    mutationFn: ({ filmId, filmData }: { filmId: string; filmData: FilmUpdateRequest }) =>
-      updateFilm(filmId, filmData),
+    mutationFn: ({
+      filmId,
+      filmData,
+      version,
+    }: {
+      filmId: string;
+      filmData: FilmUpdateRequest;
+      version?: number;
+    }) => updateFilm(filmId, filmData, version),
     onSuccess: (updatedFilm: Film) => {
       // Invalidate films list
       queryClient.invalidateQueries({ queryKey: FILMS_QUERY_KEY });
@@ -83,3 +137,41 @@ export const useDeleteFilm = () => {
     },
   });
 };
+
+/**
+ * Invalidate both sides of a cast change: the film's cast and the actor's films
+ */
+const invalidateCast = (
+  queryClient: ReturnType<typeof useQueryClient>,
+  filmId: string,
+  actorId: string
+) => {
+  queryClient.invalidateQueries({ queryKey: [...FILMS_QUERY_KEY, filmId, "actors"] });
+  queryClient.invalidateQueries({ queryKey: ["actors", actorId, "films"] });
+};
+
+/**
+ * Hook to add an actor to the cast of a film
+ */
+export const useAddFilmActor = () => {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: ({ filmId, actorId }: { filmId: string; actorId: string }) =>
+      addFilmActor(filmId, actorId),
+    onSuccess: (_, { filmId, actorId }) => invalidateCast(queryClient, filmId, actorId),
+  });
+};
+
+/**
+ * Hook to remove an actor from the cast of a film
+ */
+export const useRemoveFilmActor = () => {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: ({ filmId, actorId }: { filmId: string; actorId: string }) =>
+      removeFilmActor(filmId, actorId),
+    onSuccess: (_, { filmId, actorId }) => invalidateCast(queryClient, filmId, actorId),
+  });
+};
@@ -68,6 +68,7 @@ const ActorFormPage = () => {
         await updateActorMutation.mutateAsync({
           actorId,
           actorData: updateData,
+          version: actor?.version,
         });
         showSuccess("Actor updated successfully");
       } else {
@@ -84,7 +85,10 @@ const ActorFormPage = () => {
       // Navigate back to actors list on success
       navigate("/actors");
     } catch (error: any) {
-      const errorMessage = error?.message || "Failed to save actor";
+      const errorMessage =
+        error?.status === 409
+          ? "This actor was changed by someone else. Reload the page to get the latest version."
+          : error?.message || "Failed to save actor";
       showError(errorMessage);
     }
   };
@@ -1,22 +1,45 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
-import { useActors, useDeleteActor } from "../hooks";
+import { useActors, useActorSearch, useActorSuggestions, useDeleteActor } from "../hooks";
 import { useToast } from "../contexts";
 import { ConfirmDialog, LoadingSpinner, Header } from "../components";
 import type { Actor } from "../types";
 
+// Wait this long after the last keystroke before searching
+const SEARCH_DEBOUNCE_MS = 300;
+
 /**
  * ActorListPage Component
- * Displays a list of all actors with edit and delete actions
+ * Displays a list of all actors with edit and delete actions,
+ * or the full-text search results while a search text is entered
  */
 const ActorListPage = () => {
   const navigate = useNavigate();
-  const { data: actors, isLoading, error } = useActors();
+  const [searchInput, setSearchInput] = useState("");
+  const [searchText, setSearchText] = useState("");
+  const listQuery = useActors();
+  const searchQuery = useActorSearch(searchText);
+  // Suggestions follow every keystroke; they are served from memory and need no debounce
+  const { data: suggestionData } = useActorSuggestions(searchInput.trim());
+  const {
+    data,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = searchText ? searchQuery : listQuery;
+  const actors = data?.pages.flatMap((page) => page.actors);
   const deleteActorMutation = useDeleteActor();
   const { showError, showSuccess } = useToast();
   
   const [actorToDelete, setActorToDelete] = useState<Actor | null>(null);
 
+  useEffect(() => {
+    const timer = setTimeout(() => setSearchText(searchInput.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchInput]);
+
   // Show error toast when there's an error
   useEffect(() => {
     if (error) {
@@ -56,7 +79,8 @@ const ActorListPage = () => {
     navigate("/actors/new");
   };
 
-  if (isLoading) {
+  // Keep the page (and the search box) mounted while search results load
+  if (listQuery.isLoading) {
     return <LoadingSpinner fullScreen message="Loading actors..." />;
   }
 
@@ -75,9 +99,31 @@ const ActorListPage = () => {
             </button>
           </div>
 
-          {actors && actors.length === 0 ? (
+          <div className="mb-6">
+            <input
+              type="search"
+              className="w-full px-4 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+              placeholder="Search first and last names"
+              value={searchInput}
+              onChange={(e) => setSearchInput(e.target.value)}
+              list="actor-suggestions"
+            />
+            <datalist id="actor-suggestions">
+              {suggestionData?.suggestions.map((suggestion) => (
+                <option key={suggestion.actor_id} value={suggestion.name} />
+              ))}
+            </datalist>
+          </div>
+
+          {searchText && isLoading ? (
             <div className="bg-white rounded-lg shadow p-12 text-center">
-              <p className="text-gray-500 text-lg">No actors found. Create your first actor!</p>
+              <p className="text-gray-500 text-lg">Searching...</p>
+            </div>
+          ) : actors && actors.length === 0 ? (
+            <div className="bg-white rounded-lg shadow p-12 text-center">
+              <p className="text-gray-500 text-lg">
+                {searchText ? `No actors match "${searchText}".` : "No actors found. Create your first actor!"}
+              </p>
             </div>
           ) : (
             <div className="bg-white rounded-lg shadow overflow-hidden">
@@ -118,6 +164,18 @@ const ActorListPage = () => {
             </div>
           )}
 
+          {hasNextPage && (
+            <div className="flex justify-center mt-6">
+              <button
+                className="px-4 py-2 bg-gray-200 hover:bg-gray-300 text-gray-800 font-medium rounded-md transition disabled:opacity-50 cursor-pointer"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+              >
+                {isFetchingNextPage ? "Loading..." : "Load More"}
+              </button>
+            </div>
+          )}
+
           <ConfirmDialog
             isOpen={!!actorToDelete}
             title="Delete Actor"
@@ -1,6 +1,14 @@
-import { useEffect } from "react";
+import { useEffect, useState } from "react";
 import { useNavigate, useParams } from "react-router-dom";
-import { useFilm, useCreateFilm, useUpdateFilm } from "../hooks";
+import {
+  useFilm,
+  useFilmWithActors,
+  useCreateFilm,
+  useUpdateFilm,
+  useActorSuggestions,
+  useAddFilmActor,
+  useRemoveFilmActor,
+} from "../hooks";
 import { useToast } from "../contexts";
 import { LoadingSpinner, Header } from "../components";
 import { useFilmFormStore } from "../stores";
@@ -25,6 +33,13 @@ const FilmFormPage = () => {
   const createFilmMutation = useCreateFilm();
   const updateFilmMutation = useUpdateFilm();
 
+  // Cast (edit mode only): the film and its actors come back in one request
+  const { data: filmWithActors } = useFilmWithActors(filmId || "");
+  const [castInput, setCastInput] = useState("");
+  const { data: castSuggestionData } = useActorSuggestions(castInput.trim());
+  const addFilmActorMutation = useAddFilmActor();
+  const removeFilmActorMutation = useRemoveFilmActor();
+
   // Show error toast when there's a loading error
   useEffect(() => {
     if (loadError) {
@@ -81,6 +96,7 @@ const FilmFormPage = () => {
         await updateFilmMutation.mutateAsync({
           filmId,
           filmData: updateData,
+          version: film?.version,
         });
         showSuccess("Film updated successfully");
       } else {
@@ -100,11 +116,40 @@ const FilmFormPage = () => {
       // Navigate back to films list on success
       navigate("/films");
     } catch (error: any) {
-      const errorMessage = error?.message || "Failed to save film";
+      const errorMessage =
+        error?.status === 409
+          ? "This film was changed by someone else. Reload the page to get the latest version."
+          : error?.message || "Failed to save film";
       showError(errorMessage);
     }
   };
 
+  const handleAddActor = async () => {
+    if (!filmId) return;
+    const suggestion = castSuggestionData?.suggestions.find(
+      (s) => s.name === castInput.trim()
+    );
+    if (!suggestion) {
+      showError("Choose an actor from the suggestions");
+      return;
+    }
+    try {
+      await addFilmActorMutation.mutateAsync({ filmId, actorId: suggestion.actor_id });
+      setCastInput("");
+    } catch (error: any) {
+      showError(error?.message || "Failed to add actor");
+    }
+  };
+
+  const handleRemoveActor = async (actorId: string) => {
+    if (!filmId) return;
+    try {
+      await removeFilmActorMutation.mutateAsync({ filmId, actorId });
+    } catch (error: any) {
+      showError(error?.message || "Failed to remove actor");
+    }
+  };
+
   const handleCancel = () => {
     navigate("/films");
   };
@@ -237,6 +282,55 @@ const FilmFormPage = () => {
                 </button>
               </div>
             </form>
+
+            {isEditMode && (
+              <div className="mt-8 pt-6 border-t border-gray-200">
+                <h2 className="text-lg font-semibold text-gray-900 mb-3">Cast</h2>
+                <ul className="divide-y divide-gray-100 mb-4">
+                  {filmWithActors?.actors.map((actor) => (
+                    <li key={actor.actor_id} className="flex items-center justify-between py-2">
+                      <span className="text-gray-800">
+                        {actor.first_name} {actor.last_name}
+                      </span>
+                      <button
+                        type="button"
+                        className="text-sm text-red-600 hover:text-red-800 disabled:opacity-50 cursor-pointer"
+                        onClick={() => handleRemoveActor(actor.actor_id)}
+                        disabled={removeFilmActorMutation.isPending}
+                      >
+                        Remove
+                      </button>
+                    </li>
+                  ))}
+                  {filmWithActors?.actors.length === 0 && (
+                    <li className="py-2 text-sm text-gray-500">No actors yet</li>
+                  )}
+                </ul>
+                <div className="flex space-x-3">
+                  <input
+                    type="search"
+                    className="flex-1 px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent transition"
+                    placeholder="Type an actor name"
+                    value={castInput}
+                    onChange={(e) => setCastInput(e.target.value)}
+                    list="cast-suggestions"
+                  />
+                  <datalist id="cast-suggestions">
+                    {castSuggestionData?.suggestions.map((suggestion) => (
+                      <option key={suggestion.actor_id} value={suggestion.name} />
+                    ))}
+                  </datalist>
+                  <button
+                    type="button"
+                    className="px-4 py-2 bg-blue-600 hover:bg-blue-700 text-white rounded-md transition disabled:opacity-50 cursor-pointer"
+                    onClick={handleAddActor}
+                    disabled={addFilmActorMutation.isPending}
+                  >
+                    Add Actor
+                  </button>
+                </div>
+              </div>
+            )}
           </div>
         </div>
       </div>
@@ -1,22 +1,45 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
-import { useFilms, useDeleteFilm } from "../hooks";
+import { useFilms, useFilmSearch, useFilmSuggestions, useDeleteFilm } from "../hooks";
 import { useToast } from "../contexts";
 import { ConfirmDialog, LoadingSpinner, Header } from "../components";
 import type { Film } from "../types";
 
+// Wait this long after the last keystroke before searching
+const SEARCH_DEBOUNCE_MS = 300;
+
 /**
  * FilmListPage Component
- * Displays a list of all films with edit and delete actions
+ * Displays a list of all films with edit and delete actions,
+ * or the full-text search results while a search text is entered
  */
 const FilmListPage = () => {
   const navigate = useNavigate();
-  const { data: films, isLoading, error } = useFilms();
+  const [searchInput, setSearchInput] = useState("");
+  const [searchText, setSearchText] = useState("");
+  const listQuery = useFilms();
+  const searchQuery = useFilmSearch(searchText);
+  // Suggestions follow every keystroke; they are served from memory and need no debounce
+  const { data: suggestionData } = useFilmSuggestions(searchInput.trim());
+  const {
+    data,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = searchText ? searchQuery : listQuery;
+  const films = data?.pages.flatMap((page) => page.films);
   const deleteFilmMutation = useDeleteFilm();
   const { showError, showSuccess } = useToast();
   
   const [filmToDelete, setFilmToDelete] = useState<Film | null>(null);
 
+  useEffect(() => {
+    const timer = setTimeout(() => setSearchText(searchInput.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchInput]);
+
   // Show error toast when there's an error
   useEffect(() => {
     if (error) {
@@ -56,7 +79,8 @@ const FilmListPage = () => {
     navigate("/films/new");
   };
 
-  if (isLoading) {
+  // Keep the page (and the search box) mounted while search results load
+  if (listQuery.isLoading) {
     return <LoadingSpinner fullScreen message="Loading films..." />;
   }
 
@@ -75,9 +99,31 @@ const FilmListPage = () => {
             </button>
           </div>
 
-          {films && films.length === 0 ? (
+          <div className="mb-6">
+            <input
+              type="search"
+              className="w-full px-4 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+              placeholder="Search titles and descriptions"
+              value={searchInput}
+              onChange={(e) => setSearchInput(e.target.value)}
+              list="film-suggestions"
+            />
+            <datalist id="film-suggestions">
+              {suggestionData?.suggestions.map((suggestion) => (
+                <option key={suggestion.film_id} value={suggestion.title} />
+              ))}
+            </datalist>
+          </div>
+
+          {searchText && isLoading ? (
             <div className="bg-white rounded-lg shadow p-12 text-center">
-              <p className="text-gray-500 text-lg">No films found. Create your first film!</p>
+              <p className="text-gray-500 text-lg">Searching...</p>
+            </div>
+          ) : films && films.length === 0 ? (
+            <div className="bg-white rounded-lg shadow p-12 text-center">
+              <p className="text-gray-500 text-lg">
+                {searchText ? `No films match "${searchText}".` : "No films found. Create your first film!"}
+              </p>
             </div>
           ) : (
             <div className="bg-white rounded-lg shadow overflow-hidden">
@@ -122,6 +168,18 @@ const FilmListPage = () => {
             </div>
           )}
 
+          {hasNextPage && (
+            <div className="flex justify-center mt-6">
+              <button
+                className="px-4 py-2 bg-gray-200 hover:bg-gray-300 text-gray-800 font-medium rounded-md transition disabled:opacity-50 cursor-pointer"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+              >
+                {isFetchingNextPage ? "Loading..." : "Load More"}
+              </button>
+            </div>
+          )}
+
           <ConfirmDialog
             isOpen={!!filmToDelete}
             title="Delete Film"
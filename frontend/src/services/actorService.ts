@@ -1,10 +1,14 @@
 import apiClient from "./apiClient";
 import type {
   Actor,
+  ActorWithFilms,
   ActorCreateRequest,
   ActorUpdateRequest,
   ActorResponse,
   ActorsListResponse,
+  ActorsBatchGetResponse,
+  ActorSuggestionsResponse,
+  CursorPaginationParams,
 } from "../types";
 
 /**
@@ -13,14 +17,56 @@ import type {
  */
 
 /**
- * Get all actors
- * Retrieves all actors with delete_flag=false
+ * Get actors
+ * Retrieves one page of actors with delete_flag=false, newest first.
+ * Pass the returned next_cursor as `cursor` to fetch the following page.
  * 
- * @returns Promise with array of actors
+ * @param params - Optional page size (limit) and cursor
+ * @returns Promise with the page of actors and next_cursor (null on the last page)
  */
-export const getActors = async (): Promise<Actor[]> => {
-  const response = await apiClient.get<ActorsListResponse>("/api/actors");
-  return response.data.actors;
+export const getActors = async (
+  params: CursorPaginationParams = {}
+): Promise<ActorsListResponse> => {
+  const response = await apiClient.get<ActorsListResponse>("/api/actors", { params });
+  return response.data;
+};
+
+/**
+ * Search actors
+ * Full-text search over first and last names, most relevant first.
+ * Pass the returned next_cursor as `cursor`, with the same query, to fetch the following page.
+ * 
+ * @param q - Search text
+ * @param params - Optional page size (limit) and cursor
+ * @returns Promise with the page of actors and next_cursor (null on the last page)
+ */
+export const searchActors = async (
+  q: string,
+  params: CursorPaginationParams = {}
+): Promise<ActorsListResponse> => {
+  const response = await apiClient.get<ActorsListResponse>("/api/actors/search", {
+    params: { ...params, q },
+  });
+  return response.data;
+};
+
+/**
+ * Suggest actors
+ * Actors whose "first last" or "last first" name starts with the typed prefix,
+ * in name order (case and width insensitive).
+ * 
+ * @param prefix - Text typed so far
+ * @param limit - Optional maximum number of suggestions
+ * @returns Promise with the matching actor IDs and names
+ */
+export const suggestActors = async (
+  prefix: string,
+  limit?: number
+): Promise<ActorSuggestionsResponse> => {
+  const response = await apiClient.get<ActorSuggestionsResponse>("/api/actors/suggest", {
+    params: { prefix, limit },
+  });
+  return response.data;
 };
 
 /**
@@ -35,6 +81,34 @@ export const getActorById = async (actorId: string): Promise<Actor> => {
   return response.data;
 };
 
+/**
+ * Get actor with their films
+ * Retrieves an actor together with the non-deleted films they appear in, in one request (expand=films)
+ * 
+ * @param actorId - The ID of the actor to retrieve
+ * @returns Promise with actor data including films
+ */
+export const getActorWithFilms = async (actorId: string): Promise<ActorWithFilms> => {
+  const response = await apiClient.get<ActorWithFilms>(`/api/actors/${actorId}`, {
+    params: { expand: "films" },
+  });
+  return response.data;
+};
+
+/**
+ * Get actors by IDs
+ * Retrieves several actors in one request instead of one request per ID
+ * 
+ * @param actorIds - The IDs of the actors to retrieve
+ * @returns Promise with the actors in request order and the IDs that were not found
+ */
+export const getActorsByIds = async (actorIds: string[]): Promise<ActorsBatchGetResponse> => {
+  const response = await apiClient.post<ActorsBatchGetResponse>("/api/actors:batchGet", {
+    actor_ids: actorIds,
+  });
+  return response.data;
+};
+
 /**
  * Create new actor
  * Creates a new actor with the provided data
@@ -51,17 +125,23 @@ export const createActor = async (actorData: ActorCreateRequest): Promise<Actor>
  * Update actor
  * Updates an existing actor with the provided data
  * 
+ * Sends If-Match with the version the actor was loaded at, so the server
+ * rejects the update with 409 if someone else changed it in the meantime.
+ * 
  * @param actorId - The ID of the actor to update
  * @param actorData - Actor update data
+ * @param version - Version of the actor the edit is based on (optional)
  * @returns Promise with updated actor data
  */
 export const updateActor = async (
   actorId: string,
-  actorData: ActorUpdateRequest
+  actorData: ActorUpdateRequest,
+  version?: number
 ): Promise<Actor> => {
   const response = await apiClient.put<ActorResponse>(
     `/api/actors/${actorId}`,
-    actorData
+    actorData,
+    version !== undefined ? { headers: { "If-Match": `"v${version}"` } } : undefined
   );
   return response.data;
 };
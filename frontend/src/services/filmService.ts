@@ -1,10 +1,15 @@
 import apiClient from "./apiClient";
 import type {
   Film,
+  FilmWithActors,
   FilmCreateRequest,
   FilmUpdateRequest,
   FilmResponse,
   FilmsListResponse,
+  FilmsBatchGetResponse,
+  FilmSuggestionsResponse,
+  FilmListParams,
+  CursorPaginationParams,
 } from "../types";
 
 /**
@@ -13,15 +18,56 @@ import type {
  */
 
 /**
- * Get all films
- * Retrieves all films with delete_flag=false
+ * Get films
+ * Retrieves one page of films with delete_flag=false, newest first by default.
+ * Filtering (rating, release year range) and sorting are applied by the server.
+ * Pass the returned next_cursor as `cursor`, with the same filters, to fetch the following page.
  * 
- * @returns Promise with array of films
+ * @param params - Optional page size (limit), cursor, filters and sort order
+ * @returns Promise with the page of films and next_cursor (null on the last page)
  */
-export const getFilms = async (): Promise<Film[]> => {
-  const response = await apiClient.get<FilmsListResponse>("/api/films");
-  console.log(response.data)
-  return response.data.films;
+export const getFilms = async (
+  params: FilmListParams = {}
+): Promise<FilmsListResponse> => {
+  const response = await apiClient.get<FilmsListResponse>("/api/films", { params });
+  return response.data;
+};
+
+/**
+ * Search films
+ * Full-text search over titles and descriptions, most relevant first.
+ * Pass the returned next_cursor as `cursor`, with the same query, to fetch the following page.
+ * 
+ * @param q - Search text
+ * @param params - Optional page size (limit) and cursor
+ * @returns Promise with the page of films and next_cursor (null on the last page)
+ */
+export const searchFilms = async (
+  q: string,
+  params: CursorPaginationParams = {}
+): Promise<FilmsListResponse> => {
+  const response = await apiClient.get<FilmsListResponse>("/api/films/search", {
+    params: { ...params, q },
+  });
+  return response.data;
+};
+
+/**
+ * Suggest films
+ * Films whose title starts with the typed prefix, in title order (case and width insensitive).
+ * 
+ * @param prefix - Text typed so far
+ * @param limit - Optional maximum number of suggestions
+ * @returns Promise with the matching film IDs and titles
+ */
+export const suggestFilms = async (
+  prefix: string,
+  limit?: number
+): Promise<FilmSuggestionsResponse> => {
+  const response = await apiClient.get<FilmSuggestionsResponse>("/api/films/suggest", {
+    params: { prefix, limit },
+  });
+  return response.data;
 };
 
 /**
@@ -36,6 +82,34 @@ export const getFilmById = async (filmId: string): Promise<Film> => {
   return response.data;
 };
 
+/**
+ * Get film with its cast
+ * Retrieves a film together with its non-deleted actors in one request (expand=actors)
+ * 
+ * @param filmId - The ID of the film to retrieve
+ * @returns Promise with film data including actors
+ */
+export const getFilmWithActors = async (filmId: string): Promise<FilmWithActors> => {
+  const response = await apiClient.get<FilmWithActors>(`/api/films/${filmId}`, {
+    params: { expand: "actors" },
+  });
+  return response.data;
+};
+
+/**
+ * Get films by IDs
+ * Retrieves several films in one request instead of one request per ID
+ * 
+ * @param filmIds - The IDs of the films to retrieve
+ * @returns Promise with the films in request order and the IDs that were not found
+ */
+export const getFilmsByIds = async (filmIds: string[]): Promise<FilmsBatchGetResponse> => {
+  const response = await apiClient.post<FilmsBatchGetResponse>("/api/films:batchGet", {
+    film_ids: filmIds,
+  });
+  return response.data;
+};
+
 /**
  * Create new film
  * Creates a new film with the provided data
@@ -52,17 +126,23 @@ export const createFilm = async (filmData: FilmCreateRequest): Promise<Film> =>
  * Update film
  * Updates an existing film with the provided data
  * 
+ * Sends If-Match with the version the film was loaded at, so the server
+ * rejects the update with 409 if someone else changed it in the meantime.
+ * 
  * @param filmId - The ID of the film to update
  * @param filmData - Film update data
+ * @param version - Version of the film the edit is based on (optional)
  * @returns Promise with updated film data
  */
 export const updateFilm = async (
   filmId: string,
-  filmData: FilmUpdateRequest
+  filmData: FilmUpdateRequest,
+  version?: number
 ): Promise<Film> => {
   const response = await apiClient.put<FilmResponse>(
     `/api/films/${filmId}`,
-    filmData
+    filmData,
+    version !== undefined ? { headers: { "If-Match": `"v${version}"` } } : undefined
   );
   return response.data;
 };
@@ -77,3 +157,27 @@ export const updateFilm = async (
 export const deleteFilm = async (filmId: string): Promise<void> => {
   await apiClient.delete(`/api/films/${filmId}`);
 };
+
+/**
+ * Add film actor
+ * Adds an actor to the cast of a film (no-op if already in the cast)
+ * 
+ * @param filmId - The ID of the film
+ * @param actorId - The ID of the actor
+ * @returns Promise that resolves when the actor is in the cast
+ */
+export const addFilmActor = async (filmId: string, actorId: string): Promise<void> => {
+  await apiClient.put(`/api/films/${filmId}/actors/${actorId}`);
+};
+
+/**
+ * Remove film actor
+ * Removes an actor from the cast of a film
+ * 
+ * @param filmId - The ID of the film
+ * @param actorId - The ID of the actor
+ * @returns Promise that resolves when the actor is removed from the cast
+ */
+export const removeFilmActor = async (filmId: string, actorId: string): Promise<void> => {
+  await apiClient.delete(`/api/films/${filmId}/actors/${actorId}`);
+};
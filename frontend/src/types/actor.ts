@@ -1,3 +1,5 @@
+import type { Film } from "./film";
+
 /**
  * Actor Entity
  * Represents an actor in the system
@@ -8,6 +10,15 @@ export interface Actor {
   last_name: string;
   last_update: string; // ISO 8601 datetime string
   delete_flag: boolean;
+  version: number; // incremented on every update; send it back as If-Match
+}
+
+/**
+ * Actor With Films
+ * Actor returned by the get actor endpoint with expand=films
+ */
+export interface ActorWithFilms extends Actor {
+  films: Film[]; // non-deleted films the actor appears in, by title
 }
 
 /**
@@ -34,10 +45,37 @@ export interface ActorUpdateRequest {
  */
 export type ActorResponse = Actor;
 
+/**
+ * Actors Batch Get Response
+ * Response of the batch get-by-ids endpoint
+ */
+export interface ActorsBatchGetResponse {
+  actors: Actor[]; // in request order, duplicates collapsed
+  not_found: string[];
+}
+
 /**
  * Actors List Response
- * Response from get all actors endpoint
+ * One page of the get actors endpoint
  */
 export interface ActorsListResponse {
   actors: Actor[];
+  next_cursor: string | null; // null on the last page
+}
+
+/**
+ * Actor Suggestion
+ * One entry of the suggest actors endpoint
+ */
+export interface ActorSuggestion {
+  actor_id: string;
+  name: string; // "first last"
+}
+
+/**
+ * Actors Suggestions Response
+ * Response of the suggest actors endpoint, in dictionary order
+ */
+export interface ActorSuggestionsResponse {
+  suggestions: ActorSuggestion[];
 }
@@ -26,6 +26,15 @@ export interface ApiRequestConfig {
   params?: Record<string, any>;
 }
 
+/**
+ * Cursor Pagination Parameters
+ * Query parameters for list endpoints (GET /api/films, GET /api/actors)
+ */
+export interface CursorPaginationParams {
+  limit?: number;
+  cursor?: string; // next_cursor returned by the previous page
+}
+
 /**
  * Pagination Parameters
  * For future pagination support
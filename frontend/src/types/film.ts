@@ -1,4 +1,6 @@
 import type { Rating } from "./rating";
+import type { CursorPaginationParams } from "./api";
+import type { Actor } from "./actor";
 
 /**
  * Film Entity
@@ -13,6 +15,15 @@ export interface Film {
   rating: Rating;
   last_update: string; // ISO 8601 datetime string
   delete_flag: boolean;
+  version: number; // incremented on every update; send it back as If-Match
+}
+
+/**
+ * Film With Actors
+ * Film returned by the get film endpoint with expand=actors
+ */
+export interface FilmWithActors extends Film {
+  actors: Actor[]; // non-deleted cast members, by last name then first name
 }
 
 /**
@@ -45,10 +56,55 @@ export interface FilmUpdateRequest {
  */
 export type FilmResponse = Film;
 
+/**
+ * Films Batch Get Response
+ * Response of the batch get-by-ids endpoint
+ */
+export interface FilmsBatchGetResponse {
+  films: Film[]; // in request order, duplicates collapsed
+  not_found: string[];
+}
+
 /**
  * Films List Response
- * Response from get all films endpoint
+ * One page of the get films endpoint
  */
 export interface FilmsListResponse {
   films: Film[];
+  next_cursor: string | null; // null on the last page
+}
+
+/**
+ * Film Suggestion
+ * One entry of the suggest films endpoint
+ */
+export interface FilmSuggestion {
+  film_id: string;
+  title: string;
 }
+
+/**
+ * Films Suggestions Response
+ * Response of the suggest films endpoint, in dictionary order
+ */
+export interface FilmSuggestionsResponse {
+  suggestions: FilmSuggestion[];
+}
+
+/**
+ * Film List Filters
+ * Filtering and sorting applied by the server to the get films endpoint
+ */
+export interface FilmListFilters {
+  rating?: Rating;
+  year_from?: number; // inclusive; films without a release year are excluded
+  year_to?: number; // inclusive; films without a release year are excluded
+  sort?: "last_update" | "title" | "release_year"; // defaults to last_update
+  order?: "asc" | "desc"; // defaults to asc for title, desc otherwise
+}
+
+/**
+ * Film List Params
+ * Query parameters of the get films endpoint; a cursor is only valid with the filters it was issued for
+ */
+export type FilmListParams = CursorPaginationParams & FilmListFilters;
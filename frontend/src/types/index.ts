@@ -9,19 +9,29 @@ export { RATING_VALUES, isValidRating } from "./rating";
 // Film types
 export type {
   Film,
+  FilmWithActors,
   FilmCreateRequest,
   FilmUpdateRequest,
   FilmResponse,
   FilmsListResponse,
+  FilmsBatchGetResponse,
+  FilmSuggestion,
+  FilmSuggestionsResponse,
+  FilmListFilters,
+  FilmListParams,
 } from "./film";
 
 // Actor types
 export type {
   Actor,
+  ActorWithFilms,
   ActorCreateRequest,
   ActorUpdateRequest,
   ActorResponse,
   ActorsListResponse,
+  ActorsBatchGetResponse,
+  ActorSuggestion,
+  ActorSuggestionsResponse,
 } from "./actor";
 
 // User and Auth types
@@ -45,6 +55,7 @@ export type {
   ErrorResponse,
   SuccessResponse,
   ApiRequestConfig,
+  CursorPaginationParams,
   PaginationParams,
   PaginatedResponse,
 } from "./api";